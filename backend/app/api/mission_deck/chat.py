@@ -50,6 +50,51 @@ def _is_valid_citizen(citizen_id: str) -> bool:
     return citizen_dir.exists() and citizen_dir.is_dir()
 
 
+def format_message_history_item(msg: dict) -> MessageHistoryItem:
+    """
+    Convert a FalkorDB message node to MessageHistoryItem schema.
+
+    Args:
+        msg: U4_Event message node from FalkorDB
+
+    Returns:
+        MessageHistoryItem (unparseable timestamps fall back to now,
+        unparseable code blocks to none)
+    """
+    # Parse timestamp safely
+    timestamp = msg.get("timestamp")
+    if timestamp:
+        try:
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            elif not isinstance(timestamp, datetime):
+                timestamp = datetime.utcnow()
+        except (ValueError, AttributeError) as e:
+            print(f"[chat.py:format_message_history_item] Failed to parse timestamp: {timestamp}, error: {e}")
+            timestamp = datetime.utcnow()
+    else:
+        timestamp = datetime.utcnow()
+
+    # Parse code blocks safely
+    code_blocks = msg.get("code_blocks", [])
+    try:
+        if code_blocks and isinstance(code_blocks, list):
+            code_blocks = [CodeBlockResponse(**block) for block in code_blocks]
+        else:
+            code_blocks = []
+    except Exception as e:
+        print(f"[chat.py:format_message_history_item] Failed to parse code blocks: {e}")
+        code_blocks = []
+
+    return MessageHistoryItem(
+        id=msg.get("slug"),
+        role=msg.get("role"),
+        content=msg.get("content"),
+        code_blocks=code_blocks,
+        created_at=timestamp
+    )
+
+
 @router.post("/{citizen_id}/chat", response_model=ChatMessageResponse)
 async def send_chat_message(
     citizen_id: str,
@@ -112,7 +157,7 @@ async def send_chat_message(
 
     try:
         # Save user message to graph (shared chat history)
-        create_citizen_message(
+        await create_citizen_message(
             citizen_id=citizen_id,
             role="user",
             content=request.message,
@@ -124,7 +169,7 @@ async def send_chat_message(
         citizen_response, code_blocks = ask_citizen(citizen_id, request.message)
 
         # Save citizen response to graph
-        create_citizen_message(
+        await create_citizen_message(
             citizen_id=citizen_id,
             role="assistant",
             content=citizen_response,
@@ -216,45 +261,10 @@ async def get_chat_history(
 
     try:
         # Get shared messages from graph
-        messages = get_citizen_messages(citizen_id, limit=limit)
+        messages = await get_citizen_messages(citizen_id, limit=limit)
 
         # Format messages for response
-        formatted_messages = []
-        for msg in messages:
-            # Parse timestamp safely
-            timestamp = msg.get("timestamp")
-            if timestamp:
-                try:
-                    if isinstance(timestamp, str):
-                        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    elif not isinstance(timestamp, datetime):
-                        timestamp = datetime.utcnow()
-                except (ValueError, AttributeError) as e:
-                    print(f"[chat.py:get_chat_history] Failed to parse timestamp: {timestamp}, error: {e}")
-                    timestamp = datetime.utcnow()
-            else:
-                timestamp = datetime.utcnow()
-
-            # Parse code blocks safely
-            code_blocks = msg.get("code_blocks", [])
-            try:
-                if code_blocks and isinstance(code_blocks, list):
-                    code_blocks = [CodeBlockResponse(**block) for block in code_blocks]
-                else:
-                    code_blocks = []
-            except Exception as e:
-                print(f"[chat.py:get_chat_history] Failed to parse code blocks: {e}")
-                code_blocks = []
-
-            formatted_messages.append(
-                MessageHistoryItem(
-                    id=msg.get("slug"),
-                    role=msg.get("role"),
-                    content=msg.get("content"),
-                    code_blocks=code_blocks,
-                    created_at=timestamp
-                )
-            )
+        formatted_messages = [format_message_history_item(msg) for msg in messages]
 
         return MessageHistoryResponse(
             messages=formatted_messages,
@@ -5,11 +5,17 @@ REST endpoints for earnings tracking and mission fund visibility.
 Maps to: docs/missions/mission-deck-compensation/MECHANISM.md REST API section
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 from app.api.mission_deck.services.compensation.tier_calculator import (
+    CACHE_TTL_FUND_BALANCE,
     get_mission_fund_balance,
     get_current_tier,
     get_tier_info,
@@ -17,11 +23,26 @@ from app.api.mission_deck.services.compensation.tier_calculator import (
 )
 from app.api.mission_deck.services.compensation.earnings_calculator import (
     calculate_member_full_earnings,
-    calculate_member_total_potential_earnings
+    calculate_jobs_earnings,
+    calculate_member_total_potential_earnings,
+    calculate_team_earnings,
+    get_member_earnings_stamp
 )
+from app.api.mission_deck.services.compensation.earnings_history import earnings_history
+from app.api.mission_deck.services.compensation.earnings_stream import stream_member_earnings
+from app.api.mission_deck.services.conditional_get import conditional_json_response
+from app.api.mission_deck.services.graph_cache import cache_tag
+from app.api.mission_deck.services.graph_resilience import GraphUnavailableError
 
 router = APIRouter()
 
+# How long a rendered earnings response is served before recomputing (writes
+# on this worker invalidate it sooner - see conditional_get.py)
+RESPONSE_TTL_EARNINGS = 10.0
+
+# Most job slugs accepted by the batch job earnings endpoint
+MAX_BATCH_JOBS = 100
+
 
 # Response models
 class EarningsResponse(BaseModel):
@@ -33,6 +54,75 @@ class EarningsResponse(BaseModel):
     totalInteractions: int
 
 
+class EarningsHistoryPoint(BaseModel):
+    """One bucket of a member's earnings history"""
+    time: int  # Bucket start (Unix seconds)
+    potentialFromJobs: float
+    completedMissions: float
+    grandTotal: float
+    minGrandTotal: float
+    maxGrandTotal: float
+    totalInteractions: int
+    samples: int
+
+
+class EarningsHistoryResponse(BaseModel):
+    """Member earnings over time"""
+    memberSlug: str
+    resolution: str
+    start: int
+    end: int
+    points: List[EarningsHistoryPoint]
+
+
+class LeaderboardEntry(BaseModel):
+    """One member's row on the team leaderboard"""
+    memberSlug: str
+    rank: int
+    potentialFromJobs: float
+    completedMissions: float
+    grandTotal: float
+    totalInteractions: int
+    jobCount: int
+
+
+class LeaderboardResponse(BaseModel):
+    """Team-wide earnings, highest grand total first"""
+    members: List[LeaderboardEntry]
+    teamPotentialFromJobs: float
+    teamCompletedMissions: float
+    teamGrandTotal: float
+    jobSlugs: List[str]
+
+
+class JobMemberEarning(BaseModel):
+    """One member's earning on one job"""
+    memberSlug: str
+    earning: float
+    yourInteractions: int
+
+
+class JobEarningsBreakdown(BaseModel):
+    """Earnings breakdown of one job card"""
+    jobSlug: str
+    jobName: str
+    teamTotal: int
+    members: List[JobMemberEarning]
+
+
+class JobEarningsError(BaseModel):
+    """A job card whose earnings couldn't be computed"""
+    jobSlug: str
+    detail: str
+
+
+class JobsEarningsResponse(BaseModel):
+    """Earnings breakdown of several jobs"""
+    jobs: List[JobEarningsBreakdown]
+    missing: List[str]
+    errors: List[JobEarningsError]
+
+
 class MissionFundResponse(BaseModel):
     """Mission fund status"""
     balance: float
@@ -44,12 +134,35 @@ class MissionFundResponse(BaseModel):
     missionPayments: Dict[str, float]
 
 
+def earnings_cache_tags(earnings: EarningsResponse) -> list:
+    """Graph data an earnings payload depends on."""
+    return [
+        cache_tag("U4_Work_Item"),  # active jobs, completed missions
+        cache_tag("U4_Interaction_Counter"),
+        *(cache_tag("U4_Event", job.get("jobSlug")) for job in earnings.jobs)
+    ]
+
+
+def leaderboard_cache_tags(leaderboard: LeaderboardResponse) -> list:
+    """Graph data the leaderboard depends on."""
+    return [
+        cache_tag("U4_Work_Item"),
+        cache_tag("U4_Interaction_Counter"),
+        *(cache_tag("U4_Event", job_slug) for job_slug in leaderboard.jobSlugs)
+    ]
+
+
 @router.get("/api/compensation/earnings/{member_slug}", response_model=EarningsResponse)
-async def get_member_earnings(member_slug: str):
+async def get_member_earnings(member_slug: str, request: Request):
     """
     Get member's complete earnings summary.
 
-    This endpoint is polled by the frontend every 2 seconds for real-time updates.
+    Polling fallback for clients without EventSource support - live clients
+    subscribe to /api/compensation/earnings/{member_slug}/stream instead of
+    polling this every 2 seconds.
+
+    Conditional GET: responses carry an ETag; send it back as If-None-Match
+    and an unchanged payload is answered with 304 Not Modified.
 
     Returns:
         - potentialFromJobs: Earnings from active jobs (based on interactions)
@@ -58,10 +171,25 @@ async def get_member_earnings(member_slug: str):
         - jobs: List of job earnings breakdowns
         - totalInteractions: Total interactions across all jobs
     """
-    try:
-        earnings_data = calculate_member_full_earnings(member_slug)
+    async def compute() -> EarningsResponse:
+        earnings_data = await calculate_member_full_earnings(member_slug)
         return EarningsResponse(**earnings_data)
 
+    try:
+        return await conditional_json_response(
+            request,
+            f"earnings:{member_slug}",
+            compute,
+            ttl=RESPONSE_TTL_EARNINGS,
+            tags=earnings_cache_tags
+        )
+
+    except GraphUnavailableError as e:
+        print(f"[compensation:get_member_earnings] Graph unavailable: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to calculate earnings: graph temporarily unavailable"
+        )
     except Exception as e:
         print(f"[compensation:get_member_earnings] Error for {member_slug}: {e}")
         raise HTTPException(
@@ -70,11 +198,148 @@ async def get_member_earnings(member_slug: str):
         )
 
 
+@router.get("/api/compensation/earnings/{member_slug}/stream")
+async def stream_member_earnings_updates(
+    member_slug: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Stream member's earnings as Server-Sent Events.
+
+    Sends the EarningsResponse on connect, then again only when an input
+    changes, with a keep-alive comment otherwise. Chat messages on the
+    member's jobs push right away; mission completions and fund writes
+    (CLI tools, scripts) are noticed within EARNINGS_STREAM_SIGNAL_SECONDS
+    from their updated_at stamps.
+
+    Events:
+        - earnings: EarningsResponse JSON (id = payload version)
+        - earnings-error: {"detail": ...} - stream stays open and retries
+
+    Example:
+        const events = new EventSource('/api/compensation/earnings/kara/stream');
+        events.addEventListener('earnings', (e) => render(JSON.parse(e.data)));
+
+    Clients without EventSource keep polling GET /api/compensation/earnings/{member_slug}.
+    """
+    async def compute() -> Dict:
+        earnings_data = await calculate_member_full_earnings(member_slug)
+        return EarningsResponse(**earnings_data).model_dump()
+
+    return StreamingResponse(
+        stream_member_earnings(
+            member_slug,
+            compute,
+            request.is_disconnected,
+            last_event_id,
+            signal=lambda: get_member_earnings_stamp(member_slug)
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Don't let proxies buffer the stream
+        }
+    )
+
+
+@router.get("/api/compensation/earnings/{member_slug}/history", response_model=EarningsHistoryResponse)
+async def get_member_earnings_history(
+    member_slug: str,
+    start: Optional[datetime] = Query(None, description="Range start (default: 7 days ago)"),
+    end: Optional[datetime] = Query(None, description="Range end (default: now)"),
+    resolution: Optional[str] = Query(None, description="minute | hour | day (default: finest retained)")
+):
+    """
+    Get member's earnings over time from the local history store.
+
+    Served from periodic snapshots (earnings_history.py) - never touches
+    the graph. Minute points are kept for a day, hourly for 30 days,
+    daily for 2 years.
+
+    Returns:
+        - resolution: Bucket size of the points
+        - points: [{time, potentialFromJobs, completedMissions, grandTotal,
+                    minGrandTotal, maxGrandTotal, totalInteractions, samples}]
+
+    Example:
+        GET /api/compensation/earnings/kara/history?start=2025-11-01T00:00:00Z&resolution=hour
+    """
+    now = time.time()
+    end_ts = end.timestamp() if end else now
+    start_ts = start.timestamp() if start else end_ts - 7 * 86400
+    if start_ts > end_ts:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    try:
+        history = await asyncio.to_thread(earnings_history.query, member_slug, start_ts, end_ts, resolution, now)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"[compensation:get_member_earnings_history] Error for {member_slug}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to read earnings history: {str(e)}"
+        )
+
+    return EarningsHistoryResponse(
+        memberSlug=member_slug,
+        resolution=history['resolution'],
+        start=int(start_ts),
+        end=int(end_ts),
+        points=history['points']
+    )
+
+
+@router.get("/api/compensation/leaderboard", response_model=LeaderboardResponse)
+async def get_earnings_leaderboard(request: Request):
+    """
+    Get every member's earnings, highest grand total first.
+
+    Computed in one pass over all active jobs and completed missions (the
+    same 2 graph round trips as one member's earnings), in integer cents.
+    Cached and served with an ETag like the member earnings endpoint.
+
+    Returns:
+        - members: [{memberSlug, rank, potentialFromJobs, completedMissions,
+                     grandTotal, totalInteractions, jobCount}]
+        - teamPotentialFromJobs / teamCompletedMissions / teamGrandTotal
+        - jobSlugs: Active jobs included
+    """
+    async def compute() -> LeaderboardResponse:
+        return LeaderboardResponse(**await calculate_team_earnings())
+
+    try:
+        return await conditional_json_response(
+            request,
+            "leaderboard",
+            compute,
+            ttl=RESPONSE_TTL_EARNINGS,
+            tags=leaderboard_cache_tags
+        )
+
+    except GraphUnavailableError as e:
+        print(f"[compensation:get_earnings_leaderboard] Graph unavailable: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to calculate leaderboard: graph temporarily unavailable"
+        )
+    except Exception as e:
+        print(f"[compensation:get_earnings_leaderboard] Error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to calculate leaderboard: {str(e)}"
+        )
+
+
 @router.get("/api/compensation/mission-fund", response_model=MissionFundResponse)
-async def get_mission_fund_status():
+async def get_mission_fund_status(request: Request):
     """
     Get current mission fund balance and tier information.
 
+    Conditional GET: responses carry an ETag; send it back as If-None-Match
+    and an unchanged payload is answered with 304 Not Modified.
+
     Returns:
         - balance: Current mission fund balance
         - tier: Current tier number (1-4)
@@ -84,15 +349,15 @@ async def get_mission_fund_status():
         - tierEmoji: Emoji indicator (🟢, 🟡, 🟠, 🔴)
         - missionPayments: Current payment amounts for each mission type
     """
-    try:
+    async def compute() -> MissionFundResponse:
         # Get current tier and balance
-        tier, balance = get_current_tier()
+        tier, balance = await get_current_tier()
 
         # Get tier info
         tier_info = get_tier_info(tier)
 
         # Get all mission payments at current tier
-        mission_payments = get_all_mission_payments(tier)
+        mission_payments = await get_all_mission_payments(tier)
 
         return MissionFundResponse(
             balance=float(balance),
@@ -107,6 +372,21 @@ async def get_mission_fund_status():
             }
         )
 
+    try:
+        return await conditional_json_response(
+            request,
+            "mission-fund",
+            compute,
+            ttl=CACHE_TTL_FUND_BALANCE,
+            tags=lambda _: [cache_tag("U4_Account")]
+        )
+
+    except GraphUnavailableError as e:
+        print(f"[compensation:get_mission_fund_status] Graph unavailable: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to get mission fund status: graph temporarily unavailable"
+        )
     except Exception as e:
         print(f"[compensation:get_mission_fund_status] Error: {e}")
         raise HTTPException(
@@ -115,12 +395,53 @@ async def get_mission_fund_status():
         )
 
 
+@router.get("/api/compensation/jobs/earnings", response_model=JobsEarningsResponse)
+async def get_jobs_earnings(
+    jobs: List[str] = Query(..., description="Job slugs (repeat the parameter)"),
+    members: Optional[List[str]] = Query(None, description="Member slugs (default: everyone with interactions)")
+):
+    """
+    Get earnings breakdowns for several jobs in one graph round trip.
+
+    Batch form of /api/compensation/jobs/{job_slug}/earnings/{member_slug}
+    for boards of job cards.
+
+    Returns:
+        - jobs: [{jobSlug, jobName, teamTotal, members: [{memberSlug, earning, yourInteractions}]}]
+        - missing: Requested slugs that matched no job
+        - errors: [{jobSlug, detail}] for jobs that couldn't be computed
+          (e.g. interactions but no teamPool) - one bad card doesn't fail the board
+
+    Example:
+        GET /api/compensation/jobs/earnings?jobs=job-a&jobs=job-b&members=kara
+    """
+    if len(jobs) > MAX_BATCH_JOBS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_JOBS} jobs per request")
+
+    try:
+        return JobsEarningsResponse(**await calculate_jobs_earnings(jobs, members))
+
+    except GraphUnavailableError as e:
+        print(f"[compensation:get_jobs_earnings] Graph unavailable: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Failed to get job earnings: graph temporarily unavailable"
+        )
+    except Exception as e:
+        print(f"[compensation:get_jobs_earnings] Error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get job earnings: {str(e)}"
+        )
+
+
 @router.get("/api/compensation/jobs/{job_slug}/earnings/{member_slug}")
 async def get_job_specific_earnings(job_slug: str, member_slug: str):
     """
     Get member's earnings for a specific job.
 
-    Used by job card detail view to show interaction breakdown.
+    Used by job card detail view to show interaction breakdown. Boards
+    showing many cards use /api/compensation/jobs/earnings instead.
 
     Returns:
         - earning: Member's earning from this job
@@ -133,10 +454,10 @@ async def get_job_specific_earnings(job_slug: str, member_slug: str):
             calculate_member_job_earning
         )
 
-        interaction_counts = get_job_interaction_counts(job_slug)
+        interaction_counts = await get_job_interaction_counts(job_slug)
         your_interactions = interaction_counts.get(member_slug, 0)
         team_total = sum(interaction_counts.values())
-        earning = calculate_member_job_earning(job_slug, member_slug, interaction_counts)
+        earning = await calculate_member_job_earning(job_slug, member_slug, interaction_counts)
 
         return {
             'earning': float(earning),
@@ -165,7 +486,7 @@ async def compensation_health_check():
         - currentTier: Current tier number
     """
     try:
-        tier, balance = get_current_tier()
+        tier, balance = await get_current_tier()
 
         return {
             'status': 'ok',
@@ -0,0 +1,192 @@
+"""
+Mission Dashboard Router for Mission Deck
+
+One read for everything the mission page shows, instead of separate
+requests for the mission, its DoD checklist, its chat and the user's
+earnings (each re-authenticating and re-resolving the mission).
+
+Architecture:
+- GET /dashboard: Mission + DoD + recent mission chat + current user's earnings
+- The mission is resolved and access-checked once (get_current_user_mission)
+- Sections load concurrently, so the response takes about as long as the
+  slowest section; each reads through the graph result cache like its
+  standalone endpoint
+- ?sections=mission,dod loads only those sections
+- ?fields=mission.title,dod.completed returns only those fields of a
+  section (sections without listed fields are returned whole)
+"""
+
+import asyncio
+from typing import Dict, Optional, Set
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.mission_deck.chat import format_message_history_item
+from app.api.mission_deck.compensation import EarningsResponse
+from app.api.mission_deck.dependencies import get_current_user, get_current_user_mission, CurrentUser
+from app.api.mission_deck.dod import build_dod_list
+from app.api.mission_deck.missions import format_mission_response
+from app.api.mission_deck.services.compensation.earnings_calculator import calculate_member_full_earnings
+from app.api.mission_deck.services.graph import get_mission_dod_items, get_mission_messages, issue_sync_cursor
+from app.api.mission_deck.services.graph_resilience import GraphUnavailableError
+from app.api.mission_deck.schemas import (
+    DoDListResponse,
+    MessageHistoryResponse,
+    MissionDashboardResponse,
+    MissionResponse
+)
+
+router = APIRouter(prefix="/api/missions", tags=["Missions"])
+
+# Section name -> response model whose fields can be selected
+DASHBOARD_SECTIONS: Dict[str, type] = {
+    "mission": MissionResponse,
+    "dod": DoDListResponse,
+    "chat": MessageHistoryResponse,
+    "earnings": EarningsResponse,
+}
+
+# Most chat messages a dashboard returns
+MAX_DASHBOARD_MESSAGES = 100
+
+
+def parse_dashboard_selection(sections: Optional[str], fields: Optional[str]) -> Dict[str, Optional[Set[str]]]:
+    """
+    Parse ?sections= and ?fields= into {section: fields or None (all)}.
+
+    Args:
+        sections: Comma-separated section names (None = all sections)
+        fields: Comma-separated "<section>.<field>" entries
+
+    Returns:
+        Requested sections, in DASHBOARD_SECTIONS order, with their field sets
+
+    Raises:
+        ValueError: If a section or field is unknown, or a field's section wasn't requested
+    """
+    if sections:
+        requested = {name.strip() for name in sections.split(",") if name.strip()}
+        unknown = sorted(requested - DASHBOARD_SECTIONS.keys())
+        if unknown:
+            raise ValueError(
+                f"Unknown sections: {', '.join(unknown)}. Must be among: {', '.join(DASHBOARD_SECTIONS)}"
+            )
+    else:
+        requested = set(DASHBOARD_SECTIONS)
+
+    selection: Dict[str, Optional[Set[str]]] = {name: None for name in DASHBOARD_SECTIONS if name in requested}
+
+    for entry in (fields or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        section, _, field = entry.partition(".")
+        if section not in selection:
+            raise ValueError(f"Invalid field: {entry}. Use <section>.<field> for a requested section")
+        if field not in DASHBOARD_SECTIONS[section].model_fields:
+            raise ValueError(f"Unknown field for {section}: {field}")
+        selection[section] = (selection[section] or set()) | {field}
+
+    return selection
+
+
+async def _mission_section(mission: dict) -> MissionResponse:
+    return format_mission_response(mission)
+
+
+async def _dod_section(mission_id: str) -> DoDListResponse:
+    cursor = issue_sync_cursor()
+    return build_dod_list(await get_mission_dod_items(mission_id), cursor=cursor)
+
+
+async def _chat_section(mission_id: str, limit: int) -> MessageHistoryResponse:
+    messages = [format_message_history_item(msg) for msg in await get_mission_messages(mission_id, limit=limit)]
+    return MessageHistoryResponse(messages=messages, total=len(messages))
+
+
+async def _earnings_section(member_slug: str) -> EarningsResponse:
+    return EarningsResponse(**await calculate_member_full_earnings(member_slug))
+
+
+@router.get(
+    "/{mission_id}/dashboard",
+    response_model=MissionDashboardResponse,
+    response_model_exclude_unset=True
+)
+async def get_mission_dashboard(
+    mission_id: str,
+    sections: Optional[str] = None,
+    fields: Optional[str] = None,
+    chat_limit: int = 20,
+    current_user: CurrentUser = Depends(get_current_user),
+    mission: dict = Depends(get_current_user_mission)
+):
+    """
+    Get everything the mission page shows in one call.
+
+    Args:
+        mission_id: Mission slug (from URL)
+        sections: Comma-separated sections: mission, dod, chat, earnings (default all)
+        fields: Comma-separated "<section>.<field>" to trim sections (default whole sections)
+        chat_limit: Most recent mission chat messages to return (default 20, max 100)
+        current_user: Authenticated user (injected dependency)
+        mission: Mission node (injected dependency, includes auth check)
+
+    Returns:
+        MissionDashboardResponse with the requested sections only
+
+    Raises:
+        HTTPException 400: If a section, field or chat_limit is invalid
+        HTTPException 503: If the graph is unavailable
+        HTTPException 500: If a section fails to load
+
+    Example:
+        GET /api/missions/mission-47-telegram-bot/dashboard?sections=mission,dod&fields=mission.title,dod.completed
+        Authorization: Bearer <token>
+
+        Response:
+        {
+            "mission": {"title": "Telegram Notifier"},
+            "dod": {"completed": 1}
+        }
+    """
+    try:
+        selection = parse_dashboard_selection(sections, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if chat_limit < 1 or chat_limit > MAX_DASHBOARD_MESSAGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"chat_limit must be between 1 and {MAX_DASHBOARD_MESSAGES}"
+        )
+
+    loaders = {
+        "mission": lambda: _mission_section(mission),
+        "dod": lambda: _dod_section(mission_id),
+        "chat": lambda: _chat_section(mission_id, chat_limit),
+        "earnings": lambda: _earnings_section(current_user.slug),
+    }
+
+    try:
+        # Independent sections - overlap their round trips
+        models = await asyncio.gather(*(loaders[section]() for section in selection))
+
+    except GraphUnavailableError as e:
+        print(f"[routers/dashboard.py:get_mission_dashboard] Graph unavailable for {mission_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to load mission dashboard: graph temporarily unavailable"
+        )
+    except Exception as e:
+        # Fail loud
+        print(f"[routers/dashboard.py:get_mission_dashboard] Error loading dashboard for {mission_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to load mission dashboard"
+        )
+
+    return MissionDashboardResponse(**{
+        section: model.model_dump(mode="json", include=selection[section])
+        for section, model in zip(selection, models)
+    })
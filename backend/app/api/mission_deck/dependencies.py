@@ -6,16 +6,29 @@ Provides reusable dependencies for authentication and authorization.
 Dependencies:
 - get_current_user: Extracts and validates JWT from Authorization header
 - get_current_user_mission: Verifies user has access to requested mission
+
+Mission resolution is cached at two levels:
+- Shared: get_mission_by_slug reads through the graph result cache
+  (CACHE_TTL_MISSION), invalidated by the mission write paths (notes
+  update, DoD complete -> qa, complete_mission)
+- Per request: resolve_mission memoizes the node on request.state, so
+  every resolution after the first in a request is a dict lookup. The
+  memo is dropped when the graph cache generation moves (a write in the
+  same request), so a handler never sees the node from before its own write
+
+Only the mission node is cached - the access check runs against the
+current user on every call.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from jose import JWTError
-from typing import Dict
+from typing import Dict, Optional
 
 from app.api.mission_deck.auth import decode_access_token
 from app.api.mission_deck.services.graph import get_mission_by_slug
+from app.api.mission_deck.services.graph_cache import graph_cache
 
 # HTTP Bearer security scheme (Authorization: Bearer <token>)
 security = HTTPBearer()
@@ -80,8 +93,31 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         )
 
 
-def get_current_user_mission(
+async def resolve_mission(request: Request, mission_id: str) -> Optional[Dict]:
+    """
+    Get a mission node, memoized for the rest of the request.
+
+    Args:
+        request: Current request (the memo lives on request.state)
+        mission_id: Mission slug
+
+    Returns:
+        Mission node dict or None if not found (don't mutate - cached nodes are shared)
+    """
+    memo = getattr(request.state, "missions", None)
+    if memo is None or memo[0] != graph_cache.generation:
+        memo = (graph_cache.generation, {})
+        request.state.missions = memo
+
+    missions = memo[1]
+    if mission_id not in missions:
+        missions[mission_id] = await get_mission_by_slug(mission_id)
+    return missions[mission_id]
+
+
+async def get_current_user_mission(
     mission_id: str,
+    request: Request,
     current_user: CurrentUser = Depends(get_current_user)
 ) -> Dict:
     """
@@ -94,10 +130,11 @@ def get_current_user_mission(
 
     Args:
         mission_id: Mission slug from URL parameter
+        request: Current request (per-request mission memo)
         current_user: Current authenticated user (injected dependency)
 
     Returns:
-        Mission node dict from FalkorDB
+        Mission node dict from FalkorDB (cached - see resolve_mission)
 
     Raises:
         HTTPException 404: If mission not found
@@ -105,14 +142,14 @@ def get_current_user_mission(
 
     Usage:
         @app.get("/api/missions/{mission_id}")
-        def get_mission(
+        async def get_mission(
             mission_id: str,
             mission: Dict = Depends(get_current_user_mission)
         ):
             return mission
     """
-    # Query mission from FalkorDB
-    mission = get_mission_by_slug(mission_id)
+    # Query mission from FalkorDB (memoized per request, shared TTL cache behind it)
+    mission = await resolve_mission(request, mission_id)
 
     if not mission:
         raise HTTPException(
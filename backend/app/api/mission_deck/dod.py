@@ -4,7 +4,8 @@ DoD (Definition of Done) Router for Mission Deck
 Handles DoD checklist endpoints for mission completion tracking.
 
 Architecture:
-- GET /dod: List all DoD items for a mission
+- GET /dod: List all DoD items for a mission (?since= for changed items only)
+- PATCH /dod: Apply several item state changes at once (returns the checklist)
 - PATCH /dod/{item_id}: Toggle DoD item completion state
 - PATCH /dod/complete: Mark all items complete (transition to QA)
 - All endpoints require authentication + mission access
@@ -15,14 +16,23 @@ Implements: ALGORITHM.md Step 1.10
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from datetime import datetime
+from typing import List, Optional
 
 from app.api.mission_deck.dependencies import get_current_user, get_current_user_mission, CurrentUser
 from app.api.mission_deck.services.graph import (
+    complete_all_dod_tasks,
+    is_unsupported_query_error,
     get_mission_dod_items,
+    issue_sync_cursor,
     update_dod_task_state,
-    query_graph
+    update_dod_task_states,
+    validate_sync_cursor,
+    dod_task_state_statement,
+    query_graph_many
 )
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache
 from app.api.mission_deck.schemas import (
+    DoDBatchUpdateRequest,
     DoDListResponse,
     DoDItemResponse,
     DoDUpdateRequest,
@@ -65,23 +75,57 @@ def format_dod_item(task_node: dict) -> DoDItemResponse:
     )
 
 
+def build_dod_list(dod_items: List[dict], cursor: Optional[str] = None, since: Optional[str] = None) -> DoDListResponse:
+    """
+    Build the checklist response from DoD task nodes.
+
+    Args:
+        dod_items: The mission's whole checklist (get_mission_dod_items order)
+        cursor: Next sync cursor, issued before dod_items were read (issue_sync_cursor)
+        since: Sync cursor - only items updated after it are listed; total
+               and completed still cover the whole checklist
+
+    Returns:
+        DoDListResponse
+    """
+    formatted_items = [format_dod_item(item) for item in dod_items]
+
+    return DoDListResponse(
+        items=[
+            formatted for item, formatted in zip(dod_items, formatted_items)
+            if since is None or (isinstance(item.get("updated_at"), str) and item["updated_at"] > since)
+        ],
+        total=len(formatted_items),
+        completed=sum(1 for item in formatted_items if item.completed),
+        cursor=cursor
+    )
+
+
 @router.get("/{mission_id}/dod", response_model=DoDListResponse)
 async def list_dod_items(
     mission_id: str,
+    since: Optional[str] = None,
     current_user: CurrentUser = Depends(get_current_user),
     mission: dict = Depends(get_current_user_mission)
 ):
     """
     Get DoD checklist items for a mission.
 
+    Delta sync: send the response's cursor back as ?since= to get only the
+    items updated after it (DoD items are never removed, so no tombstones).
+
     Args:
         mission_id: Mission slug (from URL)
+        since: Cursor from a previous response (None = whole checklist)
         current_user: Authenticated user (injected dependency)
         mission: Mission node (injected dependency, includes auth check)
 
     Returns:
         DoDListResponse with list of DoD items and completion stats
 
+    Raises:
+        HTTPException 400: If the cursor is invalid
+
     Example:
         GET /api/missions/mission-47-telegram-bot/dod
         Authorization: Bearer <token>
@@ -122,21 +166,20 @@ async def list_dod_items(
             "completed": 1
         }
     """
-    try:
-        # Get DoD items from FalkorDB
-        dod_items = get_mission_dod_items(mission_id)
+    if since is not None:
+        try:
+            since = validate_sync_cursor(since)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-        # Format items
-        formatted_items = [format_dod_item(item) for item in dod_items]
+    try:
+        cursor = issue_sync_cursor()
 
-        # Count completed items
-        completed_count = sum(1 for item in formatted_items if item.completed)
+        # Get DoD items from FalkorDB (a checklist is small and cached - the
+        # since filter runs here rather than as its own query)
+        dod_items = await get_mission_dod_items(mission_id)
 
-        return DoDListResponse(
-            items=formatted_items,
-            total=len(formatted_items),
-            completed=completed_count
-        )
+        return build_dod_list(dod_items, cursor=cursor, since=since)
 
     except Exception as e:
         # Fail loud
@@ -147,84 +190,116 @@ async def list_dod_items(
         )
 
 
-@router.patch("/{mission_id}/dod/{item_id}", response_model=DoDUpdateResponse)
-async def toggle_dod_item(
+@router.patch("/{mission_id}/dod", response_model=DoDListResponse)
+async def update_dod_items(
     mission_id: str,
-    item_id: str,
-    request: DoDUpdateRequest,
+    request: DoDBatchUpdateRequest,
     current_user: CurrentUser = Depends(get_current_user),
     mission: dict = Depends(get_current_user_mission)
 ):
     """
-    Toggle DoD item completion state.
+    Apply several DoD item state changes in one write.
+
+    Lets the checklist UI debounce rapid toggles into one request instead
+    of one toggle_dod_item call per click.
 
     Args:
         mission_id: Mission slug (from URL)
-        item_id: DoD task slug (from URL)
-        request: DoDUpdateRequest with desired completion state
+        request: DoDBatchUpdateRequest with {item_id, state} changes
         current_user: Authenticated user (injected dependency)
         mission: Mission node (injected dependency, includes auth check)
 
     Returns:
-        DoDUpdateResponse with updated item state
+        DoDListResponse with the whole updated checklist
 
     Raises:
-        HTTPException 404: If item not found or not part of this mission
+        HTTPException 404: If an item is not part of this mission (nothing is updated)
         HTTPException 500: If update fails
 
     Example:
-        PATCH /api/missions/mission-47-telegram-bot/dod/mission-47-task-1
+        PATCH /api/missions/mission-47-telegram-bot/dod
         Authorization: Bearer <token>
         {
-            "completed": true
+            "changes": [
+                {"item_id": "mission-47-task-1", "state": "done"},
+                {"item_id": "mission-47-task-2", "state": "todo"}
+            ]
         }
 
-        Response:
-        {
-            "id": "mission-47-task-1",
-            "completed": True,
-            "completed_at": "2025-11-05T15:00:00Z"
-        }
+        Response: same shape as GET /api/missions/{mission_id}/dod
     """
     try:
-        # Map completed bool to Cypher state
-        new_state = "done" if request.completed else "todo"
-
-        # Update task state in FalkorDB
-        updated_task = update_dod_task_state(item_id, new_state)
+        # A later change to the same item wins (debounced clicks)
+        changes = {change.item_id: change.state for change in request.changes}
 
-        # Parse completion timestamp
-        updated_at = updated_task.get("updated_at")
-        completed_at = None
-        if request.completed and updated_at:
-            if isinstance(updated_at, str):
-                try:
-                    completed_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    completed_at = None
-
-        return DoDUpdateResponse(
-            id=updated_task.get("slug"),
-            completed=request.completed,
-            completed_at=completed_at
-        )
-
-    except Exception as e:
-        # Check if error is "task not found"
-        if "not found" in str(e).lower():
+        # Reject unknown items before writing anything (checklist read is cached)
+        known_slugs = {item.get("slug") for item in await get_mission_dod_items(mission_id)}
+        unknown = [slug for slug in changes if slug not in known_slugs]
+        if unknown:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="DoD item not found"
+                detail=f"DoD items not found: {', '.join(unknown)}"
             )
 
+        # One UNWIND statement applies every change and returns the checklist
+        cursor = issue_sync_cursor()
+        dod_items = await update_dod_task_states(mission_id, changes)
+
+        return build_dod_list(dod_items, cursor=cursor)
+
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions
+
+    except Exception as e:
         # Fail loud
-        print(f"[routers/dod.py:toggle_dod_item] Error updating DoD item: {e}")
+        print(f"[routers/dod.py:update_dod_items] Error updating DoD items: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update DoD item"
+            detail="Failed to update DoD items"
         )
 
 
+async def _complete_dod_items_batched(mission_id: str) -> Optional[dict]:
+    """
+    Fallback for mark_all_dod_complete: one update per unfinished item plus
+    the mission transition, shipped as one query_graph_many batch.
+    """
+    # Get all current DoD items
+    dod_items = await get_mission_dod_items(mission_id)
+
+    # Only update items not already done
+    pending_slugs = [
+        item.get("slug") for item in dod_items
+        if item.get("state", "todo") != "done"
+    ]
+
+    # Update mission status to QA
+    cypher = """
+    MATCH (m:U4_Work_Item {slug: $slug, scope_ref: 'scopelock'})
+    SET m.state = 'qa',
+        m.updated_at = $updated_at
+    RETURN m.state as new_state
+    """
+
+    # Item updates + mission transition are independent - ship as one batch
+    statements = [dod_task_state_statement(slug, "done") for slug in pending_slugs]
+    statements.append((cypher, {"slug": mission_id, "updated_at": datetime.utcnow().isoformat() + 'Z'}))
+    try:
+        results = await query_graph_many(statements)
+    finally:
+        invalidate_graph_cache([cache_tag("U4_Work_Item", mission_id)])
+
+    item_results, mission_results = results[:-1], results[-1]
+    if not mission_results:
+        return None
+
+    return {
+        "new_state": mission_results[0].get("new_state"),
+        "completed_count": sum(1 for rows in item_results if rows)
+    }
+
+
+# Declared before /dod/{item_id} - routes match in order, and "complete" is a valid item_id
 @router.patch("/{mission_id}/dod/complete", response_model=dict)
 async def mark_all_dod_complete(
     mission_id: str,
@@ -246,6 +321,7 @@ async def mark_all_dod_complete(
         Success response with updated mission status
 
     Raises:
+        HTTPException 404: If mission not found
         HTTPException 500: If update fails
 
     Example:
@@ -260,46 +336,31 @@ async def mark_all_dod_complete(
         }
     """
     try:
-        # Get all current DoD items
-        dod_items = get_mission_dod_items(mission_id)
-
-        # Mark each item as complete
-        completed_count = 0
-        for item in dod_items:
-            try:
-                item_slug = item.get("slug")
-                item_state = item.get("state", "todo")
-
-                # Only update if not already done
-                if item_state != "done":
-                    update_dod_task_state(item_slug, "done")
-                    completed_count += 1
-            except Exception as item_error:
-                # Log but continue with other items (fail-loud but don't crash)
-                print(f"[routers/dod.py:mark_all_dod_complete] Failed to mark item {item.get('slug')} complete: {item_error}")
-
-        # Update mission status to QA
-        cypher = """
-        MATCH (m:U4_Work_Item {slug: $slug, scope_ref: 'scopelock'})
-        SET m.state = 'qa',
-            m.updated_at = datetime()
-        RETURN m.state as new_state
-        """
-
         try:
-            results = query_graph(cypher, {"slug": mission_id})
-            new_state = results[0].get("new_state") if results else "unknown"
+            # Set-based: every unfinished task + the mission transition in one batch
+            result = await complete_all_dod_tasks(mission_id)
         except Exception as e:
-            # Log error but still return success (items were marked complete)
-            print(f"[routers/dod.py:mark_all_dod_complete] Failed to update mission status: {e}")
-            new_state = "qa"
+            # Only a graph that rejects the set-based form falls back; real errors fail loud
+            if not is_unsupported_query_error(e):
+                raise
+            print(f"[routers/dod.py:mark_all_dod_complete] Set-based completion unsupported, updating items one by one: {e}")
+            result = await _complete_dod_items_batched(mission_id)
+
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Mission not found"
+            )
 
         return {
             "message": "All DoD items marked complete",
-            "mission_status": new_state or "qa",
-            "completed_count": completed_count
+            "mission_status": result["new_state"] or "qa",
+            "completed_count": result["completed_count"]
         }
 
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions
+
     except Exception as e:
         # Fail loud
         print(f"[routers/dod.py:mark_all_dod_complete] Error marking all items complete: {e}")
@@ -307,3 +368,81 @@ async def mark_all_dod_complete(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to mark all DoD items complete"
         )
+
+
+@router.patch("/{mission_id}/dod/{item_id}", response_model=DoDUpdateResponse)
+async def toggle_dod_item(
+    mission_id: str,
+    item_id: str,
+    request: DoDUpdateRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    mission: dict = Depends(get_current_user_mission)
+):
+    """
+    Toggle DoD item completion state.
+
+    Args:
+        mission_id: Mission slug (from URL)
+        item_id: DoD task slug (from URL)
+        request: DoDUpdateRequest with desired completion state
+        current_user: Authenticated user (injected dependency)
+        mission: Mission node (injected dependency, includes auth check)
+
+    Returns:
+        DoDUpdateResponse with updated item state
+
+    Raises:
+        HTTPException 404: If item not found or not part of this mission
+        HTTPException 500: If update fails
+
+    Example:
+        PATCH /api/missions/mission-47-telegram-bot/dod/mission-47-task-1
+        Authorization: Bearer <token>
+        {
+            "completed": true
+        }
+
+        Response:
+        {
+            "id": "mission-47-task-1",
+            "completed": True,
+            "completed_at": "2025-11-05T15:00:00Z"
+        }
+    """
+    try:
+        # Map completed bool to Cypher state
+        new_state = "done" if request.completed else "todo"
+
+        # Update task state in FalkorDB
+        updated_task = await update_dod_task_state(item_id, new_state, mission_slug=mission_id)
+
+        # Parse completion timestamp
+        updated_at = updated_task.get("updated_at")
+        completed_at = None
+        if request.completed and updated_at:
+            if isinstance(updated_at, str):
+                try:
+                    completed_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+                except (ValueError, AttributeError):
+                    completed_at = None
+
+        return DoDUpdateResponse(
+            id=updated_task.get("slug"),
+            completed=request.completed,
+            completed_at=completed_at
+        )
+
+    except Exception as e:
+        # Check if error is "task not found"
+        if "not found" in str(e).lower():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="DoD item not found"
+            )
+
+        # Fail loud
+        print(f"[routers/dod.py:toggle_dod_item] Error updating DoD item: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update DoD item"
+        )
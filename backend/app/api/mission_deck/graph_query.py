@@ -7,7 +7,12 @@ Useful for browser-based testing and debugging.
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
+from app.config import settings
+from app.api.mission_deck.services.compensation.tier_calculator import fund_snapshot
 from app.api.mission_deck.services.graph import query_graph
+from app.api.mission_deck.services.graph_cache import clear_graph_caches, get_graph_cache_stats
+from app.api.mission_deck.services.graph_metrics import get_slow_queries
+from app.api.mission_deck.services.graph_resilience import is_read_only
 
 router = APIRouter(prefix="/api/graph", tags=["Graph"])
 
@@ -40,8 +45,14 @@ async def get_query_graph(
         if limit and "LIMIT" not in cypher.upper():
             cypher = f"{cypher} LIMIT {limit}"
 
-        # Execute query
-        results = query_graph(cypher)
+        # Execute query (an ad-hoc write may touch anything - drop every cache;
+        # reads leave them alone so debugging doesn't cost other users their hits)
+        try:
+            results = await query_graph(cypher)
+        finally:
+            if not is_read_only(cypher):
+                clear_graph_caches()
+                fund_snapshot.invalidate()
 
         return {
             "success": True,
@@ -63,3 +74,58 @@ async def get_query_graph(
             status_code=400,
             detail=f"Query failed: {str(e)}"
         )
+
+
+@router.get("/cache")
+async def get_graph_cache_status():
+    """
+    Get graph result cache counters (hits, misses, evictions, occupancy).
+
+    Used to tune per-query TTLs and the cache memory bound.
+
+    Example:
+        GET /api/graph/cache
+
+        Response:
+        {
+            "enabled": true,
+            "hits": 1520,
+            "misses": 310,
+            "hitRate": 0.8306,
+            ...
+        }
+    """
+    return get_graph_cache_stats()
+
+
+@router.get("/slow-queries")
+async def get_graph_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum entries to return")
+):
+    """
+    Get the slow-query log (queries slower than GRAPH_SLOW_QUERY_MS), newest first.
+
+    Entries carry the query text and parameter names - never parameter values.
+
+    Example:
+        GET /api/graph/slow-queries?limit=10
+
+        Response:
+        {
+            "thresholdMs": 500.0,
+            "queries": [
+                {
+                    "caller": "earnings_calculator:get_job_interaction_counts",
+                    "fingerprint": "3f2a9c1b7d4e",
+                    "durationMs": 812.4,
+                    "rows": 14,
+                    "query": "MATCH (job:U4_Work_Item {slug: $job_slug}) ...",
+                    ...
+                }
+            ]
+        }
+    """
+    return {
+        "thresholdMs": settings.graph_slow_query_ms,
+        "queries": get_slow_queries(limit)
+    }
@@ -9,16 +9,27 @@ Architecture:
 - Mission data from FalkorDB (U4_Work_Item nodes)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import List, Optional
 from datetime import datetime
 
 from app.api.mission_deck.dependencies import get_current_user, get_current_user_mission, CurrentUser
-from app.api.mission_deck.services.graph import get_user_missions, query_graph
+from app.api.mission_deck.services.conditional_get import conditional_json_response
+from app.api.mission_deck.services.graph import (
+    ACTIVE_MISSION_STATES,
+    CACHE_TTL_USER_MISSIONS,
+    get_user_missions,
+    get_user_missions_changed_since,
+    issue_sync_cursor,
+    query_graph,
+    validate_sync_cursor
+)
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache
 from app.api.mission_deck.schemas import (
     MissionResponse,
     MissionListResponse,
     MissionStackResponse,
+    MissionTombstone,
     MissionNotesRequest
 )
 
@@ -72,15 +83,32 @@ def format_mission_response(mission_node: dict) -> MissionResponse:
 
 
 @router.get("", response_model=MissionListResponse)
-async def list_missions(current_user: CurrentUser = Depends(get_current_user)):
+async def list_missions(
+    request: Request,
+    since: Optional[str] = None,
+    current_user: CurrentUser = Depends(get_current_user)
+):
     """
     List all missions for authenticated user.
 
+    Conditional GET: responses carry an ETag; send it back as If-None-Match
+    and an unchanged list is answered with 304 Not Modified.
+
+    Delta sync: every response carries a cursor. Send it back as ?since=
+    to get only missions updated after it, plus tombstones (removed) for
+    missions that left todo/doing - merge them into the previous list by
+    id (missions changed just before the cursor may be sent again).
+
     Args:
+        request: Incoming request (If-None-Match header)
+        since: Cursor from a previous response (None = full list)
         current_user: Authenticated user (injected dependency)
 
     Returns:
-        MissionListResponse with list of missions
+        MissionListResponse with list of missions (changed ones only with since)
+
+    Raises:
+        HTTPException 400: If the cursor is invalid
 
     Example:
         GET /api/missions
@@ -100,19 +128,57 @@ async def list_missions(current_user: CurrentUser = Depends(get_current_user)):
                     ...
                 }
             ],
-            "total": 1
+            "total": 1,
+            "removed": [],
+            "cursor": "2025-11-05T15:30:00.123456Z"
         }
+
+        GET /api/missions?since=2025-11-05T15:30:00.123456Z
+        -> only missions updated since, e.g. "removed": [{"id": "mission-12", "status": "qa"}]
     """
-    try:
-        # Get missions from FalkorDB
-        missions = get_user_missions(current_user.slug)
+    if since is not None:
+        try:
+            since = validate_sync_cursor(since)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def compute() -> MissionListResponse:
+        # Issued before reading: the next delta covers whatever this read may have missed
+        cursor = issue_sync_cursor()
+
+        if since is None:
+            # Get missions from FalkorDB
+            missions = await get_user_missions(current_user.slug)
+            removed = []
+        else:
+            # Only missions updated since the cursor (updated_at index)
+            changed = await get_user_missions_changed_since(current_user.slug, since)
+            missions = [m for m in changed if m.get("state") in ACTIVE_MISSION_STATES]
+            removed = [
+                MissionTombstone(id=m.get("slug"), status=m.get("state") or "unknown")
+                for m in changed if m.get("state") not in ACTIVE_MISSION_STATES
+            ]
 
         # Format responses
         formatted_missions = [format_mission_response(m) for m in missions]
 
         return MissionListResponse(
             missions=formatted_missions,
-            total=len(formatted_missions)
+            total=len(formatted_missions),
+            removed=removed,
+            cursor=cursor
+        )
+
+    try:
+        # Collection read: any U4_Work_Item write may change it
+        return await conditional_json_response(
+            request,
+            f"missions:{current_user.slug}" if since is None else f"missions:{current_user.slug}:since:{since}",
+            compute,
+            ttl=CACHE_TTL_USER_MISSIONS,
+            tags=lambda _: [cache_tag("U4_Work_Item")],
+            # An older cursor is still valid - an unchanged list stays 304
+            etag_exclude={"cursor"}
         )
 
     except Exception as e:
@@ -205,14 +271,19 @@ async def update_mission_notes(
         cypher = """
         MATCH (m:U4_Work_Item {slug: $slug, scope_ref: 'scopelock'})
         SET m.notes = $notes,
-            m.updated_at = datetime()
+            m.updated_at = $updated_at
         RETURN m.updated_at as updated_at
         """
 
-        results = query_graph(cypher, {
-            "slug": mission_id,
-            "notes": request.notes
-        })
+        try:
+            # Timestamp from Python like the other mission writes (delta sync compares updated_at)
+            results = await query_graph(cypher, {
+                "slug": mission_id,
+                "notes": request.notes,
+                "updated_at": datetime.utcnow().isoformat() + 'Z'
+            })
+        finally:
+            invalidate_graph_cache([cache_tag("U4_Work_Item", mission_id)])
 
         if not results:
             raise HTTPException(
@@ -128,16 +128,26 @@ class MissionResponse(BaseModel):
         }
 
 
+class MissionTombstone(BaseModel):
+    """Mission that left the developer's list since the sync cursor."""
+    id: str = Field(..., description="Mission unique identifier (slug)")
+    status: str = Field(..., description="State it moved to (e.g. qa, done)")
+
+
 class MissionListResponse(BaseModel):
     """List of missions response."""
-    missions: List[MissionResponse] = Field(..., description="List of missions")
-    total: int = Field(..., description="Total number of missions")
+    missions: List[MissionResponse] = Field(..., description="List of missions (only changed ones with ?since=)")
+    total: int = Field(..., description="Total number of missions in this response")
+    removed: List[MissionTombstone] = Field(default_factory=list, description="Missions to drop (?since= only)")
+    cursor: Optional[str] = Field(None, description="Pass as ?since= to get only later changes")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "missions": [],
-                "total": 0
+                "total": 0,
+                "removed": [],
+                "cursor": "2025-11-05T15:30:00.123456Z"
             }
         }
 
@@ -269,13 +279,15 @@ class DoDListResponse(BaseModel):
     items: List[DoDItemResponse] = Field(..., description="DoD checklist items")
     total: int = Field(..., description="Total number of items")
     completed: int = Field(..., description="Number of completed items")
+    cursor: Optional[str] = Field(None, description="Pass as ?since= to get only later changes")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "items": [],
                 "total": 0,
-                "completed": 0
+                "completed": 0,
+                "cursor": "2025-11-05T15:00:00.123456Z"
             }
         }
 
@@ -308,6 +320,50 @@ class DoDUpdateResponse(BaseModel):
         }
 
 
+class DoDItemChange(BaseModel):
+    """One DoD item state change in a batch update."""
+    item_id: str = Field(..., min_length=1, description="DoD task slug")
+    state: str = Field(..., pattern="^(todo|doing|done)$", description="New state (todo/doing/done)")
+
+
+class DoDBatchUpdateRequest(BaseModel):
+    """Request to apply several DoD item state changes at once."""
+    changes: List[DoDItemChange] = Field(
+        ..., min_length=1, max_length=100,
+        description="State changes (a later change to the same item wins)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "changes": [
+                    {"item_id": "mission-47-task-1", "state": "done"},
+                    {"item_id": "mission-47-task-2", "state": "todo"}
+                ]
+            }
+        }
+
+
+# ============================================================================
+# Mission Dashboard Schemas
+# ============================================================================
+
+class MissionDashboardResponse(BaseModel):
+    """Mission page payload; only the requested sections (and fields) are present."""
+    mission: Optional[Dict[str, Any]] = Field(None, description="MissionResponse fields")
+    dod: Optional[Dict[str, Any]] = Field(None, description="DoDListResponse fields")
+    chat: Optional[Dict[str, Any]] = Field(None, description="MessageHistoryResponse fields (recent mission chat)")
+    earnings: Optional[Dict[str, Any]] = Field(None, description="Current user's EarningsResponse fields")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "mission": {"id": "mission-47-telegram-bot", "title": "Telegram Notifier", "status": "doing"},
+                "dod": {"total": 4, "completed": 1}
+            }
+        }
+
+
 # ============================================================================
 # Error Schemas
 # ============================================================================
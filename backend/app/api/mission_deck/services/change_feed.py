@@ -0,0 +1,110 @@
+"""
+In-process change notifications for push endpoints
+
+Writers publish what they changed (a chat message about a job, a mission
+status, the mission fund balance); streaming endpoints subscribe and
+recompute only when something relevant changed, instead of clients
+polling.
+
+Architecture:
+- Events are (topic, key) pairs, e.g. ("interactions", "job-1") or
+  ("fund", None); key None means "anything under this topic"
+- Each subscription keeps the set of distinct events since its last
+  drain, so a burst of writes is one wake-up, and memory stays bounded
+- publish() is safe from any thread: delivery is scheduled onto the
+  subscriber's event loop
+- Per-process: writes handled by another uvicorn worker, or by CLI tools
+  and scripts (emma's mission completions, fund adjustments), are never
+  seen here - subscribers poll a cross-process signal and refresh
+  periodically to catch those
+"""
+
+import asyncio
+import threading
+from typing import Optional, Set, Tuple
+
+
+# Topics
+TOPIC_INTERACTIONS = "interactions"  # key: work item slug a chat message was linked to
+TOPIC_MISSIONS = "missions"          # key: member slug whose mission status changed
+TOPIC_FUND = "fund"                  # key: None (mission fund balance / tier)
+
+ChangeEvent = Tuple[str, Optional[str]]
+
+
+class Subscription:
+    """One subscriber's pending events and wake-up signal."""
+
+    def __init__(self, feed: "ChangeFeed", loop: asyncio.AbstractEventLoop):
+        self._feed = feed
+        self._loop = loop
+        self._pending: Set[ChangeEvent] = set()
+        self._wakeup = asyncio.Event()
+
+    def _deliver(self, event: ChangeEvent) -> None:
+        # Runs on the subscriber's loop
+        self._pending.add(event)
+        self._wakeup.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for events; False if the timeout passed with none pending."""
+        if self._pending:
+            return True
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def drain(self) -> Set[ChangeEvent]:
+        """Take every pending event."""
+        events, self._pending = self._pending, set()
+        self._wakeup.clear()
+        return events
+
+    def close(self) -> None:
+        self._feed._unsubscribe(self)
+
+
+class ChangeFeed:
+    """Fan-out of change events to every live subscription."""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self) -> Subscription:
+        """Subscribe from a coroutine; close() the subscription when done."""
+        subscription = Subscription(self, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, topic: str, key: Optional[str] = None) -> None:
+        """Notify every subscriber of a change (never raises)."""
+        self.published += 1
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, (topic, key))
+            except RuntimeError:
+                # Subscriber's loop already closed - it will never drain
+                self._unsubscribe(subscription)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+
+# Global feed (one per worker process)
+change_feed = ChangeFeed()
+
+
+def publish_change(topic: str, key: Optional[str] = None) -> None:
+    """Publish a change event to the process-wide feed."""
+    change_feed.publish(topic, key)
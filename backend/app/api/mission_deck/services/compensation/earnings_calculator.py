@@ -4,15 +4,27 @@ Earnings Calculator
 Calculates member earnings from job interactions and completed missions.
 Formula: (member_interactions / team_total_interactions) × job.teamPool
 
+Potential earnings across all active jobs come from one query
+(get_active_job_interaction_counts) - every job's teamPool and per-member
+message counts - with the shares computed here, instead of 2 round trips
+per job. Message counts are read from the materialized job × member
+counters (interaction_counters.py), not recounted from chat history.
+
+The team leaderboard (calculate_team_earnings) reuses the same job query
+and one completed-mission aggregation for every member at once, in
+integer cents.
+
 Maps to: docs/missions/mission-deck-compensation/ALGORITHM.md Step 2
 """
 
+import asyncio
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.api.mission_deck.services.graph import query_graph
+from app.api.mission_deck.services.graph_resilience import GraphUnavailableError
 
 
-def get_job_interaction_counts(job_slug: str) -> Dict[str, int]:
+async def get_job_interaction_counts(job_slug: str) -> Dict[str, int]:
     """
     Get interaction counts for all members on a specific job.
 
@@ -23,19 +35,17 @@ def get_job_interaction_counts(job_slug: str) -> Dict[str, int]:
         Dict mapping member_slug to interaction count
         Example: {'member_a': 10, 'member_b': 5}
 
-    Note: Counts U4_Event nodes with event_kind='message' linked to job
+    Note: Reads the job's U4_Interaction_Counter nodes (one per member),
+    which count U4_Event nodes with event_kind='message' linked to the job
     """
     cypher = """
-    MATCH (job:U4_Work_Item {slug: $job_slug, work_type: 'job', scope_ref: 'scopelock'})
-    OPTIONAL MATCH (job)<-[:U4_ABOUT]-(msg:U4_Event)
-    WHERE msg.event_kind = 'message' AND msg.scope_ref = 'scopelock'
-    WITH job, msg
-    WHERE msg IS NOT NULL
-    RETURN msg.actor_ref AS member_slug, count(msg) AS interaction_count
+    MATCH (counter:U4_Interaction_Counter {job_slug: $job_slug, scope_ref: 'scopelock'})
+    WHERE counter.count > 0
+    RETURN counter.member_slug AS member_slug, counter.count AS interaction_count
     """
 
     try:
-        results = query_graph(cypher, {"job_slug": job_slug})
+        results = await query_graph(cypher, {"job_slug": job_slug})
 
         interaction_counts = {}
         for row in results:
@@ -51,7 +61,7 @@ def get_job_interaction_counts(job_slug: str) -> Dict[str, int]:
         raise
 
 
-def get_job_team_pool(job_slug: str) -> Decimal:
+async def get_job_team_pool(job_slug: str) -> Decimal:
     """
     Get team pool amount for a job (30% of job value).
 
@@ -70,7 +80,7 @@ def get_job_team_pool(job_slug: str) -> Decimal:
     """
 
     try:
-        results = query_graph(cypher, {"job_slug": job_slug})
+        results = await query_graph(cypher, {"job_slug": job_slug})
 
         if not results or 'team_pool' not in results[0]:
             raise ValueError(f"Job not found or missing teamPool: {job_slug}")
@@ -83,7 +93,7 @@ def get_job_team_pool(job_slug: str) -> Decimal:
         raise
 
 
-def calculate_member_job_earning(
+async def calculate_member_job_earning(
     job_slug: str,
     member_slug: str,
     interaction_counts: Optional[Dict[str, int]] = None
@@ -108,7 +118,7 @@ def calculate_member_job_earning(
     """
     # Get interaction counts (use provided or fetch)
     if interaction_counts is None:
-        interaction_counts = get_job_interaction_counts(job_slug)
+        interaction_counts = await get_job_interaction_counts(job_slug)
 
     member_interactions = interaction_counts.get(member_slug, 0)
 
@@ -123,36 +133,70 @@ def calculate_member_job_earning(
         return Decimal('0.00')
 
     # Get team pool
-    team_pool = get_job_team_pool(job_slug)
+    team_pool = await get_job_team_pool(job_slug)
+
+    return compute_share(member_interactions, team_total, team_pool)
+
+
+def compute_share(member_interactions: int, team_total: int, team_pool: Decimal) -> Decimal:
+    """
+    Member's share of a team pool, rounded to cents.
+
+    Args:
+        member_interactions: Member's message count on the job
+        team_total: All members' message count on the job
+        team_pool: Job team pool
+
+    Returns:
+        (member_interactions / team_total) × team_pool, or $0 with no interactions
+    """
+    if member_interactions == 0 or team_total == 0:
+        return Decimal('0.00')
 
-    # Calculate member's share
-    member_share = Decimal(member_interactions) / Decimal(team_total)
-    earning = member_share * team_pool
+    # Multiply before dividing: exact whenever the share is a whole number of
+    # sub-cents, so ties round the same as compute_share_cents
+    earning = Decimal(member_interactions) * team_pool / Decimal(team_total)
 
     # Round to 2 decimal places (cents)
-    earning = earning.quantize(Decimal('0.01'))
+    return earning.quantize(Decimal('0.01'))
+
+
+def to_cents(amount) -> int:
+    """Dollar amount (float, Decimal or str) as integer cents."""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal('1')))
 
-    return earning
 
+def compute_share_cents(member_interactions: int, team_total: int, team_pool_cents: int) -> int:
+    """
+    Integer-cent version of compute_share (same banker's rounding).
 
-def get_all_active_jobs() -> List[Dict]:
+    Returns:
+        round(member_interactions × team_pool_cents / team_total), half to even
+    """
+    if member_interactions == 0 or team_total == 0:
+        return 0
+
+    share, remainder = divmod(member_interactions * team_pool_cents, team_total)
+    if remainder * 2 > team_total or (remainder * 2 == team_total and share % 2):
+        share += 1
+    return share
+
+
+async def get_all_active_jobs() -> List[Dict]:
     """
     Get all active jobs (status='active').
 
     Returns:
         List of job dicts with slug, value, teamPool
-
-    Note: Limited to 50 jobs to prevent memory issues on free tier hosting
     """
     cypher = """
     MATCH (job:U4_Work_Item {work_type: 'job', scope_ref: 'scopelock'})
     WHERE job.status = 'active'
     RETURN job.slug AS slug, job.value AS value, job.teamPool AS team_pool, job.name AS name
-    LIMIT 50
     """
 
     try:
-        results = query_graph(cypher)
+        results = await query_graph(cypher)
         return [
             {
                 'slug': row['slug'],
@@ -168,7 +212,128 @@ def get_all_active_jobs() -> List[Dict]:
         raise
 
 
-def calculate_member_total_potential_earnings(member_slug: str) -> Dict:
+async def get_active_job_interaction_counts() -> List[Dict]:
+    """
+    Get every active job with its team pool and per-member interaction counts.
+
+    One query for all jobs (replaces get_all_active_jobs plus
+    get_job_interaction_counts/get_job_team_pool per job): an indexed
+    counter lookup per job, independent of chat history size.
+
+    Returns:
+        List of job dicts with slug, name, value, teamPool and
+        interactionCounts (member_slug -> count, same as get_job_interaction_counts)
+        Example: [{'slug': 'job-1', 'name': 'Chatbot', 'value': 1500, 'teamPool': 450.0,
+                   'interactionCounts': {'member_a': 10, 'member_b': 5}}]
+    """
+    cypher = """
+    MATCH (job:U4_Work_Item {work_type: 'job', scope_ref: 'scopelock'})
+    WHERE job.status = 'active'
+    OPTIONAL MATCH (counter:U4_Interaction_Counter {job_slug: job.slug, scope_ref: 'scopelock'})
+    RETURN job.slug AS slug, job.name AS name, job.value AS value, job.teamPool AS team_pool,
+           collect([counter.member_slug, counter.count]) AS counts
+    ORDER BY slug
+    """
+
+    try:
+        results = await query_graph(cypher)
+        return [
+            {
+                'slug': row['slug'],
+                'name': row.get('name', row['slug']),
+                'value': row['value'],
+                'teamPool': row['team_pool'],
+                'interactionCounts': {
+                    member_slug: count
+                    for member_slug, count in row['counts']
+                    if member_slug and count
+                }
+            }
+            for row in results
+        ]
+
+    except Exception as e:
+        print(f"[earnings_calculator:get_active_job_interaction_counts] Error: {e}")
+        raise
+
+
+async def get_jobs_interaction_counts(job_slugs: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Get team pool and per-member interaction counts for the given jobs, in one query.
+
+    The batch form of get_job_interaction_counts + get_job_team_pool (job
+    cards), whatever the job's status.
+
+    Args:
+        job_slugs: Job slugs
+
+    Returns:
+        Dict mapping each slug to a job dict (slug, name, value, teamPool,
+        interactionCounts - same shape as get_active_job_interaction_counts)
+        or None if no such job exists
+    """
+    cypher = """
+    UNWIND $job_slugs AS job_slug
+    OPTIONAL MATCH (job:U4_Work_Item {slug: job_slug, work_type: 'job', scope_ref: 'scopelock'})
+    OPTIONAL MATCH (counter:U4_Interaction_Counter {job_slug: job_slug, scope_ref: 'scopelock'})
+    RETURN job_slug AS slug, job.slug AS found, job.name AS name, job.value AS value,
+           job.teamPool AS team_pool, collect([counter.member_slug, counter.count]) AS counts
+    """
+
+    try:
+        results = await query_graph(cypher, {"job_slugs": list(job_slugs)})
+    except Exception as e:
+        print(f"[earnings_calculator:get_jobs_interaction_counts] Error: {e}")
+        raise
+
+    jobs: Dict[str, Optional[Dict]] = {slug: None for slug in job_slugs}
+    for row in results:
+        if row['found'] is None:
+            continue
+        jobs[row['slug']] = {
+            'slug': row['slug'],
+            'name': row.get('name') or row['slug'],
+            'value': row['value'],
+            'teamPool': row['team_pool'],
+            'interactionCounts': {
+                member_slug: count
+                for member_slug, count in row['counts']
+                if member_slug and count
+            }
+        }
+    return jobs
+
+
+def calculate_job_earning(job: Dict, member_slug: str) -> Dict:
+    """
+    Compute a member's earning on one job from get_active_job_interaction_counts() data.
+
+    Returns:
+        Job breakdown dict (jobSlug, jobName, yourInteractions, teamTotal, earning)
+
+    Raises:
+        ValueError: If the member has interactions but the job has no teamPool
+    """
+    interaction_counts = job['interactionCounts']
+    member_interactions = interaction_counts.get(member_slug, 0)
+    team_total = sum(interaction_counts.values())
+
+    earning = Decimal('0.00')
+    if member_interactions and team_total:
+        if job['teamPool'] is None:
+            raise ValueError(f"Job not found or missing teamPool: {job['slug']}")
+        earning = compute_share(member_interactions, team_total, Decimal(str(job['teamPool'])))
+
+    return {
+        'jobSlug': job['slug'],
+        'jobName': job['name'],
+        'yourInteractions': member_interactions,
+        'teamTotal': team_total,
+        'earning': earning
+    }
+
+
+async def calculate_member_total_potential_earnings(member_slug: str) -> Dict:
     """
     Calculate member's total potential earnings from all active jobs.
 
@@ -192,7 +357,10 @@ def calculate_member_total_potential_earnings(member_slug: str) -> Dict:
         }
     """
     try:
-        active_jobs = get_all_active_jobs()
+        active_jobs = await get_active_job_interaction_counts()
+    except GraphUnavailableError:
+        # Graph down - fail fast instead of reporting $0
+        raise
     except Exception as e:
         # If query fails, return empty earnings (prevents memory crash)
         print(f"[earnings_calculator:calculate_member_total_potential_earnings] Failed to get jobs: {e}")
@@ -215,27 +383,13 @@ def calculate_member_total_potential_earnings(member_slug: str) -> Dict:
     total_interactions = 0
 
     for job in active_jobs:
-        job_slug = job['slug']
-
-        # Get interaction counts for this job
-        interaction_counts = get_job_interaction_counts(job_slug)
-
-        member_interactions = interaction_counts.get(member_slug, 0)
-        team_total = sum(interaction_counts.values())
+        job_earning = calculate_job_earning(job, member_slug)
 
-        # Calculate earning for this job
-        earning = calculate_member_job_earning(job_slug, member_slug, interaction_counts)
+        total_earning += job_earning['earning']
+        total_interactions += job_earning['yourInteractions']
 
-        total_earning += earning
-        total_interactions += member_interactions
-
-        job_earnings.append({
-            'jobSlug': job_slug,
-            'jobName': job['name'],
-            'yourInteractions': member_interactions,
-            'teamTotal': team_total,
-            'earning': float(earning)  # Convert to float for JSON serialization
-        })
+        job_earning['earning'] = float(job_earning['earning'])  # Convert to float for JSON serialization
+        job_earnings.append(job_earning)
 
     return {
         'total': float(total_earning),
@@ -244,7 +398,7 @@ def calculate_member_total_potential_earnings(member_slug: str) -> Dict:
     }
 
 
-def get_member_completed_mission_earnings(member_slug: str) -> Decimal:
+async def get_member_completed_mission_earnings(member_slug: str) -> Decimal:
     """
     Get total earnings from completed missions (pending payment).
 
@@ -264,7 +418,7 @@ def get_member_completed_mission_earnings(member_slug: str) -> Decimal:
     """
 
     try:
-        results = query_graph(cypher, {"member_slug": member_slug})
+        results = await query_graph(cypher, {"member_slug": member_slug})
 
         if not results or 'total_mission_earnings' not in results[0]:
             return Decimal('0.00')
@@ -272,13 +426,45 @@ def get_member_completed_mission_earnings(member_slug: str) -> Decimal:
         total = results[0]['total_mission_earnings']
         return Decimal(str(total)) if total else Decimal('0.00')
 
+    except GraphUnavailableError:
+        # Graph down - fail fast instead of reporting $0
+        raise
     except Exception as e:
         # Return 0 instead of crashing (prevents memory issues from cascading)
         print(f"[earnings_calculator:get_member_completed_mission_earnings] Error: {e}")
         return Decimal('0.00')
 
 
-def calculate_member_full_earnings(member_slug: str) -> Dict:
+async def get_member_earnings_stamp(member_slug: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Last-write stamps of a member's mission and fund inputs.
+
+    Cheap cross-process change signal for the earnings stream: mission
+    completions (emma's CLI) and fund writes (scripts) happen outside the
+    server process, so the in-process change feed never sees them, but
+    both stamp updated_at.
+
+    Args:
+        member_slug: Member slug
+
+    Returns:
+        (max updated_at of the member's missions, mission fund updated_at)
+    """
+    cypher = """
+    OPTIONAL MATCH (mission:U4_Work_Item {work_type: 'mission', scope_ref: 'scopelock'})
+    WHERE mission.claimedBy = $member_slug OR mission.completedBy = $member_slug
+    WITH max(mission.updated_at) AS missions_updated_at
+    OPTIONAL MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+    RETURN missions_updated_at, fund.updated_at AS fund_updated_at
+    """
+
+    results = await query_graph(cypher, {"member_slug": member_slug})
+    if not results:
+        return (None, None)
+    return (results[0].get('missions_updated_at'), results[0].get('fund_updated_at'))
+
+
+async def calculate_member_full_earnings(member_slug: str) -> Dict:
     """
     Calculate member's complete earnings summary.
 
@@ -298,11 +484,11 @@ def calculate_member_full_earnings(member_slug: str) -> Dict:
         - jobs: List of job breakdowns
         - totalInteractions: Total interactions across all jobs
     """
-    # Get job earnings
-    job_data = calculate_member_total_potential_earnings(member_slug)
-
-    # Get mission earnings
-    mission_earnings = get_member_completed_mission_earnings(member_slug)
+    # Job earnings and mission earnings are independent - overlap the round trips
+    job_data, mission_earnings = await asyncio.gather(
+        calculate_member_total_potential_earnings(member_slug),
+        get_member_completed_mission_earnings(member_slug)
+    )
 
     grand_total = Decimal(str(job_data['total'])) + mission_earnings
 
@@ -313,3 +499,170 @@ def calculate_member_full_earnings(member_slug: str) -> Dict:
         'jobs': job_data['jobs'],
         'totalInteractions': job_data['totalInteractions']
     }
+
+
+async def calculate_jobs_earnings(job_slugs: List[str], member_slugs: Optional[List[str]] = None) -> Dict:
+    """
+    Member earnings on several jobs at once (a board of job cards).
+
+    One round trip for any number of jobs, instead of the per-card
+    get_job_interaction_counts + get_job_team_pool pair.
+
+    Args:
+        job_slugs: Jobs to break down (duplicates ignored, order kept)
+        member_slugs: Members to report per job (None = every member with
+                      interactions on the job)
+
+    Returns:
+        Dict with:
+        - jobs: [{jobSlug, jobName, teamTotal, members: [{memberSlug, earning, yourInteractions}]}]
+        - missing: requested slugs with no such job
+        - errors: [{jobSlug, detail}] for jobs that can't be broken down
+          (a reported member has interactions but the job has no teamPool);
+          the other jobs are still returned
+    """
+    job_slugs = list(dict.fromkeys(job_slugs))
+    jobs = await get_jobs_interaction_counts(job_slugs)
+
+    breakdowns = []
+    errors = []
+    for slug in job_slugs:
+        job = jobs[slug]
+        if job is None:
+            continue
+        members = member_slugs if member_slugs is not None else sorted(job['interactionCounts'])
+        try:
+            rows = [calculate_job_earning(job, member_slug) for member_slug in members]
+        except ValueError as e:
+            print(f"[earnings_calculator:calculate_jobs_earnings] Skipping {slug}: {e}")
+            errors.append({'jobSlug': slug, 'detail': str(e)})
+            continue
+        breakdowns.append({
+            'jobSlug': slug,
+            'jobName': job['name'],
+            'teamTotal': sum(job['interactionCounts'].values()),
+            'members': [
+                {
+                    'memberSlug': member_slug,
+                    'earning': float(row['earning']),
+                    'yourInteractions': row['yourInteractions']
+                }
+                for member_slug, row in zip(members, rows)
+            ]
+        })
+
+    return {
+        'jobs': breakdowns,
+        'missing': [slug for slug in job_slugs if jobs[slug] is None],
+        'errors': errors
+    }
+
+
+async def get_completed_mission_earnings_by_member() -> Dict[str, int]:
+    """
+    Completed-mission earnings (pending payment) for every member, in cents.
+
+    One aggregation - the all-members version of
+    get_member_completed_mission_earnings().
+
+    Returns:
+        Dict mapping member_slug to cents
+    """
+    cypher = """
+    MATCH (mission:U4_Work_Item {work_type: 'mission', scope_ref: 'scopelock'})
+    WHERE mission.claimedBy IS NOT NULL
+      AND mission.status IN ['completed', 'approved']
+    RETURN mission.claimedBy AS member_slug, sum(mission.fixedPayment) AS total_mission_earnings
+    """
+
+    try:
+        results = await query_graph(cypher)
+    except Exception as e:
+        print(f"[earnings_calculator:get_completed_mission_earnings_by_member] Error: {e}")
+        raise
+
+    return {
+        row['member_slug']: to_cents(row['total_mission_earnings'])
+        for row in results
+        if row.get('member_slug') and row.get('total_mission_earnings')
+    }
+
+
+async def calculate_team_earnings() -> Dict:
+    """
+    Every member's earnings in one pass (team leaderboard).
+
+    Same two round trips as calculate_member_full_earnings() for one
+    member: the active-job counts already hold every member's interactions,
+    and completed missions are aggregated per member. Amounts are summed
+    in integer cents; each job share is rounded exactly like compute_share,
+    so a member's row matches their own earnings view.
+
+    Returns:
+        Dict with:
+        - members: [{memberSlug, rank, potentialFromJobs, completedMissions,
+                     grandTotal, totalInteractions, jobCount}] by grandTotal desc
+        - teamPotentialFromJobs, teamCompletedMissions, teamGrandTotal
+        - jobSlugs: active jobs included
+
+    Raises:
+        ValueError: If a job with interactions has no teamPool
+    """
+    active_jobs, mission_cents = await asyncio.gather(
+        get_active_job_interaction_counts(),
+        get_completed_mission_earnings_by_member()
+    )
+
+    potential_cents: Dict[str, int] = {}
+    interactions: Dict[str, int] = {}
+    job_counts: Dict[str, int] = {}
+
+    for job in active_jobs:
+        interaction_counts = job['interactionCounts']
+        team_total = sum(interaction_counts.values())
+        if not team_total:
+            continue
+        if job['teamPool'] is None:
+            raise ValueError(f"Job not found or missing teamPool: {job['slug']}")
+        pool_cents = to_cents(job['teamPool'])
+
+        for member_slug, count in interaction_counts.items():
+            share = compute_share_cents(count, team_total, pool_cents)
+            potential_cents[member_slug] = potential_cents.get(member_slug, 0) + share
+            interactions[member_slug] = interactions.get(member_slug, 0) + count
+            job_counts[member_slug] = job_counts.get(member_slug, 0) + 1
+
+    members = []
+    for member_slug in set(potential_cents) | set(mission_cents):
+        job_total = potential_cents.get(member_slug, 0)
+        mission_total = mission_cents.get(member_slug, 0)
+        members.append({
+            'memberSlug': member_slug,
+            'potentialCents': job_total,
+            'missionCents': mission_total,
+            'totalInteractions': interactions.get(member_slug, 0),
+            'jobCount': job_counts.get(member_slug, 0)
+        })
+    members.sort(key=lambda m: (-(m['potentialCents'] + m['missionCents']), m['memberSlug']))
+
+    team_potential = sum(potential_cents.values())
+    team_missions = sum(mission_cents.values())
+
+    return {
+        'members': [
+            {
+                'memberSlug': member['memberSlug'],
+                'rank': rank,
+                'potentialFromJobs': member['potentialCents'] / 100,
+                'completedMissions': member['missionCents'] / 100,
+                'grandTotal': (member['potentialCents'] + member['missionCents']) / 100,
+                'totalInteractions': member['totalInteractions'],
+                'jobCount': member['jobCount']
+            }
+            for rank, member in enumerate(members, start=1)
+        ],
+        'teamPotentialFromJobs': team_potential / 100,
+        'teamCompletedMissions': team_missions / 100,
+        'teamGrandTotal': (team_potential + team_missions) / 100,
+        'jobSlugs': [job['slug'] for job in active_jobs]
+    }
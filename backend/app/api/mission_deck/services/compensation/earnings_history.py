@@ -0,0 +1,237 @@
+"""
+Earnings history: periodic snapshots in a local SQLite time series
+
+Earnings are computed on the fly from the graph, so nothing remembers
+how they evolved. A background sampler snapshots every member's earnings
+(one calculate_team_earnings pass - the same numbers as each member's
+calculate_member_full_earnings) into a SQLite file under data_dir, and
+GET /api/compensation/earnings/{member}/history serves ranges from it
+without touching the graph.
+
+Storage (one row per member × resolution × bucket):
+    earnings_points(member_slug, resolution, bucket_start, samples,
+                    potential_cents, missions_cents, total_cents,
+                    min_total_cents, max_total_cents, interactions)
+
+Downsampling and retention:
+- Every snapshot updates its minute, hour and day bucket at once (values
+  are levels: the latest sample wins; min/max track the bucket's range)
+- Older minute points are dropped after 1 day, hour points after 30 days,
+  day points after 2 years - the coarser rollup is already there
+- Queries pick the finest resolution still retained for the range start
+
+Per-process sampler: with several uvicorn workers each one samples, and
+the upserts land in the same buckets (harmless, latest wins).
+"""
+
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.api.mission_deck.services.compensation.earnings_calculator import calculate_team_earnings, to_cents
+from app.api.mission_deck.services.graph_resilience import GraphUnavailableError
+
+
+# Bucket width (seconds) and retention (seconds) per resolution, finest first
+RESOLUTIONS: Dict[str, int] = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+RETENTION: Dict[str, int] = {
+    "minute": 86400,
+    "hour": 30 * 86400,
+    "day": 730 * 86400,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS earnings_points (
+    member_slug TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    potential_cents INTEGER NOT NULL,
+    missions_cents INTEGER NOT NULL,
+    total_cents INTEGER NOT NULL,
+    min_total_cents INTEGER NOT NULL,
+    max_total_cents INTEGER NOT NULL,
+    interactions INTEGER NOT NULL,
+    PRIMARY KEY (member_slug, resolution, bucket_start)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO earnings_points (
+    member_slug, resolution, bucket_start, samples, potential_cents, missions_cents,
+    total_cents, min_total_cents, max_total_cents, interactions
+) VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (member_slug, resolution, bucket_start) DO UPDATE SET
+    samples = samples + 1,
+    potential_cents = excluded.potential_cents,
+    missions_cents = excluded.missions_cents,
+    total_cents = excluded.total_cents,
+    min_total_cents = min(min_total_cents, excluded.total_cents),
+    max_total_cents = max(max_total_cents, excluded.total_cents),
+    interactions = excluded.interactions
+"""
+
+
+def choose_resolution(start: float, now: float) -> str:
+    """Finest resolution whose retention still covers `start`."""
+    for resolution, retention in RETENTION.items():
+        if start >= now - retention:
+            return resolution
+    return "day"
+
+
+class EarningsHistoryStore:
+    """
+    SQLite-backed earnings time series with minute/hour/day rollups.
+
+    Blocking - call from a thread (asyncio.to_thread) in request handlers.
+
+    Args:
+        path: SQLite database file (created on first use)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._initialized = True
+        return connection
+
+    def record(self, members: List[Dict], timestamp: float) -> int:
+        """
+        Store one snapshot of every member's earnings.
+
+        Args:
+            members: calculate_team_earnings()['members'] rows
+            timestamp: Unix time of the snapshot
+
+        Returns:
+            Number of members recorded
+        """
+        rows = []
+        for member in members:
+            potential = to_cents(member['potentialFromJobs'])
+            missions = to_cents(member['completedMissions'])
+            total = potential + missions
+            for resolution, width in RESOLUTIONS.items():
+                bucket_start = int(timestamp) - int(timestamp) % width
+                rows.append((
+                    member['memberSlug'], resolution, bucket_start,
+                    potential, missions, total, total, total, member['totalInteractions']
+                ))
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(_UPSERT, rows)
+        return len(members)
+
+    def prune(self, now: float) -> int:
+        """Drop points older than their resolution's retention. Returns rows deleted."""
+        deleted = 0
+        with closing(self._connect()) as connection, connection:
+            for resolution, retention in RETENTION.items():
+                cursor = connection.execute(
+                    "DELETE FROM earnings_points WHERE resolution = ? AND bucket_start < ?",
+                    (resolution, int(now - retention))
+                )
+                deleted += cursor.rowcount
+        return deleted
+
+    def query(
+        self,
+        member_slug: str,
+        start: float,
+        end: float,
+        resolution: Optional[str] = None,
+        now: Optional[float] = None
+    ) -> Dict:
+        """
+        Points for one member between start and end (Unix times, inclusive).
+
+        Args:
+            resolution: "minute" | "hour" | "day" (None = finest retained for start)
+
+        Returns:
+            {'resolution', 'points': [{'time', 'potentialFromJobs', 'completedMissions',
+              'grandTotal', 'minGrandTotal', 'maxGrandTotal', 'totalInteractions', 'samples'}]}
+
+        Raises:
+            ValueError: If the resolution is unknown
+        """
+        if resolution is None:
+            resolution = choose_resolution(start, now if now is not None else time.time())
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Invalid resolution: {resolution}. Must be one of: {list(RESOLUTIONS)}")
+
+        bucket_from = int(start) - int(start) % RESOLUTIONS[resolution]
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT bucket_start, potential_cents, missions_cents, total_cents, "
+                "min_total_cents, max_total_cents, interactions, samples "
+                "FROM earnings_points "
+                "WHERE member_slug = ? AND resolution = ? AND bucket_start BETWEEN ? AND ? "
+                "ORDER BY bucket_start",
+                (member_slug, resolution, bucket_from, int(end))
+            ).fetchall()
+
+        return {
+            'resolution': resolution,
+            'points': [
+                {
+                    'time': bucket_start,
+                    'potentialFromJobs': potential / 100,
+                    'completedMissions': missions / 100,
+                    'grandTotal': total / 100,
+                    'minGrandTotal': low / 100,
+                    'maxGrandTotal': high / 100,
+                    'totalInteractions': interactions,
+                    'samples': samples
+                }
+                for bucket_start, potential, missions, total, low, high, interactions, samples in rows
+            ]
+        }
+
+
+# Global store (one SQLite file per deployment, under data_dir)
+earnings_history = EarningsHistoryStore(settings.data_dir / "earnings_history.sqlite3")
+
+
+async def record_earnings_snapshot(store: Optional[EarningsHistoryStore] = None) -> int:
+    """
+    Snapshot every member's earnings into the history store and prune it.
+
+    Returns:
+        Number of members recorded
+    """
+    store = store or earnings_history
+    team = await calculate_team_earnings()
+    now = time.time()
+    recorded = await asyncio.to_thread(store.record, team['members'], now)
+    await asyncio.to_thread(store.prune, now)
+    return recorded
+
+
+async def run_earnings_history_sampler() -> None:
+    """Background task: snapshot earnings every earnings_history_interval_seconds."""
+    while True:
+        try:
+            await record_earnings_snapshot()
+        except GraphUnavailableError as e:
+            print(f"[earnings_history:run_earnings_history_sampler] Graph unavailable, skipping snapshot: {e}")
+        except Exception as e:
+            print(f"[earnings_history:run_earnings_history_sampler] Snapshot failed: {e}")
+        await asyncio.sleep(settings.earnings_history_interval_seconds)
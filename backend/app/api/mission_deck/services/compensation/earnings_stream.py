@@ -0,0 +1,184 @@
+"""
+Server-Sent Events stream of a member's earnings
+
+Replaces 2-second polling of /api/compensation/earnings/{member}: the
+stream pushes the earnings payload once on connect and again only when an
+input changed, with a comment line as keep-alive in between.
+
+Triggers:
+- ("interactions", job_slug) from the in-process change feed
+  (change_feed.py): a chat message about a job in the payload, written by
+  this server process
+- Change signal (get_member_earnings_stamp), polled every
+  EARNINGS_STREAM_SIGNAL_SECONDS: the member's missions' max updated_at and
+  the mission fund's updated_at. Mission completions (emma's CLI) and fund
+  writes (scripts) run in other processes, so they never reach the feed
+- ("missions", ...) and ("fund", None) feed events are honoured too, for
+  writers that do run in-process
+
+Architecture:
+- Events within EARNINGS_STREAM_DEBOUNCE_SECONDS collapse into one recompute
+- A recompute whose payload hashes to the version already sent pushes nothing
+- Every EARNINGS_STREAM_REFRESH_SECONDS the payload is recomputed anyway,
+  catching chat messages handled by other uvicorn workers
+- Event ids are the payload version: a reconnecting EventSource sends
+  Last-Event-ID and gets no initial push if nothing changed meanwhile
+- Graph errors are sent as "earnings-error" events (not "error", which
+  EventSource fires itself on connection failures); the stream stays
+  open and retries on the next trigger or refresh
+
+Wire format:
+    retry: 5000
+
+    event: earnings
+    id: 3f2a9c1b7d4e5f60
+    data: {"potentialFromJobs": 225.0, ...}
+
+    : keep-alive
+
+Maps to: docs/missions/mission-deck-compensation/MECHANISM.md REST API section
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+
+from app.config import settings
+from app.api.mission_deck.services.change_feed import (
+    TOPIC_FUND,
+    TOPIC_INTERACTIONS,
+    TOPIC_MISSIONS,
+    ChangeEvent,
+    change_feed
+)
+
+
+# Client reconnect delay suggested to EventSource (milliseconds)
+RECONNECT_MS = 5000
+
+KEEPALIVE = ": keep-alive\n\n"
+
+
+def payload_version(payload: Dict[str, Any]) -> str:
+    """Content hash of a JSON payload (stable across key order)."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def format_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    """One SSE message."""
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def is_relevant(event: ChangeEvent, member_slug: str, job_slugs: Optional[Iterable[str]]) -> bool:
+    """True if a change event can alter this member's earnings payload."""
+    topic, key = event
+    if topic == TOPIC_FUND:
+        return True
+    if topic == TOPIC_MISSIONS:
+        return key is None or key == member_slug
+    if topic == TOPIC_INTERACTIONS:
+        # Unknown job list (nothing sent yet) - recompute to be safe
+        return job_slugs is None or key in job_slugs
+    return False
+
+
+async def stream_member_earnings(
+    member_slug: str,
+    compute: Callable[[], Awaitable[Dict[str, Any]]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    last_event_id: Optional[str] = None,
+    signal: Optional[Callable[[], Awaitable[Any]]] = None
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for one member until the client disconnects.
+
+    Args:
+        member_slug: Member whose earnings are streamed
+        compute: Returns the earnings payload (EarningsResponse as a dict)
+        is_disconnected: Request.is_disconnected
+        last_event_id: Version the client already has (Last-Event-ID header)
+        signal: Returns a cheap stamp of cross-process inputs; a recompute
+                runs when it changes (polled every EARNINGS_STREAM_SIGNAL_SECONDS)
+
+    Yields:
+        SSE text: "earnings" events, "earnings-error" events and keep-alive comments
+    """
+    subscription = change_feed.subscribe()
+    sent_version = last_event_id
+    job_slugs: Optional[set] = None
+    stamp: Any = None
+
+    async def refresh() -> Optional[str]:
+        nonlocal sent_version, job_slugs
+        try:
+            payload = await compute()
+        except Exception as e:
+            print(f"[earnings_stream:stream_member_earnings] Recompute failed for {member_slug}: {e}")
+            return format_event("earnings-error", {"detail": "Failed to calculate earnings"})
+
+        job_slugs = {job.get("jobSlug") for job in payload.get("jobs", [])}
+        version = payload_version(payload)
+        if version == sent_version:
+            return None
+        sent_version = version
+        return format_event("earnings", payload, event_id=version)
+
+    async def signal_changed() -> bool:
+        nonlocal stamp
+        try:
+            current = await signal()
+        except Exception as e:
+            # Periodic refresh still catches the change
+            print(f"[earnings_stream:stream_member_earnings] Change signal failed for {member_slug}: {e}")
+            return False
+        changed, stamp = current != stamp, current
+        return changed
+
+    wait_seconds = settings.earnings_stream_keepalive_seconds
+    if signal is not None:
+        wait_seconds = min(wait_seconds, settings.earnings_stream_signal_seconds)
+
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+        if signal is not None:
+            await signal_changed()
+        message = await refresh()
+        if message:
+            yield message
+        refreshed_at = sent_at = signalled_at = time.monotonic()
+
+        while not await is_disconnected():
+            due = False
+            if await subscription.wait(wait_seconds):
+                # Let a burst of writes land before recomputing once
+                await asyncio.sleep(settings.earnings_stream_debounce_seconds)
+                events = subscription.drain()
+                due = any(is_relevant(event, member_slug, job_slugs) for event in events)
+            if signal is not None and time.monotonic() - signalled_at >= settings.earnings_stream_signal_seconds:
+                signalled_at = time.monotonic()
+                if await signal_changed():
+                    due = True
+            if time.monotonic() - refreshed_at >= settings.earnings_stream_refresh_seconds:
+                due = True
+
+            message = None
+            if due:
+                message = await refresh()
+                refreshed_at = time.monotonic()
+
+            if message:
+                yield message
+                sent_at = time.monotonic()
+            elif time.monotonic() - sent_at >= settings.earnings_stream_keepalive_seconds:
+                yield KEEPALIVE
+                sent_at = time.monotonic()
+
+    finally:
+        subscription.close()
@@ -0,0 +1,248 @@
+"""
+Append-only ledger of mission fund transactions
+
+Every change to the mission fund balance is one statement that updates
+U4_Account.balance and appends a U4_Transaction in the same round trip,
+so the balance can always be re-derived from the ledger and checked.
+
+Transaction node:
+    (:U4_Transaction {slug, idempotency_key, kind, amount, balance_after,
+                      source_ref, scope_ref, created_at})-[:U4_ABOUT]->(fund:U4_Account)
+    kind: 'credit' (job contribution) | 'debit' (mission payment) | 'opening'
+    indexed on idempotency_key (ensure_ledger_index, run on app startup)
+
+Guarantees (FalkorDB runs each write statement atomically):
+- Debits carry a `fund.balance >= $amount` guard - concurrent payouts
+  can't overdraw the fund
+- A retried write with an idempotency key already in the ledger changes
+  nothing (keys default to the job / mission slug: a job contributes once,
+  a mission is paid once)
+- A write that matches nothing returns no row; only then is a second read
+  made to tell a duplicate from insufficient funds
+
+Funds created before the ledger need an opening entry for the ledger to
+add up (run once after deploying):
+    cd backend
+    python3 scripts/check_fund_ledger.py [--check]
+
+Maps to: docs/missions/mission-deck-compensation/ALGORITHM.md Step 1.3
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+
+from app.api.mission_deck.services.graph import query_graph
+
+
+TRANSACTION_LABEL = "U4_Transaction"
+
+KIND_CREDIT = "credit"
+KIND_DEBIT = "debit"
+KIND_OPENING = "opening"
+
+OPENING_KEY = "fund-opening"
+
+# Create-or-credit the fund and append the credit, unless the key is already in the ledger
+CREDIT_CYPHER = """
+MERGE (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+ON CREATE SET
+  fund.name = 'ScopeLock Mission Fund',
+  fund.slug = 'scopelock-mission-fund',
+  fund.level = 'L2',
+  fund.balance = 0.0,
+  fund.currency = 'USD',
+  fund.created_at = $created_at,
+  fund.updated_at = $created_at,
+  fund.valid_from = $created_at,
+  fund.valid_to = null,
+  fund.description = 'Fund for internal missions (5% from client jobs)',
+  fund.type_name = 'U4_Account',
+  fund.visibility = 'partners',
+  fund.created_by = 'system',
+  fund.substrate = 'organizational'
+WITH fund
+OPTIONAL MATCH (prior:U4_Transaction {idempotency_key: $idempotency_key, scope_ref: 'scopelock'})
+WITH fund, prior
+WHERE prior IS NULL
+SET fund.balance = fund.balance + $amount,
+    fund.updated_at = $updated_at
+CREATE (tx:U4_Transaction {
+  slug: $tx_slug,
+  name: 'Mission fund credit',
+  idempotency_key: $idempotency_key,
+  kind: 'credit',
+  amount: $amount,
+  balance_after: fund.balance,
+  source_ref: $source_ref,
+  scope_ref: 'scopelock',
+  type_name: 'U4_Transaction',
+  created_at: $created_at
+})-[:U4_ABOUT]->(fund)
+RETURN fund.balance AS new_balance
+"""
+
+# Guarded debit: no row unless the balance covers it and the key is new
+DEBIT_CYPHER = """
+MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+WHERE fund.balance >= $amount
+OPTIONAL MATCH (prior:U4_Transaction {idempotency_key: $idempotency_key, scope_ref: 'scopelock'})
+WITH fund, prior
+WHERE prior IS NULL
+SET fund.balance = fund.balance - $amount,
+    fund.updated_at = $updated_at
+CREATE (tx:U4_Transaction {
+  slug: $tx_slug,
+  name: 'Mission fund debit',
+  idempotency_key: $idempotency_key,
+  kind: 'debit',
+  amount: $amount,
+  balance_after: fund.balance,
+  source_ref: $source_ref,
+  scope_ref: 'scopelock',
+  type_name: 'U4_Transaction',
+  created_at: $created_at
+})-[:U4_ABOUT]->(fund)
+RETURN fund.balance AS new_balance
+"""
+
+# Why a write returned no row (failure path only)
+_REJECTION_CYPHER = """
+OPTIONAL MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+OPTIONAL MATCH (prior:U4_Transaction {idempotency_key: $idempotency_key, scope_ref: 'scopelock'})
+RETURN fund.balance AS balance, prior.kind AS prior_kind, prior.balance_after AS prior_balance_after
+"""
+
+_LEDGER_CYPHER = """
+MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+OPTIONAL MATCH (tx:U4_Transaction {scope_ref: 'scopelock'})-[:U4_ABOUT]->(fund)
+RETURN fund.balance AS balance,
+       sum(CASE WHEN tx.kind = 'debit' THEN -tx.amount ELSE tx.amount END) AS ledger_balance,
+       count(tx) AS transactions
+"""
+
+# Opening entry for the balance the ledger doesn't account for (once)
+_OPENING_CYPHER = """
+MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
+OPTIONAL MATCH (tx:U4_Transaction {scope_ref: 'scopelock'})-[:U4_ABOUT]->(fund)
+WITH fund,
+     sum(CASE WHEN tx.kind = 'debit' THEN -tx.amount ELSE tx.amount END) AS ledger_balance,
+     collect(tx.idempotency_key) AS keys
+WHERE NOT $idempotency_key IN keys
+CREATE (opening:U4_Transaction {
+  slug: $tx_slug,
+  name: 'Mission fund opening balance',
+  idempotency_key: $idempotency_key,
+  kind: 'opening',
+  amount: fund.balance - ledger_balance,
+  balance_after: fund.balance,
+  source_ref: null,
+  scope_ref: 'scopelock',
+  type_name: 'U4_Transaction',
+  created_at: $created_at
+})-[:U4_ABOUT]->(fund)
+RETURN opening.amount AS amount
+"""
+
+_CREATE_INDEX_CYPHER = "CREATE INDEX FOR (t:U4_Transaction) ON (t.idempotency_key)"
+
+
+def credit_key(source_job_slug: str) -> str:
+    """Default idempotency key of a job's contribution."""
+    return f"fund-credit:{source_job_slug}"
+
+
+def debit_key(mission_slug: str) -> str:
+    """Default idempotency key of a mission payment."""
+    return f"fund-debit:{mission_slug}"
+
+
+def ledger_params(amount: Decimal, idempotency_key: str, source_ref: Optional[str]) -> Dict:
+    """Parameters shared by CREDIT_CYPHER and DEBIT_CYPHER."""
+    # Generate timestamps in Python (FalkorDB doesn't support datetime() function)
+    now = datetime.utcnow().isoformat() + 'Z'
+    return {
+        "amount": float(amount),
+        "idempotency_key": idempotency_key,
+        "source_ref": source_ref,
+        "tx_slug": f"fund-tx-{uuid.uuid4()}",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def explain_rejected_write(idempotency_key: str) -> Dict:
+    """
+    Read why a ledger write matched nothing.
+
+    Returns:
+        {'balance': Decimal | None (no fund), 'duplicate': bool,
+         'priorBalanceAfter': Decimal | None}
+    """
+    results = await query_graph(_REJECTION_CYPHER, {"idempotency_key": idempotency_key})
+    row = results[0] if results else {}
+    balance = row.get('balance')
+    prior_balance_after = row.get('prior_balance_after')
+    return {
+        'balance': Decimal(str(balance)) if balance is not None else None,
+        'duplicate': row.get('prior_kind') is not None,
+        'priorBalanceAfter': Decimal(str(prior_balance_after)) if prior_balance_after is not None else None
+    }
+
+
+async def ensure_ledger_index() -> None:
+    """Create the idempotency_key index ledger writes rely on (no-op if it exists)."""
+    try:
+        await query_graph(_CREATE_INDEX_CYPHER)
+    except Exception as e:
+        # FalkorDB rejects creating an index that already exists
+        if "already" not in str(e).lower():
+            print(f"[fund_ledger:ensure_ledger_index] Error: {e}")
+            raise
+
+
+async def check_fund_ledger() -> Dict:
+    """
+    Compare the fund balance with the balance derived from its ledger.
+
+    Returns:
+        {'balance', 'ledgerBalance', 'drift', 'transactions'} - drift is
+        balance - ledgerBalance rounded to cents (0.0 when in sync).
+        Balances are None if the fund doesn't exist yet.
+    """
+    results = await query_graph(_LEDGER_CYPHER)
+    if not results:
+        return {'balance': None, 'ledgerBalance': None, 'drift': 0.0, 'transactions': 0}
+
+    row = results[0]
+    balance = Decimal(str(row['balance'] or 0))
+    ledger_balance = Decimal(str(row['ledger_balance'] or 0))
+    return {
+        'balance': float(balance),
+        'ledgerBalance': float(ledger_balance),
+        'drift': float((balance - ledger_balance).quantize(Decimal('0.01'))),
+        'transactions': row['transactions']
+    }
+
+
+async def open_fund_ledger() -> Optional[float]:
+    """
+    Record the fund's pre-ledger balance as an opening entry (once).
+
+    Returns:
+        Opening amount written, or None if the fund doesn't exist or the
+        ledger was already opened
+    """
+    await ensure_ledger_index()
+    try:
+        results = await query_graph(_OPENING_CYPHER, {
+            "idempotency_key": OPENING_KEY,
+            "tx_slug": f"fund-tx-{uuid.uuid4()}",
+            "created_at": datetime.utcnow().isoformat() + 'Z'
+        })
+    except Exception as e:
+        print(f"[fund_ledger:open_fund_ledger] Error: {e}")
+        raise
+
+    return results[0]['amount'] if results else None
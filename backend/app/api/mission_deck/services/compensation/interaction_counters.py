@@ -0,0 +1,211 @@
+"""
+Materialized job × member interaction counters
+
+Earnings used to recount every U4_Event message U4_ABOUT a job on each
+poll, so cost grew with chat history. Each (job, member) pair now has a
+counter node, incremented in the same statement that links a new message
+to a job (create_chat_message in graph.py), so earnings reads look up
+counters instead of scanning messages.
+
+Counter node:
+    (:U4_Interaction_Counter {job_slug, member_slug, count, scope_ref, updated_at})
+    indexed on job_slug
+
+Counted messages match the old live count: U4_Event with
+event_kind='message', scope_ref='scopelock' and an actor_ref, linked
+U4_ABOUT a U4_Work_Item with work_type='job'.
+
+Counters are only maintained by create_chat_message. The deploy counts
+existing chat history once, before the app starts, if no counter exists
+yet (render.yaml preDeployCommand):
+    cd backend
+    python3 scripts/reconcile_interaction_counters.py --backfill
+To rebuild them by hand, e.g. after messages were written by other tools:
+    python3 scripts/reconcile_interaction_counters.py [--job SLUG] [--check]
+
+Maps to: docs/missions/mission-deck-compensation/ALGORITHM.md Step 2
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.api.mission_deck.services.graph import query_graph, query_graph_many
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache
+
+
+COUNTER_LABEL = "U4_Interaction_Counter"
+
+# Live counts from raw events (what the counters must equal)
+_EVENT_COUNTS_CYPHER = """
+MATCH (job:U4_Work_Item {work_type: 'job', scope_ref: 'scopelock'})<-[:U4_ABOUT]-(msg:U4_Event)
+WHERE msg.event_kind = 'message' AND msg.scope_ref = 'scopelock' AND msg.actor_ref IS NOT NULL
+  AND ($job_slug IS NULL OR job.slug = $job_slug)
+WITH job.slug AS job_slug, msg.actor_ref AS member_slug, count(msg) AS interaction_count
+RETURN job_slug, member_slug, interaction_count
+"""
+
+_COUNTERS_CYPHER = """
+MATCH (counter:U4_Interaction_Counter {scope_ref: 'scopelock'})
+WHERE $job_slug IS NULL OR counter.job_slug = $job_slug
+RETURN counter.job_slug AS job_slug, counter.member_slug AS member_slug, counter.count AS interaction_count
+"""
+
+_DELETE_COUNTERS_CYPHER = """
+MATCH (counter:U4_Interaction_Counter {scope_ref: 'scopelock'})
+WHERE $job_slug IS NULL OR counter.job_slug = $job_slug
+DELETE counter
+"""
+
+_CREATE_COUNTERS_CYPHER = """
+MATCH (job:U4_Work_Item {work_type: 'job', scope_ref: 'scopelock'})<-[:U4_ABOUT]-(msg:U4_Event)
+WHERE msg.event_kind = 'message' AND msg.scope_ref = 'scopelock' AND msg.actor_ref IS NOT NULL
+  AND ($job_slug IS NULL OR job.slug = $job_slug)
+WITH job.slug AS job_slug, msg.actor_ref AS member_slug, count(msg) AS interaction_count
+CREATE (:U4_Interaction_Counter {
+  job_slug: job_slug,
+  member_slug: member_slug,
+  count: interaction_count,
+  scope_ref: 'scopelock',
+  updated_at: $updated_at
+})
+RETURN count(*) AS counters
+"""
+
+# Upsert every (job, member) pair to its live count in one statement, so
+# a message created concurrently is either counted here or increments the
+# corrected counter afterwards - never lost. Returns the pairs it wrote.
+_BACKFILL_COUNTERS_CYPHER = """
+MATCH (job:U4_Work_Item {work_type: 'job', scope_ref: 'scopelock'})<-[:U4_ABOUT]-(msg:U4_Event)
+WHERE msg.event_kind = 'message' AND msg.scope_ref = 'scopelock' AND msg.actor_ref IS NOT NULL
+WITH job.slug AS job_slug, msg.actor_ref AS member_slug, count(msg) AS interaction_count
+MERGE (counter:U4_Interaction_Counter {job_slug: job_slug, member_slug: member_slug, scope_ref: 'scopelock'})
+ON CREATE SET counter.count = 0
+WITH counter, interaction_count
+WHERE counter.count <> interaction_count
+SET counter.count = interaction_count, counter.updated_at = $updated_at
+RETURN count(counter) AS counters
+"""
+
+_ANY_COUNTER_CYPHER = """
+MATCH (counter:U4_Interaction_Counter {scope_ref: 'scopelock'})
+RETURN counter.job_slug AS job_slug
+LIMIT 1
+"""
+
+_CREATE_INDEX_CYPHER = "CREATE INDEX FOR (c:U4_Interaction_Counter) ON (c.job_slug)"
+
+
+CounterKey = Tuple[str, str]
+
+
+def _by_pair(rows: List[Dict]) -> Dict[CounterKey, int]:
+    return {
+        (row['job_slug'], row['member_slug']): row['interaction_count']
+        for row in rows
+        if row['job_slug'] and row['member_slug']
+    }
+
+
+async def ensure_counter_index() -> None:
+    """Create the job_slug index counter lookups rely on (no-op if it exists)."""
+    try:
+        await query_graph(_CREATE_INDEX_CYPHER)
+    except Exception as e:
+        # FalkorDB rejects creating an index that already exists
+        if "already" not in str(e).lower():
+            print(f"[interaction_counters:ensure_counter_index] Error: {e}")
+            raise
+
+
+async def interaction_counters_exist() -> bool:
+    """True once any counter has been written (the backfill ran or a job message was counted)."""
+    return bool(await query_graph(_ANY_COUNTER_CYPHER))
+
+
+async def check_interaction_counters(job_slug: Optional[str] = None) -> List[Dict]:
+    """
+    Compare counters with live counts from the raw message events.
+
+    Args:
+        job_slug: Only check this job (None = every job)
+
+    Returns:
+        Drifted pairs: [{'jobSlug', 'memberSlug', 'counter', 'events'}] (empty if in sync)
+    """
+    counters_rows, event_rows = await query_graph_many([
+        (_COUNTERS_CYPHER, {"job_slug": job_slug}),
+        (_EVENT_COUNTS_CYPHER, {"job_slug": job_slug}),
+    ])
+    counters = _by_pair(counters_rows)
+    events = _by_pair(event_rows)
+
+    return [
+        {
+            'jobSlug': pair[0],
+            'memberSlug': pair[1],
+            'counter': counters.get(pair, 0),
+            'events': events.get(pair, 0)
+        }
+        for pair in sorted(set(counters) | set(events))
+        if counters.get(pair, 0) != events.get(pair, 0)
+    ]
+
+
+async def rebuild_interaction_counters(job_slug: Optional[str] = None) -> int:
+    """
+    Rebuild counters from the raw message events.
+
+    Deletes the existing counters (for one job or all) and recreates them
+    from a live count, in one pipelined round trip. Messages written while
+    this runs may be counted twice or missed - run check_interaction_counters
+    afterwards if writes were in flight.
+
+    Args:
+        job_slug: Only rebuild this job (None = every job)
+
+    Returns:
+        Number of counters written
+    """
+    await ensure_counter_index()
+
+    params = {"job_slug": job_slug}
+    try:
+        _, created = await query_graph_many([
+            (_DELETE_COUNTERS_CYPHER, params),
+            (_CREATE_COUNTERS_CYPHER, {**params, "updated_at": datetime.utcnow().isoformat() + 'Z'}),
+        ], ordered=True)
+    except Exception as e:
+        print(f"[interaction_counters:rebuild_interaction_counters] Error: {e}")
+        raise
+    finally:
+        # Earnings responses are built from the counters
+        invalidate_graph_cache([cache_tag("U4_Interaction_Counter")])
+
+    return created[0]['counters'] if created else 0
+
+
+async def backfill_interaction_counters() -> int:
+    """
+    Create missing counters and correct drifted ones from the raw message events.
+
+    Unlike rebuild_interaction_counters this never deletes counters and
+    runs as one statement, so it is safe while messages are being written.
+    It scans every job message - run it once (reconcile script --backfill),
+    not per process. Counters for pairs that have no messages left are
+    not touched - use a rebuild for those.
+
+    Returns:
+        Number of counters created or corrected
+    """
+    await ensure_counter_index()
+
+    try:
+        results = await query_graph(_BACKFILL_COUNTERS_CYPHER, {"updated_at": datetime.utcnow().isoformat() + 'Z'})
+    except Exception as e:
+        print(f"[interaction_counters:backfill_interaction_counters] Error: {e}")
+        raise
+
+    written = results[0]['counters'] if results else 0
+    if written:
+        invalidate_graph_cache([cache_tag("U4_Interaction_Counter")])
+    return written
@@ -0,0 +1,175 @@
+"""
+Bulk payout settlement across all jobs and members
+
+Month-end settlement splits every job's teamPool among its members by
+interaction share. Instead of one Decimal division per (job, member), the
+job × member interaction matrix and the pools are loaded in one query and
+all shares computed together in integer cents - with NumPy when it is
+installed, pure Python otherwise (identical results).
+
+Rounding (largest remainder, deterministic):
+- Each member gets floor(interactions × pool_cents / team_total)
+- The cents left over go one each to the largest remainders, ties broken
+  by member slug - so each job's shares sum exactly to its teamPool
+- That is the per-member rounding (compute_share) whenever it already
+  sums to the pool; otherwise the fewest members move by one cent, and
+  the report lists them as adjustments
+
+Maps to: docs/missions/mission-deck-compensation/ALGORITHM.md Step 2
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from app.api.mission_deck.services.compensation.earnings_calculator import (
+    compute_share_cents,
+    get_active_job_interaction_counts,
+    to_cents
+)
+
+try:
+    import numpy as np
+except ImportError:  # Optional speedup - the pure-Python allocator is the fallback
+    np = None
+
+
+def _allocate_python(counts: List[List[int]], pool_cents: List[int]) -> List[List[int]]:
+    shares = []
+    for row, pool in zip(counts, pool_cents):
+        team_total = sum(row)
+        if not team_total:
+            shares.append([0] * len(row))
+            continue
+        quotients = [divmod(count * pool, team_total) for count in row]
+        allocated = [quotient for quotient, _ in quotients]
+        leftover = pool - sum(allocated)
+        # Largest remainder first, then lowest member index
+        order = sorted(range(len(row)), key=lambda i: (-quotients[i][1], i))
+        for i in order[:leftover]:
+            allocated[i] += 1
+        shares.append(allocated)
+    return shares
+
+
+def _allocate_numpy(counts: List[List[int]], pool_cents: List[int]) -> List[List[int]]:
+    matrix = np.asarray(counts, dtype=np.int64).reshape(len(counts), -1)
+    pools = np.asarray(pool_cents, dtype=np.int64)
+    team_totals = matrix.sum(axis=1)
+    divisors = np.where(team_totals > 0, team_totals, 1)[:, None]
+
+    numerators = matrix * pools[:, None]
+    allocated = numerators // divisors
+    remainders = numerators % divisors
+    leftover = np.where(team_totals > 0, pools - allocated.sum(axis=1), 0)
+
+    # Position of each member in its job's (remainder desc, index asc) order
+    members = np.broadcast_to(np.arange(matrix.shape[1]), matrix.shape)
+    order = np.lexsort((members, -remainders), axis=1)
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, members, axis=1)
+
+    allocated += positions < leftover[:, None]
+    return allocated.tolist()
+
+
+def allocate_cents(counts: Sequence[Sequence[int]], pool_cents: Sequence[int]) -> List[List[int]]:
+    """
+    Split each job's pool among its members by largest remainder.
+
+    Args:
+        counts: Interaction matrix, one row per job, one column per member
+        pool_cents: Each job's teamPool in cents
+
+    Returns:
+        Shares in cents, same shape as counts; each row sums to its pool
+        (rows without interactions are all zero)
+
+    Raises:
+        ValueError: If the matrix and pools don't line up
+    """
+    counts = [list(row) for row in counts]
+    pool_cents = list(pool_cents)
+    if len(counts) != len(pool_cents):
+        raise ValueError(f"{len(counts)} job rows but {len(pool_cents)} team pools")
+    if len({len(row) for row in counts}) > 1:
+        raise ValueError("Interaction matrix rows must all have one column per member")
+    if not counts or not counts[0]:
+        return [[] for _ in counts]
+
+    if np is not None:
+        return _allocate_numpy(counts, pool_cents)
+    return _allocate_python(counts, pool_cents)
+
+
+async def build_settlement(job_slugs: Optional[Sequence[str]] = None) -> Dict:
+    """
+    Settle every active job (or the given ones) in one pass.
+
+    Args:
+        job_slugs: Only settle these active jobs (None = all)
+
+    Returns:
+        Settlement report dict:
+        - generatedAt, engine ("numpy" | "python")
+        - jobs: [{jobSlug, jobName, teamPoolCents, teamTotal, shares: {member: cents}}]
+        - members: [{memberSlug, totalCents, total, jobs, adjustments}] -
+          adjustments lists jobs where the settled cent differs from the
+          member's own earnings view: {jobSlug, settledCents, viewCents}
+        - totalCents: sum of all shares (= sum of settled pools)
+
+    Raises:
+        ValueError: If a job with interactions has no teamPool, or a
+                    requested job is not active
+    """
+    jobs = await get_active_job_interaction_counts()
+    if job_slugs is not None:
+        wanted = set(job_slugs)
+        missing = wanted - {job['slug'] for job in jobs}
+        if missing:
+            raise ValueError(f"Jobs not active (or not found): {', '.join(sorted(missing))}")
+        jobs = [job for job in jobs if job['slug'] in wanted]
+
+    # Jobs nobody worked on have nothing to settle
+    jobs = [job for job in jobs if sum(job['interactionCounts'].values())]
+    for job in jobs:
+        if job['teamPool'] is None:
+            raise ValueError(f"Job not found or missing teamPool: {job['slug']}")
+
+    member_slugs = sorted({member for job in jobs for member in job['interactionCounts']})
+    counts = [[job['interactionCounts'].get(member, 0) for member in member_slugs] for job in jobs]
+    pool_cents = [to_cents(job['teamPool']) for job in jobs]
+    shares = allocate_cents(counts, pool_cents)
+
+    job_reports = []
+    member_reports = {member: {'memberSlug': member, 'totalCents': 0, 'jobs': 0, 'adjustments': []}
+                      for member in member_slugs}
+    for job, row, pool, job_shares in zip(jobs, counts, pool_cents, shares):
+        team_total = sum(row)
+        job_reports.append({
+            'jobSlug': job['slug'],
+            'jobName': job['name'],
+            'teamPoolCents': pool,
+            'teamTotal': team_total,
+            'shares': {member: cents for member, count, cents in zip(member_slugs, row, job_shares) if count}
+        })
+        for member, count, cents in zip(member_slugs, row, job_shares):
+            if not count:
+                continue
+            report = member_reports[member]
+            report['totalCents'] += cents
+            report['jobs'] += 1
+            view_cents = compute_share_cents(count, team_total, pool)
+            if view_cents != cents:
+                report['adjustments'].append({'jobSlug': job['slug'], 'settledCents': cents, 'viewCents': view_cents})
+
+    members = sorted(member_reports.values(), key=lambda m: (-m['totalCents'], m['memberSlug']))
+    for member in members:
+        member['total'] = member['totalCents'] / 100
+
+    return {
+        'generatedAt': datetime.utcnow().isoformat() + 'Z',
+        'engine': "numpy" if np is not None else "python",
+        'jobs': job_reports,
+        'members': members,
+        'totalCents': sum(pool_cents)
+    }
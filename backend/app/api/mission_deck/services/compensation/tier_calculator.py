@@ -4,12 +4,22 @@ Tier-Based Mission Payment Calculator
 Dynamically calculates mission payments based on mission fund balance.
 4 tiers: Abundant (≥$200), Healthy ($100-200), Limited ($50-100), Critical (<$50)
 
+The fund balance and its tier are kept in an in-process snapshot: every
+tier lookup (get_current_tier, get_mission_payment, get_all_mission_payments)
+is served from memory. increase/decrease_mission_fund write the new balance
+through; writes from other workers or tools show up after FUND_SNAPSHOT_TTL.
+
 Maps to: docs/missions/mission-deck-compensation/ALGORITHM.md Step 1.3
 """
 
+import time
 from decimal import Decimal
-from typing import Tuple, Dict
+from typing import Optional, Tuple, Dict
+from app.api.mission_deck.services.change_feed import TOPIC_FUND, publish_change
+from app.api.mission_deck.services.compensation import fund_ledger
 from app.api.mission_deck.services.graph import query_graph
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache
+from app.api.mission_deck.services.graph_resilience import GraphUnavailableError
 
 
 # Tier thresholds (in dollars)
@@ -18,6 +28,13 @@ TIER_2_THRESHOLD = Decimal('100.00')  # Healthy
 TIER_3_THRESHOLD = Decimal('50.00')   # Limited
 # Tier 4: < $50 (Critical)
 
+# Seconds the fund snapshot is trusted (fund writes on this worker update it
+# immediately - the TTL bounds how stale other writers' changes can be)
+FUND_SNAPSHOT_TTL = 10.0
+
+# Rendered /api/compensation/mission-fund responses live as long as the snapshot
+CACHE_TTL_FUND_BALANCE = FUND_SNAPSHOT_TTL
+
 # Payment matrix: mission_type -> [tier1, tier2, tier3, tier4]
 PAYMENT_MATRIX: Dict[str, list[Decimal]] = {
     'proposal':    [Decimal('2.00'), Decimal('1.50'), Decimal('1.00'), Decimal('0.50')],
@@ -27,66 +44,155 @@ PAYMENT_MATRIX: Dict[str, list[Decimal]] = {
 }
 
 
-def get_mission_fund_balance() -> Decimal:
+def tier_for_balance(balance: Decimal) -> int:
+    """Tier number (1-4) for a mission fund balance."""
+    if balance >= TIER_1_THRESHOLD:
+        return 1  # Abundant
+    if balance >= TIER_2_THRESHOLD:
+        return 2  # Healthy
+    if balance >= TIER_3_THRESHOLD:
+        return 3  # Limited
+    return 4  # Critical
+
+
+class FundSnapshot:
+    """
+    In-process mission fund balance and tier.
+
+    Coherence:
+    - Reads store a fresh balance only if no fund write started or finished
+      meanwhile (generation check, as in graph_cache.py)
+    - A write stores the balance its statement returned; overlapping writes
+      can't tell which result is newer, so they drop the snapshot instead
+    - Failed writes drop the snapshot (the statement may have applied)
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.balance: Optional[Decimal] = None
+        self.tier: Optional[int] = None
+        self.expires_at = 0.0
+        self.generation = 0
+        self._writes_in_flight = 0
+        self._writes_overlapped = False
+
+        self.hits = 0
+        self.refreshes = 0
+
+    def get(self) -> Optional[Tuple[int, Decimal]]:
+        """(tier, balance) if the snapshot is fresh, else None."""
+        if self.balance is None or self.expires_at <= time.monotonic():
+            return None
+        self.hits += 1
+        return (self.tier, self.balance)
+
+    def store(self, balance: Decimal, generation: Optional[int] = None) -> None:
+        """Record a balance read from the graph (dropped if a write raced it)."""
+        if generation is not None and generation != self.generation:
+            return
+        self.balance = balance
+        self.tier = tier_for_balance(balance)
+        self.expires_at = time.monotonic() + self.ttl
+        self.refreshes += 1
+
+    def invalidate(self) -> None:
+        self.balance = None
+        self.tier = None
+        self.generation += 1
+
+    def begin_write(self) -> None:
+        if self._writes_in_flight:
+            self._writes_overlapped = True
+        self._writes_in_flight += 1
+        self.generation += 1
+
+    def end_write(self, new_balance: Optional[Decimal]) -> None:
+        """Write the new balance through, or drop the snapshot if it can't be trusted."""
+        self._writes_in_flight -= 1
+        if new_balance is None or self._writes_overlapped:
+            self.invalidate()
+        else:
+            self.generation += 1
+            self.store(new_balance)
+        if not self._writes_in_flight:
+            self._writes_overlapped = False
+
+
+# Global snapshot (one per worker process)
+fund_snapshot = FundSnapshot(ttl=FUND_SNAPSHOT_TTL)
+
+
+async def get_mission_fund_balance(use_cache: bool = True) -> Decimal:
     """
-    Query FalkorDB for current mission fund balance.
+    Current mission fund balance.
+
+    Args:
+        use_cache: Serve from the fund snapshot (False forces a fresh read,
+                   e.g. before a payout)
 
     Returns:
         Mission fund balance as Decimal
 
     Note: Mission fund is a U4_Account node with accountType='mission_fund'
     """
+    if use_cache:
+        snapshot = fund_snapshot.get()
+        if snapshot is not None:
+            return snapshot[1]
+
     cypher = """
     MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
     RETURN fund.balance AS balance
     """
 
+    generation = fund_snapshot.generation
     try:
-        results = query_graph(cypher)
+        results = await query_graph(cypher)
 
         if not results or 'balance' not in results[0]:
             # If mission fund doesn't exist yet, return $0
             print("[tier_calculator] Mission fund not found, returning $0")
-            return Decimal('0.00')
-
-        balance = results[0]['balance']
-        return Decimal(str(balance))
+            balance = Decimal('0.00')
+        else:
+            balance = Decimal(str(results[0]['balance']))
 
+    except GraphUnavailableError:
+        # Graph down - fail fast instead of reporting a $0 fund (Tier 4)
+        raise
     except Exception as e:
         print(f"[tier_calculator:get_mission_fund_balance] Error: {e}")
-        # Return 0 instead of crashing (prevents memory issues)
+        # Return 0 instead of crashing (prevents memory issues) - not snapshotted
         return Decimal('0.00')
 
+    fund_snapshot.store(balance, generation)
+    return balance
+
 
-def get_current_tier() -> Tuple[int, Decimal]:
+async def get_current_tier() -> Tuple[int, Decimal]:
     """
     Determine current mission fund tier based on balance.
 
+    Served from the fund snapshot; reads the graph only when it expired.
+
     Returns:
         (tier_number, balance) tuple
         - tier_number: 1 (Abundant) | 2 (Healthy) | 3 (Limited) | 4 (Critical)
         - balance: Current mission fund balance
 
     Example:
-        >>> tier, balance = get_current_tier()
+        >>> tier, balance = await get_current_tier()
         >>> print(f"Tier {tier}, Balance: ${balance}")
         Tier 2, Balance: $150.00
     """
-    balance = get_mission_fund_balance()
-
-    if balance >= TIER_1_THRESHOLD:
-        tier = 1  # Abundant
-    elif balance >= TIER_2_THRESHOLD:
-        tier = 2  # Healthy
-    elif balance >= TIER_3_THRESHOLD:
-        tier = 3  # Limited
-    else:
-        tier = 4  # Critical
+    snapshot = fund_snapshot.get()
+    if snapshot is not None:
+        return snapshot
 
-    return (tier, balance)
+    balance = await get_mission_fund_balance(use_cache=False)
+    return (tier_for_balance(balance), balance)
 
 
-def get_mission_payment(mission_type: str, tier: int = None) -> Decimal:
+async def get_mission_payment(mission_type: str, tier: int = None) -> Decimal:
     """
     Get payment amount for a mission type at current or specified tier.
 
@@ -101,7 +207,7 @@ def get_mission_payment(mission_type: str, tier: int = None) -> Decimal:
         ValueError: If mission_type is invalid
 
     Example:
-        >>> payment = get_mission_payment('proposal')  # Uses current tier
+        >>> payment = await get_mission_payment('proposal')  # Uses current tier
         >>> print(f"Proposal payment: ${payment}")
         Proposal payment: $1.50
     """
@@ -113,7 +219,7 @@ def get_mission_payment(mission_type: str, tier: int = None) -> Decimal:
 
     # If tier not specified, get current tier
     if tier is None:
-        tier, _ = get_current_tier()
+        tier, _ = await get_current_tier()
 
     # Validate tier range
     if tier not in [1, 2, 3, 4]:
@@ -152,7 +258,7 @@ def get_tier_info(tier: int) -> Dict[str, str]:
     return tier_info_map[tier]
 
 
-def get_all_mission_payments(tier: int = None) -> Dict[str, Decimal]:
+async def get_all_mission_payments(tier: int = None) -> Dict[str, Decimal]:
     """
     Get payment amounts for all mission types at current or specified tier.
 
@@ -163,101 +269,126 @@ def get_all_mission_payments(tier: int = None) -> Dict[str, Decimal]:
         Dict mapping mission_type to payment amount
 
     Example:
-        >>> payments = get_all_mission_payments()
+        >>> payments = await get_all_mission_payments()
         >>> print(payments)
         {'proposal': Decimal('1.50'), 'social': Decimal('2.50'), ...}
     """
     if tier is None:
-        tier, _ = get_current_tier()
+        tier, _ = await get_current_tier()
 
+    # One tier lookup for every mission type
     return {
-        mission_type: get_mission_payment(mission_type, tier)
+        mission_type: await get_mission_payment(mission_type, tier)
         for mission_type in PAYMENT_MATRIX.keys()
     }
 
 
-def increase_mission_fund(amount: Decimal, source_job_slug: str, source_job_value: Decimal):
+async def _write_fund(cypher: str, params: Dict) -> Optional[Decimal]:
+    """
+    Run a ledger write and write the returned balance through to the snapshot.
+
+    Returns:
+        New balance, or None if the statement matched nothing (guard failed
+        or duplicate idempotency key)
+    """
+    new_balance = None
+    fund_snapshot.begin_write()
+    try:
+        results = await query_graph(cypher, params)
+        if results:
+            new_balance = Decimal(str(results[0]['new_balance']))
+        return new_balance
+    finally:
+        fund_snapshot.end_write(new_balance)
+        invalidate_graph_cache([cache_tag("U4_Account")])
+        publish_change(TOPIC_FUND)
+
+
+async def increase_mission_fund(
+    amount: Decimal,
+    source_job_slug: str,
+    source_job_value: Decimal,
+    idempotency_key: Optional[str] = None
+) -> Decimal:
     """
     Increase mission fund balance (5% from job completion).
 
+    One round trip: creates the fund if needed, credits it and appends the
+    U4_Transaction (see fund_ledger.py).
+
     Args:
         amount: Amount to add to mission fund (typically job_value * 0.05)
         source_job_slug: Job slug that contributed this amount
         source_job_value: Original job value
+        idempotency_key: Ledger key (default: one contribution per job)
+
+    Returns:
+        Fund balance after the credit (the original credit's balance if this
+        key was already applied)
 
     Note: Creates mission fund account if it doesn't exist
     """
-    # Check if mission fund exists
-    cypher_check = """
-    MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
-    RETURN fund
-    """
-    results = query_graph(cypher_check)
-
-    if not results:
-        # Create mission fund account
-        cypher_create = """
-        CREATE (fund:U4_Account {
-          name: 'ScopeLock Mission Fund',
-          slug: 'scopelock-mission-fund',
-          accountType: 'mission_fund',
-          level: 'L2',
-          scope_ref: 'scopelock',
-          balance: $amount,
-          currency: 'USD',
-          created_at: datetime(),
-          updated_at: datetime(),
-          valid_from: datetime(),
-          valid_to: null,
-          description: 'Fund for internal missions (5% from client jobs)',
-          type_name: 'U4_Account',
-          visibility: 'partners',
-          created_by: 'system',
-          substrate: 'organizational'
-        })
-        RETURN fund
-        """
-        query_graph(cypher_create, {"amount": float(amount)})
-        print(f"[tier_calculator] Created mission fund with ${amount}")
-    else:
-        # Increase existing balance
-        cypher_increase = """
-        MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
-        SET fund.balance = fund.balance + $amount,
-            fund.updated_at = datetime()
-        RETURN fund.balance AS new_balance
-        """
-        results = query_graph(cypher_increase, {"amount": float(amount)})
-        new_balance = results[0]['new_balance']
-        print(f"[tier_calculator] Mission fund increased by ${amount} → ${new_balance}")
-
-
-def decrease_mission_fund(amount: Decimal, mission_slug: str):
+    if amount <= 0:
+        raise ValueError(f"Mission fund credit must be positive, got ${amount}")
+
+    key = idempotency_key or fund_ledger.credit_key(source_job_slug)
+    new_balance = await _write_fund(
+        fund_ledger.CREDIT_CYPHER,
+        fund_ledger.ledger_params(amount, key, source_job_slug)
+    )
+
+    if new_balance is None:
+        rejection = await fund_ledger.explain_rejected_write(key)
+        if not rejection['duplicate']:
+            raise Exception(f"Mission fund credit {key} was not applied")
+        print(f"[tier_calculator] Mission fund credit {key} already applied (${source_job_value} job) - skipped")
+        return rejection['priorBalanceAfter']
+
+    print(f"[tier_calculator] Mission fund increased by ${amount} → ${new_balance}")
+    return new_balance
+
+
+async def decrease_mission_fund(
+    amount: Decimal,
+    mission_slug: str,
+    idempotency_key: Optional[str] = None
+) -> Decimal:
     """
     Decrease mission fund balance (mission payment).
 
+    One guarded round trip: the debit only applies if the balance covers it
+    at that moment, so concurrent payouts can't overdraw the fund.
+
     Args:
         amount: Amount to deduct from mission fund
         mission_slug: Mission slug that consumed this amount
+        idempotency_key: Ledger key (default: one payment per mission)
+
+    Returns:
+        Fund balance after the debit (the original debit's balance if this
+        key was already applied)
 
     Raises:
-        ValueError: If insufficient funds
+        ValueError: If insufficient funds (or no mission fund exists)
     """
-    current_balance = get_mission_fund_balance()
-
-    if current_balance < amount:
+    if amount <= 0:
+        raise ValueError(f"Mission fund debit must be positive, got ${amount}")
+
+    key = idempotency_key or fund_ledger.debit_key(mission_slug)
+    new_balance = await _write_fund(
+        fund_ledger.DEBIT_CYPHER,
+        fund_ledger.ledger_params(amount, key, mission_slug)
+    )
+
+    if new_balance is None:
+        rejection = await fund_ledger.explain_rejected_write(key)
+        if rejection['duplicate']:
+            print(f"[tier_calculator] Mission fund debit {key} already applied - skipped")
+            return rejection['priorBalanceAfter']
         raise ValueError(
             f"Insufficient mission fund balance. "
-            f"Available: ${current_balance}, Needed: ${amount}"
+            f"Available: ${rejection['balance'] or Decimal('0.00')}, Needed: ${amount}"
         )
 
-    cypher = """
-    MATCH (fund:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock'})
-    SET fund.balance = fund.balance - $amount,
-        fund.updated_at = datetime()
-    RETURN fund.balance AS new_balance
-    """
-
-    results = query_graph(cypher, {"amount": float(amount)})
-    new_balance = results[0]['new_balance']
     print(f"[tier_calculator] Mission fund decreased by ${amount} → ${new_balance}")
+    return new_balance
@@ -0,0 +1,128 @@
+"""
+Conditional GET (ETag / If-None-Match) for polled Mission Deck endpoints
+
+Dashboards poll earnings, mission fund status and the mission list every
+few seconds, and almost every poll returns the same payload. Each
+response is rendered once, stored with its ETag (content hash) in the
+response cache, and served from there: a poll carrying the current ETag
+gets 304 Not Modified without recomputing or reserializing anything.
+
+Architecture:
+- ETag = hash of the rendered JSON body, so it only changes when the
+  payload does (an expired entry that recomputes to the same bytes keeps
+  its ETag, and the client still gets 304); fields that change on every
+  compute, like sync cursors, can be left out of the hash
+- Entries live in response_cache (graph_cache.py), tagged with the graph
+  data they were built from: the writes that already invalidate cached
+  reads (chat messages, DoD/mission updates, fund changes) invalidate the
+  rendered responses too
+- A miss records the cache generation before computing, so a response
+  computed across a write is served but not stored
+- Per-process, like the result cache: TTLs bound how long another
+  worker's writes can stay invisible
+- graph_cache_enabled=False disables storage; ETags and 304s still work
+  (the payload is recomputed and compared)
+
+Version check cost: one dict lookup and a string compare.
+"""
+
+import hashlib
+from typing import AbstractSet, Awaitable, Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.config import settings
+from app.api.mission_deck.services.graph_cache import CacheTag, response_cache
+
+
+# Per-user payloads - shared caches must not store them; clients revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+# 304s sent since startup (GET /metrics)
+not_modified_sent = 0
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a rendered response body."""
+    return '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header covers this ETag.
+
+    Accepts lists ('"a", "b"'), weak validators (W/"a") and "*".
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _render(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    global not_modified_sent
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        not_modified_sent += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def conditional_json_response(
+    request: Request,
+    key: str,
+    compute: Callable[[], Awaitable[BaseModel]],
+    ttl: float,
+    tags: Callable[[BaseModel], Iterable[CacheTag]],
+    etag_exclude: Optional[AbstractSet[str]] = None
+) -> Response:
+    """
+    Serve a JSON payload with an ETag, answering If-None-Match with 304.
+
+    Args:
+        request: Incoming request (If-None-Match header)
+        key: Response cache key, e.g. "earnings:kara"
+        compute: Builds the response model (only called on a cache miss)
+        ttl: Seconds a rendered response may be served without recomputing
+        tags: (label, key) tags the payload depends on, from the computed model
+        etag_exclude: Top-level fields left out of the ETag (values that change on
+                      every compute but that a client may keep, e.g. a sync cursor)
+
+    Returns:
+        200 with body and ETag, or 304 with the ETag only
+
+    Raises:
+        Whatever compute() raised (routers map it to an HTTPException)
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    if settings.graph_cache_enabled:
+        found, cached = response_cache.get(key)
+        if found:
+            etag, body = cached
+            return _render(body, etag, if_none_match)
+
+    generation = response_cache.generation
+    model = await compute()
+    body = model.model_dump_json().encode("utf-8")
+    etag = make_etag(model.model_dump_json(exclude=etag_exclude).encode("utf-8") if etag_exclude else body)
+
+    if settings.graph_cache_enabled:
+        response_cache.set(
+            key,
+            (etag, body),
+            ttl,
+            tags=tags(model),
+            size=len(body),
+            generation=generation
+        )
+
+    return _render(body, etag, if_none_match)
@@ -19,7 +19,10 @@ import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
-from app.api.mission_deck.services.graph import query_graph
+# Emma is driven from CLI scripts, so it uses the blocking graph client
+from app.api.mission_deck.services.graph import query_graph_sync as query_graph
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache
+from app.api.mission_deck.services.graph_decoder import to_plain
 from app.config import settings
 
 # Local backup directory (fallback if FalkorDB unavailable)
@@ -37,7 +40,7 @@ def _save_local_backup(slug: str, data: Dict) -> None:
     try:
         backup_path = BACKUP_DIR / f"{slug}.json"
         with open(backup_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            json.dump(to_plain(data), f, indent=2, default=str)
     except Exception as e:
         print(f"[emma.py] Failed to save local backup: {e}")
 
@@ -886,6 +889,11 @@ def complete_mission(
         # Update local backup
         _save_local_backup(mission_slug, mission_node)
 
+        # Completed missions feed earnings - drop cached earnings responses.
+        # Open earnings streams live in the server process and notice the
+        # new updated_at through their change signal, not the change feed
+        invalidate_graph_cache([cache_tag("U4_Work_Item", mission_slug)])
+
         return mission_node
 
     except Exception as e:
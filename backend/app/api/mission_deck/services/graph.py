@@ -6,16 +6,45 @@ connecting to the production Mind Protocol v2 FalkorDB instance.
 
 Architecture:
 - REST API client (not direct database connection)
+- Async queries over a pooled keep-alive client (see graph_client.py)
+- query_graph_many() pipelines multi-statement work into one round trip
+- Hot reads go through a TTL/LRU result cache invalidated by writes (graph_cache.py)
 - Cypher query language for graph operations
+- Results decoded into slot-based dict-style rows/nodes (graph_decoder.py)
+- Retries, circuit breaker and hedged reads around every call (graph_resilience.py)
+- Per-call-site latency/size/row/error metrics and slow-query log (graph_metrics.py)
+- Identical concurrent reads share one in-flight request (graph_singleflight.py)
+- Parameters sent via FalkorDB's CYPHER preamble (constant query text per call site)
 - Mind Protocol v2 universal node attributes
 - Scope: scopelock (L2 org level)
 """
 
-import requests
+import asyncio
+import httpx
+import re
+import time
 import uuid
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+from datetime import datetime, timedelta, timezone
 from app.config import settings
+from app.api.mission_deck.services.change_feed import TOPIC_INTERACTIONS, publish_change
+from app.api.mission_deck.services.graph_client import get_graph_client, get_sync_graph_client
+from app.api.mission_deck.services.graph_cache import (
+    CacheTag,
+    cache_tag,
+    graph_cache,
+    invalidate_graph_cache,
+    make_cache_key
+)
+from app.api.mission_deck.services.graph_decoder import decode_result, loads
+from app.api.mission_deck.services.graph_metrics import (
+    call_site,
+    graph_metrics,
+    request_size,
+    resolve_call_site
+)
+from app.api.mission_deck.services.graph_resilience import graph_resilience, is_read_only
+from app.api.mission_deck.services.graph_singleflight import graph_singleflight
 
 
 # Production FalkorDB connection
@@ -23,82 +52,46 @@ FALKORDB_API_URL = settings.falkordb_api_url
 FALKORDB_API_KEY = settings.falkordb_api_key
 GRAPH_NAME = settings.graph_name
 
+# Result cache TTLs (seconds) for hot reads - writes invalidate these early
+CACHE_TTL_MISSION = 30.0
+CACHE_TTL_USER_MISSIONS = 15.0
+CACHE_TTL_DOD_ITEMS = 15.0
+CACHE_TTL_CITIZEN_MESSAGES = 5.0
+CACHE_TTL_MISSION_MESSAGES = 5.0
 
-def _parse_falkordb_node(node_data: List) -> Dict:
-    """
-    Parse FalkorDB node format into a dictionary.
-
-    FalkorDB returns nodes as:
-    [["id", 0], ["labels", ["NodeType"]], ["properties", [["key1", "val1"], ["key2", "val2"]]]]
+# Mission states shown in a developer's list - a mission leaving them is a
+# tombstone in delta sync
+ACTIVE_MISSION_STATES = ("todo", "doing")
 
-    Args:
-        node_data: FalkorDB node representation
-
-    Returns:
-        Dict with node properties
-    """
-    result = {}
-    for item in node_data:
-        if item[0] == "properties":
-            # Parse properties list into dict
-            for prop in item[1]:
-                result[prop[0]] = prop[1]
-        elif item[0] == "id":
-            result["_id"] = item[1]
-        elif item[0] == "labels":
-            result["_labels"] = item[1]
-    return result
+# Range index behind delta sync (updated_at > $since)
+_MISSION_SYNC_INDEX_CYPHER = "CREATE INDEX FOR (m:U4_Work_Item) ON (m.updated_at)"
 
 
 def _parse_falkordb_result(raw_result: List) -> List[Dict]:
     """
-    Parse FalkorDB result format into list of dicts.
+    Parse FalkorDB result format into dict-style rows.
 
     FalkorDB format:
     - result[0] = column names: ["col1", "col2"]
     - result[1] = data rows: [[[node_data]], [[node_data]]]
     - result[2] = metadata: ["Nodes created: 1", ...]
 
+    See graph_decoder.py for the row/node types (read-only Mappings).
+
     Args:
         raw_result: Raw FalkorDB result
 
     Returns:
-        List of dicts with column names as keys
+        List of rows with column names as keys
     """
-    if not raw_result or len(raw_result) < 2:
-        return []
-
-    columns = raw_result[0]
-    rows = raw_result[1]
-
-    if not rows:
-        return []
-
-    parsed_rows = []
-    for row in rows:
-        parsed_row = {}
-        for i, col_name in enumerate(columns):
-            if i < len(row):
-                # Check if this is a node (list of lists with specific format)
-                cell_data = row[i]
-                if isinstance(cell_data, list) and len(cell_data) > 0:
-                    # Check if it looks like a node (has id/labels/properties)
-                    if isinstance(cell_data[0], list) and len(cell_data[0]) == 2:
-                        parsed_row[col_name] = _parse_falkordb_node(cell_data)
-                    else:
-                        parsed_row[col_name] = cell_data
-                else:
-                    parsed_row[col_name] = cell_data
-        parsed_rows.append(parsed_row)
-
-    return parsed_rows
+    return decode_result(raw_result)
 
 
 def _escape_cypher_value(value: Any) -> str:
     """
-    Escape a Python value for inline Cypher query.
+    Render a Python value as a Cypher literal.
 
-    FalkorDB doesn't support parameterized queries, so we must inline values safely.
+    Used for the CYPHER parameter preamble (and legacy inline mode).
 
     Args:
         value: Python value to escape
@@ -113,8 +106,8 @@ def _escape_cypher_value(value: Any) -> str:
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, str):
-        # Escape single quotes for Cypher strings
-        escaped = value.replace("'", "\\'")
+        # Escape backslashes first, then single quotes, for Cypher strings
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
         return f"'{escaped}'"
     elif isinstance(value, list):
         # Convert list to Cypher array
@@ -129,65 +122,439 @@ def _escape_cypher_value(value: Any) -> str:
         return _escape_cypher_value(str(value))
 
 
-def query_graph(cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Dict]:
+# Cypher parameter reference ($name) and valid parameter names
+_PARAM_REF_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+_PARAM_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _cypher_params_preamble(params: Dict[str, Any]) -> str:
+    """
+    Build FalkorDB's parameter header: "CYPHER slug='mission-47' limit=50 ".
+
+    FalkorDB caches execution plans by the query text that follows this
+    header, so every call site keeps a single cached plan no matter which
+    slug or limit it is called with.
+    """
+    parts = []
+    for key, value in params.items():
+        if not _PARAM_NAME_RE.match(key):
+            raise ValueError(f"Invalid Cypher parameter name: {key!r}")
+        parts.append(f"{key}={_escape_cypher_value(value)}")
+    return "CYPHER " + " ".join(parts) + " "
+
+
+def _inline_params(cypher: str, params: Dict[str, Any]) -> str:
+    """
+    Substitute $name references with literals (legacy FALKORDB_PARAM_MODE=inline).
+
+    Matches whole parameter names, so $slug never clobbers $slug_x.
+    """
+    def substitute(match: "re.Match[str]") -> str:
+        key = match.group(1)
+        return _escape_cypher_value(params[key]) if key in params else match.group(0)
+
+    return _PARAM_REF_RE.sub(substitute, cypher)
+
+
+def _build_query_payload(cypher: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the JSON body for a FalkorDB REST query.
+
+    Parameters are passed separately from the query text so the text stays
+    constant per call site (FalkorDB plan cache hits). FALKORDB_PARAM_MODE:
+    - "preamble": FalkorDB's native "CYPHER k=v ..." header (default)
+    - "params": JSON "params" field, for proxies that forward it
+    - "inline": legacy literal substitution into the query text
+    """
+    if not FALKORDB_API_URL or not FALKORDB_API_KEY:
+        raise ValueError(
+            "FalkorDB credentials missing. Set FALKORDB_API_URL and FALKORDB_API_KEY."
+        )
+
+    mode = settings.falkordb_param_mode
+    if params and mode == "params":
+        return {"graph_name": GRAPH_NAME, "query": cypher, "params": params}
+
+    if params and mode == "inline":
+        cypher = _inline_params(cypher, params)
+    elif params:
+        cypher = _cypher_params_preamble(params) + cypher
+
+    return {
+        "graph_name": GRAPH_NAME,
+        "query": cypher,
+        "params": {}
+    }
+
+
+def _parse_query_response(response: httpx.Response) -> List[Dict]:
+    """Raise on HTTP errors and parse the FalkorDB result payload."""
+    response.raise_for_status()
+    # FalkorDB returns "result" (not "results"), and in a special format
+    raw_result = loads(response.content).get("result", [])
+    return _parse_falkordb_result(raw_result)
+
+
+async def query_graph(
+    cypher: str,
+    params: Optional[Dict[str, Any]] = None,
+    cache_ttl: Optional[float] = None,
+    cache_tags: Iterable[CacheTag] = ()
+) -> List[Dict]:
     """
     Execute Cypher query on FalkorDB production graph.
 
-    IMPORTANT: FalkorDB doesn't support parameterized queries, so parameters are
-    interpolated inline using safe escaping.
+    Uses the shared pooled async client (graph_client.py), so the event loop
+    keeps serving other requests while this query is in flight. Concurrent
+    identical reads share one request (graph_singleflight.py).
 
     Args:
         cypher: Cypher query string (use $param for parameters)
-        params: Dict of parameters to substitute in query
+        params: Query parameters, referenced as $name in the Cypher
+        cache_ttl: Seconds to serve this read from the result cache (reads only;
+                   None bypasses the cache)
+        cache_tags: (label, key) tags the cached result depends on, used by
+                    writers to invalidate it (see graph_cache.py)
 
     Returns:
-        List of result dictionaries
+        List of result dictionaries (cached and coalesced rows are shared - don't mutate)
 
     Raises:
-        requests.HTTPError: If FalkorDB API returns error
+        httpx.HTTPError: If FalkorDB API returns error or is unreachable
+        GraphUnavailableError: If retries are exhausted or the circuit is open
 
     Example:
-        results = query_graph(
+        results = await query_graph(
             "MATCH (m:U4_Work_Item {slug: $slug}) RETURN m",
-            {"slug": "mission-47"}
+            {"slug": "mission-47"},
+            cache_ttl=30,
+            cache_tags=[cache_tag("U4_Work_Item", "mission-47")]
         )
     """
-    if not FALKORDB_API_URL or not FALKORDB_API_KEY:
-        raise ValueError(
-            "FalkorDB credentials missing. Set FALKORDB_API_URL and FALKORDB_API_KEY."
+    caller = resolve_call_site()
+    use_cache = cache_ttl is not None and settings.graph_cache_enabled
+    read_only = is_read_only(cypher)
+    key = make_cache_key(cypher, params) if use_cache or read_only else None
+    if use_cache:
+        found, cached = graph_cache.get(key)
+        if found:
+            graph_metrics.record_cache_hit(caller, cypher)
+            return cached
+        generation = graph_cache.generation
+
+    if read_only and settings.graph_coalesce_enabled:
+        # Keyed by cache generation too: writes invalidate (bumping it), so a
+        # read issued after a write never joins a flight that started before it
+        (results, size), shared = await graph_singleflight.do(
+            f"{graph_cache.generation}:{key}",
+            lambda: _execute_query(cypher, params, caller, idempotent=True)
+        )
+        if shared:
+            graph_metrics.record_coalesced(caller, cypher)
+            results = list(results)
+    else:
+        results, size = await _execute_query(cypher, params, caller, idempotent=read_only)
+
+    if use_cache:
+        graph_cache.set(
+            key,
+            results,
+            ttl=cache_ttl,
+            tags=cache_tags,
+            size=size,
+            generation=generation
         )
+    return results
 
-    # Inline parameters since FalkorDB doesn't support parameterized queries
-    if params:
-        for key, value in params.items():
-            escaped_value = _escape_cypher_value(value)
-            cypher = cypher.replace(f"${key}", escaped_value)
 
+async def _execute_query(
+    cypher: str,
+    params: Optional[Dict[str, Any]],
+    caller: str,
+    idempotent: bool
+) -> Tuple[List[Dict], int]:
+    """
+    Send one statement to FalkorDB and record its metrics.
+
+    Returns:
+        (parsed results, response body size in bytes)
+    """
+    payload = _build_query_payload(cypher, params)
+
+    response = None
+    started = time.perf_counter()
     try:
-        response = requests.post(
-            FALKORDB_API_URL,
-            headers={
-                "Content-Type": "application/json",
-                "X-API-Key": FALKORDB_API_KEY
-            },
-            json={
-                "graph_name": GRAPH_NAME,
-                "query": cypher,
-                "params": {}  # Always empty since we inline
-            },
-            timeout=10
+        client = await get_graph_client()
+        response = await graph_resilience.execute(
+            lambda: client.post(FALKORDB_API_URL, json=payload),
+            idempotent=idempotent
+        )
+        results = _parse_query_response(response)
+    except httpx.HTTPError as e:
+        graph_metrics.record(
+            caller, cypher, time.perf_counter() - started,
+            request_bytes=request_size(response), error=e, params=params
         )
-        response.raise_for_status()
-        # FalkorDB returns "result" (not "results"), and in a special format
-        raw_result = response.json().get("result", [])
-        return _parse_falkordb_result(raw_result)
-    except requests.exceptions.RequestException as e:
         # Fail loud per ScopeLock fail-loud principle
         print(f"[graph.py:query_graph] FalkorDB query failed: {e}")
         raise
 
+    graph_metrics.record(
+        caller, cypher, time.perf_counter() - started,
+        request_bytes=request_size(response),
+        response_bytes=len(response.content),
+        rows=len(results),
+        params=params
+    )
+    return results, len(response.content)
+
+
+def query_graph_sync(cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    """
+    Blocking variant of query_graph() for CLI scripts and citizen tooling.
+
+    Never call this from an async route handler - it blocks the event loop.
+
+    Args:
+        cypher: Cypher query string (use $param for parameters)
+        params: Query parameters, referenced as $name in the Cypher
+
+    Returns:
+        List of result dictionaries
+
+    Raises:
+        httpx.HTTPError: If FalkorDB API returns error or is unreachable
+    """
+    caller = resolve_call_site()
+    payload = _build_query_payload(cypher, params)
+
+    response = None
+    started = time.perf_counter()
+    try:
+        client = get_sync_graph_client()
+        response = graph_resilience.execute_sync(
+            lambda: client.post(FALKORDB_API_URL, json=payload),
+            idempotent=is_read_only(cypher)
+        )
+        results = _parse_query_response(response)
+    except httpx.HTTPError as e:
+        graph_metrics.record(
+            caller, cypher, time.perf_counter() - started,
+            request_bytes=request_size(response), error=e, params=params
+        )
+        # Fail loud per ScopeLock fail-loud principle
+        print(f"[graph.py:query_graph_sync] FalkorDB query failed: {e}")
+        raise
+
+    graph_metrics.record(
+        caller, cypher, time.perf_counter() - started,
+        request_bytes=request_size(response),
+        response_bytes=len(response.content),
+        rows=len(results),
+        params=params
+    )
+    return results
+
+
+# A graph statement: bare Cypher string or (cypher, params) tuple
+GraphStatement = Union[str, Tuple[str, Optional[Dict[str, Any]]]]
+
+# Whether the REST proxy accepts pipelined batches (None = not probed yet)
+_pipeline_supported: Optional[bool] = None
+
+# Status codes a proxy without batch support answers a "queries" body with
+_PIPELINE_UNSUPPORTED_STATUS = {400, 404, 405, 422, 501}
+
+
+def is_unsupported_query_error(error: Exception) -> bool:
+    """True if FalkorDB rejected a query for using a construct it doesn't support (HTTP 4xx)."""
+    if not isinstance(error, httpx.HTTPStatusError) or not 400 <= error.response.status_code < 500:
+        return False
+    detail = error.response.text.lower()
+    return "not supported" in detail or "unsupported" in detail
+
+
+def _normalize_statement(statement: GraphStatement) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Turn a bare Cypher string or (cypher, params) tuple into a tuple."""
+    if isinstance(statement, str):
+        return statement, None
+    cypher, params = statement
+    return cypher, params
+
+
+async def _pipeline_queries(
+    statements: List[Tuple[str, Optional[Dict[str, Any]]]]
+) -> Optional[List[List[Dict]]]:
+    """
+    Ship a batch of statements to FalkorDB in one HTTP exchange.
+
+    Wire format (executed in order by the proxy):
+        request:  {"graph_name": ..., "queries": [{"query": ..., "params": {}}, ...]}
+        response: {"results": [<FalkorDB result>, ...]}
+
+    Returns:
+        Parsed result sets in statement order, or None if the proxy doesn't
+        support pipelining (caller falls back to per-statement dispatch)
+    """
+    global _pipeline_supported
+
+    queries = []
+    for cypher, params in statements:
+        payload = _build_query_payload(cypher, params)
+        queries.append({"query": payload["query"], "params": payload["params"]})
+
+    body = {"graph_name": GRAPH_NAME, "queries": queries}
+    caller = resolve_call_site()
+    started = time.perf_counter()
+    client = await get_graph_client()
+    try:
+        response = await graph_resilience.execute(
+            lambda: client.post(FALKORDB_API_URL, json=body),
+            idempotent=all(is_read_only(cypher) for cypher, _ in statements)
+        )
+    except httpx.HTTPError as e:
+        _record_batch(caller, statements, time.perf_counter() - started, error=e)
+        raise
+
+    # Only downgrade while probing - once batches worked, a 4xx is a real query error.
+    # Only read batches probe: a write batch that partly ran must not be re-run
+    # statement by statement (query_graph_many probes with a read batch first)
+    probing = (
+        _pipeline_supported is None
+        and settings.falkordb_pipeline == "auto"
+        and all(is_read_only(cypher) for cypher, _ in statements)
+    )
+    if probing and response.status_code in _PIPELINE_UNSUPPORTED_STATUS:
+        _pipeline_supported = False
+        print(f"[graph.py:query_graph_many] Pipelining unsupported (HTTP {response.status_code}), using concurrent dispatch")
+        return None
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        _record_batch(caller, statements, time.perf_counter() - started, response=response, error=e)
+        raise
+    raw_results = loads(response.content).get("results")
+
+    if not isinstance(raw_results, list) or len(raw_results) != len(statements):
+        if probing:
+            _pipeline_supported = False
+            print("[graph.py:query_graph_many] Pipelining unsupported (no batch results), using concurrent dispatch")
+            return None
+        raise ValueError(
+            f"FalkorDB batch returned {len(raw_results or [])} result sets for {len(statements)} statements"
+        )
+
+    _pipeline_supported = True
+    results = [_parse_falkordb_result(raw) for raw in raw_results]
+    _record_batch(caller, statements, time.perf_counter() - started, response=response, results=results)
+    return results
+
+
+# Read-only batch used to probe pipelining before the first write batch
+_PIPELINE_PROBE = [("RETURN 1 AS probe", None), ("RETURN 1 AS probe", None)]
+
+
+async def _probe_pipeline() -> None:
+    """Find out whether the proxy accepts batches, using a read-only batch (sets _pipeline_supported)."""
+    try:
+        await _pipeline_queries(_PIPELINE_PROBE)
+    except (httpx.HTTPError, ValueError) as e:
+        # Inconclusive - the write batch itself will be shipped as a batch and fail loud
+        print(f"[graph.py:query_graph_many] Pipelining probe failed: {e}")
+
+
+def _record_batch(
+    caller: str,
+    statements: List[Tuple[str, Optional[Dict[str, Any]]]],
+    seconds: float,
+    response: Optional[httpx.Response] = None,
+    results: Optional[List[List[Dict]]] = None,
+    error: Optional[Exception] = None
+) -> None:
+    """Record a pipelined exchange, splitting its time and bytes across statements."""
+    share = len(statements)
+    request_bytes = request_size(response) // share
+    response_bytes = len(response.content) // share if response is not None else 0
+    for i, (cypher, params) in enumerate(statements):
+        graph_metrics.record(
+            caller, cypher, seconds / share,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            rows=len(results[i]) if results is not None else 0,
+            error=error,
+            params=params
+        )
+
+
+async def query_graph_many(
+    statements: Sequence[GraphStatement],
+    ordered: bool = False
+) -> List[List[Dict]]:
+    """
+    Execute several Cypher statements with as few round trips as possible.
+
+    Ships the whole batch in one HTTP exchange when the REST proxy supports
+    pipelining. Otherwise falls back to dispatching statements individually:
+    concurrently (bounded by FALKORDB_BATCH_CONCURRENCY) or, for ordered
+    batches, one after another.
 
-def get_mission_by_slug(slug: str) -> Optional[Dict]:
+    Args:
+        statements: Cypher strings or (cypher, params) tuples
+        ordered: True if later statements depend on earlier ones
+                 (e.g. create a node, then link it)
+
+    Returns:
+        List of result lists, one per statement, in statement order
+
+    Raises:
+        httpx.HTTPError: If FalkorDB API returns error or is unreachable
+
+    Example:
+        created, linked = await query_graph_many([
+            (cypher_create, {"slug": slug}),
+            (cypher_link, {"slug": slug, "mission_slug": mission_slug}),
+        ], ordered=True)
+    """
+    normalized = [_normalize_statement(statement) for statement in statements]
+
+    if not normalized:
+        return []
+    if len(normalized) == 1:
+        return [await query_graph(*normalized[0])]
+
+    # Fallback tasks don't have the caller on their stack - pin it for them
+    with call_site():
+        if (
+            settings.falkordb_pipeline == "auto"
+            and _pipeline_supported is None
+            and not all(is_read_only(cypher) for cypher, _ in normalized)
+        ):
+            await _probe_pipeline()
+
+        if settings.falkordb_pipeline != "off" and _pipeline_supported is not False:
+            try:
+                results = await _pipeline_queries(normalized)
+            except httpx.HTTPError as e:
+                # Fail loud per ScopeLock fail-loud principle
+                print(f"[graph.py:query_graph_many] FalkorDB batch failed: {e}")
+                raise
+            if results is not None:
+                return results
+
+        if ordered:
+            return [await query_graph(cypher, params) for cypher, params in normalized]
+
+        semaphore = asyncio.Semaphore(settings.falkordb_batch_concurrency)
+
+        async def run(cypher: str, params: Optional[Dict[str, Any]]) -> List[Dict]:
+            async with semaphore:
+                return await query_graph(cypher, params)
+
+        return list(await asyncio.gather(*(run(cypher, params) for cypher, params in normalized)))
+
+
+async def get_mission_by_slug(slug: str) -> Optional[Dict]:
     """
     Get mission node by slug.
 
@@ -202,11 +569,16 @@ def get_mission_by_slug(slug: str) -> Optional[Dict]:
     WHERE m.work_type = 'mission'
     RETURN m
     """
-    results = query_graph(cypher, {"slug": slug})
+    results = await query_graph(
+        cypher,
+        {"slug": slug},
+        cache_ttl=CACHE_TTL_MISSION,
+        cache_tags=[cache_tag("U4_Work_Item", slug)]
+    )
     return results[0]["m"] if results else None
 
 
-def get_user_missions(assignee_ref: str) -> List[Dict]:
+async def get_user_missions(assignee_ref: str) -> List[Dict]:
     """
     Get all missions assigned to a developer.
 
@@ -220,15 +592,113 @@ def get_user_missions(assignee_ref: str) -> List[Dict]:
     MATCH (m:U4_Work_Item {scope_ref: 'scopelock'})
     WHERE m.work_type = 'mission'
       AND m.assignee_ref = $assignee_ref
-      AND m.state IN ['todo', 'doing']
+      AND m.state IN $states
     RETURN m
     ORDER BY m.due_date ASC
     """
-    results = query_graph(cypher, {"assignee_ref": assignee_ref})
+    # Collection read: any U4_Work_Item write may change it
+    results = await query_graph(
+        cypher,
+        {"assignee_ref": assignee_ref, "states": list(ACTIVE_MISSION_STATES)},
+        cache_ttl=CACHE_TTL_USER_MISSIONS,
+        cache_tags=[cache_tag("U4_Work_Item")]
+    )
     return [r["m"] for r in results]
 
 
-def get_citizen_messages(citizen_id: str, limit: int = 50) -> List[Dict]:
+async def get_user_missions_changed_since(assignee_ref: str, since: str) -> List[Dict]:
+    """
+    Get a developer's missions updated after a sync cursor, in any state.
+
+    Missions no longer in ACTIVE_MISSION_STATES are returned too, so the
+    caller can report them as removed from the list.
+
+    Args:
+        assignee_ref: Developer slug (e.g., "bigbosexf", "kara")
+        since: Sync cursor (updated_at ISO timestamp, see validate_sync_cursor)
+
+    Returns:
+        List of mission nodes, oldest update first
+    """
+    cypher = """
+    MATCH (m:U4_Work_Item {scope_ref: 'scopelock'})
+    WHERE m.updated_at > $since
+      AND m.work_type = 'mission'
+      AND m.assignee_ref = $assignee_ref
+    RETURN m
+    ORDER BY m.updated_at ASC
+    """
+    # Collection read: any U4_Work_Item write may change it
+    results = await query_graph(
+        cypher,
+        {"assignee_ref": assignee_ref, "since": since},
+        cache_ttl=CACHE_TTL_USER_MISSIONS,
+        cache_tags=[cache_tag("U4_Work_Item")]
+    )
+    return [r["m"] for r in results]
+
+
+def format_sync_cursor(moment: datetime) -> str:
+    """
+    Format a moment as a sync cursor: UTC, microseconds, "Z" suffix.
+
+    The same format as stored updated_at values (datetime.utcnow().isoformat() + 'Z'),
+    so cursors and timestamps compare correctly as strings.
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def validate_sync_cursor(since: str) -> str:
+    """
+    Check a delta sync cursor and normalize it for the graph.
+
+    Cursors (issue_sync_cursor) are compared as strings against stored updated_at values
+    (UTC, "Z" suffix), so any other offset is converted to UTC first;
+    a timestamp without an offset is taken as UTC.
+
+    Args:
+        since: Cursor from a previous response
+
+    Returns:
+        The cursor in the stored format (see format_sync_cursor)
+
+    Raises:
+        ValueError: If the cursor is not an ISO timestamp
+    """
+    try:
+        moment = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        raise ValueError(f"Invalid sync cursor: {since}. Use the cursor from a previous response.")
+    return format_sync_cursor(moment)
+
+
+def issue_sync_cursor() -> str:
+    """
+    Cursor for a delta sync read that starts now.
+
+    Server time minus SYNC_CURSOR_MARGIN_SECONDS rather than the newest
+    updated_at returned: updated_at is stamped before the write commits,
+    so an older stamp can become visible after a newer one was synced.
+    The next delta re-reads the margin window instead (clients merge by
+    id, so re-sent items are harmless). Call it before reading.
+    """
+    return format_sync_cursor(datetime.utcnow() - timedelta(seconds=settings.sync_cursor_margin_seconds))
+
+
+async def ensure_mission_sync_index() -> None:
+    """Create the U4_Work_Item.updated_at index delta sync relies on (no-op if it exists)."""
+    try:
+        await query_graph(_MISSION_SYNC_INDEX_CYPHER)
+    except Exception as e:
+        # FalkorDB rejects creating an index that already exists
+        if "already" not in str(e).lower():
+            print(f"[graph.py:ensure_mission_sync_index] Error: {e}")
+            raise
+
+
+async def get_citizen_messages(citizen_id: str, limit: int = 50) -> List[Dict]:
     """
     Get shared chat messages for a citizen.
 
@@ -250,14 +720,45 @@ def get_citizen_messages(citizen_id: str, limit: int = 50) -> List[Dict]:
     ORDER BY msg.timestamp ASC
     LIMIT $limit
     """
-    results = query_graph(cypher, {
-        "citizen_id": citizen_id,
-        "limit": limit
-    })
+    results = await query_graph(
+        cypher,
+        {"citizen_id": citizen_id, "limit": limit},
+        cache_ttl=CACHE_TTL_CITIZEN_MESSAGES,
+        cache_tags=[cache_tag("U4_Event", citizen_id)]
+    )
     return [r["msg"] for r in results]
 
 
-def get_mission_dod_items(mission_slug: str) -> List[Dict]:
+async def get_mission_messages(mission_slug: str, limit: int = 20) -> List[Dict]:
+    """
+    Get the most recent chat messages about a mission.
+
+    Args:
+        mission_slug: Mission slug
+        limit: Max number of messages to return (default 20)
+
+    Returns:
+        List of message nodes (U4_Event with event_kind='message'), oldest first
+    """
+    cypher = """
+    MATCH (msg:U4_Event)-[:U4_ABOUT]->(mission:U4_Work_Item {slug: $mission_slug, scope_ref: 'scopelock'})
+    WHERE msg.event_kind = 'message'
+      AND msg.scope_ref = 'scopelock'
+    RETURN msg
+    ORDER BY msg.timestamp DESC
+    LIMIT $limit
+    """
+    # create_chat_message invalidates the mission's U4_Event tag
+    results = await query_graph(
+        cypher,
+        {"mission_slug": mission_slug, "limit": limit},
+        cache_ttl=CACHE_TTL_MISSION_MESSAGES,
+        cache_tags=[cache_tag("U4_Event", mission_slug)]
+    )
+    return [r["msg"] for r in reversed(results)]
+
+
+async def get_mission_dod_items(mission_slug: str) -> List[Dict]:
     """
     Get DoD checklist items for a mission.
 
@@ -274,11 +775,17 @@ def get_mission_dod_items(mission_slug: str) -> List[Dict]:
     RETURN task
     ORDER BY task.dod_category, task.dod_sort_order
     """
-    results = query_graph(cypher, {"mission_slug": mission_slug})
+    # Tagged with the mission: task updates invalidate the mission's checklist
+    results = await query_graph(
+        cypher,
+        {"mission_slug": mission_slug},
+        cache_ttl=CACHE_TTL_DOD_ITEMS,
+        cache_tags=[cache_tag("U4_Work_Item", mission_slug)]
+    )
     return [r["task"] for r in results]
 
 
-def create_citizen_message(
+async def create_citizen_message(
     citizen_id: str,
     role: str,
     content: str,
@@ -344,7 +851,7 @@ def create_citizen_message(
     """
 
     try:
-        results = query_graph(cypher_create, {
+        results = await query_graph(cypher_create, {
             "name": msg_name,
             "slug": msg_slug,
             "citizen_id": citizen_id,
@@ -371,8 +878,12 @@ def create_citizen_message(
         print(f"[graph.py:create_citizen_message] Failed to create message for {citizen_id}: {e}")
         raise
 
+    finally:
+        # Invalidate even on failure - a timed-out write may still have landed
+        invalidate_graph_cache([cache_tag("U4_Event", citizen_id)])
+
 
-def create_chat_message(
+async def create_chat_message(
     mission_slug: str,
     role: str,
     content: str,
@@ -436,59 +947,72 @@ def create_chat_message(
     RETURN msg
     """
 
+    # Link message to mission (generate timestamps for edge); messages about a
+    # job also bump the job × member interaction counter in the same statement
+    # (see compensation/interaction_counters.py)
+    edge_created_at = datetime.utcnow().isoformat() + 'Z'
+    edge_updated_at = edge_created_at
+    edge_valid_from = edge_created_at
+
+    cypher_link = """
+    MATCH (msg:U4_Event {slug: $msg_slug})
+    MATCH (mission:U4_Work_Item {slug: $mission_slug})
+    CREATE (msg)-[:U4_ABOUT {
+      focus_type: 'primary_subject',
+      created_at: $edge_created_at,
+      updated_at: $edge_updated_at,
+      valid_from: $edge_valid_from,
+      valid_to: null,
+      confidence: 1.0,
+      energy: 0.7,
+      forming_mindstate: 'guidance',
+      goal: 'Chat message about mission',
+      visibility: 'partners',
+      commitments: [],
+      created_by: $created_by,
+      substrate: 'organizational'
+    }]->(mission)
+    WITH mission
+    WHERE mission.work_type = 'job' AND mission.scope_ref = 'scopelock'
+    MERGE (counter:U4_Interaction_Counter {job_slug: mission.slug, member_slug: $actor_ref, scope_ref: 'scopelock'})
+    ON CREATE SET counter.count = 1, counter.updated_at = $edge_created_at
+    ON MATCH SET counter.count = counter.count + 1, counter.updated_at = $edge_created_at
+    """
+
     try:
-        results = query_graph(cypher_create, {
-            "name": msg_name,
-            "slug": msg_slug,
-            "actor_ref": actor_ref,
-            "timestamp": timestamp,
-            "role": role,
-            "content": content,
-            "code_blocks": code_blocks or [],
-            "created_at": created_at,
-            "updated_at": updated_at,
-            "valid_from": valid_from,
-            "description": f"Chat message from {actor_ref}",
-            "detailed_description": content[:200],
-            "created_by": actor_ref
-        })
+        # Create + link in one round trip (ordered: the link needs the new node)
+        results, _ = await query_graph_many([
+            (cypher_create, {
+                "name": msg_name,
+                "slug": msg_slug,
+                "actor_ref": actor_ref,
+                "timestamp": timestamp,
+                "role": role,
+                "content": content,
+                "code_blocks": code_blocks or [],
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "valid_from": valid_from,
+                "description": f"Chat message from {actor_ref}",
+                "detailed_description": content[:200],
+                "created_by": actor_ref
+            }),
+            (cypher_link, {
+                "msg_slug": msg_slug,
+                "mission_slug": mission_slug,
+                "edge_created_at": edge_created_at,
+                "edge_updated_at": edge_updated_at,
+                "edge_valid_from": edge_valid_from,
+                "created_by": actor_ref,
+                "actor_ref": actor_ref
+            })
+        ], ordered=True)
 
         if not results:
             raise Exception("Failed to create message node")
 
-        # Link message to mission (generate timestamps for edge)
-        edge_created_at = datetime.utcnow().isoformat() + 'Z'
-        edge_updated_at = edge_created_at
-        edge_valid_from = edge_created_at
-
-        cypher_link = """
-        MATCH (msg:U4_Event {slug: $msg_slug})
-        MATCH (mission:U4_Work_Item {slug: $mission_slug})
-        CREATE (msg)-[:U4_ABOUT {
-          focus_type: 'primary_subject',
-          created_at: $edge_created_at,
-          updated_at: $edge_updated_at,
-          valid_from: $edge_valid_from,
-          valid_to: null,
-          confidence: 1.0,
-          energy: 0.7,
-          forming_mindstate: 'guidance',
-          goal: 'Chat message about mission',
-          visibility: 'partners',
-          commitments: [],
-          created_by: $created_by,
-          substrate: 'organizational'
-        }]->(mission)
-        """
-
-        query_graph(cypher_link, {
-            "msg_slug": msg_slug,
-            "mission_slug": mission_slug,
-            "edge_created_at": edge_created_at,
-            "edge_updated_at": edge_updated_at,
-            "edge_valid_from": edge_valid_from,
-            "created_by": actor_ref
-        })
+        # Messages about a job change its members' earnings (earnings streams)
+        publish_change(TOPIC_INTERACTIONS, mission_slug)
 
         return results[0]["msg"]
 
@@ -497,20 +1021,25 @@ def create_chat_message(
         print(f"[graph.py:create_chat_message] Failed to create message: {e}")
         raise
 
+    finally:
+        invalidate_graph_cache([cache_tag("U4_Event", mission_slug)])
 
-def update_dod_task_state(task_slug: str, new_state: str) -> Dict:
+
+def dod_task_state_statement(task_slug: str, new_state: str) -> Tuple[str, Dict[str, Any]]:
     """
-    Update DoD task state (todo/doing/done).
+    Build the (cypher, params) statement that sets a DoD task's state.
+
+    Shared by update_dod_task_state() and batched callers (query_graph_many).
 
     Args:
         task_slug: DoD task slug
         new_state: "todo" | "doing" | "done"
 
     Returns:
-        Updated task node
+        (cypher, params) tuple returning the updated task as `task`
 
     Raises:
-        Exception: If task not found or update fails
+        ValueError: If new_state is invalid
     """
     if new_state not in ["todo", "doing", "done"]:
         raise ValueError(f"Invalid state: {new_state}. Must be todo/doing/done.")
@@ -525,12 +1054,37 @@ def update_dod_task_state(task_slug: str, new_state: str) -> Dict:
     RETURN task
     """
 
+    return cypher, {
+        "slug": task_slug,
+        "new_state": new_state,
+        "updated_at": updated_at
+    }
+
+
+async def update_dod_task_state(
+    task_slug: str,
+    new_state: str,
+    mission_slug: Optional[str] = None
+) -> Dict:
+    """
+    Update DoD task state (todo/doing/done).
+
+    Args:
+        task_slug: DoD task slug
+        new_state: "todo" | "doing" | "done"
+        mission_slug: Mission the task belongs to (narrows cache invalidation;
+                      None invalidates every cached U4_Work_Item read)
+
+    Returns:
+        Updated task node
+
+    Raises:
+        Exception: If task not found or update fails
+    """
+    cypher, params = dod_task_state_statement(task_slug, new_state)
+
     try:
-        results = query_graph(cypher, {
-            "slug": task_slug,
-            "new_state": new_state,
-            "updated_at": updated_at
-        })
+        results = await query_graph(cypher, params)
 
         if not results:
             raise Exception(f"DoD task not found: {task_slug}")
@@ -541,3 +1095,128 @@ def update_dod_task_state(task_slug: str, new_state: str) -> Dict:
         # Fail loud
         print(f"[graph.py:update_dod_task_state] Failed to update task: {e}")
         raise
+
+    finally:
+        invalidate_graph_cache([
+            cache_tag("U4_Work_Item", task_slug),
+            cache_tag("U4_Work_Item", mission_slug)
+        ])
+
+
+async def update_dod_task_states(mission_slug: str, changes: Dict[str, str]) -> List[Dict]:
+    """
+    Apply several DoD task state changes in one statement.
+
+    Only tasks that are DoD members of the mission are touched.
+
+    Args:
+        mission_slug: Mission slug
+        changes: {task_slug: new_state} ("todo" | "doing" | "done")
+
+    Returns:
+        The mission's whole checklist after the update (DoD task nodes, in
+        get_mission_dod_items order); empty if nothing was updated
+
+    Raises:
+        ValueError: If a state is invalid
+        Exception: If the update fails
+    """
+    for task_slug, new_state in changes.items():
+        if new_state not in ["todo", "doing", "done"]:
+            raise ValueError(f"Invalid state for {task_slug}: {new_state}. Must be todo/doing/done.")
+
+    # Generate timestamp in Python (FalkorDB doesn't support datetime() function)
+    updated_at = datetime.utcnow().isoformat() + 'Z'
+
+    cypher = """
+    MATCH (mission:U4_Work_Item {slug: $mission_slug, scope_ref: 'scopelock'})
+    UNWIND $changes AS change
+    MATCH (mission)<-[:U4_MEMBER_OF {role: 'dod_task'}]-(task:U4_Work_Item {slug: change.item_id})
+    WHERE task.scope_ref = 'scopelock'
+    SET task.state = change.state,
+        task.updated_at = $updated_at
+    WITH DISTINCT mission
+    MATCH (mission)<-[:U4_MEMBER_OF {role: 'dod_task'}]-(item:U4_Work_Item)
+    WHERE item.scope_ref = 'scopelock'
+    RETURN item AS task
+    ORDER BY item.dod_category, item.dod_sort_order
+    """
+
+    try:
+        results = await query_graph(cypher, {
+            "mission_slug": mission_slug,
+            "changes": [{"item_id": slug, "state": state} for slug, state in changes.items()],
+            "updated_at": updated_at
+        })
+        return [r["task"] for r in results]
+
+    except Exception as e:
+        # Fail loud
+        print(f"[graph.py:update_dod_task_states] Failed to update tasks: {e}")
+        raise
+
+    finally:
+        invalidate_graph_cache(
+            [cache_tag("U4_Work_Item", mission_slug)]
+            + [cache_tag("U4_Work_Item", task_slug) for task_slug in changes]
+        )
+
+
+async def complete_all_dod_tasks(mission_slug: str) -> Optional[Dict]:
+    """
+    Mark every unfinished DoD task of a mission done and move it to QA.
+
+    Two set-based statements in one batch (all unfinished tasks, then the
+    mission transition, which doubles as the existence check) instead of
+    one update per task plus the transition.
+
+    Args:
+        mission_slug: Mission slug
+
+    Returns:
+        {'new_state': str, 'completed_count': int} (tasks that changed),
+        or None if the mission was not found
+
+    Raises:
+        Exception: If the update fails
+    """
+    # Generate timestamp in Python (FalkorDB doesn't support datetime() function)
+    updated_at = datetime.utcnow().isoformat() + 'Z'
+    params = {"mission_slug": mission_slug, "updated_at": updated_at}
+
+    tasks_cypher = """
+    MATCH (mission:U4_Work_Item {slug: $mission_slug, scope_ref: 'scopelock'})<-[:U4_MEMBER_OF {role: 'dod_task'}]-(task:U4_Work_Item)
+    WHERE task.scope_ref = 'scopelock' AND coalesce(task.state, 'todo') <> 'done'
+    SET task.state = 'done',
+        task.updated_at = $updated_at
+    RETURN count(task) AS completed_count
+    """
+
+    mission_cypher = """
+    MATCH (mission:U4_Work_Item {slug: $mission_slug, scope_ref: 'scopelock'})
+    SET mission.state = 'qa',
+        mission.updated_at = $updated_at
+    RETURN mission.state AS new_state
+    """
+
+    try:
+        task_results, mission_results = await query_graph_many([
+            (tasks_cypher, params),
+            (mission_cypher, params),
+        ], ordered=True)
+        if not mission_results:
+            return None
+
+        return {
+            "new_state": mission_results[0].get("new_state"),
+            "completed_count": task_results[0]["completed_count"] if task_results else 0
+        }
+
+    except Exception as e:
+        # Fail loud
+        print(f"[graph.py:complete_all_dod_tasks] Failed to complete DoD tasks: {e}")
+        raise
+
+    finally:
+        # Checklist reads are tagged with the mission (get_mission_dod_items)
+        invalidate_graph_cache([cache_tag("U4_Work_Item", mission_slug)])
@@ -0,0 +1,276 @@
+"""
+Read-through cache for FalkorDB query results
+
+Hot Mission Deck reads (mission by slug, user missions, DoD items, mission
+fund balance, citizen chat history) run identical Cypher on every request.
+This cache sits in front of query_graph() and serves repeated reads from
+memory until their TTL expires or a write invalidates them.
+
+Architecture:
+- Per-query TTLs (callers pass cache_ttl to query_graph)
+- LRU eviction bounded by entry count and approximate bytes
+- Tag-based invalidation: entries are tagged with (label, key) pairs, e.g.
+  ("U4_Work_Item", "mission-47"); writers invalidate what they touch
+- Per-process: each uvicorn worker has its own cache, so TTLs bound how
+  long another worker's writes can stay invisible
+- A second instance, response_cache, holds rendered HTTP responses built
+  from graph reads (see conditional_get.py); the same write tags
+  invalidate both
+
+Invalidation semantics:
+- invalidate("U4_Work_Item", "mission-47") drops entries tagged with that
+  exact pair AND label-wide entries tagged ("U4_Work_Item", None), since
+  collection reads (e.g. all missions for a user) may include the node
+- invalidate("U4_Work_Item") drops every entry carrying that label
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from app.config import settings
+
+
+# (label, key) - key None means "any node with this label" (collection read)
+CacheTag = Tuple[str, Optional[str]]
+
+
+def cache_tag(label: str, key: Optional[str] = None) -> CacheTag:
+    """Build a cache tag for a graph label and optional slug/key."""
+    return (label, key)
+
+
+def make_cache_key(cypher: str, params: Optional[Dict[str, Any]]) -> str:
+    """Build a stable cache key from query text and parameters."""
+    if not params:
+        return cypher
+    return cypher + "\x00" + json.dumps(params, sort_keys=True, default=str)
+
+
+class _CacheEntry:
+    """Cached result set with expiry, tags and approximate size."""
+
+    __slots__ = ("value", "expires_at", "tags", "size")
+
+    def __init__(self, value: Any, expires_at: float, tags: Tuple[CacheTag, ...], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+        self.size = size
+
+
+class GraphResultCache:
+    """
+    LRU + TTL cache for graph query results with tag-based invalidation.
+
+    Cached values are shared between callers - treat them as read-only.
+
+    Args:
+        max_entries: Maximum number of cached result sets
+        max_bytes: Approximate memory bound (sum of raw response sizes)
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._by_tag: Dict[CacheTag, Set[str]] = {}
+        self._by_label: Dict[str, Set[str]] = {}
+        self._bytes = 0
+
+        # Bumped on every invalidation so reads that started before a write
+        # don't store pre-write results after it (see set(generation=...))
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (found, value) tuple - found is False on miss or expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[CacheTag] = (),
+        size: int = 0,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a result set.
+
+        Args:
+            key: Cache key (see make_cache_key)
+            value: Parsed result rows
+            ttl: Seconds until the entry expires
+            tags: (label, key) tags used for invalidation
+            size: Approximate size in bytes (raw response length)
+            generation: Cache generation when the read started; the result is
+                        dropped if an invalidation happened since
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        entry = _CacheEntry(value, time.monotonic() + ttl, tuple(tags), size)
+        self._entries[key] = entry
+        self._bytes += size
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+            self._by_label.setdefault(tag[0], set()).add(key)
+
+        # LRU eviction down to both bounds
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate(self, label: str, key: Optional[str] = None) -> int:
+        """
+        Drop entries touching a label (and optionally a specific slug/key).
+
+        Args:
+            label: Graph label (e.g. "U4_Work_Item")
+            key: Optional slug/key; None drops every entry with this label
+
+        Returns:
+            Number of entries dropped
+        """
+        if key is None:
+            doomed = set(self._by_label.get(label, ()))
+        else:
+            doomed = set(self._by_tag.get((label, key), ()))
+            doomed |= self._by_tag.get((label, None), set())
+
+        for cache_key in doomed:
+            self._remove(cache_key)
+
+        self.generation += 1
+        self.invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self, reset_counters: bool = False) -> None:
+        """Drop every entry, optionally zeroing the counters too."""
+        self._entries.clear()
+        self._by_tag.clear()
+        self._by_label.clear()
+        self._bytes = 0
+        self.generation += 1
+        if reset_counters:
+            self.hits = self.misses = 0
+            self.evictions = self.expirations = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy, for tuning TTLs and bounds."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": settings.graph_cache_enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxEntries": self.max_entries,
+            "maxBytes": self.max_bytes,
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove one entry and its tag index references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+            label_keys = self._by_label.get(tag[0])
+            if label_keys is not None:
+                label_keys.discard(key)
+                if not label_keys:
+                    del self._by_label[tag[0]]
+
+
+# Global cache instance (one per worker process)
+graph_cache = GraphResultCache(
+    max_entries=settings.graph_cache_max_entries,
+    max_bytes=settings.graph_cache_max_bytes
+)
+
+
+# Rendered responses (JSON body + ETag) of polled endpoints, tagged with the
+# graph data they were built from
+response_cache = GraphResultCache(
+    max_entries=settings.response_cache_max_entries,
+    max_bytes=settings.response_cache_max_bytes
+)
+
+
+def invalidate_graph_cache(tags: Iterable[CacheTag]) -> int:
+    """
+    Invalidate cached reads (and responses built from them) for every
+    (label, key) tag a write touched.
+
+    Args:
+        tags: (label, key) tags - key None invalidates the whole label
+
+    Returns:
+        Number of cached read results dropped
+    """
+    dropped = 0
+    for label, key in tags:
+        dropped += graph_cache.invalidate(label, key)
+        response_cache.invalidate(label, key)
+    return dropped
+
+
+def clear_graph_caches() -> None:
+    """Drop every cached read and response (e.g. after an ad-hoc query)."""
+    graph_cache.clear()
+    response_cache.clear()
+
+
+def get_graph_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the graph result cache."""
+    return graph_cache.stats()
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the rendered response cache."""
+    return response_cache.stats()
+
@@ -0,0 +1,144 @@
+"""
+Async HTTP transport for the FalkorDB REST API
+
+Holds the shared, pooled httpx client used by every graph query in
+Mission Deck. The client is opened in the FastAPI lifespan hook
+(app/main.py) and closed on shutdown, so all requests reuse the same
+keep-alive connections to the FalkorDB REST proxy instead of doing a
+fresh TCP + TLS handshake per query.
+
+Architecture:
+- One httpx.AsyncClient per event loop (pooled, keep-alive)
+- Opened/closed by the app lifespan; lazily created for scripts and tests
+- Blocking httpx.Client kept for CLI callers (emma.py, backend/test_*.py)
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config import settings
+
+
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_client: Optional[httpx.Client] = None
+
+# Optional transport overrides (e.g. an in-process graph stand-in for tests)
+_transport: Optional[httpx.AsyncBaseTransport] = None
+_sync_transport: Optional[httpx.BaseTransport] = None
+
+
+def _client_options() -> Dict[str, Any]:
+    """Build shared httpx client options from settings."""
+    return {
+        "headers": {
+            "Content-Type": "application/json",
+            "X-API-Key": settings.falkordb_api_key,
+        },
+        "timeout": httpx.Timeout(
+            settings.falkordb_timeout,
+            connect=settings.falkordb_connect_timeout,
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.falkordb_max_connections,
+            max_keepalive_connections=settings.falkordb_max_keepalive_connections,
+            keepalive_expiry=settings.falkordb_keepalive_expiry,
+        ),
+    }
+
+
+async def open_graph_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> httpx.AsyncClient:
+    """
+    Open the shared async graph client (called from the app lifespan).
+
+    Args:
+        transport: Optional httpx transport override (tests, local stand-ins)
+
+    Returns:
+        The pooled httpx.AsyncClient
+    """
+    global _async_client, _async_client_loop, _transport
+
+    if transport is not None:
+        _transport = transport
+
+    await close_graph_client()
+
+    options = _client_options()
+    if _transport is not None:
+        options["transport"] = _transport
+
+    _async_client = httpx.AsyncClient(**options)
+    _async_client_loop = asyncio.get_running_loop()
+    return _async_client
+
+
+async def close_graph_client() -> None:
+    """Close the shared async graph client (called on app shutdown)."""
+    global _async_client, _async_client_loop
+
+    client, loop = _async_client, _async_client_loop
+    _async_client, _async_client_loop = None, None
+
+    # Connections belong to the loop that opened them; a client left over
+    # from a finished loop is dropped rather than closed from this one.
+    if client is not None and not client.is_closed and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+async def get_graph_client() -> httpx.AsyncClient:
+    """
+    Get the pooled async client, creating it lazily if needed.
+
+    The app lifespan normally opens the client. Scripts and tests that call
+    query_graph() without running the lifespan get one created on first use.
+    A client is bound to the loop that created it, so a new loop (e.g. a
+    second asyncio.run()) gets a fresh client.
+    """
+    if (
+        _async_client is None
+        or _async_client.is_closed
+        or _async_client_loop is not asyncio.get_running_loop()
+    ):
+        return await open_graph_client()
+    return _async_client
+
+
+def get_sync_graph_client() -> httpx.Client:
+    """Get the pooled blocking client used by CLI callers."""
+    global _sync_client
+
+    if _sync_client is None or _sync_client.is_closed:
+        options = _client_options()
+        if _sync_transport is not None:
+            options["transport"] = _sync_transport
+        _sync_client = httpx.Client(**options)
+    return _sync_client
+
+
+def set_graph_transport(
+    transport: Optional[httpx.AsyncBaseTransport],
+    sync_transport: Optional[httpx.BaseTransport] = None
+) -> None:
+    """
+    Route graph traffic through custom httpx transports.
+
+    Used by tests and benchmarks to point Mission Deck at an in-process
+    graph stand-in. Pass None to restore the real network transport.
+
+    Args:
+        transport: Transport for the async client (query_graph)
+        sync_transport: Transport for the blocking client (query_graph_sync)
+    """
+    global _transport, _sync_transport, _sync_client, _async_client_loop
+
+    _transport = transport
+    _sync_transport = sync_transport
+    _async_client_loop = None  # Force a fresh async client on next use
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
@@ -0,0 +1,349 @@
+"""
+Result decoder for FalkorDB REST responses
+
+Turns the raw FalkorDB result payload into rows the rest of Mission Deck
+can read like dicts (row["m"]["slug"], row.get("count")), without building
+a dict per row and per node.
+
+FalkorDB result format:
+- result[0] = header: column names ["m", "count"] (verbose) or
+              [column_type, name] pairs [[2, "m"], [1, "count"]] (compact)
+- result[1] = data rows: [[cell, cell], ...]
+- result[2] = metadata: ["Nodes created: 1", ...]
+
+Nodes arrive as:
+    [["id", 0], ["labels", ["NodeType"]], ["properties", [["key1", "val1"], ...]]]
+Relationships as:
+    [["id", 3], ["type", "U4_ABOUT"], ["src_node", 0], ["dest_node", 1], ["properties", [...]]]
+
+Architecture:
+- Column kinds (scalar / node / relationship) are resolved once per result
+  set from the header - compact headers carry them, verbose headers are
+  resolved from the first non-null cell of each column - so scalar-only
+  results (counts, sums, slugs) are returned without touching any cell
+- GraphRow keeps the decoded row list and a column index shared by every
+  row of the result set (no per-row dict)
+- GraphNode / GraphRelationship keep the raw property pairs and build the
+  property dict on first access (GRAPH_LAZY_PROPERTIES, default on), so
+  nodes that are only counted, filtered or passed through cost one object
+- Response bodies are decoded with orjson when installed (stdlib json otherwise)
+
+Rows, nodes and relationships are read-only Mappings: indexing, .get(),
+"in", keys()/items() and dict(...) all work, and node["_id"] /
+node["_labels"] keep the keys the old dict-based parser produced.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is the fallback
+    orjson = None
+
+
+# Compact header column types (FalkorDB ColumnType)
+COLUMN_SCALAR = 1
+COLUMN_NODE = 2
+COLUMN_RELATION = 3
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class GraphNode(Mapping):
+    """
+    Graph node with dict-style access to "_id", "_labels" and its properties.
+
+    Attributes:
+        id: FalkorDB internal node id
+        labels: Node labels
+    """
+
+    __slots__ = ("id", "labels", "_raw_properties", "_properties")
+
+    def __init__(self, node_id: Any, labels: List[str], raw_properties: List, lazy: bool = True):
+        self.id = node_id
+        self.labels = labels
+        self._raw_properties = raw_properties
+        self._properties: Optional[Dict[str, Any]] = None
+        if not lazy:
+            self._materialize()
+
+    def _materialize(self) -> Dict[str, Any]:
+        """Build the property dict from the raw [key, value] pairs."""
+        if self._properties is None:
+            self._properties = dict(self._raw_properties)
+            self._raw_properties = None
+        return self._properties
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Node properties (built on first access in lazy mode)."""
+        return self._properties if self._properties is not None else self._materialize()
+
+    def _meta(self) -> Tuple[Tuple[str, Any], ...]:
+        return (("_id", self.id), ("_labels", self.labels))
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "_id":
+            return self.id
+        if key == "_labels":
+            return self.labels
+        return self.properties[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "_id":
+            return self.id
+        if key == "_labels":
+            return self.labels
+        return self.properties.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in ("_id", "_labels") or key in self.properties
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._meta():
+            yield key
+        yield from self.properties
+
+    def __len__(self) -> int:
+        return len(self.properties) + 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy (e.g. for JSON backups)."""
+        result = dict(self._meta())
+        result.update(self.properties)
+        return result
+
+    def __repr__(self) -> str:
+        return f"GraphNode(id={self.id!r}, labels={self.labels!r})"
+
+
+class GraphRelationship(GraphNode):
+    """
+    Graph relationship with dict-style access to "_id", "_type", "_src",
+    "_dest" and its properties.
+    """
+
+    __slots__ = ("type", "src", "dest")
+
+    def __init__(self, rel_id: Any, rel_type: str, src: Any, dest: Any, raw_properties: List, lazy: bool = True):
+        super().__init__(rel_id, [], raw_properties, lazy)
+        self.type = rel_type
+        self.src = src
+        self.dest = dest
+
+    def _meta(self) -> Tuple[Tuple[str, Any], ...]:
+        return (("_id", self.id), ("_type", self.type), ("_src", self.src), ("_dest", self.dest))
+
+    def __getitem__(self, key: str) -> Any:
+        if key.startswith("_"):
+            for name, value in self._meta():
+                if name == key:
+                    return value
+        return self.properties[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in ("_id", "_type", "_src", "_dest") or key in self.properties
+
+    def __len__(self) -> int:
+        return len(self.properties) + 4
+
+    def __repr__(self) -> str:
+        return f"GraphRelationship(id={self.id!r}, type={self.type!r}, src={self.src!r}, dest={self.dest!r})"
+
+
+class GraphRow(Mapping):
+    """
+    One result row: the decoded cell list plus a column index shared by
+    every row of the result set.
+
+    Supports row["column"], row.get("column"), "column" in row, and
+    positional row[0]. Cells beyond a short row are treated as missing.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: List):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, int):
+            return self._values[key]
+        position = self._index[key]
+        if position >= len(self._values):
+            raise KeyError(key)
+        return self._values[position]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        position = self._index.get(key)
+        if position is None or position >= len(self._values):
+            return default
+        return self._values[position]
+
+    def __contains__(self, key: object) -> bool:
+        position = self._index.get(key)
+        return position is not None and position < len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        size = len(self._values)
+        return (name for name, position in self._index.items() if position < size)
+
+    def __len__(self) -> int:
+        return min(len(self._index), len(self._values))
+
+    def values_tuple(self) -> Tuple:
+        """Cells in column order."""
+        return tuple(self._values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy (e.g. for JSON backups)."""
+        return {name: to_plain(value) for name, value in self.items()}
+
+    def __repr__(self) -> str:
+        return f"GraphRow({dict(self.items())!r})"
+
+
+def to_plain(value: Any) -> Any:
+    """Recursively convert decoded rows/nodes into plain dicts and lists."""
+    if isinstance(value, (GraphNode, GraphRow)):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def _is_entity(cell: Any) -> bool:
+    """True if a verbose cell is a node/relationship ([["id", n], ...])."""
+    return (
+        type(cell) is list
+        and len(cell) > 1
+        and type(cell[0]) is list
+        and len(cell[0]) == 2
+        and cell[0][0] == "id"
+    )
+
+
+def _decode_node(cell: Any, lazy: bool) -> Any:
+    """Decode a verbose node cell (non-node cells are returned unchanged)."""
+    if not _is_entity(cell):
+        return cell
+    node_id, labels, properties = None, [], []
+    for key, value in cell:
+        if key == "properties":
+            properties = value
+        elif key == "id":
+            node_id = value
+        elif key == "labels":
+            labels = value
+    return GraphNode(node_id, labels, properties, lazy)
+
+
+def _decode_relationship(cell: Any, lazy: bool) -> Any:
+    """Decode a verbose relationship cell (other cells are returned unchanged)."""
+    if not _is_entity(cell):
+        return cell
+    fields = dict(cell)
+    return GraphRelationship(
+        fields.get("id"),
+        fields.get("type"),
+        fields.get("src_node"),
+        fields.get("dest_node"),
+        fields.get("properties", []),
+        lazy
+    )
+
+
+_DECODERS: Dict[int, Callable[[Any, bool], Any]] = {
+    COLUMN_NODE: _decode_node,
+    COLUMN_RELATION: _decode_relationship,
+}
+
+
+def _infer_column_type(rows: List[List], position: int) -> int:
+    """Resolve a verbose column's type from its first non-null cell."""
+    for row in rows:
+        if position < len(row) and row[position] is not None:
+            cell = row[position]
+            if not _is_entity(cell):
+                return COLUMN_SCALAR
+            keys = {item[0] for item in cell if type(item) is list and item}
+            return COLUMN_RELATION if "type" in keys else COLUMN_NODE
+    return COLUMN_SCALAR
+
+
+def _read_header(header: List, rows: List[List]) -> Tuple[List[str], List[int]]:
+    """Column names and types from a compact or verbose header."""
+    names, types = [], []
+    for position, column in enumerate(header):
+        if isinstance(column, list) and len(column) == 2:
+            column_type, name = column
+            names.append(name)
+            types.append(column_type)
+        else:
+            names.append(column)
+            types.append(_infer_column_type(rows, position))
+    return names, types
+
+
+def decode_result(raw_result: List, lazy: Optional[bool] = None) -> List[GraphRow]:
+    """
+    Decode a FalkorDB result payload into rows.
+
+    Decodes in place: entity cells in the payload's row lists are replaced
+    by GraphNode / GraphRelationship objects, so pass a freshly parsed payload.
+
+    Args:
+        raw_result: Raw FalkorDB result ([header, rows, metadata])
+        lazy: Build node property dicts on first access
+              (default: settings.graph_lazy_properties)
+
+    Returns:
+        List of GraphRow (dict-style access by column name)
+    """
+    if not raw_result or len(raw_result) < 2:
+        return []
+
+    header, rows = raw_result[0], raw_result[1]
+    if not rows:
+        return []
+
+    if lazy is None:
+        lazy = settings.graph_lazy_properties
+
+    names, types = _read_header(header, rows)
+    index = {name: position for position, name in enumerate(names)}
+    entity_columns = [
+        (position, _DECODERS[column_type])
+        for position, column_type in enumerate(types)
+        if column_type in _DECODERS
+    ]
+
+    if not entity_columns:
+        return [GraphRow(index, row) for row in rows]
+
+    decoded = []
+    for row in rows:
+        size = len(row)
+        for position, decode in entity_columns:
+            if position < size and row[position] is not None:
+                row[position] = decode(row[position], lazy)
+        decoded.append(GraphRow(index, row))
+    return decoded
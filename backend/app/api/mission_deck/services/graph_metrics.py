@@ -0,0 +1,478 @@
+"""
+Per-call-site instrumentation for FalkorDB queries
+
+~40 service functions call query_graph(); failures used to be the only
+signal of which ones drive graph load. Every query is now recorded against
+the function that issued it and a normalized fingerprint of its Cypher.
+
+Architecture:
+- Call site: first stack frame outside the graph client plumbing
+  (query_graph, query_graph_many, ...), as "module:function". Batches carry
+  their caller into the concurrent fallback tasks via a context variable.
+- Fingerprint: Cypher with literals replaced by "?" and whitespace
+  collapsed, hashed to a short id (the text is exported once as an info
+  series, so labels stay short)
+- Per (caller, fingerprint): latency, response size and row count
+  histograms, request bytes, error counts by kind, cache hits and reads
+  coalesced onto another caller's in-flight request
+- Pipelined batches: the exchange's latency and bytes are split evenly
+  across its statements, so per-site sums still add up to real load
+- Slow-query log: queries slower than GRAPH_SLOW_QUERY_MS are printed and
+  kept in a bounded in-memory log (GET /api/graph/slow-queries)
+
+Exposition: GET /metrics renders the Prometheus text format (0.0.4) without
+a client library dependency. Per-process, like the result cache: each
+uvicorn worker reports its own series.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import re
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+from app.config import settings
+
+
+# Histogram upper bounds (+Inf is implicit)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+ROWS_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Prometheus text exposition content type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Graph client plumbing - frames skipped when resolving the call site
+_CLIENT_MODULE = "graph"
+_CLIENT_FUNCTIONS = {
+    "query_graph", "query_graph_sync", "query_graph_many", "_execute_query", "_pipeline_queries", "run"
+}
+
+# Reaching the event loop means the query itself was the task's root coroutine
+_ASYNCIO_DIR = str(Path(asyncio.__file__).parent)
+
+# Distinct fingerprints tracked; queries beyond this share one series
+_MAX_FINGERPRINTS = 500
+_OVERFLOW_FINGERPRINT = "overflow"
+
+# Fingerprint info series carry at most this much query text
+_INFO_QUERY_CHARS = 200
+
+# Slow-query log entries keep at most this much query text
+_SLOW_QUERY_CHARS = 2000
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_LIST_LITERAL_RE = re.compile(r"\[\s*\?(?:\s*,\s*\?)*\s*\]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Call site set by query_graph_many for its concurrent fallback tasks
+_call_site: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("graph_call_site", default=None)
+
+
+def normalize_cypher(cypher: str) -> str:
+    """
+    Reduce a Cypher statement to its shape: literals become "?", whitespace collapses.
+
+    Example:
+        normalize_cypher("MATCH (m {slug: 'mission-47'})\\n  RETURN m LIMIT 50")
+        → "MATCH (m {slug: ?}) RETURN m LIMIT ?"
+    """
+    text = _STRING_LITERAL_RE.sub("?", cypher)
+    text = _NUMBER_LITERAL_RE.sub("?", text)
+    text = _LIST_LITERAL_RE.sub("[?]", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _module_name(filename: str) -> str:
+    return Path(filename).stem
+
+
+def resolve_call_site(depth: int = 1) -> str:
+    """
+    Name the function that called into the graph client, as "module:function".
+
+    Uses the call site set by query_graph_many() if there is one (its
+    fallback tasks run without the caller on their stack), else walks the
+    stack past the client plumbing. Queries scheduled directly as tasks
+    have no caller on their stack and report "unknown".
+    """
+    site = _call_site.get()
+    if site is not None:
+        return site
+
+    frame = sys._getframe(depth + 1)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_ASYNCIO_DIR):
+            break
+        module = _module_name(code.co_filename)
+        if module != "graph_metrics" and not (module == _CLIENT_MODULE and code.co_name in _CLIENT_FUNCTIONS):
+            return f"{module}:{code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+@contextmanager
+def call_site() -> Iterator[str]:
+    """
+    Pin the current call site for everything issued inside the block.
+
+    Tasks created inside inherit it, so concurrently dispatched statements
+    are still attributed to the function that submitted the batch.
+    """
+    site = resolve_call_site(depth=2)
+    token = _call_site.set(site)
+    try:
+        yield site
+    finally:
+        _call_site.reset(token)
+
+
+def error_kind(error: BaseException) -> str:
+    """Short error label: HTTP status for status errors, else the exception class."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"http_{error.response.status_code}"
+    return type(error).__name__
+
+
+def request_size(response: Optional[httpx.Response]) -> int:
+    """Bytes of the request body that produced a response (0 if unknown)."""
+    try:
+        return len(response.request.content) if response is not None else 0
+    except RuntimeError:
+        # Response built without a request (e.g. in tests)
+        return 0
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs, ending with +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            pairs.append((_format_value(bound), running))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+class CallSiteStats:
+    """Everything recorded for one (caller, fingerprint) pair."""
+
+    __slots__ = ("duration", "response_bytes", "rows", "request_bytes", "errors", "cache_hits", "coalesced")
+
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.response_bytes = Histogram(BYTES_BUCKETS)
+        self.rows = Histogram(ROWS_BUCKETS)
+        self.request_bytes = 0
+        self.errors: Dict[str, int] = {}
+        self.cache_hits = 0
+        self.coalesced = 0
+
+
+class GraphQueryMetrics:
+    """
+    Registry of per-call-site query metrics plus the slow-query log.
+
+    Args:
+        slow_log_size: Slow queries kept in memory (oldest dropped first)
+    """
+
+    def __init__(self, slow_log_size: int = 100):
+        self._sites: Dict[Tuple[str, str], CallSiteStats] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._fingerprint_ids: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=slow_log_size)
+        self.slow_total = 0
+
+    def fingerprint(self, cypher: str) -> str:
+        """Short stable id for a statement's normalized shape."""
+        fingerprint = self._fingerprint_ids.get(cypher)
+        if fingerprint is not None:
+            return fingerprint
+
+        normalized = normalize_cypher(cypher)
+        fingerprint = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+        if fingerprint not in self._fingerprints:
+            if len(self._fingerprints) >= _MAX_FINGERPRINTS:
+                return _OVERFLOW_FINGERPRINT
+            self._fingerprints[fingerprint] = normalized
+        # Raw text → id memo; legacy inline-literal queries vary, so keep it bounded
+        if len(self._fingerprint_ids) >= _MAX_FINGERPRINTS * 4:
+            self._fingerprint_ids.clear()
+        self._fingerprint_ids[cypher] = fingerprint
+        return fingerprint
+
+    def _site(self, caller: str, fingerprint: str) -> CallSiteStats:
+        key = (caller, fingerprint)
+        stats = self._sites.get(key)
+        if stats is None:
+            stats = self._sites[key] = CallSiteStats()
+        return stats
+
+    def record(
+        self,
+        caller: str,
+        cypher: str,
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        rows: int = 0,
+        error: Optional[BaseException] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record one statement execution (successful or failed).
+
+        Args:
+            caller: Call site ("module:function")
+            cypher: Statement text as the caller wrote it
+            seconds: Wall time of the exchange (including retries)
+            request_bytes: Request body size
+            response_bytes: Response body size
+            rows: Result rows returned
+            error: Exception that failed the call, if any
+            params: Query parameters (only their names reach the slow log)
+        """
+        if not settings.graph_metrics_enabled:
+            return
+
+        with self._lock:
+            fingerprint = self.fingerprint(cypher)
+            stats = self._site(caller, fingerprint)
+            stats.duration.observe(seconds)
+            stats.request_bytes += request_bytes
+            if error is None:
+                stats.response_bytes.observe(response_bytes)
+                stats.rows.observe(rows)
+            else:
+                kind = error_kind(error)
+                stats.errors[kind] = stats.errors.get(kind, 0) + 1
+
+        threshold = settings.graph_slow_query_ms
+        if threshold > 0 and seconds * 1000 >= threshold:
+            self._log_slow_query(caller, fingerprint, cypher, seconds, rows, response_bytes, error, params)
+
+    def record_cache_hit(self, caller: str, cypher: str) -> None:
+        """Count a read served from the result cache (no graph load)."""
+        if not settings.graph_metrics_enabled:
+            return
+        with self._lock:
+            self._site(caller, self.fingerprint(cypher)).cache_hits += 1
+
+    def record_coalesced(self, caller: str, cypher: str) -> None:
+        """Count a read that shared another caller's in-flight request."""
+        if not settings.graph_metrics_enabled:
+            return
+        with self._lock:
+            self._site(caller, self.fingerprint(cypher)).coalesced += 1
+
+    def _log_slow_query(
+        self,
+        caller: str,
+        fingerprint: str,
+        cypher: str,
+        seconds: float,
+        rows: int,
+        response_bytes: int,
+        error: Optional[BaseException],
+        params: Optional[Dict[str, Any]]
+    ) -> None:
+        """Print and keep a slow query (text and param names - never param values)."""
+        entry = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "caller": caller,
+            "fingerprint": fingerprint,
+            "durationMs": round(seconds * 1000, 1),
+            "rows": rows,
+            "responseBytes": response_bytes,
+            "error": error_kind(error) if error is not None else None,
+            "params": sorted(params) if params else [],
+            "query": _WHITESPACE_RE.sub(" ", cypher).strip()[:_SLOW_QUERY_CHARS],
+        }
+        with self._lock:
+            self.slow_queries.append(entry)
+            self.slow_total += 1
+        print(
+            f"[graph_metrics:slow_query] {entry['durationMs']}ms caller={caller} "
+            f"fingerprint={fingerprint} rows={rows} query={entry['query'][:300]}"
+        )
+
+    def get_slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Slow-query log, newest first."""
+        with self._lock:
+            entries = list(reversed(self.slow_queries))
+        return entries[:limit] if limit is not None else entries
+
+    def site_stats(self, caller: str, fingerprint: str) -> Optional[CallSiteStats]:
+        """Recorded stats for one call site (None if it never ran)."""
+        return self._sites.get((caller, fingerprint))
+
+    def reset(self) -> None:
+        """Drop every series and the slow-query log."""
+        with self._lock:
+            self._sites.clear()
+            self._fingerprints.clear()
+            self._fingerprint_ids.clear()
+            self.slow_queries.clear()
+            self.slow_total = 0
+
+    def render(self) -> str:
+        """Per-call-site series in Prometheus text format."""
+        with self._lock:
+            sites = sorted(self._sites.items())
+            fingerprints = sorted(self._fingerprints.items())
+            slow_total = self.slow_total
+
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, help_text: str, attr: str) -> None:
+            header(name, "histogram", help_text)
+            for (caller, fingerprint), stats in sites:
+                hist: Histogram = getattr(stats, attr)
+                if not hist.count:
+                    continue
+                labels = {"caller": caller, "fingerprint": fingerprint}
+                for le, count in hist.cumulative():
+                    lines.append(f"{name}_bucket{_labels({**labels, 'le': le})} {count}")
+                lines.append(f"{name}_sum{_labels(labels)} {_format_value(hist.sum)}")
+                lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+        histogram("graph_query_duration_seconds", "FalkorDB query wall time, including retries.", "duration")
+        histogram("graph_query_response_bytes", "FalkorDB response body size.", "response_bytes")
+        histogram("graph_query_rows", "Result rows returned per query.", "rows")
+
+        header("graph_query_request_bytes_total", "counter", "FalkorDB request body bytes sent.")
+        for (caller, fingerprint), stats in sites:
+            if stats.duration.count:
+                labels = _labels({"caller": caller, "fingerprint": fingerprint})
+                lines.append(f"graph_query_request_bytes_total{labels} {stats.request_bytes}")
+
+        header("graph_query_errors_total", "counter", "Failed FalkorDB queries by error kind.")
+        for (caller, fingerprint), stats in sites:
+            for kind, count in sorted(stats.errors.items()):
+                labels = _labels({"caller": caller, "fingerprint": fingerprint, "error": kind})
+                lines.append(f"graph_query_errors_total{labels} {count}")
+
+        header("graph_query_cache_hits_total", "counter", "Reads served from the graph result cache.")
+        for (caller, fingerprint), stats in sites:
+            if stats.cache_hits:
+                labels = _labels({"caller": caller, "fingerprint": fingerprint})
+                lines.append(f"graph_query_cache_hits_total{labels} {stats.cache_hits}")
+
+        header("graph_query_coalesced_total", "counter", "Reads that shared an identical in-flight request.")
+        for (caller, fingerprint), stats in sites:
+            if stats.coalesced:
+                labels = _labels({"caller": caller, "fingerprint": fingerprint})
+                lines.append(f"graph_query_coalesced_total{labels} {stats.coalesced}")
+
+        header("graph_query_fingerprint_info", "gauge", "Normalized Cypher text for each fingerprint.")
+        for fingerprint, normalized in fingerprints:
+            labels = _labels({"fingerprint": fingerprint, "query": normalized[:_INFO_QUERY_CHARS]})
+            lines.append(f"graph_query_fingerprint_info{labels} 1")
+
+        header("graph_slow_queries_total", "counter", "Queries slower than GRAPH_SLOW_QUERY_MS.")
+        lines.append(f"graph_slow_queries_total {slow_total}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """Prometheus sample value: integers without a trailing .0."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    return "{" + ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _render_client_state() -> str:
+    """Result cache and resilience counters as process-wide series."""
+    from app.api.mission_deck.services import conditional_get
+    from app.api.mission_deck.services.graph_cache import get_graph_cache_stats, get_response_cache_stats
+    from app.api.mission_deck.services.graph_resilience import get_graph_resilience_stats
+    from app.api.mission_deck.services.graph_singleflight import get_graph_singleflight_stats
+
+    cache = get_graph_cache_stats()
+    responses = get_response_cache_stats()
+    resilience = get_graph_resilience_stats()
+    singleflight = get_graph_singleflight_stats()
+    samples = [
+        ("graph_cache_hits_total", "counter", "Graph result cache hits.", cache["hits"]),
+        ("graph_cache_misses_total", "counter", "Graph result cache misses.", cache["misses"]),
+        ("graph_cache_evictions_total", "counter", "Graph result cache LRU evictions.", cache["evictions"]),
+        ("graph_cache_entries", "gauge", "Graph result cache entries.", cache["entries"]),
+        ("graph_cache_bytes", "gauge", "Graph result cache size (approximate bytes).", cache["bytes"]),
+        ("response_cache_hits_total", "counter", "Polled responses served without recomputing.", responses["hits"]),
+        ("response_cache_misses_total", "counter", "Polled responses recomputed.", responses["misses"]),
+        ("response_not_modified_total", "counter", "304 Not Modified responses sent.",
+         conditional_get.not_modified_sent),
+        ("graph_circuit_open", "gauge", "1 while the graph circuit breaker is open.",
+         1 if resilience["breaker"]["state"] == "open" else 0),
+        ("graph_circuit_opened_total", "counter", "Times the graph circuit breaker opened.",
+         resilience["breaker"]["timesOpened"]),
+        ("graph_retries_total", "counter", "Graph read retries sent.", resilience["retries"]["attempted"]),
+        ("graph_hedges_sent_total", "counter", "Hedged graph reads sent.", resilience["hedging"]["sent"]),
+        ("graph_inflight_reads", "gauge", "Distinct graph reads currently in flight (coalescing keys).",
+         singleflight["inFlight"]),
+    ]
+
+    lines = []
+    for name, kind, help_text, value in samples:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# Global registry (one per worker process)
+graph_metrics = GraphQueryMetrics(slow_log_size=settings.graph_slow_query_log_size)
+
+
+def render_prometheus() -> str:
+    """Full /metrics payload: per-call-site query series plus client state."""
+    return graph_metrics.render() + _render_client_state()
+
+
+def get_slow_queries(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Recent slow queries, newest first."""
+    return graph_metrics.get_slow_queries(limit)
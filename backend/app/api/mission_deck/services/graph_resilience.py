@@ -0,0 +1,404 @@
+"""
+Resilience policy for FalkorDB REST calls
+
+Wraps each HTTP exchange with the graph proxy so a cold or failing backend
+turns into a fast, explicit failure instead of a 10s wait followed by
+callers quietly reporting $0.
+
+Architecture:
+- Retries: idempotent reads (no CREATE/MERGE/SET/DELETE/REMOVE) are retried
+  on transport errors and 429/502/503/504, with full-jitter exponential
+  backoff. Writes are never retried - a lost response may still have applied.
+- Retry budget: retries (and hedges) spend tokens earned at
+  GRAPH_RETRY_BUDGET_RATIO per call plus a small per-second floor, so a
+  degraded backend never sees more than ~(1 + ratio)x its normal load
+- Circuit breaker: GRAPH_BREAKER_FAILURE_THRESHOLD consecutive failures open
+  the circuit; calls then fail immediately with GraphCircuitOpenError until
+  GRAPH_BREAKER_RESET_TIMEOUT passes and a single probe call succeeds
+- Hedged reads (GRAPH_HEDGE_ENABLED): if a read hasn't answered after the
+  observed p95 read latency, a duplicate is sent and the first good answer wins
+
+Only backend-health failures (transport errors, 5xx, 429) count against the
+breaker; 4xx query errors mean the backend is up and answering.
+
+Breaker, retry and hedging counters are reported by /health.
+"""
+
+import asyncio
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from app.config import settings
+
+
+# Statuses worth retrying: the proxy or graph is overloaded/restarting
+RETRYABLE_STATUS = {429, 502, 503, 504}
+
+# Write clauses - statements containing any of these are never retried
+_WRITE_CLAUSE_RE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE)\b", re.IGNORECASE)
+
+# Retry budget tokens never accumulate past this (bounds retry bursts)
+_BUDGET_MAX_TOKENS = 10.0
+
+
+class GraphUnavailableError(httpx.HTTPError):
+    """FalkorDB is unreachable or failing (retries exhausted)."""
+
+
+class GraphCircuitOpenError(GraphUnavailableError):
+    """Circuit breaker is open - the call was rejected without reaching FalkorDB."""
+
+
+def is_read_only(cypher: str) -> bool:
+    """True if a Cypher statement has no write clauses (safe to retry/hedge)."""
+    return _WRITE_CLAUSE_RE.search(cypher) is None
+
+
+def _is_failure(response: Optional[httpx.Response]) -> bool:
+    """True if a response signals backend trouble (not a query error)."""
+    return response is not None and response.status_code in RETRYABLE_STATUS
+
+
+class RetryBudget:
+    """
+    Token bucket bounding retries to a fraction of regular traffic.
+
+    Args:
+        ratio: Tokens earned per call (0.2 = retries capped at ~20% of calls)
+        min_per_second: Tokens earned per second regardless of traffic, so a
+                        quiet worker can still retry its occasional failure
+    """
+
+    def __init__(self, ratio: float, min_per_second: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self._tokens = _BUDGET_MAX_TOKENS
+        self._refilled_at = time.monotonic()
+        self.spent = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        earned = (now - self._refilled_at) * self.min_per_second
+        self._tokens = min(_BUDGET_MAX_TOKENS, self._tokens + earned)
+        self._refilled_at = now
+
+    def record_call(self) -> None:
+        """Earn tokens for one regular call."""
+        self._refill()
+        self._tokens = min(_BUDGET_MAX_TOKENS, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a retry or hedge; False if the budget is empty."""
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.spent += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 2),
+            "spent": self.spent,
+            "exhausted": self.exhausted,
+        }
+
+
+class CircuitBreaker:
+    """
+    Closed → open after consecutive failures → half-open probe → closed.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a probe is allowed
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (claims the probe slot when half-open)."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                print(f"[graph_resilience] Circuit opened after {self.consecutive_failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Free the half-open probe slot when a call ends without an outcome (cancelled)."""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        retry_in = None
+        if self.state == self.OPEN:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state,
+            "consecutiveFailures": self.consecutive_failures,
+            "timesOpened": self.times_opened,
+            "rejected": self.rejected,
+            "retryInSeconds": round(retry_in, 2) if retry_in is not None else None,
+        }
+
+
+class LatencyTracker:
+    """Rolling window of successful read latencies, for the hedge delay."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._p95: Optional[float] = None
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._p95 = None
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile, or None with too few samples."""
+        if len(self._samples) < settings.graph_hedge_min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging (p95, cached until the next sample)."""
+        if self._p95 is None:
+            self._p95 = self.percentile(settings.graph_hedge_percentile)
+        if self._p95 is None:
+            return None
+        return max(settings.graph_hedge_min_delay, self._p95)
+
+
+class GraphResilience:
+    """
+    Retry / circuit breaker / hedging policy shared by every graph call.
+
+    Wrap the HTTP exchange, not the parsing:
+
+        response = await graph_resilience.execute(
+            lambda: client.post(url, json=payload),
+            idempotent=is_read_only(cypher)
+        )
+        response.raise_for_status()
+
+    Returns the response for successes and non-retryable statuses (4xx query
+    errors are left to raise_for_status). Raises GraphCircuitOpenError when
+    the circuit is open and GraphUnavailableError once retryable failures are
+    exhausted.
+    """
+
+    def __init__(self):
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.graph_breaker_failure_threshold,
+            reset_timeout=settings.graph_breaker_reset_timeout
+        )
+        self.budget = RetryBudget(
+            ratio=settings.graph_retry_budget_ratio,
+            min_per_second=settings.graph_retry_budget_min_per_second
+        )
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_lost = 0
+
+    def _check_breaker(self) -> None:
+        if not self.breaker.allow():
+            raise GraphCircuitOpenError("FalkorDB circuit open - failing fast")
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry number (1-based)."""
+        cap = min(settings.graph_retry_max_delay, settings.graph_retry_base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+    def _may_retry(self, idempotent: bool, attempt: int) -> bool:
+        return (
+            idempotent
+            and attempt <= settings.graph_retry_attempts
+            and self.breaker.state == CircuitBreaker.CLOSED
+            and self.budget.try_spend()
+        )
+
+    def _unavailable(self, error: Optional[Exception], response: Optional[httpx.Response]) -> GraphUnavailableError:
+        reason = f"HTTP {response.status_code}" if response is not None else f"{type(error).__name__}: {error}"
+        return GraphUnavailableError(f"FalkorDB unavailable ({reason})")
+
+    async def execute(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        idempotent: bool
+    ) -> httpx.Response:
+        """
+        Run one logical graph call under the policy.
+
+        Args:
+            send: Zero-arg coroutine factory performing the HTTP exchange
+            idempotent: True for read-only statements (retries and hedging allowed)
+        """
+        self.budget.record_call()
+        attempt = 0
+
+        while True:
+            self._check_breaker()
+            error: Optional[Exception] = None
+            response: Optional[httpx.Response] = None
+            started = time.perf_counter()
+            try:
+                if idempotent and settings.graph_hedge_enabled:
+                    response = await self._hedged(send)
+                else:
+                    response = await send()
+            except httpx.TransportError as e:
+                error = e
+            except BaseException:
+                self.breaker.release()
+                raise
+
+            if error is None and not _is_failure(response):
+                self.breaker.record_success()
+                if idempotent:
+                    self.latency.record(time.perf_counter() - started)
+                return response
+
+            self.breaker.record_failure()
+            attempt += 1
+            if not self._may_retry(idempotent, attempt):
+                raise self._unavailable(error, response) from error
+
+            self.retries += 1
+            await asyncio.sleep(self._retry_delay(attempt))
+
+    async def _hedged(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a read; if it is slower than p95, race a duplicate against it."""
+        delay = self.latency.hedge_delay()
+        if delay is None:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.budget.try_spend():
+            return await primary
+
+        self.hedges_sent += 1
+        hedge = asyncio.ensure_future(send())
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    failed = task.exception() is not None or _is_failure(task.result())
+                    if failed and pending:
+                        continue  # Wait for the other attempt
+                    if task is hedge:
+                        self.hedges_won += 1
+                    else:
+                        self.hedges_lost += 1
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def execute_sync(
+        self,
+        send: Callable[[], httpx.Response],
+        idempotent: bool
+    ) -> httpx.Response:
+        """Blocking variant of execute() for CLI callers (no hedging)."""
+        self.budget.record_call()
+        attempt = 0
+
+        while True:
+            self._check_breaker()
+            error: Optional[Exception] = None
+            response: Optional[httpx.Response] = None
+            try:
+                response = send()
+            except httpx.TransportError as e:
+                error = e
+            except BaseException:
+                self.breaker.release()
+                raise
+
+            if error is None and not _is_failure(response):
+                self.breaker.record_success()
+                return response
+
+            self.breaker.record_failure()
+            attempt += 1
+            if not self._may_retry(idempotent, attempt):
+                raise self._unavailable(error, response) from error
+
+            self.retries += 1
+            time.sleep(self._retry_delay(attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state, retry budget and hedging outcomes (for /health)."""
+        hedge_delay = self.latency.hedge_delay() if settings.graph_hedge_enabled else None
+        return {
+            "breaker": self.breaker.stats(),
+            "retries": {
+                "attempted": self.retries,
+                "maxAttempts": settings.graph_retry_attempts,
+                "budget": self.budget.stats(),
+            },
+            "hedging": {
+                "enabled": settings.graph_hedge_enabled,
+                "delayMs": round(hedge_delay * 1000, 1) if hedge_delay is not None else None,
+                "sent": self.hedges_sent,
+                "won": self.hedges_won,
+                "lost": self.hedges_lost,
+            },
+        }
+
+
+# Global policy instance (one per worker process)
+graph_resilience = GraphResilience()
+
+
+def get_graph_resilience_stats() -> Dict[str, Any]:
+    """Breaker/retry/hedging state for the graph client."""
+    return graph_resilience.stats()
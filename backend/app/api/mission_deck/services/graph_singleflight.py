@@ -0,0 +1,94 @@
+"""
+Single-flight coalescing for identical in-flight FalkorDB reads
+
+Dashboards poll the same endpoints every few seconds (earnings, mission
+fund status, current tier), so a burst of pollers puts the same Cypher in
+flight many times at once. Concurrent callers asking for the same read
+share one request and its result; graph load then scales with distinct
+queries rather than with open dashboards.
+
+Architecture:
+- Keyed by query text + parameters (same key as the result cache) +
+  the cache generation: writes invalidate the result cache, which bumps
+  the generation, so a read issued after a write starts its own request
+  instead of joining one that may have read pre-write data
+- Reads only: statements with write clauses always run individually
+- The shared request runs in its own task, so a caller that is cancelled
+  (client disconnected) never fails the others waiting on it
+- Nothing is kept once the request completes - this is not a cache; TTL
+  caching stays in graph_cache.py and composes with it (a cache miss
+  burst turns into one request that fills the cache)
+- Followers get their own copy of the result list; rows and nodes are
+  read-only Mappings and are shared
+
+Per-process and per-event-loop, like the pooled client.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+from app.config import settings
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight call per key among concurrent callers."""
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: str, fetch: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run fetch() unless an identical call is already in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call (cache generation + query text + parameters)
+            fetch: Coroutine factory performing the call
+
+        Returns:
+            (result, shared) - shared is True if another caller's request was reused
+
+        Raises:
+            Whatever fetch() raised, for every caller sharing it
+        """
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.followers += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        self.leaders += 1
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome retrieved - every waiter may have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests sent vs. callers that piggybacked on one."""
+        calls = self.leaders + self.followers
+        return {
+            "enabled": settings.graph_coalesce_enabled,
+            "sent": self.leaders,
+            "coalesced": self.followers,
+            "coalescedRate": round(self.followers / calls, 4) if calls else 0.0,
+            "inFlight": len(self._inflight),
+        }
+
+
+# Global instance (one per worker process)
+graph_singleflight = SingleFlight()
+
+
+def get_graph_singleflight_stats() -> Dict[str, Any]:
+    """Coalescing counters for the graph client."""
+    return graph_singleflight.stats()
@@ -38,6 +38,42 @@ class Settings(BaseSettings):
     falkordb_api_url: str = "https://mindprotocol.onrender.com/admin/query"
     falkordb_api_key: str = ""
     graph_name: str = "scopelock"
+    falkordb_timeout: float = 10.0  # Seconds per graph query
+    falkordb_connect_timeout: float = 5.0
+    falkordb_max_connections: int = 50  # Pooled connections to the REST proxy
+    falkordb_max_keepalive_connections: int = 20
+    falkordb_keepalive_expiry: float = 30.0
+    falkordb_param_mode: Literal["preamble", "params", "inline"] = "preamble"  # How query params are sent
+    falkordb_pipeline: Literal["auto", "on", "off"] = "auto"  # Batched multi-statement requests
+    falkordb_batch_concurrency: int = 8  # Fallback fan-out when pipelining is unavailable
+    graph_cache_enabled: bool = True  # Read-through cache for hot graph reads
+    graph_cache_max_entries: int = 2048
+    graph_cache_max_bytes: int = 32 * 1024 * 1024  # Approximate (raw response bytes)
+    response_cache_max_entries: int = 4096  # Rendered responses of polled endpoints (ETags)
+    response_cache_max_bytes: int = 16 * 1024 * 1024
+    graph_lazy_properties: bool = True  # Build node property dicts on first access
+    graph_retry_attempts: int = 2  # Retries for idempotent reads (writes are never retried)
+    graph_retry_base_delay: float = 0.05  # Seconds, doubled per retry (full jitter)
+    graph_retry_max_delay: float = 1.0
+    graph_retry_budget_ratio: float = 0.2  # Retries + hedges capped at ~20% of calls
+    graph_retry_budget_min_per_second: float = 1.0
+    graph_breaker_failure_threshold: int = 5  # Consecutive failures that open the circuit
+    graph_breaker_reset_timeout: float = 15.0  # Seconds before a half-open probe
+    graph_hedge_enabled: bool = False  # Duplicate slow reads after the p95 latency
+    graph_hedge_percentile: float = 95.0
+    graph_hedge_min_delay: float = 0.05  # Never hedge sooner than this (seconds)
+    graph_hedge_min_samples: int = 20  # Reads observed before hedging starts
+    graph_coalesce_enabled: bool = True  # Identical concurrent reads share one in-flight request
+    graph_metrics_enabled: bool = True  # Per-call-site query metrics (GET /metrics)
+    graph_slow_query_ms: float = 500.0  # Log queries at least this slow (0 disables)
+    graph_slow_query_log_size: int = 100  # Slow queries kept for GET /api/graph/slow-queries
+    sync_cursor_margin_seconds: float = 30.0  # Delta sync cursors trail the clock by this (> query timeout + cache TTL)
+    earnings_stream_keepalive_seconds: float = 15.0  # SSE comment sent when nothing changed
+    earnings_stream_refresh_seconds: float = 60.0  # Recompute anyway (writes from other workers)
+    earnings_stream_debounce_seconds: float = 0.25  # Collapse write bursts into one recompute
+    earnings_stream_signal_seconds: float = 10.0  # Poll mission/fund updated_at (CLI and script writes)
+    earnings_history_enabled: bool = True  # Background earnings snapshots (data_dir/earnings_history.sqlite3)
+    earnings_history_interval_seconds: float = 60.0
     jwt_secret: str = ""
     cors_origins: str = "https://scopelock.mindprotocol.ai,http://localhost:3000"
 
@@ -145,6 +145,7 @@ class HealthCheckResult(BaseModel):
     status: Literal["healthy", "degraded", "unhealthy"]
     uptime_seconds: int
     services: dict[str, ServiceStatus]
+    graph_client: Optional[dict] = None  # Circuit breaker, retries, hedged reads
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
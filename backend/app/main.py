@@ -4,6 +4,7 @@ ScopeLock Backend - FastAPI Application
 Main entry point for the event-native automation backend.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -11,10 +12,15 @@ from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.config import settings
 from app.contracts import ErrorResponse
+from app.api.mission_deck.services.graph import ensure_mission_sync_index
+from app.api.mission_deck.services.graph_client import open_graph_client, close_graph_client
+from app.api.mission_deck.services.compensation.earnings_history import run_earnings_history_sampler
+from app.api.mission_deck.services.compensation.fund_ledger import ensure_ledger_index
+from app.api.mission_deck.services.compensation.interaction_counters import ensure_counter_index
 
 # Set up logging
 logging.basicConfig(
@@ -23,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO - too noisy for per-query graph traffic
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # Track uptime
 START_TIME = time.time()
 
@@ -47,12 +56,46 @@ async def lifespan(app: FastAPI):
     settings.data_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"✅ Data directory ready: {settings.data_dir}")
 
+    # Shared pooled FalkorDB client (keep-alive connections for all graph queries)
+    await open_graph_client()
+    logger.info(f"✅ Graph client ready: {settings.falkordb_api_url}")
+
+    # updated_at index behind mission/DoD delta sync (?since=) - serving works without it, just slower
+    try:
+        await ensure_mission_sync_index()
+        logger.info("✅ Mission sync index ready")
+    except Exception as e:
+        logger.warning(f"⚠️ Mission sync index not created: {e}")
+
+    # idempotency_key index behind every fund ledger write's duplicate check - without it each write scans the ledger
+    try:
+        await ensure_ledger_index()
+        logger.info("✅ Fund ledger index ready")
+    except Exception as e:
+        logger.warning(f"⚠️ Fund ledger index not created: {e}")
+
+    # job_slug index behind earnings' counter lookups (chat history is backfilled by the deploy step)
+    try:
+        await ensure_counter_index()
+        logger.info("✅ Interaction counter index ready")
+    except Exception as e:
+        logger.warning(f"⚠️ Interaction counter index not created: {e}")
+
+    # Earnings history snapshots (served by /api/compensation/earnings/{member}/history)
+    history_sampler = None
+    if settings.earnings_history_enabled:
+        history_sampler = asyncio.create_task(run_earnings_history_sampler())
+        logger.info(f"✅ Earnings history sampler every {settings.earnings_history_interval_seconds:g}s")
+
     logger.info("🚀 ScopeLock Backend ready (file-based, webhook-only)")
 
     yield
 
     # Shutdown
     logger.info("ScopeLock Backend shutting down...")
+    if history_sampler is not None:
+        history_sampler.cancel()
+    await close_graph_client()
 
 
 # Create FastAPI app
@@ -145,6 +188,14 @@ async def health_check():
             last_check=datetime.utcnow()
         )
 
+    # Check FalkorDB (circuit breaker state - no extra query per health check)
+    from app.api.mission_deck.services.graph_resilience import get_graph_resilience_stats
+    graph_client = get_graph_resilience_stats()
+    services["falkordb"] = ServiceStatus(
+        status="disconnected" if graph_client["breaker"]["state"] == "open" else "connected",
+        last_check=datetime.utcnow()
+    )
+
     # Determine overall status
     all_connected = all(s.status == "connected" for s in services.values())
     overall_status = "healthy" if all_connected else "degraded"
@@ -152,10 +203,25 @@ async def health_check():
     return HealthCheckResult(
         status=overall_status,
         uptime_seconds=uptime,
-        services=services
+        services=services,
+        graph_client=graph_client
     )
 
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape target
+
+    Per-call-site FalkorDB query latency, payload size, row and error
+    series, plus graph cache and circuit breaker state (this worker only).
+    """
+    from app.api.mission_deck.services.graph_metrics import CONTENT_TYPE, render_prometheus
+
+    return PlainTextResponse(render_prometheus(), media_type=CONTENT_TYPE)
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -179,13 +245,15 @@ app.include_router(webhooks_router, tags=["webhooks"])
 from app.api.mission_deck.missions import router as missions_router
 from app.api.mission_deck.chat import router as chat_router
 from app.api.mission_deck.dod import router as dod_router
+from app.api.mission_deck.dashboard import router as dashboard_router
 from app.api.mission_deck.auth_routes import router as auth_router
 from app.api.mission_deck.compensation import router as compensation_router
 from app.api.mission_deck.graph_query import router as graph_query_router
 app.include_router(auth_router, tags=["Mission Deck Auth"])
-app.include_router(missions_router, prefix="/api", tags=["Mission Deck"])
+app.include_router(missions_router, tags=["Mission Deck"])  # Router already has /api/missions prefix
 app.include_router(chat_router, tags=["Mission Deck Chat"])  # Router already has /api/missions prefix
-app.include_router(dod_router, prefix="/api", tags=["Mission Deck"])
+app.include_router(dod_router, tags=["Mission Deck"])  # Router already has /api/missions prefix
+app.include_router(dashboard_router, tags=["Mission Deck"])  # Router already has /api/missions prefix
 app.include_router(compensation_router, tags=["Compensation"])
 app.include_router(graph_query_router, tags=["Graph Query"])
 
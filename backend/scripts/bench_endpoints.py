@@ -0,0 +1,540 @@
+"""
+Benchmark: Mission Deck API endpoints (latency, throughput, graph round trips)
+
+Seeds a graph of configurable size (members, jobs, missions with DoD
+checklists, chat messages, the mission fund) into a local graph backend,
+then drives the FastAPI app in-process (ASGI, no sockets) at fixed
+concurrency levels:
+
+- missions:          GET /api/missions
+- mission_dod:       GET /api/missions/{id}/dod
+- citizen_messages:  GET /api/citizens/{id}/messages
+- earnings:          GET /api/compensation/earnings/{member}
+- mission_fund:      GET /api/compensation/mission-fund
+
+Reports p50/p95/p99 latency, throughput and graph round trips (HTTP
+exchanges with FalkorDB) per request, and compares them with a stored
+baseline so regressions show up in review. Round trips are deterministic
+for a given seed; latencies are machine-dependent, so they are compared
+with a tolerance.
+
+The graph backend is the in-process FalkorDB stand-in by default
+(scripts/falkordb_standin.py) with --graph-latency-ms of simulated network
+latency per round trip. --falkordb-url points at a local FalkorDB REST
+endpoint instead (a disposable graph - the seed wipes it).
+
+The graph result cache is disabled unless --cache is given, so every
+request measures the graph path.
+
+Usage:
+    cd backend
+    python3 scripts/bench_endpoints.py                        # compare with baseline
+    python3 scripts/bench_endpoints.py --check                # exit 1 on regression
+    python3 scripts/bench_endpoints.py --save-baseline        # record a new baseline
+    python3 scripts/bench_endpoints.py --concurrency 1,16 --jobs 50 --graph-latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.api.mission_deck.services import graph, graph_client
+from app.api.mission_deck.services.compensation.interaction_counters import rebuild_interaction_counters
+from app.api.mission_deck.services.graph_cache import graph_cache
+from scripts.falkordb_standin import FalkorDBStandin
+
+DEFAULT_BASELINE = Path(__file__).parent.parent / "benchmarks" / "endpoints_baseline.json"
+
+DEFAULT_SEED = {
+    "members": 25,
+    "jobs": 20,
+    "messages_per_job": 40,
+    "missions": 50,
+    "dod_per_mission": 6,
+    "citizen_messages": 200,
+}
+
+CITIZENS = ["emma", "rafael", "sofia", "inna"]
+ENDPOINTS = ["missions", "mission_dod", "citizen_messages", "earnings", "mission_fund"]
+SEED_BATCH_SIZE = 500
+
+
+# ============================================================================
+# Graph backend
+# ============================================================================
+
+class GraphTrafficCounter:
+    """Counts round trips (HTTP exchanges) and statements sent to the graph."""
+
+    def __init__(self):
+        self.round_trips = 0
+        self.statements = 0
+
+    def record(self, request: httpx.Request) -> None:
+        self.round_trips += 1
+        try:
+            body = json.loads(request.content or b"{}")
+        except ValueError:
+            body = {}
+        self.statements += len(body.get("queries", [])) or 1
+
+    def reset(self) -> None:
+        self.round_trips = 0
+        self.statements = 0
+
+
+class StandinBenchTransport(httpx.AsyncBaseTransport):
+    """Async transport answering from the stand-in after a simulated network delay."""
+
+    def __init__(self, standin: FalkorDBStandin, counter: GraphTrafficCounter, latency_ms: float):
+        self._inner = standin.transport()
+        self._counter = counter
+        self._delay = latency_ms / 1000
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counter.record(request)
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        response = self._inner.handle_request(request)
+        await response.aread()
+        return response
+
+
+class CountingHTTPTransport(httpx.AsyncHTTPTransport):
+    """Network transport (--falkordb-url) that counts graph traffic."""
+
+    def __init__(self, counter: GraphTrafficCounter):
+        super().__init__()
+        self._counter = counter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counter.record(request)
+        return await super().handle_async_request(request)
+
+
+def configure_graph_backend(
+    falkordb_url: Optional[str],
+    api_key: Optional[str],
+    graph_latency_ms: float
+) -> GraphTrafficCounter:
+    """Point the app's graph client at the benchmark backend."""
+    counter = GraphTrafficCounter()
+
+    if falkordb_url:
+        graph.FALKORDB_API_URL = falkordb_url
+        graph.FALKORDB_API_KEY = api_key or settings.falkordb_api_key
+        settings.falkordb_api_key = graph.FALKORDB_API_KEY
+        graph_client.set_graph_transport(CountingHTTPTransport(counter))
+        return counter
+
+    standin = FalkorDBStandin()
+    graph.FALKORDB_API_URL = "http://falkordb-standin/admin/query"
+    graph.FALKORDB_API_KEY = settings.falkordb_api_key = "bench"
+    graph_client.set_graph_transport(
+        StandinBenchTransport(standin, counter, graph_latency_ms),
+        standin.transport()
+    )
+    return counter
+
+
+# ============================================================================
+# Seed data
+# ============================================================================
+
+def build_seed(config: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+    """Deterministic seed rows for the given graph size."""
+    members = [f"bench-member-{i}" for i in range(config["members"])]
+    now = "2025-11-05T10:00:00Z"
+
+    agents = [
+        {"slug": slug, "name": f"Bench Member {i}", "scope_ref": "scopelock", "created_at": now}
+        for i, slug in enumerate(members)
+    ]
+
+    jobs = [
+        {
+            "slug": f"bench-job-{j}", "name": f"Bench Job {j}", "work_type": "job",
+            "scope_ref": "scopelock", "status": "active", "value": 1000 + 100 * j,
+            "teamPool": round((1000 + 100 * j) * 0.30, 2),
+            "missionFund": round((1000 + 100 * j) * 0.05, 2), "created_at": now,
+        }
+        for j in range(config["jobs"])
+    ]
+
+    messages = []
+    for j in range(config["jobs"]):
+        for k in range(config["messages_per_job"]):
+            # Skewed participation: low member indexes talk the most
+            member = members[(k * k + j) % len(members)] if members else "bench-member-0"
+            messages.append({
+                "job": f"bench-job-{j}",
+                "props": {
+                    "slug": f"bench-msg-{j}-{k}", "event_kind": "message", "scope_ref": "scopelock",
+                    "actor_ref": member, "role": "user", "content": f"Job {j} message {k}",
+                    "citizen_ref": CITIZENS[k % len(CITIZENS)],
+                    "timestamp": f"2025-11-05T10:{k // 60 % 60:02d}:{k % 60:02d}Z",
+                },
+            })
+
+    citizen_messages = [
+        {
+            "slug": f"bench-citizen-msg-{i}", "event_kind": "message", "scope_ref": "scopelock",
+            "citizen_ref": CITIZENS[i % len(CITIZENS)], "actor_ref": members[i % len(members)] if members else "nlr",
+            "role": "user" if i % 2 == 0 else "assistant", "content": f"Citizen message {i}",
+            "code_blocks": [], "timestamp": f"2025-11-05T11:{i // 60 % 60:02d}:{i % 60:02d}Z",
+        }
+        for i in range(config["citizen_messages"])
+    ]
+
+    missions, tasks = [], []
+    for m in range(config["missions"]):
+        slug = f"bench-mission-{m}"
+        missions.append({
+            "slug": slug, "name": f"Bench Mission {m}", "work_type": "mission", "scope_ref": "scopelock",
+            "client_name": "Bench Client", "budget_cents": 10000 + 500 * m,
+            "due_date": "2025-12-01T23:59:59Z", "state": "todo" if m % 3 else "doing",
+            "assignee_ref": members[m % len(members)] if members else "nlr",
+            "stack_backend": "Python FastAPI", "stack_database": "FalkorDB", "created_at": now,
+        })
+        for t in range(config["dod_per_mission"]):
+            tasks.append({
+                "mission": slug,
+                "props": {
+                    "slug": f"{slug}-task-{t}", "name": f"Criterion {t}", "work_type": "task",
+                    "scope_ref": "scopelock", "dod_category": ["functional", "non-functional", "tests"][t % 3],
+                    "dod_sort_order": t, "state": "done" if t % 2 else "todo", "updated_at": now,
+                },
+            })
+
+    return {
+        "members": agents, "jobs": jobs, "messages": messages,
+        "citizen_messages": citizen_messages, "missions": missions, "tasks": tasks,
+    }
+
+
+def _chunks(rows: List[Any]) -> List[List[Any]]:
+    return [rows[i:i + SEED_BATCH_SIZE] for i in range(0, len(rows), SEED_BATCH_SIZE)]
+
+
+async def seed_graph(config: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+    """Wipe the benchmark graph and load the seed in UNWIND batches."""
+    seed = build_seed(config)
+    statements: List[Tuple[str, Dict[str, Any]]] = [("MATCH (n) DETACH DELETE n", {})]
+
+    for label, key in (("U4_Agent", "members"), ("U4_Work_Item", "jobs"),
+                       ("U4_Work_Item", "missions"), ("U4_Event", "citizen_messages")):
+        for chunk in _chunks(seed[key]):
+            statements.append((f"UNWIND $rows AS row CREATE (n:{label}) SET n += row", {"rows": chunk}))
+
+    for chunk in _chunks(seed["messages"]):
+        statements.append(("""
+        UNWIND $rows AS row
+        MATCH (job:U4_Work_Item {slug: row.job})
+        CREATE (msg:U4_Event)-[:U4_ABOUT]->(job)
+        SET msg += row.props
+        """, {"rows": chunk}))
+
+    for chunk in _chunks(seed["tasks"]):
+        statements.append(("""
+        UNWIND $rows AS row
+        MATCH (mission:U4_Work_Item {slug: row.mission})
+        CREATE (task:U4_Work_Item)-[:U4_MEMBER_OF {role: 'dod_task'}]->(mission)
+        SET task += row.props
+        """, {"rows": chunk}))
+
+    fund_balance = round(sum(job["missionFund"] for job in seed["jobs"]), 2)
+    statements.append(("""
+    CREATE (:U4_Account {slug: 'scopelock-mission-fund', accountType: 'mission_fund',
+                         scope_ref: 'scopelock', balance: $balance, currency: 'USD'})
+    """, {"balance": fund_balance}))
+
+    for cypher, params in statements:
+        await graph.query_graph(cypher, params)
+    # Seeded messages bypass create_chat_message - materialize their counters
+    await rebuild_interaction_counters()
+    return seed
+
+
+# ============================================================================
+# Load generation
+# ============================================================================
+
+RequestFactory = Callable[[int], Tuple[str, Dict[str, str]]]
+
+
+def build_request_factories(seed: Dict[str, List[Dict[str, Any]]]) -> Dict[str, RequestFactory]:
+    """Request (path, headers) generators per endpoint, cycling through seeded entities."""
+    from app.api.mission_deck.auth import create_access_token
+
+    members = [member["slug"] for member in seed["members"]]
+    tokens = {
+        slug: {"Authorization": f"Bearer {create_access_token(slug, f'{slug}@bench.local')}"}
+        for slug in members
+    }
+    missions = [mission["slug"] for mission in seed["missions"]]
+
+    def member(i: int) -> str:
+        return members[i % len(members)]
+
+    return {
+        "missions": lambda i: ("/api/missions", tokens[member(i)]),
+        "mission_dod": lambda i: (f"/api/missions/{missions[i % len(missions)]}/dod", tokens[member(i)]),
+        "citizen_messages": lambda i: (f"/api/citizens/{CITIZENS[i % len(CITIZENS)]}/messages?limit=50", tokens[member(i)]),
+        "earnings": lambda i: (f"/api/compensation/earnings/{member(i)}", {}),
+        "mission_fund": lambda i: ("/api/compensation/mission-fund", {}),
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of latency samples (ms)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    factory: RequestFactory,
+    counter: GraphTrafficCounter,
+    concurrency: int,
+    requests: int,
+    warmup: int
+) -> Dict[str, Any]:
+    """Drive one endpoint with `concurrency` closed-loop workers."""
+    for i in range(warmup):
+        path, headers = factory(i)
+        await client.get(path, headers=headers)
+
+    counter.reset()
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        for i in next_index:
+            path, headers = factory(i)
+            start = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "round_trips_per_request": round(counter.round_trips / requests, 2),
+        "statements_per_request": round(counter.statements / requests, 2),
+        "status_codes": statuses,
+    }
+
+
+async def run_benchmark(
+    seed_config: Dict[str, int],
+    concurrency_levels: List[int],
+    requests: int,
+    warmup: int = 5,
+    endpoints: Optional[List[str]] = None,
+    cache: bool = False,
+    falkordb_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    graph_latency_ms: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Seed the graph and measure every endpoint at every concurrency level.
+
+    Returns:
+        {"config": {...}, "results": {endpoint: {concurrency: metrics}}}
+    """
+    from app.main import app
+
+    # Process-wide state changed for the run (restored afterwards)
+    saved_settings = {
+        key: getattr(settings, key) for key in ("graph_cache_enabled", "jwt_secret", "falkordb_api_key")
+    }
+    saved_graph = (graph.FALKORDB_API_URL, graph.FALKORDB_API_KEY)
+
+    settings.graph_cache_enabled = cache
+    settings.jwt_secret = settings.jwt_secret or "bench-jwt-secret"
+    graph_cache.clear(reset_counters=True)
+
+    counter = configure_graph_backend(falkordb_url, api_key, graph_latency_ms)
+    try:
+        seed = await seed_graph(seed_config)
+        factories = build_request_factories(seed)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for endpoint in endpoints or ENDPOINTS:
+                results[endpoint] = {}
+                for level in concurrency_levels:
+                    graph_cache.clear()
+                    results[endpoint][str(level)] = await run_level(
+                        client, factories[endpoint], counter, level, requests, warmup
+                    )
+    finally:
+        await graph_client.close_graph_client()
+        graph_client.set_graph_transport(None, None)
+        graph_cache.clear()
+        for key, value in saved_settings.items():
+            setattr(settings, key, value)
+        graph.FALKORDB_API_URL, graph.FALKORDB_API_KEY = saved_graph
+
+    return {
+        "config": {
+            "seed": dict(seed_config),
+            "requests": requests,
+            "cache": cache,
+            "graph_backend": "falkordb" if falkordb_url else "standin",
+            "graph_latency_ms": 0.0 if falkordb_url else graph_latency_ms,
+        },
+        "results": results,
+    }
+
+
+# ============================================================================
+# Baseline comparison
+# ============================================================================
+
+def compare_with_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    latency_tolerance: float = 0.25,
+    latency_floor_ms: float = 2.0,
+    check_latency: bool = True
+) -> List[str]:
+    """
+    List regressions of `current` against `baseline`.
+
+    A regression is more graph round trips per request (at concurrency > 1:
+    more than the serial baseline, since coalescing savings vary run to
+    run), or (check_latency) a p95 more than `latency_tolerance` above
+    baseline and at least `latency_floor_ms` slower. Runs with a different seed/backend config are
+    not comparable and are reported as a single mismatch.
+    """
+    base_config, config = baseline.get("config", {}), current.get("config", {})
+    comparable_keys = ("seed", "cache", "graph_backend", "graph_latency_ms")
+    if any(base_config.get(key) != config.get(key) for key in comparable_keys):
+        return ["config mismatch: baseline was recorded with a different seed/backend - not comparable"]
+
+    regressions = []
+    for endpoint, levels in current.get("results", {}).items():
+        base_levels = baseline.get("results", {}).get(endpoint, {})
+        serial = base_levels.get("1")
+        for level, metrics in levels.items():
+            base = base_levels.get(level)
+            if base is None:
+                continue
+            # Concurrent callers coalesce identical reads by timing luck - only
+            # exceeding the serial (uncoalesced) cost is a regression there
+            allowed = base["round_trips_per_request"]
+            if serial is not None:
+                allowed = max(allowed, serial["round_trips_per_request"])
+            if metrics["round_trips_per_request"] > allowed + 0.01:
+                regressions.append(
+                    f"{endpoint} @{level}: graph round trips/request "
+                    f"{allowed} → {metrics['round_trips_per_request']}"
+                )
+            if check_latency:
+                slower = metrics["p95_ms"] - base["p95_ms"]
+                if slower > latency_floor_ms and metrics["p95_ms"] > base["p95_ms"] * (1 + latency_tolerance):
+                    regressions.append(
+                        f"{endpoint} @{level}: p95 {base['p95_ms']} ms → {metrics['p95_ms']} ms"
+                    )
+    return regressions
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    base_results = (baseline or {}).get("results", {})
+    print(f"{'endpoint':<18}{'conc':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}"
+          f"{'trips':>7}{'Δtrips':>8}{'Δp95':>9}  status")
+    for endpoint, levels in report["results"].items():
+        for level, metrics in levels.items():
+            base = base_results.get(endpoint, {}).get(level)
+            delta_trips = delta_p95 = ""
+            if base:
+                delta_trips = f"{metrics['round_trips_per_request'] - base['round_trips_per_request']:+.2f}"
+                delta_p95 = f"{metrics['p95_ms'] - base['p95_ms']:+.1f}"
+            print(
+                f"{endpoint:<18}{level:>5}{metrics['p50_ms']:>9}{metrics['p95_ms']:>9}{metrics['p99_ms']:>9}"
+                f"{metrics['throughput_rps']:>9}{metrics['round_trips_per_request']:>7}"
+                f"{delta_trips:>8}{delta_p95:>9}  {metrics['status_codes']}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    for key, value in DEFAULT_SEED.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=value, help=f"Seed size (default {value})")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per endpoint and level")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed requests before each level")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="Comma-separated endpoints to run")
+    parser.add_argument("--cache", action="store_true", help="Keep the graph result cache enabled")
+    parser.add_argument("--graph-latency-ms", type=float, default=0.0, help="Simulated latency per stand-in round trip")
+    parser.add_argument("--falkordb-url", default=None, help="Local FalkorDB REST endpoint instead of the stand-in")
+    parser.add_argument("--api-key", default=None, help="API key for --falkordb-url")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if a regression is found")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative p95 increase")
+    parser.add_argument("--output", type=Path, default=None, help="Also write this run's JSON report here")
+    args = parser.parse_args()
+
+    seed_config = {key: getattr(args, key) for key in DEFAULT_SEED}
+    levels = [int(level) for level in args.concurrency.split(",") if level]
+    endpoints = [endpoint for endpoint in args.endpoints.split(",") if endpoint]
+
+    print("⏱️  Mission Deck endpoint benchmark")
+    print(f"   Graph: {args.falkordb_url or f'in-process stand-in (+{args.graph_latency_ms} ms/round trip)'}")
+    print(f"   Seed: {seed_config}")
+    print(f"   {args.requests} requests per endpoint at concurrency {levels}, "
+          f"result cache {'on' if args.cache else 'off'}\n")
+
+    report = asyncio.run(run_benchmark(
+        seed_config, levels, args.requests, args.warmup, endpoints,
+        cache=args.cache, falkordb_url=args.falkordb_url, api_key=args.api_key,
+        graph_latency_ms=args.graph_latency_ms
+    ))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    print_report(report, baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n💾 Baseline saved: {args.baseline}")
+        sys.exit(0)
+
+    if baseline is None:
+        print(f"\n⚠️  No baseline at {args.baseline} (run with --save-baseline)")
+        sys.exit(0)
+
+    regressions = compare_with_baseline(report, baseline, latency_tolerance=args.tolerance)
+    if regressions:
+        print("\n❌ Regressions vs baseline:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1 if args.check else 0)
+    print("\n✅ No regressions vs baseline")
@@ -0,0 +1,145 @@
+"""
+Benchmark: inlined vs CYPHER-preamble parameters for hot Mission Deck reads
+
+Calls the real get_mission_by_slug() and get_citizen_messages() call sites
+once per parameter mode, cycling through distinct slugs/citizens so each
+call carries a different value:
+
+- inline:   values substituted into the query text - every distinct slug is
+            a new query string, so FalkorDB parses and plans it from scratch
+- preamble: "CYPHER slug='...' <query>" - the query text after the header is
+            constant, so FalkorDB serves the plan from its cache
+
+Reports latency percentiles per mode and the number of distinct query texts
+FalkorDB saw (= plan cache keys). The result cache is disabled so every call
+reaches the graph.
+
+Usage:
+    cd backend
+    python3 scripts/bench_param_queries.py --iterations 200 --distinct 100
+
+Environment:
+    FALKORDB_API_URL: FalkorDB REST API endpoint
+    FALKORDB_API_KEY: API key for authentication
+    GRAPH_NAME: Graph name (default: scopelock)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+import httpx
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.api.mission_deck.services import graph_client
+from app.api.mission_deck.services.graph import get_citizen_messages, get_mission_by_slug
+
+
+class RecordingTransport(httpx.AsyncHTTPTransport):
+    """Network transport that records every query text sent to FalkorDB."""
+
+    def __init__(self):
+        super().__init__()
+        self.query_texts: Set[str] = set()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        query = body.get("query", "")
+        # Plan cache key = query text after the CYPHER parameter header
+        # (call-site Cypher is a triple-quoted string starting on a new line)
+        if query.startswith("CYPHER "):
+            query = query.split("\n", 1)[-1]
+        self.query_texts.add(query)
+        return await super().handle_async_request(request)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of latency samples (ms)."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_call_site(
+    name: str,
+    call: Callable[[int], "asyncio.Future"],
+    mode: str,
+    iterations: int,
+    warmup: int
+) -> Dict:
+    """Time one call site in one parameter mode."""
+    settings.falkordb_param_mode = mode
+    transport = RecordingTransport()
+    graph_client.set_graph_transport(transport)
+
+    for i in range(warmup):
+        await call(i)
+
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await call(i)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    await graph_client.close_graph_client()
+
+    return {
+        "call_site": name,
+        "mode": mode,
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "mean_ms": round(statistics.mean(samples), 2),
+        "distinct_query_texts": len(transport.query_texts),
+    }
+
+
+async def main(iterations: int, distinct: int, warmup: int) -> List[Dict]:
+    settings.graph_cache_enabled = False
+
+    call_sites = {
+        "get_mission_by_slug": lambda i: get_mission_by_slug(f"bench-mission-{i % distinct}"),
+        "get_citizen_messages": lambda i: get_citizen_messages(f"bench-citizen-{i % distinct}", limit=50),
+    }
+
+    results = []
+    for name, call in call_sites.items():
+        for mode in ("inline", "preamble"):
+            results.append(await run_call_site(name, call, mode, iterations, warmup))
+
+    graph_client.set_graph_transport(None)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per call site and mode")
+    parser.add_argument("--distinct", type=int, default=100, help="Distinct slugs/citizens to cycle through")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls before measuring")
+    args = parser.parse_args()
+
+    print("⏱️  Parameter mode benchmark (inline vs CYPHER preamble)")
+    print(f"   Graph: {settings.graph_name} @ {settings.falkordb_api_url}")
+    print(f"   {args.iterations} calls per mode, {args.distinct} distinct values\n")
+
+    rows = asyncio.run(main(args.iterations, args.distinct, args.warmup))
+
+    print(f"{'call site':<24}{'mode':<10}{'p50 ms':>9}{'p95 ms':>9}{'mean ms':>9}{'plans':>7}")
+    for row in rows:
+        print(
+            f"{row['call_site']:<24}{row['mode']:<10}{row['p50_ms']:>9}"
+            f"{row['p95_ms']:>9}{row['mean_ms']:>9}{row['distinct_query_texts']:>7}"
+        )
+
+    for name in ("get_mission_by_slug", "get_citizen_messages"):
+        inline, preamble = [row for row in rows if row["call_site"] == name]
+        saved = inline["mean_ms"] - preamble["mean_ms"]
+        print(f"\n💡 {name}: {saved:+.2f} ms/call saved by plan reuse "
+              f"({inline['distinct_query_texts']} plans → {preamble['distinct_query_texts']})")
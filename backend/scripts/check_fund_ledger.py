@@ -0,0 +1,76 @@
+"""
+Check the mission fund balance against its transaction ledger
+
+Every fund write appends a U4_Transaction (fund_ledger.py), so the balance
+must equal the sum of the ledger. This command reports the difference
+and, for a fund that predates the ledger, records the unaccounted balance
+as a one-time opening entry.
+
+Run it once after deploying the ledger, then whenever the fund was
+changed by other tools.
+
+Usage:
+    cd backend
+    python3 scripts/check_fund_ledger.py           # report, open the ledger if needed
+    python3 scripts/check_fund_ledger.py --check   # report only (exit 1 on drift)
+
+Environment:
+    FALKORDB_API_URL: FalkorDB REST API endpoint
+    FALKORDB_API_KEY: API key for authentication
+    GRAPH_NAME: Graph name (default: scopelock)
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api.mission_deck.services.compensation.fund_ledger import (  # noqa: E402
+    check_fund_ledger,
+    open_fund_ledger,
+)
+
+
+async def check(check_only: bool = False) -> float:
+    """Report drift, then open the ledger unless check_only. Returns the drift."""
+    status = await check_fund_ledger()
+    if status['balance'] is None:
+        print("⚠️  Mission fund not found - nothing to check")
+        return 0.0
+
+    print(
+        f"💰 Balance ${status['balance']:.2f}, ledger ${status['ledgerBalance']:.2f} "
+        f"({status['transactions']} transaction(s))"
+    )
+    if not status['drift']:
+        print("✅ Ledger in sync")
+        return 0.0
+
+    print(f"⚠️  Balance differs from ledger by ${status['drift']:.2f}")
+    if check_only:
+        return status['drift']
+
+    opening = await open_fund_ledger()
+    if opening is None:
+        print("❌ Ledger already has an opening entry - drift comes from writes outside the ledger")
+        return status['drift']
+
+    print(f"🔁 Recorded opening balance ${opening:.2f}")
+    return 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the mission fund balance against its ledger")
+    parser.add_argument("--check", action="store_true", help="Report drift without writing (exit 1 on drift)")
+    args = parser.parse_args()
+
+    drift = asyncio.run(check(check_only=args.check))
+    if drift:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
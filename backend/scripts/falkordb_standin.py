@@ -0,0 +1,2156 @@
+"""
+In-process FalkorDB REST stand-in for hermetic tests and benchmarks
+
+Speaks the same /admin/query JSON protocol as the Mind Protocol FalkorDB
+proxy, backed by an embedded in-memory graph that implements the Cypher
+subset Mission Deck, the compensation services and the test fixtures use.
+No network, no Redis, no FalkorDB build.
+
+Protocol:
+    request:  {"graph_name": "scopelock", "query": "MATCH ...", "params": {...}}
+    response: {"result": [columns, rows, metadata]}   (FalkorDB verbose format)
+
+    request:  {"graph_name": ..., "queries": [{"query": ..., "params": {}}, ...]}
+    response: {"results": [[columns, rows, metadata], ...]}   (pipelined batch)
+
+    Parameters arrive as FalkorDB's "CYPHER k=v ..." preamble, the "params"
+    field, or inlined literals. Errors answer HTTP 400 {"error": "..."}.
+
+Cypher subset:
+- MATCH / OPTIONAL MATCH with labels, property maps and relationship chains
+  (-[:TYPE {k: v}]->, <-[]-, -[]-), comma-separated patterns
+- WHERE with AND/OR/XOR/NOT, = <> < > <= >=, IN, STARTS WITH, ENDS WITH,
+  CONTAINS, IS [NOT] NULL, label checks (n:Label), pattern predicates
+- WITH / RETURN with aliases, DISTINCT, *, aggregates (count, sum, avg, min,
+  max, collect - incl. count(DISTINCT x) and count(*)), ORDER BY, SKIP, LIMIT
+- CREATE nodes and relationships, MERGE with ON CREATE SET / ON MATCH SET,
+  SET (n.k = v, n += {...}, n:Label), REMOVE, DELETE / DETACH DELETE, UNWIND
+- CASE, list/map literals, list comprehensions, common scalar functions
+- CREATE INDEX (both syntaxes) - property lookups are hash-indexed anyway
+
+Not supported (answers 400): variable-length paths, shortestPath, CALL,
+UNION, FOREACH, durations, and datetime()/localdatetime() - which FalkorDB
+rejects too (stamp times in Python and pass them as parameters). Queries are not transactional - a statement that
+fails halfway keeps the writes it already made.
+
+Usage (standalone server for scripts / load tests):
+    cd backend
+    python3 scripts/falkordb_standin.py --port 8765 --api-key local
+    FALKORDB_API_URL=http://127.0.0.1:8765/admin/query FALKORDB_API_KEY=local ...
+
+Usage (in-process, no sockets):
+    standin = FalkorDBStandin(api_key="local")
+    graph_client.set_graph_transport(standin.async_transport(), standin.transport())
+"""
+
+import argparse
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+
+class CypherError(Exception):
+    """Query the stand-in can't parse or execute (answered as HTTP 400)."""
+
+
+# ============================================================================
+# Graph store
+# ============================================================================
+
+class Node:
+    """Stored node."""
+
+    __slots__ = ("id", "labels", "props", "out_edges", "in_edges", "deleted")
+
+    def __init__(self, node_id: int, labels: List[str], props: Dict[str, Any]):
+        self.id = node_id
+        self.labels = labels
+        self.props = props
+        self.out_edges: Dict[int, "Edge"] = {}
+        self.in_edges: Dict[int, "Edge"] = {}
+        self.deleted = False
+
+
+class Edge:
+    """Stored relationship."""
+
+    __slots__ = ("id", "type", "src", "dest", "props", "deleted")
+
+    def __init__(self, edge_id: int, rel_type: str, src: Node, dest: Node, props: Dict[str, Any]):
+        self.id = edge_id
+        self.type = rel_type
+        self.src = src
+        self.dest = dest
+        self.props = props
+        self.deleted = False
+
+
+def _index_key(value: Any) -> Any:
+    """Hashable index key for a property value (None if not indexable)."""
+    if isinstance(value, bool):
+        return ("b", value)
+    if isinstance(value, (int, float, str)):
+        return value
+    return None
+
+
+class QueryStats:
+    """Write counters reported in the result metadata."""
+
+    __slots__ = (
+        "labels_added", "nodes_created", "properties_set",
+        "relationships_created", "nodes_deleted", "relationships_deleted",
+        "indices_created"
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def metadata(self, cached: bool, elapsed_ms: float) -> List[str]:
+        labels = {
+            "labels_added": "Labels added",
+            "nodes_created": "Nodes created",
+            "properties_set": "Properties set",
+            "relationships_created": "Relationships created",
+            "nodes_deleted": "Nodes deleted",
+            "relationships_deleted": "Relationships deleted",
+            "indices_created": "Indices created",
+        }
+        lines = [f"{text}: {getattr(self, name)}" for name, text in labels.items() if getattr(self, name)]
+        lines.append(f"Cached execution: {1 if cached else 0}")
+        lines.append(f"Query internal execution time: {elapsed_ms:.6f} milliseconds")
+        return lines
+
+
+class GraphStore:
+    """
+    In-memory property graph with label sets and lazy (label, key) hash
+    indexes (label None indexes a key across every node).
+    """
+
+    def __init__(self):
+        self.nodes: Dict[int, Node] = {}
+        self.edges: Dict[int, Edge] = {}
+        self._by_label: Dict[str, Dict[int, Node]] = {}
+        self._indexes: Dict[Tuple[str, str], Dict[Any, Dict[int, Node]]] = {}
+        self._next_node_id = 0
+        self._next_edge_id = 0
+
+    # -- reads ---------------------------------------------------------------
+
+    def nodes_with_label(self, label: str) -> List[Node]:
+        return list(self._by_label.get(label, {}).values())
+
+    def lookup(self, label: Optional[str], key: str, value: Any) -> Optional[List[Node]]:
+        """
+        Nodes with label (any label if None) and key = value via the hash
+        index (None if the value is not indexable).
+        """
+        index_key = _index_key(value)
+        if index_key is None:
+            return None
+        index = self._indexes.get((label, key))
+        if index is None:
+            index = self.create_index(label, key)
+        return list(index.get(index_key, {}).values())
+
+    # -- writes --------------------------------------------------------------
+
+    def create_index(self, label: Optional[str], key: str) -> Dict[Any, Dict[int, Node]]:
+        index: Dict[Any, Dict[int, Node]] = {}
+        nodes = self.nodes if label is None else self._by_label.get(label, {})
+        for node in nodes.values():
+            index_key = _index_key(node.props.get(key))
+            if index_key is not None:
+                index.setdefault(index_key, {})[node.id] = node
+        self._indexes[(label, key)] = index
+        return index
+
+    def _index_add(self, node: Node, labels: List[Optional[str]], keys: Optional[List[str]] = None) -> None:
+        for label in labels:
+            for key in (keys if keys is not None else node.props):
+                index = self._indexes.get((label, key))
+                if index is not None:
+                    index_key = _index_key(node.props.get(key))
+                    if index_key is not None:
+                        index.setdefault(index_key, {})[node.id] = node
+
+    def _index_remove(self, node: Node, labels: List[Optional[str]], keys: Optional[List[str]] = None) -> None:
+        for label in labels:
+            for key in (keys if keys is not None else node.props):
+                index = self._indexes.get((label, key))
+                if index is not None:
+                    bucket = index.get(_index_key(node.props.get(key)))
+                    if bucket is not None:
+                        bucket.pop(node.id, None)
+
+    def create_node(self, labels: List[str], props: Dict[str, Any]) -> Node:
+        node = Node(self._next_node_id, list(dict.fromkeys(labels)), props)
+        self._next_node_id += 1
+        self.nodes[node.id] = node
+        for label in node.labels:
+            self._by_label.setdefault(label, {})[node.id] = node
+        self._index_add(node, node.labels + [None])
+        return node
+
+    def create_edge(self, rel_type: str, src: Node, dest: Node, props: Dict[str, Any]) -> Edge:
+        edge = Edge(self._next_edge_id, rel_type, src, dest, props)
+        self._next_edge_id += 1
+        self.edges[edge.id] = edge
+        src.out_edges[edge.id] = edge
+        dest.in_edges[edge.id] = edge
+        return edge
+
+    def set_property(self, entity: Any, key: str, value: Any) -> None:
+        if isinstance(entity, Node):
+            self._index_remove(entity, entity.labels + [None], [key])
+        if value is None:
+            entity.props.pop(key, None)
+        else:
+            entity.props[key] = value
+        if isinstance(entity, Node):
+            self._index_add(entity, entity.labels + [None], [key])
+
+    def add_labels(self, node: Node, labels: List[str]) -> int:
+        added = [label for label in labels if label not in node.labels]
+        node.labels.extend(added)
+        for label in added:
+            self._by_label.setdefault(label, {})[node.id] = node
+        self._index_add(node, added)
+        return len(added)
+
+    def remove_labels(self, node: Node, labels: List[str]) -> None:
+        removed = [label for label in labels if label in node.labels]
+        self._index_remove(node, removed)
+        for label in removed:
+            node.labels.remove(label)
+            self._by_label.get(label, {}).pop(node.id, None)
+
+    def delete_edge(self, edge: Edge) -> bool:
+        if edge.deleted:
+            return False
+        edge.deleted = True
+        self.edges.pop(edge.id, None)
+        edge.src.out_edges.pop(edge.id, None)
+        edge.dest.in_edges.pop(edge.id, None)
+        return True
+
+    def delete_node(self, node: Node, detach: bool, stats: QueryStats) -> None:
+        if node.deleted:
+            return
+        if node.out_edges or node.in_edges:
+            if not detach:
+                raise CypherError("Cannot delete node, because it still has connections. Use DETACH DELETE.")
+            for edge in list(node.out_edges.values()) + list(node.in_edges.values()):
+                if self.delete_edge(edge):
+                    stats.relationships_deleted += 1
+        self._index_remove(node, node.labels + [None])
+        for label in node.labels:
+            self._by_label.get(label, {}).pop(node.id, None)
+        self.nodes.pop(node.id, None)
+        node.deleted = True
+        stats.nodes_deleted += 1
+
+
+# ============================================================================
+# Tokenizer
+# ============================================================================
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+|//[^\n]*)
+  | (?P<num>\d+\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+|\d+)
+  | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<param>\$[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<name>`[^`]+`)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op><>|!=|<=|>=|=~|\+=|\.\.|[-+*/%=<>(){}\[\],:.|;^])
+""", re.VERBOSE | re.DOTALL)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "\\": "\\", "'": "'", '"': '"'}
+_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+
+
+def _unescape(text: str) -> str:
+    def replace(match: "re.Match[str]") -> str:
+        code = match.group(1)
+        if code.startswith("u") and len(code) == 5:
+            return chr(int(code[1:], 16))
+        return _ESCAPES.get(code, code)
+    return _ESCAPE_RE.sub(replace, text)
+
+
+class Token:
+    __slots__ = ("kind", "value", "start", "end")
+
+    def __init__(self, kind: str, value: Any, start: int, end: int):
+        self.kind = kind
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{self.value!r}"
+
+
+def tokenize(text: str) -> List[Token]:
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None:
+            raise CypherError(f"Invalid input at position {position}: {text[position:position + 20]!r}")
+        kind = match.lastgroup
+        raw = match.group(kind)
+        if kind == "num":
+            value: Any = float(raw) if ("." in raw or "e" in raw or "E" in raw) else int(raw)
+            tokens.append(Token("num", value, match.start(), match.end()))
+        elif kind == "str":
+            tokens.append(Token("str", _unescape(raw[1:-1]), match.start(), match.end()))
+        elif kind == "param":
+            tokens.append(Token("param", raw[1:], match.start(), match.end()))
+        elif kind == "name":
+            tokens.append(Token("name", raw[1:-1], match.start(), match.end()))
+        elif kind == "ident":
+            tokens.append(Token("ident", raw, match.start(), match.end()))
+        elif kind == "op":
+            tokens.append(Token("op", raw, match.start(), match.end()))
+        position = match.end()
+    tokens.append(Token("eof", None, len(text), len(text)))
+    return tokens
+
+
+# ============================================================================
+# Parser (Cypher text -> AST tuples)
+# ============================================================================
+
+_CLAUSE_KEYWORDS = {
+    "MATCH", "OPTIONAL", "CREATE", "MERGE", "SET", "DELETE", "DETACH",
+    "REMOVE", "UNWIND", "WITH", "RETURN", "ON", "ORDER", "SKIP", "LIMIT", "WHERE"
+}
+AGGREGATES = {"count", "sum", "avg", "min", "max", "collect"}
+
+
+class _Backtrack(Exception):
+    pass
+
+
+class Parser:
+    """Recursive-descent parser for the supported Cypher subset."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    # -- token helpers -------------------------------------------------------
+
+    def peek(self, offset: int = 0) -> Token:
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        if token.kind != "eof":
+            self.pos += 1
+        return token
+
+    def is_kw(self, word: str, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token.kind == "ident" and token.value.upper() == word
+
+    def accept_kw(self, *words: str) -> bool:
+        if all(self.is_kw(word, i) for i, word in enumerate(words)):
+            self.pos += len(words)
+            return True
+        return False
+
+    def expect_kw(self, *words: str) -> None:
+        if not self.accept_kw(*words):
+            raise CypherError(f"Expected {' '.join(words)} near {self._near()}")
+
+    def is_op(self, op: str, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token.kind == "op" and token.value == op
+
+    def accept_op(self, op: str) -> bool:
+        if self.is_op(op):
+            self.pos += 1
+            return True
+        return False
+
+    def expect_op(self, op: str) -> None:
+        if not self.accept_op(op):
+            raise CypherError(f"Expected '{op}' near {self._near()}")
+
+    def name(self) -> str:
+        token = self.advance()
+        if token.kind not in ("ident", "name"):
+            raise CypherError(f"Expected a name near {self._near(token)}")
+        return token.value
+
+    def _near(self, token: Optional[Token] = None) -> str:
+        token = token or self.peek()
+        return repr(self.text[token.start:token.start + 30]) if token.kind != "eof" else "end of query"
+
+    # -- preamble ------------------------------------------------------------
+
+    def preamble(self) -> Tuple[Dict[str, Any], int]:
+        """Parse "CYPHER k=v ..." and return (params, offset of the query body)."""
+        params: Dict[str, Any] = {}
+        if not self.is_kw("CYPHER"):
+            return params, 0
+        self.advance()
+        while self.peek().kind in ("ident", "name") and self.is_op("=", 1):
+            key = self.name()
+            self.advance()
+            params[key] = Compiler.constant(self.expression())
+        return params, self.peek().start
+
+    # -- clauses -------------------------------------------------------------
+
+    def query(self) -> List[tuple]:
+        clauses = []
+        while self.peek().kind != "eof":
+            if self.accept_op(";"):
+                continue
+            clauses.append(self.clause())
+        if not clauses:
+            raise CypherError("Empty query")
+        return clauses
+
+    def clause(self) -> tuple:
+        if self.accept_kw("OPTIONAL", "MATCH"):
+            return self.match_clause(optional=True)
+        if self.accept_kw("MATCH"):
+            return self.match_clause(optional=False)
+        if self.is_kw("CREATE") and self.is_kw("INDEX", 1):
+            self.pos += 2
+            return self.create_index_clause()
+        if self.accept_kw("CREATE"):
+            return ("create", self.patterns())
+        if self.accept_kw("MERGE"):
+            return self.merge_clause()
+        if self.accept_kw("SET"):
+            return ("set", self.set_items())
+        if self.accept_kw("DETACH", "DELETE"):
+            return ("delete", True, self.expression_list())
+        if self.accept_kw("DELETE"):
+            return ("delete", False, self.expression_list())
+        if self.accept_kw("REMOVE"):
+            return ("remove", self.remove_items())
+        if self.accept_kw("UNWIND"):
+            expr = self.expression()
+            self.expect_kw("AS")
+            return ("unwind", expr, self.name())
+        if self.accept_kw("WITH"):
+            projection = self.projection()
+            where = self.expression() if self.accept_kw("WHERE") else None
+            return ("with", projection, where)
+        if self.accept_kw("RETURN"):
+            return ("return", self.projection())
+        raise CypherError(f"Unsupported clause near {self._near()}")
+
+    def match_clause(self, optional: bool) -> tuple:
+        paths = self.patterns()
+        where = self.expression() if self.accept_kw("WHERE") else None
+        return ("match", optional, paths, where)
+
+    def merge_clause(self) -> tuple:
+        path = self.pattern()
+        on_create, on_match = [], []
+        while self.is_kw("ON"):
+            if self.accept_kw("ON", "CREATE", "SET"):
+                on_create.extend(self.set_items())
+            elif self.accept_kw("ON", "MATCH", "SET"):
+                on_match.extend(self.set_items())
+            else:
+                raise CypherError(f"Expected ON CREATE SET / ON MATCH SET near {self._near()}")
+        return ("merge", path, on_create, on_match)
+
+    def create_index_clause(self) -> tuple:
+        # CREATE INDEX ON :Label(prop, ...)  |  CREATE INDEX FOR (n:Label) ON (n.prop, ...)
+        if self.accept_kw("ON"):
+            self.expect_op(":")
+            label = self.name()
+            self.expect_op("(")
+            keys = [self.name()]
+            while self.accept_op(","):
+                keys.append(self.name())
+            self.expect_op(")")
+            return ("index", label, keys)
+        self.expect_kw("FOR")
+        self.expect_op("(")
+        self.name()
+        self.expect_op(":")
+        label = self.name()
+        self.expect_op(")")
+        self.expect_kw("ON")
+        self.expect_op("(")
+        keys = []
+        while True:
+            self.name()
+            self.expect_op(".")
+            keys.append(self.name())
+            if not self.accept_op(","):
+                break
+        self.expect_op(")")
+        return ("index", label, keys)
+
+    def set_items(self) -> List[tuple]:
+        items = [self.set_item()]
+        while self.accept_op(","):
+            items.append(self.set_item())
+        return items
+
+    def set_item(self) -> tuple:
+        var = self.name()
+        if self.accept_op("."):
+            key = self.name()
+            self.expect_op("=")
+            return ("setprop", var, key, self.expression())
+        if self.accept_op("+="):
+            return ("setmerge", var, self.expression())
+        if self.accept_op("="):
+            return ("setall", var, self.expression())
+        if self.is_op(":"):
+            return ("setlabel", var, self.labels())
+        raise CypherError(f"Invalid SET item near {self._near()}")
+
+    def remove_items(self) -> List[tuple]:
+        items = []
+        while True:
+            var = self.name()
+            if self.accept_op("."):
+                items.append(("rmprop", var, self.name()))
+            else:
+                items.append(("rmlabel", var, self.labels()))
+            if not self.accept_op(","):
+                return items
+
+    def projection(self) -> Dict[str, Any]:
+        distinct = self.accept_kw("DISTINCT")
+        star = self.accept_op("*")
+        items = []
+        if not star or self.accept_op(","):
+            while True:
+                start = self.peek().start
+                expr = self.expression()
+                text = self.text[start:self.tokens[self.pos - 1].end].strip()
+                alias = self.name() if self.accept_kw("AS") else None
+                items.append((expr, alias or text))
+                if not self.accept_op(","):
+                    break
+        order = []
+        if self.accept_kw("ORDER", "BY"):
+            while True:
+                expr = self.expression()
+                descending = False
+                if self.accept_kw("DESC") or self.accept_kw("DESCENDING"):
+                    descending = True
+                elif self.accept_kw("ASC") or self.accept_kw("ASCENDING"):
+                    pass
+                order.append((expr, descending))
+                if not self.accept_op(","):
+                    break
+        skip = self.expression() if self.accept_kw("SKIP") else None
+        limit = self.expression() if self.accept_kw("LIMIT") else None
+        return {"distinct": distinct, "star": star, "items": items, "order": order, "skip": skip, "limit": limit}
+
+    # -- patterns ------------------------------------------------------------
+
+    def patterns(self) -> List[List[tuple]]:
+        paths = [self.pattern()]
+        while self.accept_op(","):
+            paths.append(self.pattern())
+        return paths
+
+    def pattern(self) -> List[tuple]:
+        if self.peek().kind in ("ident", "name") and self.is_op("=", 1):
+            raise CypherError("Named paths are not supported by the stand-in")
+        path = [self.node_pattern()]
+        while self.is_op("-") or (self.is_op("<") and self.is_op("-", 1)):
+            path.append(self.rel_pattern())
+            path.append(self.node_pattern())
+        return path
+
+    def labels(self) -> List[str]:
+        labels = []
+        while self.accept_op(":"):
+            labels.append(self.name())
+        return labels
+
+    def node_pattern(self) -> tuple:
+        self.expect_op("(")
+        var = self.name() if self.peek().kind in ("ident", "name") else None
+        labels = self.labels()
+        props = self.map_literal() if self.is_op("{") else None
+        self.expect_op(")")
+        return ("node", var, labels, props)
+
+    def rel_pattern(self) -> tuple:
+        incoming = self.accept_op("<")
+        self.expect_op("-")
+        var, types, props = None, [], None
+        if self.accept_op("["):
+            if self.peek().kind in ("ident", "name"):
+                var = self.name()
+            if self.accept_op(":"):
+                types.append(self.name())
+                while self.accept_op("|"):
+                    self.accept_op(":")
+                    types.append(self.name())
+            if self.is_op("*"):
+                raise CypherError("Variable-length relationships are not supported by the stand-in")
+            if self.is_op("{"):
+                props = self.map_literal()
+            self.expect_op("]")
+        self.expect_op("-")
+        outgoing = self.accept_op(">")
+        if incoming and outgoing:
+            raise CypherError("Relationship can't point both ways")
+        direction = "in" if incoming else "out" if outgoing else "both"
+        return ("rel", var, types, props, direction)
+
+    def try_pattern(self) -> Optional[List[tuple]]:
+        """Parse a relationship pattern here, or rewind and return None."""
+        saved = self.pos
+        try:
+            path = self.pattern()
+            if len(path) < 3:
+                raise _Backtrack()
+            return path
+        except (CypherError, _Backtrack):
+            self.pos = saved
+            return None
+
+    # -- expressions ---------------------------------------------------------
+
+    def expression_list(self) -> List[tuple]:
+        exprs = [self.expression()]
+        while self.accept_op(","):
+            exprs.append(self.expression())
+        return exprs
+
+    def expression(self) -> tuple:
+        return self.or_expr()
+
+    def or_expr(self) -> tuple:
+        left = self.xor_expr()
+        while self.accept_kw("OR"):
+            left = ("or", left, self.xor_expr())
+        return left
+
+    def xor_expr(self) -> tuple:
+        left = self.and_expr()
+        while self.accept_kw("XOR"):
+            left = ("xor", left, self.and_expr())
+        return left
+
+    def and_expr(self) -> tuple:
+        left = self.not_expr()
+        while self.accept_kw("AND"):
+            left = ("and", left, self.not_expr())
+        return left
+
+    def not_expr(self) -> tuple:
+        if self.accept_kw("NOT"):
+            return ("not", self.not_expr())
+        return self.comparison()
+
+    def comparison(self) -> tuple:
+        left = self.additive()
+        while True:
+            token = self.peek()
+            if token.kind == "op" and token.value in ("=", "<>", "!=", "<", ">", "<=", ">="):
+                self.advance()
+                op = "<>" if token.value == "!=" else token.value
+                left = ("cmp", op, left, self.additive())
+            elif token.kind == "op" and token.value == "=~":
+                self.advance()
+                left = ("regex", left, self.additive())
+            elif self.accept_kw("IN"):
+                left = ("in", left, self.additive())
+            elif self.accept_kw("STARTS", "WITH"):
+                left = ("starts", left, self.additive())
+            elif self.accept_kw("ENDS", "WITH"):
+                left = ("ends", left, self.additive())
+            elif self.accept_kw("CONTAINS"):
+                left = ("contains", left, self.additive())
+            elif self.accept_kw("IS", "NOT", "NULL"):
+                left = ("isnull", left, True)
+            elif self.accept_kw("IS", "NULL"):
+                left = ("isnull", left, False)
+            else:
+                return left
+
+    def additive(self) -> tuple:
+        left = self.multiplicative()
+        while self.is_op("+") or self.is_op("-"):
+            op = self.advance().value
+            left = ("bin", op, left, self.multiplicative())
+        return left
+
+    def multiplicative(self) -> tuple:
+        left = self.power()
+        while self.is_op("*") or self.is_op("/") or self.is_op("%"):
+            op = self.advance().value
+            left = ("bin", op, left, self.power())
+        return left
+
+    def power(self) -> tuple:
+        left = self.unary()
+        while self.accept_op("^"):
+            left = ("bin", "^", left, self.unary())
+        return left
+
+    def unary(self) -> tuple:
+        if self.accept_op("-"):
+            return ("neg", self.unary())
+        if self.accept_op("+"):
+            return self.unary()
+        return self.postfix()
+
+    def postfix(self) -> tuple:
+        expr = self.atom()
+        while True:
+            if self.is_op(".") and self.peek(1).kind in ("ident", "name"):
+                self.advance()
+                expr = ("prop", expr, self.name())
+            elif self.accept_op("["):
+                start = None if self.is_op("..") else self.expression()
+                if self.accept_op(".."):
+                    end = None if self.is_op("]") else self.expression()
+                    self.expect_op("]")
+                    expr = ("slice", expr, start, end)
+                else:
+                    self.expect_op("]")
+                    expr = ("index", expr, start)
+            elif expr[0] == "var" and self.is_op(":") and self.peek(1).kind in ("ident", "name"):
+                expr = ("haslabel", expr, self.labels())
+            else:
+                return expr
+
+    def atom(self) -> tuple:
+        token = self.peek()
+        if token.kind == "num" or token.kind == "str":
+            self.advance()
+            return ("lit", token.value)
+        if token.kind == "param":
+            self.advance()
+            return ("param", token.value)
+        if token.kind == "op" and token.value == "[":
+            return self.list_literal()
+        if token.kind == "op" and token.value == "{":
+            return self.map_literal()
+        if token.kind == "op" and token.value == "(":
+            path = self.try_pattern()
+            if path is not None:
+                return ("pattern", path)
+            self.advance()
+            expr = self.expression()
+            self.expect_op(")")
+            return expr
+        if token.kind == "name":
+            self.advance()
+            return ("var", token.value)
+        if token.kind == "ident":
+            word = token.value.upper()
+            if word in ("TRUE", "FALSE"):
+                self.advance()
+                return ("lit", word == "TRUE")
+            if word == "NULL":
+                self.advance()
+                return ("lit", None)
+            if word == "CASE":
+                self.advance()
+                return self.case_expr()
+            if self.is_op("(", 1) or (self.is_op(".", 1) and self.peek(2).kind == "ident" and self.is_op("(", 3)):
+                return self.function_call()
+            if word in _CLAUSE_KEYWORDS:
+                raise CypherError(f"Unexpected {token.value} near {self._near(token)}")
+            self.advance()
+            return ("var", token.value)
+        raise CypherError(f"Invalid expression near {self._near(token)}")
+
+    def function_call(self) -> tuple:
+        name = self.name()
+        while self.accept_op("."):
+            name += "." + self.name()
+        self.expect_op("(")
+        lowered = name.lower()
+        if lowered == "exists" and self.is_op("("):
+            path = self.try_pattern()
+            if path is not None:
+                self.expect_op(")")
+                return ("pattern", path)
+        distinct = self.accept_kw("DISTINCT")
+        args = []
+        if self.accept_op("*"):
+            args.append(("star",))
+        elif not self.is_op(")"):
+            args = self.expression_list()
+        self.expect_op(")")
+        return ("call", lowered, distinct, args)
+
+    def case_expr(self) -> tuple:
+        subject = None if self.is_kw("WHEN") else self.expression()
+        branches = []
+        while self.accept_kw("WHEN"):
+            condition = self.expression()
+            self.expect_kw("THEN")
+            branches.append((condition, self.expression()))
+        default = self.expression() if self.accept_kw("ELSE") else ("lit", None)
+        self.expect_kw("END")
+        if not branches:
+            raise CypherError("CASE needs at least one WHEN")
+        return ("case", subject, branches, default)
+
+    def list_literal(self) -> tuple:
+        self.expect_op("[")
+        # List comprehension: [x IN list WHERE cond | expr]
+        if self.peek().kind in ("ident", "name") and self.is_kw("IN", 1):
+            var = self.name()
+            self.advance()
+            source = self.expression()
+            where = self.expression() if self.accept_kw("WHERE") else None
+            projection = self.expression() if self.accept_op("|") else None
+            self.expect_op("]")
+            return ("listcomp", var, source, where, projection)
+        items = []
+        if not self.is_op("]"):
+            items = self.expression_list()
+        self.expect_op("]")
+        return ("list", items)
+
+    def map_literal(self) -> tuple:
+        self.expect_op("{")
+        entries = []
+        if not self.is_op("}"):
+            while True:
+                token = self.advance()
+                if token.kind not in ("ident", "name", "str"):
+                    raise CypherError(f"Invalid map key near {self._near(token)}")
+                self.expect_op(":")
+                entries.append((token.value, self.expression()))
+                if not self.accept_op(","):
+                    break
+        self.expect_op("}")
+        return ("map", entries)
+
+
+# ============================================================================
+# Expression evaluation
+# ============================================================================
+
+_AGG_KEY = "\x00aggregates"
+
+
+class Context:
+    """Per-execution state shared by compiled closures."""
+
+    __slots__ = ("store", "params", "stats")
+
+    def __init__(self, store: GraphStore, params: Dict[str, Any]):
+        self.store = store
+        self.params = params
+        self.stats = QueryStats()
+
+
+def _truthy(value: Any) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    raise CypherError(f"Expected a boolean, got {type(value).__name__}")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _equals(a: Any, b: Any) -> Optional[bool]:
+    if a is None or b is None:
+        return None
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b if isinstance(a, bool) and isinstance(b, bool) else False
+    if _is_number(a) and _is_number(b):
+        return a == b
+    if isinstance(a, list) and isinstance(b, list):
+        if len(a) != len(b):
+            return False
+        result: Optional[bool] = True
+        for x, y in zip(a, b):
+            equal = _equals(x, y)
+            if equal is False:
+                return False
+            if equal is None:
+                result = None
+        return result
+    if type(a) is not type(b):
+        return False
+    return a is b if isinstance(a, (Node, Edge)) else a == b
+
+
+def _compare(a: Any, b: Any) -> Optional[int]:
+    if a is None or b is None:
+        return None
+    if _is_number(a) and _is_number(b) or (isinstance(a, str) and isinstance(b, str)):
+        return (a > b) - (a < b)
+    if isinstance(a, bool) and isinstance(b, bool):
+        return (a > b) - (a < b)
+    return None
+
+
+def _sort_key(value: Any) -> tuple:
+    """Total ordering for ORDER BY (nulls sort last ascending)."""
+    if value is None:
+        return (1, 0, 0)
+    if isinstance(value, bool):
+        return (0, 2, value)
+    if _is_number(value):
+        return (0, 3, value)
+    if isinstance(value, str):
+        return (0, 1, value)
+    if isinstance(value, list):
+        return (0, 4, tuple(_sort_key(item) for item in value))
+    if isinstance(value, (Node, Edge)):
+        return (0, 5 if isinstance(value, Node) else 6, value.id)
+    return (0, 7, 0)
+
+
+def _hashable(value: Any) -> Any:
+    """Grouping / DISTINCT key for a value."""
+    if isinstance(value, list):
+        return ("l", tuple(_hashable(item) for item in value))
+    if isinstance(value, dict):
+        return ("m", tuple(sorted((k, _hashable(v)) for k, v in value.items())))
+    if isinstance(value, bool):
+        return ("b", value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _arith(op: str, a: Any, b: Any) -> Any:
+    if a is None or b is None:
+        return None
+    if op == "+":
+        if isinstance(a, list):
+            return a + (b if isinstance(b, list) else [b])
+        if isinstance(b, list):
+            return [a] + b
+        if isinstance(a, str) or isinstance(b, str):
+            return _to_string(a) + _to_string(b)
+    if not (_is_number(a) and _is_number(b)):
+        raise CypherError(f"Type mismatch: can't apply '{op}' to {type(a).__name__} and {type(b).__name__}")
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op == "*":
+        return a * b
+    if op == "/":
+        if b == 0:
+            if isinstance(a, int) and isinstance(b, int):
+                raise CypherError("Division by zero")
+            return math.copysign(math.inf, a) if a else math.nan
+        if isinstance(a, int) and isinstance(b, int):
+            quotient = abs(a) // abs(b)
+            return quotient if (a >= 0) == (b >= 0) else -quotient
+        return a / b
+    if op == "%":
+        if b == 0:
+            raise CypherError("Division by zero")
+        if isinstance(a, int) and isinstance(b, int):
+            return int(math.fmod(a, b))
+        return math.fmod(a, b)
+    if op == "^":
+        return float(a) ** float(b)
+    raise CypherError(f"Unknown operator {op}")
+
+
+def _fn_unsupported_temporal(ctx: Context, *args: Any) -> Any:
+    # FalkorDB has no datetime()/localdatetime() - accepting them here would hide the bug
+    raise CypherError("datetime() is not supported by FalkorDB - pass timestamps as parameters")
+
+
+def _fn_to_integer(ctx: Context, value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value)) if isinstance(value, str) else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _fn_to_float(ctx: Context, value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _fn_size(ctx: Context, value: Any) -> Optional[int]:
+    return None if value is None else len(value)
+
+
+def _fn_keys(ctx: Context, value: Any) -> Optional[List[str]]:
+    if value is None:
+        return None
+    return list(value.props if isinstance(value, (Node, Edge)) else value)
+
+
+def _fn_properties(ctx: Context, value: Any) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    return dict(value.props if isinstance(value, (Node, Edge)) else value)
+
+
+def _fn_substring(ctx: Context, value: Any, start: int, length: Optional[int] = None) -> Optional[str]:
+    if value is None:
+        return None
+    return value[start:] if length is None else value[start:start + length]
+
+
+def _fn_range(ctx: Context, start: int, end: int, step: int = 1) -> List[int]:
+    return list(range(start, end + (1 if step > 0 else -1), step))
+
+
+def _fn_round(ctx: Context, value: Any, precision: int = 0) -> Any:
+    if value is None:
+        return None
+    if precision:
+        return round(float(value), precision)
+    return float(math.floor(value + 0.5))
+
+
+def _nullsafe(fn: Callable[[Any], Any]) -> Callable[..., Any]:
+    return lambda ctx, value, *rest: None if value is None else fn(value, *rest)
+
+
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "datetime": _fn_unsupported_temporal,
+    "localdatetime": _fn_unsupported_temporal,
+    "timestamp": lambda ctx: int(time.time() * 1000),
+    "tointeger": _fn_to_integer,
+    "tofloat": _fn_to_float,
+    "tostring": lambda ctx, value: _to_string(value),
+    "toboolean": _nullsafe(lambda value: value if isinstance(value, bool) else {"true": True, "false": False}.get(str(value).lower())),
+    "tolower": _nullsafe(str.lower),
+    "toupper": _nullsafe(str.upper),
+    "lower": _nullsafe(str.lower),
+    "upper": _nullsafe(str.upper),
+    "trim": _nullsafe(str.strip),
+    "ltrim": _nullsafe(str.lstrip),
+    "rtrim": _nullsafe(str.rstrip),
+    "replace": _nullsafe(lambda value, old, new: value.replace(old, new)),
+    "split": _nullsafe(lambda value, sep: value.split(sep)),
+    "substring": _fn_substring,
+    "left": _nullsafe(lambda value, n: value[:n]),
+    "right": _nullsafe(lambda value, n: value[-n:] if n else ""),
+    "size": _fn_size,
+    "length": _fn_size,
+    "coalesce": lambda ctx, *values: next((value for value in values if value is not None), None),
+    "head": _nullsafe(lambda value: value[0] if value else None),
+    "last": _nullsafe(lambda value: value[-1] if value else None),
+    "tail": _nullsafe(lambda value: value[1:]),
+    "reverse": _nullsafe(lambda value: value[::-1]),
+    "keys": _fn_keys,
+    "properties": _fn_properties,
+    "labels": _nullsafe(lambda node: list(node.labels)),
+    "type": _nullsafe(lambda edge: edge.type),
+    "id": _nullsafe(lambda entity: entity.id),
+    "startnode": _nullsafe(lambda edge: edge.src),
+    "endnode": _nullsafe(lambda edge: edge.dest),
+    "exists": lambda ctx, value: value is not None,
+    "abs": _nullsafe(abs),
+    "ceil": _nullsafe(lambda value: float(math.ceil(value))),
+    "floor": _nullsafe(lambda value: float(math.floor(value))),
+    "round": _fn_round,
+    "sqrt": _nullsafe(math.sqrt),
+    "sign": _nullsafe(lambda value: (value > 0) - (value < 0)),
+    "range": _fn_range,
+    "rand": lambda ctx: __import__("random").random(),
+}
+
+
+class _Aggregator:
+    """Accumulates one aggregate function over a group."""
+
+    __slots__ = ("name", "distinct", "seen", "values", "count", "total")
+
+    def __init__(self, name: str, distinct: bool):
+        self.name = name
+        self.distinct = distinct
+        self.seen = set() if distinct else None
+        self.values: List[Any] = []
+        self.count = 0
+        self.total: Any = 0
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            return
+        if self.distinct:
+            key = _hashable(value)
+            if key in self.seen:
+                return
+            self.seen.add(key)
+        self.count += 1
+        if self.name in ("sum", "avg"):
+            if not _is_number(value):
+                raise CypherError(f"{self.name}() expects numbers")
+            self.total += value
+        elif self.name in ("min", "max", "collect"):
+            self.values.append(value)
+
+    def result(self) -> Any:
+        if self.name == "count":
+            return self.count
+        if self.name == "sum":
+            return self.total
+        if self.name == "avg":
+            return self.total / self.count if self.count else None
+        if self.name == "collect":
+            return self.values
+        if not self.values:
+            return None
+        ordered = sorted(self.values, key=_sort_key)
+        return ordered[0] if self.name == "min" else ordered[-1]
+
+
+Evaluator = Callable[[Dict[str, Any], Context], Any]
+
+
+class Compiler:
+    """Compiles AST tuples into closures: fn(row, ctx) -> value."""
+
+    def __init__(self, matcher: "Matcher"):
+        self.matcher = matcher
+
+    @staticmethod
+    def constant(ast: tuple) -> Any:
+        """Evaluate a parameter-free literal expression (CYPHER preamble values)."""
+        fn = Compiler(Matcher()).compile(ast)
+        return fn({}, Context(GraphStore(), {}))
+
+    def compile(self, ast: tuple, aggregates: Optional[List[tuple]] = None) -> Evaluator:
+        kind = ast[0]
+        method = getattr(self, f"_c_{kind}", None)
+        if method is None:
+            raise CypherError(f"Unsupported expression: {kind}")
+        return method(ast, aggregates)
+
+    def _c_lit(self, ast: tuple, aggregates) -> Evaluator:
+        value = ast[1]
+        return lambda row, ctx: value
+
+    def _c_param(self, ast: tuple, aggregates) -> Evaluator:
+        name = ast[1]
+
+        def param(row, ctx):
+            try:
+                return ctx.params[name]
+            except KeyError:
+                raise CypherError(f"Missing parameters: ${name}") from None
+        return param
+
+    def _c_var(self, ast: tuple, aggregates) -> Evaluator:
+        name = ast[1]
+
+        def var(row, ctx):
+            try:
+                return row[name]
+            except KeyError:
+                raise CypherError(f"'{name}' not defined") from None
+        return var
+
+    def _c_prop(self, ast: tuple, aggregates) -> Evaluator:
+        base = self.compile(ast[1], aggregates)
+        key = ast[2]
+
+        def prop(row, ctx):
+            value = base(row, ctx)
+            if value is None:
+                return None
+            if isinstance(value, (Node, Edge)):
+                return value.props.get(key)
+            if isinstance(value, dict):
+                return value.get(key)
+            raise CypherError(f"Type mismatch: expected a node, relationship or map for .{key}")
+        return prop
+
+    def _c_index(self, ast: tuple, aggregates) -> Evaluator:
+        base = self.compile(ast[1], aggregates)
+        index = self.compile(ast[2], aggregates)
+
+        def subscript(row, ctx):
+            value, position = base(row, ctx), index(row, ctx)
+            if value is None or position is None:
+                return None
+            if isinstance(value, (Node, Edge)):
+                return value.props.get(position)
+            if isinstance(value, dict):
+                return value.get(position)
+            try:
+                return value[position]
+            except IndexError:
+                return None
+        return subscript
+
+    def _c_slice(self, ast: tuple, aggregates) -> Evaluator:
+        base = self.compile(ast[1], aggregates)
+        start = self.compile(ast[2], aggregates) if ast[2] else (lambda row, ctx: None)
+        end = self.compile(ast[3], aggregates) if ast[3] else (lambda row, ctx: None)
+
+        def slice_(row, ctx):
+            value = base(row, ctx)
+            return None if value is None else value[start(row, ctx):end(row, ctx)]
+        return slice_
+
+    def _c_list(self, ast: tuple, aggregates) -> Evaluator:
+        items = [self.compile(item, aggregates) for item in ast[1]]
+        return lambda row, ctx: [item(row, ctx) for item in items]
+
+    def _c_map(self, ast: tuple, aggregates) -> Evaluator:
+        entries = [(key, self.compile(value, aggregates)) for key, value in ast[1]]
+        return lambda row, ctx: {key: value(row, ctx) for key, value in entries}
+
+    def _c_listcomp(self, ast: tuple, aggregates) -> Evaluator:
+        _, var, source_ast, where_ast, projection_ast = ast
+        source = self.compile(source_ast, aggregates)
+        where = self.compile(where_ast) if where_ast else None
+        projection = self.compile(projection_ast) if projection_ast else None
+
+        def listcomp(row, ctx):
+            values = source(row, ctx)
+            if values is None:
+                return None
+            result = []
+            for item in values:
+                scope = dict(row)
+                scope[var] = item
+                if where is not None and _truthy(where(scope, ctx)) is not True:
+                    continue
+                result.append(projection(scope, ctx) if projection else item)
+            return result
+        return listcomp
+
+    def _c_call(self, ast: tuple, aggregates) -> Evaluator:
+        _, name, distinct, args = ast
+        if name in AGGREGATES:
+            if aggregates is None:
+                raise CypherError(f"Invalid use of aggregating function {name}()")
+            argument = None if (not args or args[0][0] == "star") else self.compile(args[0])
+            slot = len(aggregates)
+            aggregates.append((name, distinct, argument))
+            return lambda row, ctx: row[_AGG_KEY][slot]
+        fn = FUNCTIONS.get(name)
+        if fn is None:
+            raise CypherError(f"Unknown function '{name}'")
+        compiled = [self.compile(arg, aggregates) for arg in args]
+
+        def call(row, ctx):
+            try:
+                return fn(ctx, *[arg(row, ctx) for arg in compiled])
+            except (TypeError, AttributeError) as e:
+                raise CypherError(f"Type mismatch in {name}(): {e}") from None
+        return call
+
+    def _c_case(self, ast: tuple, aggregates) -> Evaluator:
+        _, subject_ast, branches_ast, default_ast = ast
+        subject = self.compile(subject_ast, aggregates) if subject_ast else None
+        branches = [(self.compile(c, aggregates), self.compile(v, aggregates)) for c, v in branches_ast]
+        default = self.compile(default_ast, aggregates)
+
+        def case(row, ctx):
+            if subject is not None:
+                value = subject(row, ctx)
+                for condition, result in branches:
+                    if _equals(value, condition(row, ctx)) is True:
+                        return result(row, ctx)
+            else:
+                for condition, result in branches:
+                    if _truthy(condition(row, ctx)) is True:
+                        return result(row, ctx)
+            return default(row, ctx)
+        return case
+
+    def _c_not(self, ast: tuple, aggregates) -> Evaluator:
+        inner = self.compile(ast[1], aggregates)
+
+        def not_(row, ctx):
+            value = _truthy(inner(row, ctx))
+            return None if value is None else not value
+        return not_
+
+    def _c_and(self, ast: tuple, aggregates) -> Evaluator:
+        left, right = self.compile(ast[1], aggregates), self.compile(ast[2], aggregates)
+
+        def and_(row, ctx):
+            a = _truthy(left(row, ctx))
+            if a is False:
+                return False
+            b = _truthy(right(row, ctx))
+            if b is False:
+                return False
+            return None if a is None or b is None else True
+        return and_
+
+    def _c_or(self, ast: tuple, aggregates) -> Evaluator:
+        left, right = self.compile(ast[1], aggregates), self.compile(ast[2], aggregates)
+
+        def or_(row, ctx):
+            a = _truthy(left(row, ctx))
+            if a is True:
+                return True
+            b = _truthy(right(row, ctx))
+            if b is True:
+                return True
+            return None if a is None or b is None else False
+        return or_
+
+    def _c_xor(self, ast: tuple, aggregates) -> Evaluator:
+        left, right = self.compile(ast[1], aggregates), self.compile(ast[2], aggregates)
+
+        def xor(row, ctx):
+            a, b = _truthy(left(row, ctx)), _truthy(right(row, ctx))
+            return None if a is None or b is None else a != b
+        return xor
+
+    def _c_cmp(self, ast: tuple, aggregates) -> Evaluator:
+        _, op, left_ast, right_ast = ast
+        left, right = self.compile(left_ast, aggregates), self.compile(right_ast, aggregates)
+        if op in ("=", "<>"):
+            negate = op == "<>"
+
+            def equality(row, ctx):
+                result = _equals(left(row, ctx), right(row, ctx))
+                return None if result is None else result != negate
+            return equality
+
+        check = {"<": lambda c: c < 0, ">": lambda c: c > 0, "<=": lambda c: c <= 0, ">=": lambda c: c >= 0}[op]
+
+        def ordering(row, ctx):
+            result = _compare(left(row, ctx), right(row, ctx))
+            return None if result is None else check(result)
+        return ordering
+
+    def _c_in(self, ast: tuple, aggregates) -> Evaluator:
+        left, right = self.compile(ast[1], aggregates), self.compile(ast[2], aggregates)
+
+        def in_(row, ctx):
+            value, values = left(row, ctx), right(row, ctx)
+            if values is None:
+                return None
+            if not isinstance(values, list):
+                raise CypherError("IN expects a list")
+            unknown = False
+            for item in values:
+                equal = _equals(value, item)
+                if equal is True:
+                    return True
+                if equal is None:
+                    unknown = True
+            return None if unknown else False
+        return in_
+
+    def _string_predicate(self, ast: tuple, aggregates, test: Callable[[str, str], bool]) -> Evaluator:
+        left, right = self.compile(ast[1], aggregates), self.compile(ast[2], aggregates)
+
+        def predicate(row, ctx):
+            a, b = left(row, ctx), right(row, ctx)
+            if not isinstance(a, str) or not isinstance(b, str):
+                return None
+            return test(a, b)
+        return predicate
+
+    def _c_starts(self, ast: tuple, aggregates) -> Evaluator:
+        return self._string_predicate(ast, aggregates, str.startswith)
+
+    def _c_ends(self, ast: tuple, aggregates) -> Evaluator:
+        return self._string_predicate(ast, aggregates, str.endswith)
+
+    def _c_contains(self, ast: tuple, aggregates) -> Evaluator:
+        return self._string_predicate(ast, aggregates, lambda a, b: b in a)
+
+    def _c_regex(self, ast: tuple, aggregates) -> Evaluator:
+        return self._string_predicate(ast, aggregates, lambda a, b: re.fullmatch(b, a) is not None)
+
+    def _c_isnull(self, ast: tuple, aggregates) -> Evaluator:
+        inner = self.compile(ast[1], aggregates)
+        negate = ast[2]
+        return lambda row, ctx: (inner(row, ctx) is None) != negate
+
+    def _c_haslabel(self, ast: tuple, aggregates) -> Evaluator:
+        inner = self.compile(ast[1], aggregates)
+        labels = ast[2]
+
+        def has_label(row, ctx):
+            node = inner(row, ctx)
+            if node is None:
+                return None
+            return all(label in node.labels for label in labels)
+        return has_label
+
+    def _c_bin(self, ast: tuple, aggregates) -> Evaluator:
+        _, op, left_ast, right_ast = ast
+        left, right = self.compile(left_ast, aggregates), self.compile(right_ast, aggregates)
+        return lambda row, ctx: _arith(op, left(row, ctx), right(row, ctx))
+
+    def _c_neg(self, ast: tuple, aggregates) -> Evaluator:
+        inner = self.compile(ast[1], aggregates)
+
+        def negate(row, ctx):
+            value = inner(row, ctx)
+            if value is None:
+                return None
+            if not _is_number(value):
+                raise CypherError("Unary minus expects a number")
+            return -value
+        return negate
+
+    def _c_pattern(self, ast: tuple, aggregates) -> Evaluator:
+        path = self.matcher.compile_path(ast[1], self)
+
+        def exists(row, ctx):
+            for _ in self.matcher.match_path(path, row, ctx, frozenset()):
+                return True
+            return False
+        return exists
+
+
+# ============================================================================
+# Pattern matching
+# ============================================================================
+
+class _NodePattern:
+    __slots__ = ("var", "labels", "props")
+
+    def __init__(self, var, labels, props):
+        self.var = var
+        self.labels = labels
+        self.props = props  # List[(key, evaluator)]
+
+
+class _RelPattern:
+    __slots__ = ("var", "types", "props", "direction")
+
+    def __init__(self, var, types, props, direction):
+        self.var = var
+        self.types = types
+        self.props = props
+        self.direction = direction
+
+
+_FLIP = {"out": "in", "in": "out", "both": "both"}
+
+
+class Matcher:
+    """Finds bindings for node/relationship patterns against the store."""
+
+    def compile_path(self, path_ast: List[tuple], compiler: Compiler) -> List[Any]:
+        compiled = []
+        for element in path_ast:
+            props = None
+            if element[-2 if element[0] == "rel" else -1] is not None:
+                map_ast = element[3]
+                props = [(key, compiler.compile(value)) for key, value in map_ast[1]]
+            if element[0] == "node":
+                compiled.append(_NodePattern(element[1], element[2], props))
+            else:
+                compiled.append(_RelPattern(element[1], element[2], props, element[4]))
+        return compiled
+
+    @staticmethod
+    def _props_match(entity: Any, expected: Optional[List[Tuple[str, Any]]]) -> bool:
+        if not expected:
+            return True
+        for key, value in expected:
+            if _equals(entity.props.get(key), value) is not True:
+                return False
+        return True
+
+    @staticmethod
+    def _node_ok(pattern: _NodePattern, node: Node, expected, scope: Dict[str, Any]) -> bool:
+        if pattern.var is not None and pattern.var in scope:
+            if scope[pattern.var] is not node:
+                return False
+        for label in pattern.labels:
+            if label not in node.labels:
+                return False
+        return Matcher._props_match(node, expected)
+
+    @staticmethod
+    def _score(pattern: _NodePattern, row: Dict[str, Any], expected) -> int:
+        """Lower is more selective: bound < indexed property < label < scan."""
+        if pattern.var is not None and pattern.var in row:
+            return 0
+        if expected:
+            return 1
+        if pattern.labels:
+            return 2
+        return 3
+
+    def _candidates(self, pattern: _NodePattern, expected, row: Dict[str, Any], ctx: Context) -> List[Node]:
+        if pattern.var is not None and pattern.var in row:
+            bound = row[pattern.var]
+            return [bound] if isinstance(bound, Node) and not bound.deleted else []
+        store = ctx.store
+        label = pattern.labels[0] if pattern.labels else None
+        if expected:
+            key, value = expected[0]
+            found = store.lookup(label, key, value)
+            if found is not None:
+                return found
+        if label is not None:
+            return store.nodes_with_label(label)
+        return list(store.nodes.values())
+
+    def match_path(
+        self,
+        path: List[Any],
+        row: Dict[str, Any],
+        ctx: Context,
+        used: frozenset
+    ) -> Iterator[Tuple[Dict[str, Any], frozenset]]:
+        """Yield (new bindings, used edge ids) for every match of one path."""
+        expected = [
+            [(key, value(row, ctx)) for key, value in element.props] if element.props else None
+            for element in path
+        ]
+        # Start from the more selective end of the path
+        if len(path) > 1 and self._score(path[-1], row, expected[-1]) < self._score(path[0], row, expected[0]):
+            path = [
+                _RelPattern(e.var, e.types, e.props, _FLIP[e.direction]) if isinstance(e, _RelPattern) else e
+                for e in reversed(path)
+            ]
+            expected = list(reversed(expected))
+
+        first = path[0]
+        for node in self._candidates(first, expected[0], row, ctx):
+            if not self._node_ok(first, node, expected[0], row):
+                continue
+            bindings = {first.var: node} if first.var is not None else {}
+            yield from self._extend(path, expected, 1, node, row, bindings, ctx, used)
+
+    def _extend(self, path, expected, i, current, row, bindings, ctx, used):
+        if i >= len(path):
+            yield bindings, used
+            return
+        rel, target = path[i], path[i + 1]
+        rel_expected, target_expected = expected[i], expected[i + 1]
+        scope = {**row, **bindings} if bindings else row
+
+        if rel.direction == "out":
+            steps = [(edge, edge.dest) for edge in current.out_edges.values()]
+        elif rel.direction == "in":
+            steps = [(edge, edge.src) for edge in current.in_edges.values()]
+        else:
+            steps = [(edge, edge.dest) for edge in current.out_edges.values()]
+            steps += [(edge, edge.src) for edge in current.in_edges.values() if edge.src is not edge.dest]
+
+        for edge, other in steps:
+            if edge.id in used:
+                continue
+            if rel.types and edge.type not in rel.types:
+                continue
+            if rel.var is not None and rel.var in scope and scope[rel.var] is not edge:
+                continue
+            if not self._props_match(edge, rel_expected):
+                continue
+            if not self._node_ok(target, other, target_expected, scope):
+                continue
+            extended = dict(bindings)
+            if rel.var is not None:
+                extended[rel.var] = edge
+            if target.var is not None:
+                extended[target.var] = other
+            yield from self._extend(path, expected, i + 2, other, row, extended, ctx, used | {edge.id})
+
+    def match_all(self, paths: List[List[Any]], row: Dict[str, Any], ctx: Context) -> Iterator[Dict[str, Any]]:
+        """Yield merged rows for a comma-separated MATCH pattern list."""
+        def recurse(index: int, scope: Dict[str, Any], used: frozenset):
+            if index == len(paths):
+                yield scope
+                return
+            for bindings, now_used in self.match_path(paths[index], scope, ctx, used):
+                yield from recurse(index + 1, {**scope, **bindings}, now_used)
+        yield from recurse(0, row, frozenset())
+
+
+# ============================================================================
+# Clause execution
+# ============================================================================
+
+Rows = List[Dict[str, Any]]
+
+
+def _check_property_value(value: Any) -> None:
+    if isinstance(value, (Node, Edge, dict)):
+        raise CypherError("Property values can only be of primitive types or arrays of primitive types")
+    if isinstance(value, list):
+        for item in value:
+            _check_property_value(item)
+
+
+class Planner:
+    """Compiles a parsed query into clause functions and runs them."""
+
+    def __init__(self, clauses: List[tuple]):
+        self.matcher = Matcher()
+        self.compiler = Compiler(self.matcher)
+        self.steps: List[Callable[[Rows, Context], Rows]] = []
+        self.columns: List[str] = []
+        self.returns = False
+
+        for index, clause in enumerate(clauses):
+            kind = clause[0]
+            if kind == "return" and index != len(clauses) - 1:
+                raise CypherError("RETURN must be the last clause")
+            self.steps.append(getattr(self, f"_plan_{kind}")(clause))
+
+    def run(self, ctx: Context) -> Tuple[List[str], Rows]:
+        rows: Rows = [{}]
+        for step in self.steps:
+            rows = step(rows, ctx)
+        if not self.returns:
+            return [], []
+        return self.columns, rows
+
+    # -- MATCH ---------------------------------------------------------------
+
+    def _plan_match(self, clause: tuple):
+        _, optional, paths_ast, where_ast = clause
+        paths = [self.matcher.compile_path(path, self.compiler) for path in paths_ast]
+        where = self.compiler.compile(where_ast) if where_ast else None
+        new_vars = [
+            element.var for path in paths for element in path if element.var is not None
+        ]
+
+        def match(rows: Rows, ctx: Context) -> Rows:
+            out = []
+            for row in rows:
+                found = False
+                for scope in self.matcher.match_all(paths, row, ctx):
+                    if where is not None and _truthy(where(scope, ctx)) is not True:
+                        continue
+                    found = True
+                    out.append(scope)
+                if optional and not found:
+                    padded = dict(row)
+                    for var in new_vars:
+                        padded.setdefault(var, None)
+                    out.append(padded)
+            return out
+        return match
+
+    # -- CREATE / MERGE ------------------------------------------------------
+
+    def _create_path(self, path: List[Any], scope: Dict[str, Any], ctx: Context) -> Dict[str, Any]:
+        store, stats = ctx.store, ctx.stats
+        scope = dict(scope)
+        nodes: List[Node] = []
+        for element in path[::2]:
+            if element.var is not None and element.var in scope:
+                if element.labels or element.props:
+                    raise CypherError(f"Variable '{element.var}' already declared")
+                node = scope[element.var]
+                if not isinstance(node, Node):
+                    raise CypherError(f"Can't create relationship from '{element.var}' (not a node)")
+            else:
+                props = {}
+                for key, value in element.props or []:
+                    evaluated = value(scope, ctx)
+                    _check_property_value(evaluated)
+                    if evaluated is not None:
+                        props[key] = evaluated
+                node = store.create_node(element.labels, props)
+                stats.nodes_created += 1
+                stats.labels_added += len(node.labels)
+                stats.properties_set += len(props)
+                if element.var is not None:
+                    scope[element.var] = node
+            nodes.append(node)
+
+        for position, rel in enumerate(path[1::2]):
+            if len(rel.types) != 1 or rel.direction == "both":
+                raise CypherError("Relationships must have exactly one type and a direction in CREATE")
+            props = {}
+            for key, value in rel.props or []:
+                evaluated = value(scope, ctx)
+                _check_property_value(evaluated)
+                if evaluated is not None:
+                    props[key] = evaluated
+            src, dest = nodes[position], nodes[position + 1]
+            if rel.direction == "in":
+                src, dest = dest, src
+            edge = store.create_edge(rel.types[0], src, dest, props)
+            stats.relationships_created += 1
+            stats.properties_set += len(props)
+            if rel.var is not None:
+                scope[rel.var] = edge
+        return scope
+
+    def _plan_create(self, clause: tuple):
+        paths = [self.matcher.compile_path(path, self.compiler) for path in clause[1]]
+
+        def create(rows: Rows, ctx: Context) -> Rows:
+            out = []
+            for row in rows:
+                for path in paths:
+                    row = self._create_path(path, row, ctx)
+                out.append(row)
+            return out
+        return create
+
+    def _plan_merge(self, clause: tuple):
+        _, path_ast, on_create_ast, on_match_ast = clause
+        path = self.matcher.compile_path(path_ast, self.compiler)
+        on_create = self._compile_set_items(on_create_ast)
+        on_match = self._compile_set_items(on_match_ast)
+
+        def merge(rows: Rows, ctx: Context) -> Rows:
+            out = []
+            for row in rows:
+                matches = [
+                    {**row, **bindings}
+                    for bindings, _ in self.matcher.match_path(path, row, ctx, frozenset())
+                ]
+                if matches:
+                    for scope in matches:
+                        self._apply_set_items(on_match, scope, ctx)
+                        out.append(scope)
+                else:
+                    scope = self._create_path(path, row, ctx)
+                    self._apply_set_items(on_create, scope, ctx)
+                    out.append(scope)
+            return out
+        return merge
+
+    # -- SET / REMOVE / DELETE -----------------------------------------------
+
+    def _compile_set_items(self, items: List[tuple]) -> List[tuple]:
+        compiled = []
+        for item in items:
+            if item[0] == "setprop":
+                compiled.append((item[0], item[1], item[2], self.compiler.compile(item[3])))
+            elif item[0] in ("setmerge", "setall"):
+                compiled.append((item[0], item[1], None, self.compiler.compile(item[2])))
+            else:
+                compiled.append(item)
+        return compiled
+
+    def _apply_set_items(self, items: List[tuple], scope: Dict[str, Any], ctx: Context) -> None:
+        store, stats = ctx.store, ctx.stats
+        for item in items:
+            kind, var = item[0], item[1]
+            if var not in scope:
+                raise CypherError(f"'{var}' not defined")
+            entity = scope[var]
+            if entity is None:
+                continue
+            if not isinstance(entity, (Node, Edge)):
+                raise CypherError(f"SET expects a node or relationship, '{var}' is not")
+            if kind == "setprop":
+                value = item[3](scope, ctx)
+                _check_property_value(value)
+                store.set_property(entity, item[2], value)
+                stats.properties_set += 1
+            elif kind in ("setmerge", "setall"):
+                value = item[3](scope, ctx)
+                if isinstance(value, (Node, Edge)):
+                    value = dict(value.props)
+                if not isinstance(value, dict):
+                    raise CypherError("SET += / = expects a map")
+                if kind == "setall":
+                    for key in list(entity.props):
+                        if key not in value:
+                            store.set_property(entity, key, None)
+                for key, prop_value in value.items():
+                    _check_property_value(prop_value)
+                    store.set_property(entity, key, prop_value)
+                    stats.properties_set += 1
+            elif kind == "setlabel":
+                stats.labels_added += store.add_labels(entity, item[2])
+
+    def _plan_set(self, clause: tuple):
+        items = self._compile_set_items(clause[1])
+
+        def set_(rows: Rows, ctx: Context) -> Rows:
+            for row in rows:
+                self._apply_set_items(items, row, ctx)
+            return rows
+        return set_
+
+    def _plan_remove(self, clause: tuple):
+        items = clause[1]
+
+        def remove(rows: Rows, ctx: Context) -> Rows:
+            for row in rows:
+                for kind, var, target in items:
+                    entity = row.get(var)
+                    if entity is None:
+                        continue
+                    if kind == "rmprop":
+                        if target in entity.props:
+                            ctx.store.set_property(entity, target, None)
+                            ctx.stats.properties_set += 1
+                    else:
+                        ctx.store.remove_labels(entity, target)
+            return rows
+        return remove
+
+    def _plan_delete(self, clause: tuple):
+        _, detach, exprs_ast = clause
+        exprs = [self.compiler.compile(expr) for expr in exprs_ast]
+
+        def delete(rows: Rows, ctx: Context) -> Rows:
+            doomed_nodes, doomed_edges = {}, {}
+            for row in rows:
+                for expr in exprs:
+                    value = expr(row, ctx)
+                    if value is None:
+                        continue
+                    if isinstance(value, Node):
+                        doomed_nodes[value.id] = value
+                    elif isinstance(value, Edge):
+                        doomed_edges[value.id] = value
+                    else:
+                        raise CypherError("DELETE expects nodes or relationships")
+            for edge in doomed_edges.values():
+                if ctx.store.delete_edge(edge):
+                    ctx.stats.relationships_deleted += 1
+            for node in doomed_nodes.values():
+                ctx.store.delete_node(node, detach, ctx.stats)
+            return rows
+        return delete
+
+    def _plan_index(self, clause: tuple):
+        _, label, keys = clause
+
+        def create_index(rows: Rows, ctx: Context) -> Rows:
+            for key in keys:
+                ctx.store.create_index(label, key)
+                ctx.stats.indices_created += 1
+            return rows
+        return create_index
+
+    # -- UNWIND / WITH / RETURN ----------------------------------------------
+
+    def _plan_unwind(self, clause: tuple):
+        _, expr_ast, alias = clause
+        expr = self.compiler.compile(expr_ast)
+
+        def unwind(rows: Rows, ctx: Context) -> Rows:
+            out = []
+            for row in rows:
+                values = expr(row, ctx)
+                if values is None:
+                    continue
+                for value in (values if isinstance(values, list) else [values]):
+                    scope = dict(row)
+                    scope[alias] = value
+                    out.append(scope)
+            return out
+        return unwind
+
+    def _compile_projection(self, projection: Dict[str, Any]):
+        items = []
+        aggregates: List[tuple] = []
+        grouping = []
+        for expr_ast, name in projection["items"]:
+            before = len(aggregates)
+            fn = self.compiler.compile(expr_ast, aggregates)
+            items.append((name, fn))
+            if len(aggregates) == before:
+                grouping.append(fn)
+        order = [(self.compiler.compile(expr), descending) for expr, descending in projection["order"]]
+        skip = self.compiler.compile(projection["skip"]) if projection["skip"] else None
+        limit = self.compiler.compile(projection["limit"]) if projection["limit"] else None
+        star, distinct = projection["star"], projection["distinct"]
+
+        def project(rows: Rows, ctx: Context) -> Tuple[List[str], List[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+            names = [name for name, _ in items]
+            if star:
+                visible = [key for key in (rows[0] if rows else {}) if key != _AGG_KEY]
+                names = visible + [name for name in names if name not in visible]
+
+            def build(row: Dict[str, Any]) -> Dict[str, Any]:
+                projected = {key: row[key] for key in names if star and key in row and key not in dict(items)}
+                for name, fn in items:
+                    projected[name] = fn(row, ctx)
+                return projected
+
+            if aggregates:
+                groups: Dict[tuple, Tuple[Dict[str, Any], List[_Aggregator]]] = {}
+                for row in rows:
+                    key = tuple(_hashable(fn(row, ctx)) for fn in grouping)
+                    group = groups.get(key)
+                    if group is None:
+                        group = (row, [_Aggregator(name, distinct_) for name, distinct_, _ in aggregates])
+                        groups[key] = group
+                    for aggregator, (_, _, argument) in zip(group[1], aggregates):
+                        aggregator.add(True if argument is None else argument(row, ctx))
+                if not groups and not grouping:
+                    groups[()] = ({}, [_Aggregator(name, distinct_) for name, distinct_, _ in aggregates])
+                results = []
+                for representative, aggregators in groups.values():
+                    scope = dict(representative)
+                    scope[_AGG_KEY] = [aggregator.result() for aggregator in aggregators]
+                    projected = build(scope)
+                    results.append((projected, {**scope, **projected}))
+            else:
+                results = []
+                for row in rows:
+                    projected = build(row)
+                    results.append((projected, {**row, **projected}))
+
+            if distinct:
+                seen, unique = set(), []
+                for projected, scope in results:
+                    key = tuple(_hashable(projected[name]) for name in names)
+                    if key not in seen:
+                        seen.add(key)
+                        unique.append((projected, scope))
+                results = unique
+
+            for fn, descending in reversed(order):
+                results.sort(key=lambda pair: _sort_key(fn(pair[1], ctx)), reverse=descending)
+
+            start = skip({}, ctx) if skip else 0
+            if start:
+                results = results[start:]
+            if limit is not None:
+                results = results[:limit({}, ctx)]
+            return names, results
+
+        return project
+
+    def _plan_with(self, clause: tuple):
+        _, projection, where_ast = clause
+        project = self._compile_projection(projection)
+        where = self.compiler.compile(where_ast) if where_ast else None
+
+        def with_(rows: Rows, ctx: Context) -> Rows:
+            _, results = project(rows, ctx)
+            out = [projected for projected, _ in results]
+            if where is not None:
+                out = [row for row in out if _truthy(where(row, ctx)) is True]
+            return out
+        return with_
+
+    def _plan_return(self, clause: tuple):
+        project = self._compile_projection(clause[1])
+        self.returns = True
+
+        def return_(rows: Rows, ctx: Context) -> Rows:
+            names, results = project(rows, ctx)
+            self.columns = names
+            return [[projected[name] for name in names] for projected, _ in results]
+        return return_
+
+
+# ============================================================================
+# Result encoding and the REST protocol
+# ============================================================================
+
+def _encode(value: Any) -> Any:
+    """Encode a value in FalkorDB's verbose REST format."""
+    if isinstance(value, Node):
+        return [
+            ["id", value.id],
+            ["labels", list(value.labels)],
+            ["properties", [[key, _encode(prop)] for key, prop in value.props.items()]],
+        ]
+    if isinstance(value, Edge):
+        return [
+            ["id", value.id],
+            ["type", value.type],
+            ["src_node", value.src.id],
+            ["dest_node", value.dest.id],
+            ["properties", [[key, _encode(prop)] for key, prop in value.props.items()]],
+        ]
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    return value
+
+
+class StandinGraph:
+    """One named graph: store, plan cache and a lock for threaded servers."""
+
+    PLAN_CACHE_SIZE = 512
+
+    def __init__(self):
+        self.store = GraphStore()
+        self._plans: Dict[str, Planner] = {}
+        self._lock = threading.RLock()
+        self.queries_executed = 0
+
+    def query(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Execute one Cypher statement.
+
+        Returns:
+            FalkorDB verbose result: [columns, rows, metadata]
+
+        Raises:
+            CypherError: On syntax errors, unsupported constructs or runtime errors
+        """
+        started = time.perf_counter()
+        parser = Parser(cypher)
+        preamble_params, body_offset = parser.preamble()
+        body = cypher[body_offset:]
+        all_params = {**(params or {}), **preamble_params}
+
+        with self._lock:
+            plan = self._plans.get(body)
+            cached = plan is not None
+            if plan is None:
+                clauses = Parser(body).query()
+                plan = Planner(clauses)
+                if len(self._plans) >= self.PLAN_CACHE_SIZE:
+                    self._plans.clear()
+                self._plans[body] = plan
+
+            ctx = Context(self.store, all_params)
+            columns, rows = plan.run(ctx)
+            self.queries_executed += 1
+            encoded_rows = [[_encode(value) for value in row] for row in rows]
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return [list(columns), encoded_rows, ctx.stats.metadata(cached, elapsed_ms)]
+
+    def reset(self) -> None:
+        """Drop every node and relationship."""
+        with self._lock:
+            self.store = GraphStore()
+
+
+class FalkorDBStandin:
+    """
+    Stand-in for the FalkorDB REST proxy (/admin/query).
+
+    Args:
+        api_key: Required X-API-Key value (None accepts any key)
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key
+        self.graphs: Dict[str, StandinGraph] = {}
+        self.requests_served = 0
+
+    def graph(self, name: str) -> StandinGraph:
+        """Get (or create) a named graph."""
+        graph = self.graphs.get(name)
+        if graph is None:
+            graph = self.graphs.setdefault(name, StandinGraph())
+        return graph
+
+    def reset(self) -> None:
+        """Drop every graph."""
+        self.graphs.clear()
+
+    def handle(self, body: Any, api_key: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer one /admin/query request body.
+
+        Returns:
+            (HTTP status, JSON body)
+        """
+        self.requests_served += 1
+        if self.api_key is not None and api_key != self.api_key:
+            return 401, {"error": "Invalid or missing API key"}
+        if not isinstance(body, dict):
+            return 400, {"error": "Request body must be a JSON object"}
+
+        graph_name = body.get("graph_name")
+        if not graph_name:
+            return 400, {"error": "graph_name is required"}
+        graph = self.graph(graph_name)
+
+        try:
+            if "queries" in body:
+                results = []
+                for statement in body["queries"]:
+                    results.append(graph.query(statement["query"], statement.get("params")))
+                return 200, {"results": results}
+            if not body.get("query"):
+                return 400, {"error": "query is required"}
+            return 200, {"result": graph.query(body["query"], body.get("params"))}
+        except CypherError as e:
+            return 400, {"error": str(e)}
+        except RecursionError:
+            return 400, {"error": "Query too deeply nested"}
+
+    def _handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body = json.loads(request.content or b"null")
+        except ValueError:
+            return httpx.Response(400, json={"error": "Invalid JSON body"})
+        status, payload = self.handle(body, request.headers.get("X-API-Key"))
+        return httpx.Response(status, json=payload)
+
+    def transport(self) -> httpx.MockTransport:
+        """Blocking httpx transport answering every request in-process."""
+        return httpx.MockTransport(self._handle_httpx)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Async httpx transport answering every request in-process."""
+        return httpx.MockTransport(self._handle_httpx)
+
+    def create_app(self):
+        """FastAPI app serving POST /admin/query (for the standalone server)."""
+        from fastapi import FastAPI, Request
+        from fastapi.responses import JSONResponse
+
+        app = FastAPI(title="FalkorDB stand-in")
+
+        @app.post("/admin/query")
+        async def admin_query(request: Request):
+            try:
+                body = await request.json()
+            except ValueError:
+                return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
+            status, payload = self.handle(body, request.headers.get("X-API-Key"))
+            return JSONResponse(payload, status_code=status)
+
+        @app.get("/health")
+        async def health():
+            return {
+                "status": "ok",
+                "graphs": {name: len(graph.store.nodes) for name, graph in self.graphs.items()},
+                "requestsServed": self.requests_served,
+            }
+
+        return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--api-key", default=None, help="Require this X-API-Key (default: accept any)")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    print("🧪 FalkorDB stand-in (in-memory, Cypher subset)")
+    print(f"   FALKORDB_API_URL=http://{args.host}:{args.port}/admin/query")
+    uvicorn.run(FalkorDBStandin(api_key=args.api_key).create_app(), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,90 @@
+"""
+Reconcile job × member interaction counters with the raw message events
+
+Earnings read materialized U4_Interaction_Counter nodes that
+create_chat_message increments. This command reports counters that have
+drifted from the live message counts and rebuilds them.
+
+Each deploy runs it with --backfill (render.yaml preDeployCommand), which
+counts existing chat history once - only while no counter exists yet. Run
+it by hand whenever messages were written outside create_chat_message, or
+to remove counters whose messages were deleted.
+
+Usage:
+    cd backend
+    python3 scripts/reconcile_interaction_counters.py              # report drift, rebuild all
+    python3 scripts/reconcile_interaction_counters.py --check      # report drift only (exit 1 if any)
+    python3 scripts/reconcile_interaction_counters.py --job job-x  # one job
+    python3 scripts/reconcile_interaction_counters.py --backfill   # first deploy only (no-op once counters exist)
+
+Environment:
+    FALKORDB_API_URL: FalkorDB REST API endpoint
+    FALKORDB_API_KEY: API key for authentication
+    GRAPH_NAME: Graph name (default: scopelock)
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api.mission_deck.services.compensation.interaction_counters import (  # noqa: E402
+    backfill_interaction_counters,
+    check_interaction_counters,
+    interaction_counters_exist,
+    rebuild_interaction_counters,
+)
+
+
+async def reconcile(job_slug: Optional[str] = None, check_only: bool = False) -> int:
+    """Report drift, then rebuild unless check_only. Returns the number of drifted pairs."""
+    scope = f"job {job_slug}" if job_slug else "all jobs"
+
+    drift = await check_interaction_counters(job_slug)
+    if drift:
+        print(f"⚠️  {len(drift)} counter(s) out of sync ({scope}):")
+        for item in drift:
+            print(f"   {item['jobSlug']} × {item['memberSlug']}: counter {item['counter']}, events {item['events']}")
+    else:
+        print(f"✅ Interaction counters in sync ({scope})")
+
+    if check_only:
+        return len(drift)
+
+    written = await rebuild_interaction_counters(job_slug)
+    print(f"🔁 Rebuilt {written} counter(s) from message events ({scope})")
+    return len(drift)
+
+
+async def backfill_once() -> None:
+    """Count existing chat history unless counters already exist."""
+    if await interaction_counters_exist():
+        print("✅ Interaction counters already exist - nothing to backfill")
+        return
+
+    written = await backfill_interaction_counters()
+    print(f"🔁 Backfilled {written} counter(s) from message events")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconcile job × member interaction counters")
+    parser.add_argument("--job", help="Only reconcile this job slug")
+    parser.add_argument("--check", action="store_true", help="Report drift without rebuilding (exit 1 on drift)")
+    parser.add_argument("--backfill", action="store_true", help="Count chat history only if no counter exists yet (deploy step)")
+    args = parser.parse_args()
+
+    if args.backfill:
+        asyncio.run(backfill_once())
+        return
+
+    drifted = asyncio.run(reconcile(args.job, check_only=args.check))
+    if args.check and drifted:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Write an end-of-period settlement report
+
+Splits every active job's teamPool among its members in integer cents
+(largest remainder - each job's shares sum exactly to its pool) and writes
+the report as JSON or CSV. Read-only: nothing is paid or written to the
+graph.
+
+Usage:
+    cd backend
+    python3 scripts/settle_period.py --out settlement-2025-11.json
+    python3 scripts/settle_period.py --format csv --out settlement-2025-11.csv
+    python3 scripts/settle_period.py --job job-a --job job-b   # selected jobs, JSON to stdout
+
+Environment:
+    FALKORDB_API_URL: FalkorDB REST API endpoint
+    FALKORDB_API_KEY: API key for authentication
+    GRAPH_NAME: Graph name (default: scopelock)
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Dict
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api.mission_deck.services.compensation.settlement import build_settlement  # noqa: E402
+
+
+def to_csv(report: Dict) -> str:
+    """One row per (job, member) share."""
+    adjusted = {
+        (adjustment['jobSlug'], member['memberSlug']): adjustment['viewCents']
+        for member in report['members']
+        for adjustment in member['adjustments']
+    }
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["job_slug", "member_slug", "share_cents", "view_cents", "team_pool_cents", "team_total"])
+    for job in report['jobs']:
+        for member_slug, cents in sorted(job['shares'].items()):
+            writer.writerow([
+                job['jobSlug'],
+                member_slug,
+                cents,
+                adjusted.get((job['jobSlug'], member_slug), cents),
+                job['teamPoolCents'],
+                job['teamTotal']
+            ])
+    return buffer.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write an end-of-period settlement report")
+    parser.add_argument("--job", action="append", help="Only settle this active job (repeatable)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--out", help="Report file (default: stdout)")
+    args = parser.parse_args()
+
+    report = asyncio.run(build_settlement(args.job))
+    content = to_csv(report) if args.format == "csv" else json.dumps(report, indent=2) + "\n"
+
+    if args.out:
+        Path(args.out).write_text(content)
+        adjustments = sum(len(member['adjustments']) for member in report['members'])
+        print(
+            f"✅ Settled {len(report['jobs'])} job(s) across {len(report['members'])} member(s): "
+            f"${report['totalCents'] / 100:.2f} ({adjustments} one-cent adjustment(s), {report['engine']} engine) → {args.out}",
+            file=sys.stderr
+        )
+    else:
+        sys.stdout.write(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.api.mission_deck.services.graph import query_graph
+from app.api.mission_deck.services.graph import query_graph_sync as query_graph
 
 try:
     # Simple query to test connection
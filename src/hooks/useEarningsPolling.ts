@@ -1,7 +1,10 @@
 /**
  * useEarningsPolling Hook
  *
- * Polls the compensation API every 2 seconds for real-time earnings updates.
+ * Live earnings for a member: subscribes to the compensation SSE stream,
+ * which pushes only when earnings change. Falls back to polling the REST
+ * endpoint every 2 seconds where EventSource is unavailable, or when the
+ * stream fails to connect MAX_STREAM_ERRORS times in a row.
  * Maps to: docs/missions/mission-deck-compensation/MECHANISM.md Frontend Polling Strategy
  *
  * Usage:
@@ -14,7 +17,8 @@ import { useState, useEffect, useRef } from 'react';
 import { api } from '../lib/api';
 import type { EarningsData } from '../types';
 
-const POLLING_INTERVAL_MS = 2000; // 2 seconds
+const POLLING_INTERVAL_MS = 2000; // 2 seconds (fallback only)
+const MAX_STREAM_ERRORS = 3; // Consecutive stream connection errors before falling back to polling
 
 interface UseEarningsPollingReturn {
   earnings: EarningsData | null;
@@ -32,6 +36,8 @@ export function useEarningsPolling(memberSlug: string): UseEarningsPollingReturn
 
   useEffect(() => {
     isMountedRef.current = true;
+    let source: EventSource | null = null;
+    let intervalId: ReturnType<typeof setInterval> | null = null;
 
     // Fetch earnings function
     const fetchEarnings = async () => {
@@ -53,16 +59,63 @@ export function useEarningsPolling(memberSlug: string): UseEarningsPollingReturn
       }
     };
 
-    // Initial fetch
-    fetchEarnings();
+    const startPolling = () => {
+      // Initial fetch
+      fetchEarnings();
 
-    // Set up polling interval
-    const intervalId = setInterval(fetchEarnings, POLLING_INTERVAL_MS);
+      // Set up polling interval
+      intervalId = setInterval(fetchEarnings, POLLING_INTERVAL_MS);
+    };
+
+    // Push: the server sends earnings on connect and whenever they change
+    if (typeof window !== 'undefined' && 'EventSource' in window) {
+      const stream = new EventSource(api.earningsStreamUrl(memberSlug));
+      source = stream;
+      let consecutiveErrors = 0;
+
+      stream.addEventListener('open', () => {
+        consecutiveErrors = 0;
+      });
+
+      stream.addEventListener('earnings', (event) => {
+        consecutiveErrors = 0;
+        if (isMountedRef.current) {
+          setEarnings(JSON.parse((event as MessageEvent).data));
+          setError(null);
+          setIsLoading(false);
+        }
+      });
+
+      // Server-side failure to compute earnings (the stream stays open and retries)
+      stream.addEventListener('earnings-error', (event) => {
+        if (!isMountedRef.current) return;
+        const data = (event as MessageEvent).data;
+        console.error('[useEarningsPolling] Earnings stream error:', data);
+        setError(JSON.parse(data).detail || 'Failed to fetch earnings');
+        setIsLoading(false);
+      });
+
+      // Connection failures: EventSource reconnects by itself, but a stream that
+      // keeps failing (proxy stripping SSE, 401) never delivers - poll instead
+      stream.addEventListener('error', () => {
+        consecutiveErrors += 1;
+        if (consecutiveErrors < MAX_STREAM_ERRORS || !isMountedRef.current) return;
+        console.error(`[useEarningsPolling] Earnings stream failed ${consecutiveErrors} times, falling back to polling`);
+        stream.close();
+        source = null;
+        startPolling();
+      });
+    } else {
+      startPolling();
+    }
 
     // Cleanup function
     return () => {
       isMountedRef.current = false;
-      clearInterval(intervalId);
+      source?.close();
+      if (intervalId !== null) {
+        clearInterval(intervalId);
+      }
     };
   }, [memberSlug]);
 
@@ -450,6 +450,21 @@ export const api = {
     return response.missions;
   },
 
+  /**
+   * Delta sync: missions changed since a cursor (omit it for the full list)
+   * Merge `missions` into the local list by id (recent changes may be re-sent), drop `removed`,
+   * keep `cursor` for the next call
+   */
+  syncMissions: async (since?: string) => {
+    const query = since ? `?since=${encodeURIComponent(since)}` : '';
+    return apiCall<{
+      missions: Mission[];
+      total: number;
+      removed: Array<{ id: string; status: string }>;
+      cursor: string;
+    }>(`/api/missions${query}`);
+  },
+
   getMission: async (id: string): Promise<Mission> => {
     if (USE_MOCK_DATA) {
       await new Promise((resolve) => setTimeout(resolve, 200));
@@ -461,6 +476,26 @@ export const api = {
     return apiCall<Mission>(`/api/missions/${id}`);
   },
 
+  /**
+   * Get the mission page in one request: mission, DoD, recent mission chat, earnings
+   * sections/fields trim the payload, e.g. fields: ['mission.title', 'dod.completed']
+   */
+  getMissionDashboard: async (
+    missionId: string,
+    options: { sections?: string[]; fields?: string[]; chatLimit?: number } = {}
+  ) => {
+    const params = new URLSearchParams();
+    if (options.sections) params.set('sections', options.sections.join(','));
+    if (options.fields) params.set('fields', options.fields.join(','));
+    if (options.chatLimit) params.set('chat_limit', String(options.chatLimit));
+    return apiCall<{
+      mission?: Partial<Mission>;
+      dod?: { items?: DODItem[]; total?: number; completed?: number };
+      chat?: { messages?: ChatMessage[]; total?: number };
+      earnings?: Partial<EarningsData>;
+    }>(`/api/missions/${missionId}/dashboard?${params.toString()}`);
+  },
+
   updateMissionNotes: async (
     missionId: string,
     notes: string
@@ -527,6 +562,20 @@ export const api = {
     return response.items;
   },
 
+  /**
+   * Delta sync: DoD items changed since a cursor (omit it for the whole checklist)
+   * Merge `items` by id (recent changes may be re-sent); total/completed always cover the whole checklist
+   */
+  syncDODItems: async (missionId: string, since?: string) => {
+    const query = since ? `?since=${encodeURIComponent(since)}` : '';
+    return apiCall<{
+      items: DODItem[];
+      total: number;
+      completed: number;
+      cursor: string;
+    }>(`/api/missions/${missionId}/dod${query}`);
+  },
+
   toggleDODItem: async (
     missionId: string,
     itemId: string,
@@ -555,6 +604,39 @@ export const api = {
     );
   },
 
+  /**
+   * Apply several DoD item state changes in one request (debounced toggles)
+   * Returns the whole updated checklist
+   */
+  updateDODItems: async (
+    missionId: string,
+    changes: Array<{ item_id: string; state: 'todo' | 'doing' | 'done' }>
+  ): Promise<DODItem[]> => {
+    if (USE_MOCK_DATA) {
+      await new Promise((resolve) => setTimeout(resolve, 200));
+      const items = MOCK_DOD_ITEMS[missionId] || [];
+      if (changes.some(({ item_id }) => !items.some((i) => i.id === item_id))) {
+        throw new Error('Item not found');
+      }
+      changes.forEach(({ item_id, state }) => {
+        const item = items.find((i) => i.id === item_id)!;
+        item.completed = state === 'done';
+        item.completed_at = item.completed ? new Date().toISOString() : null;
+      });
+      return items;
+    }
+
+    const response = await apiCall<{
+      items: DODItem[];
+      total: number;
+      completed: number;
+    }>(`/api/missions/${missionId}/dod`, {
+      method: 'PATCH',
+      body: JSON.stringify({ changes }),
+    });
+    return response.items;
+  },
+
   markAllDODComplete: async (
     missionId: string
   ): Promise<{
@@ -621,12 +703,20 @@ export const api = {
 
   /**
    * Get member's complete earnings summary
-   * Polled by frontend every 2 seconds for real-time updates
+   * Polling fallback for browsers without EventSource (see earningsStreamUrl)
    */
   getEarnings: async (memberSlug: string): Promise<EarningsData> => {
     return apiCall<EarningsData>(`/api/compensation/earnings/${memberSlug}`);
   },
 
+  /**
+   * Server-Sent Events URL pushing member's earnings when they change
+   * Events: "earnings" (EarningsData JSON), "earnings-error" ({ detail })
+   */
+  earningsStreamUrl: (memberSlug: string): string => {
+    return `${API_URL}/api/compensation/earnings/${memberSlug}/stream`;
+  },
+
   /**
    * Get current mission fund balance and tier information
    */
@@ -644,4 +734,24 @@ export const api = {
       teamTotal: number;
     }>(`/api/compensation/jobs/${jobSlug}/earnings/${memberSlug}`);
   },
+
+  /**
+   * Get earnings breakdowns for several jobs in one request (job card boards)
+   * Omit memberSlugs to get every member with interactions on each job
+   */
+  getJobsEarnings: async (jobSlugs: string[], memberSlugs?: string[]) => {
+    const params = new URLSearchParams();
+    jobSlugs.forEach((slug) => params.append('jobs', slug));
+    memberSlugs?.forEach((slug) => params.append('members', slug));
+    return apiCall<{
+      jobs: Array<{
+        jobSlug: string;
+        jobName: string;
+        teamTotal: number;
+        members: Array<{ memberSlug: string; earning: number; yourInteractions: number }>;
+      }>;
+      missing: string[];
+      errors: Array<{ jobSlug: string; detail: string }>;
+    }>(`/api/compensation/jobs/earnings?${params.toString()}`);
+  },
 };
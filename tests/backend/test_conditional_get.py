@@ -0,0 +1,112 @@
+"""
+Backend Tests: Conditional GET for Polled Endpoints
+Maps to: services/conditional_get.py (ETag / If-None-Match on earnings, mission fund and mission list)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck import compensation, missions
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.compensation.tier_calculator import increase_mission_fund
+from app.api.mission_deck.services.conditional_get import etag_matches
+from app.api.mission_deck.services.graph_cache import cache_tag, invalidate_graph_cache, response_cache
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Compensation + missions routers on the stand-in graph, signed in as kara."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Work_Item {slug: 'job-1', name: 'Chatbot', work_type: 'job', scope_ref: 'scopelock', "
+        "status: 'active', value: 1000, teamPool: 300.0}),"
+        "       (:U4_Work_Item {slug: 'mission-47', name: 'Telegram Notifier', work_type: 'mission', "
+        "scope_ref: 'scopelock', state: 'doing', assignee_ref: 'kara', "
+        "due_date: '2025-11-08T23:59:59Z', created_at: '2025-11-01T09:00:00Z'}),"
+        "       (:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock', balance: 1500.0})"
+    )
+    return app_client(compensation.router, missions.router)
+
+
+class TestConditionalGet:
+    """Test suite for ETag revalidation of polled endpoints."""
+
+    @pytest.mark.parametrize("path", [
+        "/api/compensation/earnings/kara",
+        "/api/compensation/mission-fund",
+        "/api/missions",
+    ])
+    def test_unchanged_payload_is_304_without_graph_reads(self, client, falkordb_standin, path):
+        """A poll carrying the current ETag costs no graph request and no body."""
+        first = client.get(path)
+        etag = first.headers["ETag"]
+        served = falkordb_standin.requests_served
+
+        second = client.get(path, headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+        assert falkordb_standin.requests_served == served
+
+    def test_job_message_changes_earnings_etag(self, client):
+        """A chat message on one of the member's jobs invalidates the cached response."""
+        first = client.get("/api/compensation/earnings/kara")
+
+        asyncio.run(graph.create_chat_message("job-1", "user", "Shipped the webhook", "kara"))
+        second = client.get("/api/compensation/earnings/kara", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert second.json()["potentialFromJobs"] == 300.0
+
+    def test_fund_change_changes_mission_fund_etag(self, client):
+        """Fund writes drop the rendered mission fund response."""
+        first = client.get("/api/compensation/mission-fund")
+
+        asyncio.run(increase_mission_fund(Decimal("50"), "job-1", Decimal("1000")))
+        second = client.get("/api/compensation/mission-fund", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+        assert second.json()["balance"] == 1550.0
+
+    def test_recomputed_identical_payload_keeps_etag(self, client, falkordb_standin):
+        """An unrelated write recomputes, but the same bytes still revalidate as 304."""
+        etag = client.get("/api/missions").headers["ETag"]
+        served = falkordb_standin.requests_served
+
+        invalidate_graph_cache([cache_tag("U4_Work_Item", "job-1")])
+        response = client.get("/api/missions", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert falkordb_standin.requests_served > served
+
+    def test_write_during_compute_is_not_stored(self, client, monkeypatch):
+        """A payload computed across an invalidation is served but never cached."""
+        original = compensation.calculate_member_full_earnings
+
+        async def racing_calculation(member_slug):
+            earnings = await original(member_slug)
+            invalidate_graph_cache([cache_tag("U4_Event", "job-1")])
+            return earnings
+
+        monkeypatch.setattr(compensation, "calculate_member_full_earnings", racing_calculation)
+        response = client.get("/api/compensation/earnings/kara")
+
+        assert response.status_code == 200
+        assert response_cache.get("earnings:kara") == (False, None)
+
+
+class TestEtagMatching:
+    """Test suite for If-None-Match parsing."""
+
+    def test_header_forms(self):
+        """Lists, weak validators and * all match; other tags don't."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('"x", W/"abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+        assert not etag_matches(None, '"abc"')
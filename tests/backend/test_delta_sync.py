@@ -0,0 +1,114 @@
+"""
+Backend Tests: Delta Sync
+Maps to: missions.py (list_missions ?since=), dod.py (list_dod_items ?since=), services/graph.py (ensure_mission_sync_index)
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck import dod, missions
+from app.api.mission_deck.dependencies import CurrentUser, get_current_user
+from app.api.mission_deck.services.graph import ensure_mission_sync_index, format_sync_cursor
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Missions + DoD routers on the stand-in graph, signed in as kara; two active missions."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "UNWIND [47, 48] AS n "
+        "CREATE (m:U4_Work_Item {slug: 'mission-' + toString(n), name: 'Mission ' + toString(n), "
+        "work_type: 'mission', scope_ref: 'scopelock', state: 'doing', assignee_ref: 'kara', "
+        "due_date: '2025-11-08T23:59:59Z', created_at: '2025-11-01T09:00:00Z', "
+        "updated_at: '2025-11-0' + toString(n - 45) + 'T09:00:00.000001Z'}) "
+        "WITH m UNWIND range(1, 3) AS i "
+        "CREATE (:U4_Work_Item {slug: m.slug + '-task-' + toString(i), name: 'Task ' + toString(i), work_type: 'task', "
+        "scope_ref: 'scopelock', state: 'todo', dod_category: 'functional', dod_sort_order: i, "
+        "updated_at: '2025-11-01T09:00:00.000001Z'})-[:U4_MEMBER_OF {role: 'dod_task'}]->(m)"
+    )
+    return app_client(missions.router, dod.router)
+
+
+@pytest.fixture
+def no_margin(monkeypatch):
+    """Cursors at the server clock, so a delta right after a sync is empty."""
+    monkeypatch.setattr(settings, "sync_cursor_margin_seconds", 0.0)
+
+
+class TestMissionDeltaSync:
+    """Test suite for changed-since mission lists."""
+
+    def test_only_changes_and_tombstones(self, client, no_margin):
+        """A cursor returns updated missions, and missions that left todo/doing as removed."""
+        full = client.get("/api/missions").json()
+        assert full["total"] == 2
+
+        client.patch("/api/missions/mission-47/notes", json={"notes": "Client prefers inline buttons."})
+        client.patch("/api/missions/mission-48/dod/complete")
+        delta = client.get("/api/missions", params={"since": full["cursor"]}).json()
+
+        assert [mission["id"] for mission in delta["missions"]] == ["mission-47"]
+        assert delta["missions"][0]["notes"] == "Client prefers inline buttons."
+        assert delta["removed"] == [{"id": "mission-48", "status": "qa"}]
+        assert delta["cursor"] > full["cursor"]
+
+        unchanged = client.get("/api/missions", params={"since": delta["cursor"]}).json()
+        assert (unchanged["missions"], unchanged["removed"]) == ([], [])
+
+    def test_write_committed_after_a_newer_one_is_synced(self, client, falkordb_standin):
+        """The cursor trails the clock, not the newest row: a slow write stamped earlier isn't skipped."""
+        slow_write_stamp = format_sync_cursor(datetime.utcnow())
+        client.patch("/api/missions/mission-47/notes", json={"notes": "Stamped later, committed first."})
+        full = client.get("/api/missions").json()
+        assert full["cursor"] < slow_write_stamp
+
+        falkordb_standin.graph(settings.graph_name).query(
+            "MATCH (m:U4_Work_Item {slug: 'mission-48'}) SET m.name = 'Renamed', m.updated_at = $stamp",
+            {"stamp": slow_write_stamp}
+        )
+        delta = client.get("/api/missions", params={"since": full["cursor"]}).json()
+
+        # mission-47 is re-sent (inside the margin) - clients merge by id
+        assert sorted(mission["id"] for mission in delta["missions"]) == ["mission-47", "mission-48"]
+
+    def test_user_without_missions_gets_a_cursor(self, client):
+        """An empty list still starts delta sync."""
+        client.app.dependency_overrides[get_current_user] = lambda: CurrentUser("reza", "reza@scopelock.ai")
+
+        full = client.get("/api/missions").json()
+
+        assert (full["missions"], full["cursor"] is not None) == ([], True)
+        assert client.get("/api/missions", params={"since": full["cursor"]}).status_code == 200
+
+    def test_invalid_cursor(self, client):
+        """A cursor that isn't a timestamp is a 400."""
+        assert client.get("/api/missions", params={"since": "yesterday"}).status_code == 400
+
+    def test_cursor_offsets_are_normalized_to_utc(self, client):
+        """A cursor in another offset compares as the same instant in UTC."""
+        # 11:00+02:00 is 09:00Z, just before mission-47's update - but sorts after it as a raw string
+        delta = client.get("/api/missions", params={"since": "2025-11-02T11:00:00+02:00"}).json()
+
+        assert [mission["id"] for mission in delta["missions"]] == ["mission-47", "mission-48"]
+
+    def test_sync_index_is_idempotent(self, falkordb_standin):
+        """The updated_at index can be ensured on every startup."""
+        asyncio.run(ensure_mission_sync_index())
+        asyncio.run(ensure_mission_sync_index())
+
+
+class TestDoDDeltaSync:
+    """Test suite for changed-since DoD checklists."""
+
+    def test_only_changed_items(self, client, no_margin):
+        """Only items updated after the cursor are listed; counts cover the whole checklist."""
+        full = client.get("/api/missions/mission-47/dod").json()
+
+        client.patch("/api/missions/mission-47/dod/mission-47-task-2", json={"completed": True})
+        delta = client.get("/api/missions/mission-47/dod", params={"since": full["cursor"]}).json()
+
+        assert [item["id"] for item in delta["items"]] == ["mission-47-task-2"]
+        assert (delta["total"], delta["completed"]) == (3, 1)
+        assert client.get("/api/missions/mission-47/dod", params={"since": delta["cursor"]}).json()["items"] == []
@@ -0,0 +1,121 @@
+"""
+Backend Tests: DoD Checklist
+Maps to: dod.py (update_dod_items, mark_all_dod_complete), services/graph.py (update_dod_task_states, complete_all_dod_tasks)
+"""
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.api.mission_deck import dod, missions
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Missions + DoD routers on the stand-in graph, signed in as kara; mission-47 has 20 DoD tasks, 5 done."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (m:U4_Work_Item {slug: 'mission-47', name: 'Telegram Notifier', work_type: 'mission', "
+        "scope_ref: 'scopelock', state: 'doing', assignee_ref: 'kara', "
+        "due_date: '2025-11-08T23:59:59Z', created_at: '2025-11-01T09:00:00Z'}) "
+        "WITH m UNWIND range(1, 20) AS i "
+        "CREATE (:U4_Work_Item {slug: 'mission-47-task-' + toString(i), name: 'Task ' + toString(i), "
+        "work_type: 'task', scope_ref: 'scopelock', state: CASE WHEN i <= 5 THEN 'done' ELSE 'todo' END, "
+        "dod_category: 'functional', dod_sort_order: i})-[:U4_MEMBER_OF {role: 'dod_task'}]->(m)"
+    )
+    return app_client(missions.router, dod.router)
+
+
+class TestMarkAllDoDComplete:
+    """Test suite for completing a whole checklist at once."""
+
+    def test_one_batch_completes_checklist(self, client, falkordb_standin, monkeypatch):
+        """Twenty items and the QA transition cost one graph request on a pipelining proxy."""
+        monkeypatch.setattr(settings, "falkordb_pipeline", "on")
+        client.get("/api/missions/mission-47")
+        served = falkordb_standin.requests_served
+
+        response = client.patch("/api/missions/mission-47/dod/complete")
+
+        assert falkordb_standin.requests_served == served + 1
+        assert response.json() == {
+            "message": "All DoD items marked complete",
+            "mission_status": "qa",
+            "completed_count": 15
+        }
+        assert client.get("/api/missions/mission-47/dod").json()["completed"] == 20
+        assert client.get("/api/missions/mission-47").json()["status"] == "qa"
+
+    def test_falls_back_to_item_updates(self, client, monkeypatch):
+        """If the graph rejects the set-based form as unsupported, the per-item batch gives the same result."""
+        async def unsupported(mission_slug):
+            request = httpx.Request("POST", settings.falkordb_api_url)
+            response = httpx.Response(400, json={"error": "SET on a null entity is not supported"}, request=request)
+            raise httpx.HTTPStatusError("400 Bad Request", request=request, response=response)
+
+        monkeypatch.setattr(dod, "complete_all_dod_tasks", unsupported)
+
+        response = client.patch("/api/missions/mission-47/dod/complete")
+
+        assert response.json()["completed_count"] == 15
+        assert client.get("/api/missions/mission-47/dod").json()["completed"] == 20
+        assert client.get("/api/missions/mission-47").json()["status"] == "qa"
+
+    def test_other_errors_do_not_fall_back(self, client, monkeypatch):
+        """A real query or data error is a 500, not silently retried item by item."""
+        async def broken(mission_slug):
+            raise KeyError("completed_count")
+
+        monkeypatch.setattr(dod, "complete_all_dod_tasks", broken)
+
+        assert client.patch("/api/missions/mission-47/dod/complete").status_code == 500
+        assert client.get("/api/missions/mission-47/dod").json()["completed"] == 5
+
+    def test_mission_without_pending_tasks(self, client):
+        """A checklist already complete still moves to QA; an unknown mission is a 404."""
+        client.patch("/api/missions/mission-47/dod/complete")
+
+        again = client.patch("/api/missions/mission-47/dod/complete")
+        missing = client.patch("/api/missions/mission-99/dod/complete")
+
+        assert (again.json()["mission_status"], again.json()["completed_count"]) == ("qa", 0)
+        assert missing.status_code == 404
+
+
+class TestBatchDoDUpdate:
+    """Test suite for applying debounced toggles in one request."""
+
+    def test_changes_applied_in_one_write(self, client, falkordb_standin):
+        """Several changes cost one graph write and return the whole checklist; the last change to an item wins."""
+        client.get("/api/missions/mission-47/dod")
+        served = falkordb_standin.requests_served
+
+        response = client.patch("/api/missions/mission-47/dod", json={"changes": [
+            {"item_id": "mission-47-task-1", "state": "todo"},
+            {"item_id": "mission-47-task-6", "state": "todo"},
+            {"item_id": "mission-47-task-7", "state": "done"},
+            {"item_id": "mission-47-task-6", "state": "done"},
+        ]})
+
+        assert falkordb_standin.requests_served == served + 1
+        body = response.json()
+        assert (body["total"], body["completed"]) == (20, 6)
+        states = {item["id"]: item["completed"] for item in body["items"]}
+        assert (states["mission-47-task-1"], states["mission-47-task-6"], states["mission-47-task-7"]) == (
+            False, True, True
+        )
+        listed = client.get("/api/missions/mission-47/dod").json()
+        assert {**listed, "cursor": None} == {**body, "cursor": None}
+
+    def test_unknown_item_rejects_whole_batch(self, client):
+        """An item outside the mission is a 404 and nothing is written; bad states are a 422."""
+        missing = client.patch("/api/missions/mission-47/dod", json={"changes": [
+            {"item_id": "mission-47-task-6", "state": "done"},
+            {"item_id": "mission-12-task-1", "state": "done"},
+        ]})
+        invalid = client.patch("/api/missions/mission-47/dod", json={"changes": [
+            {"item_id": "mission-47-task-6", "state": "finished"},
+        ]})
+
+        assert missing.status_code == 404
+        assert invalid.status_code == 422
+        assert client.get("/api/missions/mission-47/dod").json()["completed"] == 5
@@ -0,0 +1,86 @@
+"""
+Backend Tests: Aggregated Potential Earnings
+Maps to: services/compensation/earnings_calculator.py (one-query earnings across active jobs)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services.compensation import earnings_calculator, interaction_counters
+
+
+def _seed(standin, jobs):
+    """
+    jobs: {slug: (teamPool, status, [actor, ...])} - one message per actor entry.
+
+    Messages are written as raw events, then counted by the reconcile rebuild.
+    """
+    g = standin.graph(settings.graph_name)
+    for slug, (team_pool, status, actors) in jobs.items():
+        g.query(
+            "CREATE (:U4_Work_Item {slug: $slug, name: $slug, work_type: 'job', scope_ref: 'scopelock', "
+            "status: $status, value: 1000, teamPool: $pool})",
+            {"slug": slug, "status": status, "pool": team_pool}
+        )
+        g.query(
+            "MATCH (job:U4_Work_Item {slug: $slug}) "
+            "UNWIND $actors AS actor "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: actor})-[:U4_ABOUT]->(job)",
+            {"slug": slug, "actors": actors}
+        )
+    asyncio.run(interaction_counters.rebuild_interaction_counters())
+
+
+class TestAggregatedEarnings:
+    """Test suite for potential earnings from a single aggregation query."""
+
+    def test_all_jobs_in_one_round_trip(self, falkordb_standin):
+        """Earnings across every active job cost one graph request, whatever the job count."""
+        _seed(falkordb_standin, {
+            "job-a": (300.0, "active", ["kara"] * 3 + ["reza"]),
+            "job-b": (450.0, "active", ["reza"] * 2),
+            "job-c": (100.0, "active", []),
+            "job-done": (999.0, "completed", ["kara"]),
+        })
+        served = falkordb_standin.requests_served
+
+        earnings = asyncio.run(earnings_calculator.calculate_member_total_potential_earnings("kara"))
+
+        assert falkordb_standin.requests_served == served + 1
+        assert earnings["total"] == 225.0
+        assert earnings["totalInteractions"] == 3
+        assert [(job["jobSlug"], job["teamTotal"], job["earning"]) for job in earnings["jobs"]] == [
+            ("job-a", 4, 225.0), ("job-b", 2, 0.0), ("job-c", 0, 0.0)
+        ]
+
+    def test_matches_per_job_calculation(self, falkordb_standin):
+        """Shares match calculate_member_job_earning, cent for cent."""
+        _seed(falkordb_standin, {
+            "job-x": (333.33, "active", ["kara", "reza", "reza", "mina"]),
+            "job-y": (1000.0, "active", ["kara"] * 2 + ["mina"]),
+        })
+
+        earnings = asyncio.run(earnings_calculator.calculate_member_total_potential_earnings("reza"))
+
+        for job in earnings["jobs"]:
+            expected = asyncio.run(earnings_calculator.calculate_member_job_earning(job["jobSlug"], "reza"))
+            assert Decimal(str(job["earning"])) == expected
+
+    def test_no_fifty_job_cap(self, falkordb_standin):
+        """Every active job counts - the old LIMIT 50 silently dropped the rest."""
+        _seed(falkordb_standin, {f"job-{i:03d}": (10.0, "active", ["kara"]) for i in range(60)})
+
+        earnings = asyncio.run(earnings_calculator.calculate_member_total_potential_earnings("kara"))
+
+        assert len(earnings["jobs"]) == 60
+        assert earnings["total"] == 600.0
+
+    def test_missing_team_pool_fails_loud(self):
+        """A job with interactions but no teamPool is an error, not $0."""
+        job = {"slug": "job-z", "name": "Z", "teamPool": None, "interactionCounts": {"kara": 1}}
+
+        with pytest.raises(ValueError, match="missing teamPool"):
+            earnings_calculator.calculate_job_earning(job, "kara")
@@ -0,0 +1,87 @@
+"""
+Backend Tests: Earnings History
+Maps to: services/compensation/earnings_history.py, GET /api/compensation/earnings/{member}/history
+"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck import compensation
+from app.api.mission_deck.services.compensation import interaction_counters
+from app.api.mission_deck.services.compensation.earnings_history import (
+    EarningsHistoryStore,
+    choose_resolution,
+    record_earnings_snapshot
+)
+
+T0 = 1_762_000_000 - 1_762_000_000 % 86400  # Midnight UTC
+
+
+def _kara(total_dollars, interactions=1):
+    return [{'memberSlug': "kara", 'potentialFromJobs': total_dollars, 'completedMissions': 0.0,
+             'totalInteractions': interactions}]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EarningsHistoryStore(tmp_path / "earnings_history.sqlite3")
+
+
+class TestEarningsHistoryStore:
+    """Test suite for the rollups and retention of the time series."""
+
+    def test_snapshots_roll_up(self, store):
+        """Minute points keep each sample; the hour bucket keeps the latest value and the range."""
+        for minute, total in enumerate([10.0, 30.0, 20.0]):
+            store.record(_kara(total), T0 + minute * 60)
+
+        minutes = store.query("kara", T0, T0 + 3600, resolution="minute")['points']
+        hours = store.query("kara", T0, T0 + 3600, resolution="hour")['points']
+
+        assert [point['grandTotal'] for point in minutes] == [10.0, 30.0, 20.0]
+        assert hours == [{
+            'time': T0, 'potentialFromJobs': 20.0, 'completedMissions': 0.0, 'grandTotal': 20.0,
+            'minGrandTotal': 10.0, 'maxGrandTotal': 30.0, 'totalInteractions': 1, 'samples': 3
+        }]
+
+    def test_old_points_downsample(self, store):
+        """After a day only the hour and day rollups of a sample remain."""
+        store.record(_kara(5.0), T0)
+        now = T0 + 2 * 86400
+
+        store.prune(now)
+
+        assert store.query("kara", T0, now, resolution="minute")['points'] == []
+        assert store.query("kara", T0, now, now=now)['resolution'] == "hour"
+        assert [point['grandTotal'] for point in store.query("kara", T0, now, now=now)['points']] == [5.0]
+        assert choose_resolution(T0, T0 + 40 * 86400) == "day"
+
+
+class TestEarningsHistoryEndpoint:
+    """Test suite for sampling from the graph and serving ranges without it."""
+
+    def test_history_served_without_graph(self, falkordb_standin, app_client, store, monkeypatch):
+        """A snapshot reads the graph once per pass; the history endpoint not at all."""
+        g = falkordb_standin.graph(settings.graph_name)
+        g.query(
+            "CREATE (job:U4_Work_Item {slug: 'job-1', name: 'Chatbot', work_type: 'job', scope_ref: 'scopelock', "
+            "status: 'active', value: 1000, teamPool: 300.0}) "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'kara'})-[:U4_ABOUT]->(job)"
+        )
+        asyncio.run(interaction_counters.rebuild_interaction_counters())
+        asyncio.run(record_earnings_snapshot(store))
+
+        monkeypatch.setattr(compensation, "earnings_history", store)
+        client = app_client(compensation.router)
+        served = falkordb_standin.requests_served
+
+        response = client.get("/api/compensation/earnings/kara/history")
+        invalid = client.get("/api/compensation/earnings/kara/history?resolution=week")
+
+        assert falkordb_standin.requests_served == served
+        body = response.json()
+        assert body['resolution'] == "hour"
+        assert [point['grandTotal'] for point in body['points']] == [300.0]
+        assert invalid.status_code == 400
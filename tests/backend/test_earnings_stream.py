@@ -0,0 +1,179 @@
+"""
+Backend Tests: Earnings Push Stream
+Maps to: services/compensation/earnings_stream.py, services/change_feed.py (SSE earnings updates)
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.compensation import EarningsResponse
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.change_feed import TOPIC_FUND, ChangeFeed
+from app.api.mission_deck.services.compensation.earnings_calculator import (
+    calculate_member_full_earnings,
+    get_member_earnings_stamp
+)
+from app.api.mission_deck.services.compensation.earnings_stream import payload_version, stream_member_earnings
+
+
+@pytest.fixture
+def fast_stream(falkordb_standin, monkeypatch):
+    """Stand-in graph with one active job; short stream timings."""
+    monkeypatch.setattr(settings, "earnings_stream_keepalive_seconds", 0.05)
+    monkeypatch.setattr(settings, "earnings_stream_debounce_seconds", 0.01)
+    monkeypatch.setattr(settings, "earnings_stream_refresh_seconds", 60.0)
+    monkeypatch.setattr(settings, "earnings_stream_signal_seconds", 0.02)
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Work_Item {slug: 'job-1', name: 'Chatbot', work_type: 'job', scope_ref: 'scopelock', "
+        "status: 'active', value: 1000, teamPool: 300.0}),"
+        "       (:U4_Work_Item {slug: 'mission-47', work_type: 'mission', scope_ref: 'scopelock', "
+        "status: 'claimed', claimedBy: 'kara', fixedPayment: 150.0, updated_at: '2025-11-07T10:00:00Z'})"
+    )
+    return falkordb_standin
+
+
+async def _compute_kara():
+    return EarningsResponse(**await calculate_member_full_earnings("kara")).model_dump()
+
+
+async def _stamp_kara():
+    return await get_member_earnings_stamp("kara")
+
+
+async def _collect(actions, last_event_id=None, settle=0.15, signal=None):
+    """
+    Run the stream for kara while performing `actions` (coroutine functions,
+    each followed by `settle` seconds), then disconnect. Returns the SSE messages.
+    """
+    messages = []
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    async def consume():
+        async for message in stream_member_earnings("kara", _compute_kara, is_disconnected, last_event_id, signal):
+            messages.append(message)
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(settle)
+    for action in actions:
+        await action()
+        await asyncio.sleep(settle)
+    disconnected = True
+    await asyncio.wait_for(consumer, timeout=1.0)
+    return messages
+
+
+def _earnings_events(messages):
+    return [json.loads(m.split("data: ", 1)[1]) for m in messages if m.startswith("event: earnings")]
+
+
+class TestEarningsStream:
+    """Test suite for pushing earnings only when inputs change."""
+
+    def test_pushes_on_connect_and_on_job_message(self, fast_stream):
+        """A chat message on an active job pushes new earnings; idle time sends keep-alives."""
+        async def chat():
+            await graph.create_chat_message("job-1", "user", "Shipped the webhook", "kara")
+
+        messages = asyncio.run(_collect([chat]))
+
+        assert messages[0] == "retry: 5000\n\n"
+        pushed = _earnings_events(messages)
+        assert [event["potentialFromJobs"] for event in pushed] == [0.0, 300.0]
+        assert ": keep-alive\n\n" in messages
+
+    def test_irrelevant_changes_push_nothing(self, fast_stream):
+        """Mission chat and fund changes that leave earnings unchanged don't push."""
+        async def mission_chat():
+            await graph.create_chat_message("mission-47", "user", "Status?", "kara")
+
+        async def fund_change():
+            from app.api.mission_deck.services.change_feed import publish_change
+            publish_change(TOPIC_FUND)
+
+        messages = asyncio.run(_collect([mission_chat, fund_change]))
+
+        assert len(_earnings_events(messages)) == 1
+
+    def test_mission_completed_out_of_process_pushes_via_signal(self, fast_stream):
+        """A mission completion written by another process (no feed event) is noticed from updated_at."""
+        async def complete_from_cli():
+            fast_stream.graph(settings.graph_name).query(
+                "MATCH (m:U4_Work_Item {slug: 'mission-47'}) "
+                "SET m.status = 'completed', m.updated_at = '2025-11-07T12:00:00Z'"
+            )
+
+        messages = asyncio.run(_collect([complete_from_cli], signal=_stamp_kara))
+
+        pushed = _earnings_events(messages)
+        assert [event["completedMissions"] for event in pushed] == [0.0, 150.0]
+
+    def test_out_of_process_change_without_signal_waits_for_refresh(self, fast_stream):
+        """Without the signal, only the periodic refresh would pick the completion up."""
+        async def complete_from_cli():
+            fast_stream.graph(settings.graph_name).query(
+                "MATCH (m:U4_Work_Item {slug: 'mission-47'}) "
+                "SET m.status = 'completed', m.updated_at = '2025-11-07T12:00:00Z'"
+            )
+
+        messages = asyncio.run(_collect([complete_from_cli]))
+
+        assert len(_earnings_events(messages)) == 1
+
+    def test_reconnect_with_current_version_skips_initial_push(self, fast_stream):
+        """Last-Event-ID equal to the current payload version means nothing to resend."""
+        version = payload_version(asyncio.run(_compute_kara()))
+
+        messages = asyncio.run(_collect([], last_event_id=version))
+
+        assert _earnings_events(messages) == []
+        assert ": keep-alive\n\n" in messages
+
+    def test_recompute_failure_is_a_named_event(self, fast_stream):
+        """Graph errors go out as "earnings-error", never EventSource's built-in "error"."""
+        async def failing():
+            raise RuntimeError("graph down")
+
+        async def disconnected():
+            return True
+
+        async def scenario():
+            messages = []
+            async for message in stream_member_earnings("kara", failing, disconnected):
+                messages.append(message)
+            return messages
+
+        messages = asyncio.run(scenario())
+
+        assert any(m.startswith("event: earnings-error\n") for m in messages)
+        assert not any(m.startswith("event: error") for m in messages)
+
+
+class TestChangeFeed:
+    """Test suite for the in-process change feed."""
+
+    def test_publish_from_another_thread(self):
+        """Blocking writers on other threads can publish onto the loop safely."""
+        feed = ChangeFeed()
+
+        async def scenario():
+            subscription = feed.subscribe()
+            thread = threading.Thread(target=feed.publish, args=("missions", "kara"))
+            thread.start()
+            woken = await subscription.wait(timeout=1.0)
+            thread.join()
+            events = subscription.drain()
+            subscription.close()
+            return woken, events
+
+        woken, events = asyncio.run(scenario())
+
+        assert woken
+        assert events == {("missions", "kara")}
+        assert feed.subscriber_count() == 0
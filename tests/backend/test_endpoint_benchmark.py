@@ -0,0 +1,56 @@
+"""
+Backend Tests: Endpoint Benchmark Suite
+Maps to: backend/scripts/bench_endpoints.py (graph round-trip regression gate)
+"""
+
+import asyncio
+import json
+
+from scripts.bench_endpoints import (
+    DEFAULT_BASELINE,
+    ENDPOINTS,
+    compare_with_baseline,
+    run_benchmark,
+)
+
+
+def _report(round_trips: float, p95: float) -> dict:
+    return {
+        "config": {"seed": {"jobs": 1}, "cache": False, "graph_backend": "standin", "graph_latency_ms": 0.0},
+        "results": {"earnings": {"1": {"round_trips_per_request": round_trips, "p95_ms": p95}}},
+    }
+
+
+class TestEndpointBenchmark:
+    """Test suite for the benchmark's baseline gate."""
+
+    def test_round_trips_do_not_regress_from_baseline(self):
+        """
+        Test: Every benchmarked endpoint answers 200 and needs no more graph
+        round trips per request than the committed baseline
+        Maps to: backend/benchmarks/endpoints_baseline.json
+        """
+        baseline = json.loads(DEFAULT_BASELINE.read_text())
+        # One request per member: per-member costs average the same as the baseline run
+        requests = baseline["config"]["seed"]["members"]
+
+        report = asyncio.run(run_benchmark(
+            baseline["config"]["seed"], concurrency_levels=[1], requests=requests, warmup=1
+        ))
+
+        for endpoint in ENDPOINTS:
+            assert report["results"][endpoint]["1"]["status_codes"] == {"200": requests}, endpoint
+        assert compare_with_baseline(report, baseline, check_latency=False) == []
+
+    def test_regressions_are_reported(self):
+        """More round trips, or a p95 beyond tolerance and floor, is a regression."""
+        baseline = _report(round_trips=3.0, p95=10.0)
+
+        assert compare_with_baseline(_report(3.0, 11.0), baseline) == []
+        assert len(compare_with_baseline(_report(4.0, 10.0), baseline)) == 1
+        assert len(compare_with_baseline(_report(3.0, 20.0), baseline)) == 1
+        assert compare_with_baseline(_report(3.0, 20.0), baseline, check_latency=False) == []
+
+        other_seed = _report(3.0, 10.0)
+        other_seed["config"]["seed"] = {"jobs": 2}
+        assert compare_with_baseline(other_seed, baseline)[0].startswith("config mismatch")
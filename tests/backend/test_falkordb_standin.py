@@ -0,0 +1,228 @@
+"""
+Backend Tests: In-Process FalkorDB Stand-in
+Maps to: backend/scripts/falkordb_standin.py (hermetic graph for tests and benchmarks)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.compensation import earnings_calculator, tier_calculator
+from app.api.mission_deck.services.graph_decoder import decode_result
+from scripts.falkordb_standin import CypherError, FalkorDBStandin, StandinGraph
+
+
+def _rows(raw):
+    """Decode a stand-in result into dict rows."""
+    return [dict(row) for row in decode_result(raw)]
+
+
+@pytest.fixture
+def g():
+    """Empty stand-in graph."""
+    return StandinGraph()
+
+
+class TestStandinCypher:
+    """Test suite for the Cypher subset the app and fixtures use."""
+
+    def test_create_and_match_by_properties(self, g):
+        """CREATE with a property map, then MATCH by label + property."""
+        g.query("CREATE (m:U4_Work_Item {slug: 'mission-47', work_type: 'mission', budget_cents: 30000})")
+        g.query("CREATE (m:U4_Work_Item {slug: 'mission-48', work_type: 'mission'})")
+
+        raw = g.query("MATCH (m:U4_Work_Item {slug: $slug}) RETURN m", {"slug": "mission-47"})
+
+        assert raw[0] == ["m"]
+        node = decode_result(raw)[0]["m"]
+        assert node["_labels"] == ["U4_Work_Item"]
+        assert node["budget_cents"] == 30000
+        assert any(line.startswith("Query internal execution time") for line in raw[2])
+
+    def test_cypher_preamble_parameters(self, g):
+        """Parameters sent as FalkorDB's CYPHER preamble bind like $params."""
+        g.query("CYPHER slug='felix' tags=['a', 'b'] CREATE (:U4_Agent {slug: $slug, tags: $tags})")
+
+        rows = _rows(g.query("CYPHER s='felix' MATCH (a:U4_Agent {slug: $s}) RETURN a.tags AS tags"))
+
+        assert rows == [{"tags": ["a", "b"]}]
+
+    def test_relationship_patterns_and_grouped_counts(self, g):
+        """Relationship chains in both directions with grouping aggregates."""
+        g.query("CREATE (:U4_Work_Item {slug: 'job-1', work_type: 'job'})")
+        for actor, count in (("member_a", 3), ("member_b", 1)):
+            for i in range(count):
+                g.query(
+                    "MATCH (job:U4_Work_Item {slug: 'job-1'}) "
+                    "CREATE (:U4_Event {slug: $slug, event_kind: 'message', actor_ref: $actor})-[:U4_ABOUT]->(job)",
+                    {"slug": f"{actor}-{i}", "actor": actor}
+                )
+
+        rows = _rows(g.query("""
+            MATCH (job:U4_Work_Item {slug: 'job-1'})
+            OPTIONAL MATCH (job)<-[:U4_ABOUT]-(msg:U4_Event)
+            WHERE msg.event_kind = 'message'
+            WITH job, msg
+            WHERE msg IS NOT NULL
+            RETURN msg.actor_ref AS member_slug, count(msg) AS interaction_count
+            ORDER BY interaction_count DESC
+        """))
+
+        assert rows == [
+            {"member_slug": "member_a", "interaction_count": 3},
+            {"member_slug": "member_b", "interaction_count": 1},
+        ]
+
+    def test_optional_match_keeps_row_with_nulls(self, g):
+        """OPTIONAL MATCH without a match binds null instead of dropping the row."""
+        g.query("CREATE (:U4_Work_Item {slug: 'quiet-job'})")
+
+        rows = _rows(g.query("""
+            MATCH (job:U4_Work_Item {slug: 'quiet-job'})
+            OPTIONAL MATCH (job)<-[:U4_ABOUT]-(msg:U4_Event)
+            RETURN job.slug AS slug, count(msg) AS messages
+        """))
+
+        assert rows == [{"slug": "quiet-job", "messages": 0}]
+
+    def test_merge_on_create_and_on_match(self, g):
+        """MERGE creates once, then applies ON MATCH SET."""
+        cypher = """
+            MERGE (fund:U4_Account {accountType: 'mission_fund'})
+            ON CREATE SET fund.balance = $amount
+            ON MATCH SET fund.balance = fund.balance + $amount
+            RETURN fund.balance AS balance
+        """
+        assert _rows(g.query(cypher, {"amount": 50.0})) == [{"balance": 50.0}]
+        assert _rows(g.query(cypher, {"amount": 25.0})) == [{"balance": 75.0}]
+        assert len(g.store.nodes_with_label("U4_Account")) == 1
+
+    def test_where_predicates_and_functions(self, g):
+        """IN, STARTS WITH, CASE, coalesce and pattern predicates in WHERE/RETURN."""
+        g.query("CREATE (:T {slug: 'test-a', state: 'todo', n: 1})")
+        g.query("CREATE (:T {slug: 'test-b', state: 'done', n: 2})")
+        g.query("CREATE (:T {slug: 'other', state: 'doing'})")
+        g.query("MATCH (a:T {slug: 'test-a'}), (b:T {slug: 'test-b'}) CREATE (a)-[:NEXT]->(b)")
+
+        rows = _rows(g.query("""
+            MATCH (t:T)
+            WHERE t.slug STARTS WITH 'test-' AND t.state IN ['todo', 'done']
+            RETURN t.slug AS slug,
+                   CASE WHEN t.state = 'done' THEN 1 ELSE 0 END AS done,
+                   coalesce(t.missing, t.n) AS n,
+                   exists((t)-[:NEXT]->(:T)) AS has_next
+            ORDER BY slug
+        """))
+
+        assert rows == [
+            {"slug": "test-a", "done": 0, "n": 1, "has_next": True},
+            {"slug": "test-b", "done": 1, "n": 2, "has_next": False},
+        ]
+
+    def test_unwind_set_and_detach_delete(self, g):
+        """UNWIND-driven updates and DETACH DELETE report their write counts."""
+        g.query("UNWIND $slugs AS slug CREATE (:Task {slug: slug, state: 'todo'})", {"slugs": ["t1", "t2", "t3"]})
+
+        raw = g.query("""
+            UNWIND $updates AS u
+            MATCH (t:Task {slug: u.slug})
+            SET t.state = u.state
+            RETURN count(t) AS updated
+        """, {"updates": [{"slug": "t1", "state": "done"}, {"slug": "t3", "state": "doing"}]})
+        assert _rows(raw) == [{"updated": 2}]
+        assert "Properties set: 2" in raw[2]
+
+        states = _rows(g.query("MATCH (t:Task) RETURN t.slug AS slug, t.state AS state ORDER BY slug"))
+        assert [row["state"] for row in states] == ["done", "todo", "doing"]
+
+        raw = g.query("MATCH (t:Task) WHERE t.state <> 'todo' DETACH DELETE t")
+        assert "Nodes deleted: 2" in raw[2]
+        assert _rows(g.query("MATCH (t:Task) RETURN count(t) AS c")) == [{"c": 1}]
+
+    def test_unsupported_query_raises(self, g):
+        """Syntax errors and unsupported constructs raise CypherError."""
+        with pytest.raises(CypherError):
+            g.query("MATCH (a)-[*1..3]->(b) RETURN b")
+        with pytest.raises(CypherError):
+            g.query("MATCH (n RETURN n")
+        with pytest.raises(CypherError, match="Missing parameters"):
+            g.query("MATCH (n {slug: $slug}) RETURN n")
+        # FalkorDB has no datetime() - the stand-in must not be more permissive
+        with pytest.raises(CypherError, match="datetime"):
+            g.query("CREATE (:T {created_at: datetime()})")
+
+
+class TestStandinProtocol:
+    """Test suite for the /admin/query REST protocol."""
+
+    def test_single_and_batched_requests(self):
+        """Single queries answer {"result"}, batches answer {"results"} in order."""
+        standin = FalkorDBStandin(api_key="secret")
+        client = httpx.Client(transport=standin.transport(), headers={"X-API-Key": "secret"})
+
+        response = client.post("http://standin/admin/query", json={
+            "graph_name": "scopelock",
+            "queries": [
+                {"query": "CREATE (:U4_Agent {slug: $slug})", "params": {"slug": "kara"}},
+                {"query": "MATCH (a:U4_Agent) RETURN a.slug AS slug", "params": {}},
+            ],
+        })
+        assert response.status_code == 200
+        assert response.json()["results"][1][1] == [["kara"]]
+
+        response = client.post("http://standin/admin/query", json={
+            "graph_name": "scopelock", "query": "MATCH (a:U4_Agent) RETURN count(a)"
+        })
+        assert response.json()["result"][1] == [[1]]
+
+    def test_errors_and_auth(self):
+        """Bad Cypher answers 400, a wrong API key answers 401."""
+        standin = FalkorDBStandin(api_key="secret")
+
+        status, body = standin.handle({"graph_name": "g", "query": "MATCH (n"}, api_key="secret")
+        assert status == 400 and "error" in body
+
+        status, _ = standin.handle({"graph_name": "g", "query": "RETURN 1"}, api_key="wrong")
+        assert status == 401
+
+
+class TestStandinWithMissionDeck:
+    """Test suite running the real graph services against the stand-in."""
+
+    def test_chat_message_pipeline_round_trip(self, falkordb_standin):
+        """create_chat_message (pipelined create + link) is visible to reads."""
+        asyncio.run(graph.query_graph(
+            "CREATE (:U4_Work_Item {slug: 'mission-47', scope_ref: 'scopelock', work_type: 'mission'})"
+        ))
+
+        message = asyncio.run(graph.create_chat_message("mission-47", "user", "Deploy today?", "kara"))
+        assert message["content"] == "Deploy today?"
+
+        rows = asyncio.run(graph.query_graph("""
+            MATCH (msg:U4_Event)-[:U4_ABOUT]->(m:U4_Work_Item {slug: $slug})
+            RETURN msg.actor_ref AS actor, msg.commitments AS commitments
+        """, {"slug": "mission-47"}))
+        assert [dict(row) for row in rows] == [{"actor": "kara", "commitments": []}]
+        assert falkordb_standin.requests_served == 3
+
+    def test_compensation_services(self, falkordb_standin):
+        """Mission fund and job earnings services compute from stand-in data."""
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("50"), "job-1", Decimal("1000")))
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("25"), "job-2", Decimal("500")))
+        asyncio.run(tier_calculator.decrease_mission_fund(Decimal("5"), "mission-1"))
+        assert asyncio.run(tier_calculator.get_mission_fund_balance(use_cache=False)) == Decimal("70.0")
+
+        falkordb_standin.graph("scopelock").query(
+            "CREATE (:U4_Work_Item {slug: 'job-1', work_type: 'job', scope_ref: 'scopelock', "
+            "status: 'active', value: 1000, teamPool: 300.0, name: 'Chatbot'})"
+        )
+        for i, actor in enumerate(("member_a", "member_a", "member_b")):
+            asyncio.run(graph.create_chat_message("job-1", "user", f"Update {i}", actor))
+
+        earnings = asyncio.run(earnings_calculator.calculate_member_total_potential_earnings("member_a"))
+
+        assert earnings["total"] == 200.0
+        assert earnings["jobs"][0]["teamTotal"] == 3
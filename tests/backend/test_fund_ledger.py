@@ -0,0 +1,90 @@
+"""
+Backend Tests: Mission Fund Ledger
+Maps to: services/compensation/fund_ledger.py, tier_calculator.py (guarded single-statement fund writes)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services.compensation import fund_ledger, tier_calculator
+
+
+def _fund_with(standin, balance):
+    standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock', balance: $balance})",
+        {"balance": balance}
+    )
+
+
+def _transactions(standin):
+    return standin.graph(settings.graph_name).query(
+        "MATCH (tx:U4_Transaction)-[:U4_ABOUT]->(:U4_Account) "
+        "RETURN tx.kind, tx.amount, tx.balance_after ORDER BY tx.balance_after DESC"
+    )[1]
+
+
+class TestFundLedger:
+    """Test suite for race-free fund mutations with an append-only ledger."""
+
+    def test_writes_append_ledger_entries(self, falkordb_standin):
+        """Credits and debits are each one round trip and the ledger adds up to the balance."""
+        served = falkordb_standin.requests_served
+
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("50"), "job-1", Decimal("1000")))
+        balance = asyncio.run(tier_calculator.decrease_mission_fund(Decimal("5"), "mission-1"))
+
+        assert falkordb_standin.requests_served == served + 2
+        assert balance == Decimal("45.0")
+        assert _transactions(falkordb_standin) == [["credit", 50.0, 50.0], ["debit", 5.0, 45.0]]
+        assert asyncio.run(fund_ledger.check_fund_ledger()) == {
+            'balance': 45.0, 'ledgerBalance': 45.0, 'drift': 0.0, 'transactions': 2
+        }
+
+    def test_retried_writes_apply_once(self, falkordb_standin):
+        """Same job credited twice / same mission paid twice: the ledger keeps one entry each."""
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("50"), "job-1", Decimal("1000")))
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("50"), "job-1", Decimal("1000")))
+        asyncio.run(tier_calculator.decrease_mission_fund(Decimal("10"), "mission-1"))
+        retried = asyncio.run(tier_calculator.decrease_mission_fund(Decimal("10"), "mission-1"))
+
+        assert retried == Decimal("40.0")
+        assert asyncio.run(tier_calculator.get_mission_fund_balance(use_cache=False)) == Decimal("40.0")
+        assert len(_transactions(falkordb_standin)) == 2
+
+    def test_overdraw_is_rejected(self, falkordb_standin):
+        """A debit the balance can't cover fails loud and writes nothing."""
+        _fund_with(falkordb_standin, 20.0)
+
+        with pytest.raises(ValueError, match="Insufficient mission fund balance"):
+            asyncio.run(tier_calculator.decrease_mission_fund(Decimal("25"), "mission-1"))
+
+        assert asyncio.run(tier_calculator.get_mission_fund_balance(use_cache=False)) == Decimal("20.0")
+        assert _transactions(falkordb_standin) == []
+
+    def test_concurrent_payouts_cannot_overdraw(self, falkordb_standin):
+        """Five concurrent $30 payouts on a $100 fund: exactly three land."""
+        _fund_with(falkordb_standin, 100.0)
+
+        async def payouts():
+            return await asyncio.gather(
+                *(tier_calculator.decrease_mission_fund(Decimal("30"), f"mission-{i}") for i in range(5)),
+                return_exceptions=True
+            )
+
+        outcomes = asyncio.run(payouts())
+
+        assert sum(isinstance(outcome, ValueError) for outcome in outcomes) == 2
+        assert asyncio.run(tier_calculator.get_mission_fund_balance(use_cache=False)) == Decimal("10.0")
+
+    def test_opening_entry_accounts_for_pre_ledger_balance(self, falkordb_standin):
+        """A fund that predates the ledger gets one opening entry, then checks clean."""
+        _fund_with(falkordb_standin, 120.0)
+        asyncio.run(tier_calculator.decrease_mission_fund(Decimal("20"), "mission-1"))
+        assert asyncio.run(fund_ledger.check_fund_ledger())['drift'] == 120.0
+
+        assert asyncio.run(fund_ledger.open_fund_ledger()) == 120.0
+        assert asyncio.run(fund_ledger.open_fund_ledger()) is None
+        assert asyncio.run(fund_ledger.check_fund_ledger())['drift'] == 0.0
@@ -0,0 +1,88 @@
+"""
+Backend Tests: Mission Fund Snapshot
+Maps to: services/compensation/tier_calculator.py (in-memory balance/tier, write-through fund updates)
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services.compensation import tier_calculator
+from app.api.mission_deck.services.compensation.tier_calculator import FundSnapshot, fund_snapshot
+
+
+@pytest.fixture
+def fund(falkordb_standin):
+    """Stand-in graph with a $150 mission fund (Tier 2)."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Account {accountType: 'mission_fund', scope_ref: 'scopelock', balance: 150.0})"
+    )
+    return falkordb_standin
+
+
+class TestFundSnapshot:
+    """Test suite for serving tier lookups from memory."""
+
+    def test_tier_lookups_share_one_read(self, fund):
+        """Tier, every mission payment and the balance cost one graph request together."""
+        served = fund.requests_served
+
+        async def lookups():
+            tier, balance = await tier_calculator.get_current_tier()
+            payments = await tier_calculator.get_all_mission_payments()
+            proposal = await tier_calculator.get_mission_payment("proposal")
+            return tier, balance, payments, proposal
+
+        tier, balance, payments, proposal = asyncio.run(lookups())
+
+        assert fund.requests_served == served + 1
+        assert (tier, balance) == (2, Decimal("150.0"))
+        assert payments["recruitment"] == Decimal("12.00")
+        assert proposal == Decimal("1.50")
+
+    def test_fund_writes_update_snapshot(self, fund):
+        """increase/decrease write the returned balance through - no re-read."""
+        asyncio.run(tier_calculator.get_current_tier())
+
+        asyncio.run(tier_calculator.increase_mission_fund(Decimal("60"), "job-1", Decimal("1200")))
+        served = fund.requests_served
+
+        assert asyncio.run(tier_calculator.get_current_tier()) == (1, Decimal("210.0"))
+        assert fund.requests_served == served
+
+    def test_snapshot_expires(self, fund, monkeypatch):
+        """Changes from other writers show up once the TTL passes."""
+        monkeypatch.setattr(fund_snapshot, "ttl", 0.0)
+        asyncio.run(tier_calculator.get_current_tier())
+        fund.graph(settings.graph_name).query(
+            "MATCH (fund:U4_Account {accountType: 'mission_fund'}) SET fund.balance = 40.0"
+        )
+
+        assert asyncio.run(tier_calculator.get_current_tier()) == (4, Decimal("40.0"))
+
+    def test_read_racing_a_write_is_not_stored(self):
+        """A balance read before a write landed must not overwrite the written one."""
+        snapshot = FundSnapshot(ttl=60.0)
+        generation = snapshot.generation
+
+        snapshot.begin_write()
+        snapshot.end_write(Decimal("210"))
+        snapshot.store(Decimal("150"), generation)
+
+        assert snapshot.get() == (1, Decimal("210"))
+
+    def test_overlapping_writes_drop_snapshot(self):
+        """Concurrent writes can't order their results - the next lookup re-reads."""
+        snapshot = FundSnapshot(ttl=60.0)
+
+        snapshot.begin_write()
+        snapshot.begin_write()
+        snapshot.end_write(Decimal("250"))
+        snapshot.end_write(Decimal("210"))
+
+        assert snapshot.get() is None
+        snapshot.begin_write()
+        snapshot.end_write(Decimal("90"))
+        assert snapshot.get() == (3, Decimal("90"))
@@ -0,0 +1,106 @@
+"""
+Backend Tests: Graph Result Cache
+Maps to: services/graph_cache.py (read-through cache in front of query_graph)
+"""
+
+import time
+
+import pytest
+
+from app.api.mission_deck.services.graph_cache import (
+    GraphResultCache,
+    cache_tag,
+    make_cache_key,
+)
+
+
+@pytest.fixture
+def cache():
+    """Small cache so eviction bounds are easy to hit."""
+    return GraphResultCache(max_entries=3, max_bytes=1000)
+
+
+class TestGraphResultCache:
+    """Test suite for TTL, LRU and tag invalidation behaviour."""
+
+    def test_hit_and_miss_counters(self, cache):
+        """Second lookup of a stored key is a hit."""
+        key = make_cache_key("MATCH (m) RETURN m", {"slug": "mission-47"})
+
+        assert cache.get(key) == (False, None)
+        cache.set(key, [{"m": 1}], ttl=30, size=10)
+
+        assert cache.get(key) == (True, [{"m": 1}])
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_params_are_part_of_the_key(self):
+        """Same Cypher with different params must not share an entry."""
+        cypher = "MATCH (m {slug: $slug}) RETURN m"
+
+        assert make_cache_key(cypher, {"slug": "a"}) != make_cache_key(cypher, {"slug": "b"})
+
+    def test_entries_expire_after_ttl(self, cache):
+        """Expired entries count as misses and are dropped."""
+        cache.set("k", ["v"], ttl=0.01, size=1)
+        time.sleep(0.02)
+
+        assert cache.get("k") == (False, None)
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_entry_count(self, cache):
+        """Least recently used entry is evicted first."""
+        for key in ("a", "b", "c"):
+            cache.set(key, key, ttl=30, size=1)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("d", "d", ttl=30, size=1)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, "a")
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_eviction_by_memory_bound(self, cache):
+        """Byte bound evicts old entries; oversized results are never cached."""
+        cache.set("a", "a", ttl=30, size=600)
+        cache.set("b", "b", ttl=30, size=600)
+        cache.set("huge", "x", ttl=30, size=5000)
+
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (True, "b")
+        assert cache.get("huge") == (False, None)
+        assert cache.stats()["bytes"] == 600
+
+    def test_slug_invalidation_drops_node_and_collection_reads(self):
+        """Writing mission-47 drops its entry and label-wide reads, not other missions."""
+        cache = GraphResultCache(max_entries=10, max_bytes=1000)
+        cache.set("mission-47", 1, ttl=30, tags=[cache_tag("U4_Work_Item", "mission-47")])
+        cache.set("mission-48", 2, ttl=30, tags=[cache_tag("U4_Work_Item", "mission-48")])
+        cache.set("user-missions", 3, ttl=30, tags=[cache_tag("U4_Work_Item")])
+        cache.set("fund", 4, ttl=30, tags=[cache_tag("U4_Account")])
+
+        dropped = cache.invalidate("U4_Work_Item", "mission-47")
+
+        assert dropped == 2
+        assert cache.get("mission-47")[0] is False
+        assert cache.get("user-missions")[0] is False
+        assert cache.get("mission-48") == (True, 2)
+        assert cache.get("fund") == (True, 4)
+
+    def test_label_invalidation_drops_every_entry_with_label(self, cache):
+        """Invalidating a whole label drops node and collection entries."""
+        cache.set("mission-47", 1, ttl=30, tags=[cache_tag("U4_Work_Item", "mission-47")])
+        cache.set("fund", 4, ttl=30, tags=[cache_tag("U4_Account")])
+
+        assert cache.invalidate("U4_Work_Item") == 1
+        assert cache.get("fund") == (True, 4)
+
+    def test_read_started_before_write_is_not_stored(self, cache):
+        """A read racing an invalidation must not cache pre-write results."""
+        generation = cache.generation
+        cache.invalidate("U4_Work_Item", "mission-47")
+
+        cache.set("mission-47", "stale", ttl=30,
+                  tags=[cache_tag("U4_Work_Item", "mission-47")], generation=generation)
+
+        assert cache.get("mission-47") == (False, None)
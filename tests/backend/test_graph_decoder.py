@@ -0,0 +1,117 @@
+"""
+Backend Tests: FalkorDB Result Decoder
+Maps to: services/graph_decoder.py (rows/nodes returned by query_graph)
+"""
+
+import json
+
+import pytest
+
+from app.api.mission_deck.services.graph_decoder import (
+    GraphNode,
+    GraphRelationship,
+    decode_result,
+    loads,
+    to_plain,
+)
+
+
+def _node(node_id, labels, **props):
+    """Verbose FalkorDB node cell."""
+    return [["id", node_id], ["labels", labels], ["properties", [[k, v] for k, v in props.items()]]]
+
+
+def _mission_result():
+    return [
+        ["m", "chat_count"],
+        [
+            [_node(0, ["U4_Work_Item"], slug="mission-47", name="Landing page", budget_cents=30000), 3],
+            [_node(1, ["U4_Work_Item"], slug="mission-48", name="Bot fix"), 0],
+        ],
+        ["Cached execution: 1"],
+    ]
+
+
+class TestGraphResultDecoder:
+    """Test suite for dict-compatible rows and nodes."""
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_rows_and_nodes_read_like_dicts(self, lazy):
+        """Existing call sites index rows and nodes exactly like the old dicts."""
+        rows = decode_result(_mission_result(), lazy=lazy)
+
+        assert len(rows) == 2
+        mission = rows[0]["m"]
+        assert isinstance(mission, GraphNode)
+        assert mission["slug"] == "mission-47"
+        assert mission.get("notes") is None
+        assert mission.get("notes", "") == ""
+        assert mission["_id"] == 0
+        assert mission["_labels"] == ["U4_Work_Item"]
+        assert "budget_cents" in mission and "notes" not in mission
+        assert rows[0]["chat_count"] == 3
+        assert rows[1].get("chat_count") == 0
+        assert rows[0][1] == 3
+
+    def test_plain_dict_conversion_matches_old_parser(self):
+        """dict(node) / to_plain give the same shape the dict parser produced."""
+        rows = decode_result(_mission_result())
+
+        assert dict(rows[1]["m"]) == {
+            "_id": 1, "_labels": ["U4_Work_Item"], "slug": "mission-48", "name": "Bot fix"
+        }
+        assert rows[1]["m"] == {
+            "_id": 1, "_labels": ["U4_Work_Item"], "slug": "mission-48", "name": "Bot fix"
+        }
+        plain = to_plain(rows)
+        assert json.loads(json.dumps(plain))[0]["m"]["budget_cents"] == 30000
+
+    def test_lazy_nodes_defer_property_dict(self):
+        """Lazy nodes only build their property dict when read."""
+        node = decode_result(_mission_result(), lazy=True)[0]["m"]
+
+        assert node._properties is None
+        assert node["name"] == "Landing page"
+        assert node._properties == {"slug": "mission-47", "name": "Landing page", "budget_cents": 30000}
+
+    def test_scalar_columns_are_left_untouched(self):
+        """Lists of pairs that aren't nodes (e.g. collect()) stay raw lists."""
+        raw = [["pairs", "total"], [[[["a", 1], ["b", 2]], 10]], []]
+
+        rows = decode_result(raw)
+
+        assert rows[0]["pairs"] == [["a", 1], ["b", 2]]
+        assert rows[0]["total"] == 10
+
+    def test_compact_header_and_relationships(self):
+        """Compact [type, name] headers and relationship cells decode by column type."""
+        rel = [["id", 7], ["type", "U4_ABOUT"], ["src_node", 0], ["dest_node", 1], ["properties", [["weight", 2]]]]
+        raw = [[[2, "m"], [3, "r"], [1, "n"]], [[_node(0, ["U4_Event"], slug="msg-1"), rel, None]], []]
+
+        row = decode_result(raw)[0]
+
+        assert row["m"]["slug"] == "msg-1"
+        assert isinstance(row["r"], GraphRelationship)
+        assert row["r"]["_type"] == "U4_ABOUT"
+        assert row["r"]["_dest"] == 1
+        assert row["r"].get("weight") == 2
+        assert row["n"] is None
+
+    def test_null_first_cell_and_short_rows(self):
+        """Column type comes from the first non-null cell; short rows miss keys."""
+        raw = [["m", "extra"], [[None], [_node(3, ["U4_Agent"], handle="felix")]], []]
+
+        rows = decode_result(raw)
+
+        assert rows[0]["m"] is None
+        assert rows[1]["m"]["handle"] == "felix"
+        assert "extra" not in rows[0]
+        assert rows[0].get("extra") is None
+        with pytest.raises(KeyError):
+            rows[0]["extra"]
+
+    def test_empty_results(self):
+        """Empty or malformed payloads decode to no rows."""
+        assert decode_result([]) == []
+        assert decode_result([["m"], [], []]) == []
+        assert loads(b'{"result": []}') == {"result": []}
@@ -0,0 +1,154 @@
+"""
+Backend Tests: Graph Query Metrics
+Maps to: services/graph_metrics.py (per-call-site metrics, slow-query log, /metrics)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.graph_metrics import graph_metrics, normalize_cypher
+
+
+@pytest.fixture
+def metrics(falkordb_standin):
+    """Empty metrics registry over a stand-in graph with one mission."""
+    graph_metrics.reset()
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Work_Item {slug: 'mission-47', scope_ref: 'scopelock', work_type: 'mission'})"
+    )
+    yield graph_metrics
+    graph_metrics.reset()
+
+
+async def _lookup_missions():
+    """A stand-in service function calling the graph client twice."""
+    for slug in ("mission-47", "mission-48"):
+        await graph.query_graph("MATCH (m:U4_Work_Item {slug: $slug}) RETURN m", {"slug": slug})
+
+
+class TestFingerprints:
+    """Test suite for query normalization."""
+
+    def test_literals_and_whitespace_are_normalized(self):
+        """Queries differing only in literals or layout share a shape."""
+        a = normalize_cypher("MATCH (m {slug: 'mission-47'})\n   RETURN m LIMIT 50")
+        b = normalize_cypher("MATCH (m {slug: \"other\"}) RETURN m LIMIT 10")
+
+        assert a == b == "MATCH (m {slug: ?}) RETURN m LIMIT ?"
+        assert normalize_cypher("MATCH (n:U4_Agent) WHERE n.x IN [1, 2, 3] RETURN n") == \
+            "MATCH (n:U4_Agent) WHERE n.x IN [?] RETURN n"
+
+    def test_parameters_keep_one_fingerprint_per_call_site(self):
+        """$params leave the text constant, so the fingerprint is too."""
+        cypher = "MATCH (m:U4_Work_Item {slug: $slug}) RETURN m"
+        assert graph_metrics.fingerprint(cypher) == graph_metrics.fingerprint(cypher + "\n")
+
+
+class TestCallSiteMetrics:
+    """Test suite for per-caller recording in query_graph."""
+
+    def test_queries_are_attributed_to_calling_function(self, metrics):
+        """Latency, rows and bytes land under the service function's label."""
+        asyncio.run(_lookup_missions())
+        asyncio.run(graph.get_mission_by_slug("mission-47"))
+
+        fingerprint = metrics.fingerprint("MATCH (m:U4_Work_Item {slug: $slug}) RETURN m")
+        stats = metrics.site_stats("test_graph_metrics:_lookup_missions", fingerprint)
+        assert stats.duration.count == 2
+        assert stats.rows.sum == 1  # mission-48 doesn't exist
+        assert stats.response_bytes.sum > 0
+        assert stats.request_bytes > 0
+
+        rendered = metrics.render()
+        assert 'caller="graph:get_mission_by_slug"' in rendered
+
+    def test_errors_are_counted_by_kind(self, metrics):
+        """A rejected query counts as an error with its HTTP status."""
+        async def broken_lookup():
+            await graph.query_graph("MATCH (n RETURN n")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(broken_lookup())
+
+        assert 'caller="test_graph_metrics:broken_lookup",fingerprint="' in metrics.render()
+        assert 'error="http_400"' in metrics.render()
+
+    def test_task_root_queries_are_unknown(self, metrics):
+        """A query scheduled directly as a task has no caller to credit."""
+        asyncio.run(graph.query_graph("MATCH (m:U4_Work_Item) RETURN m"))
+
+        assert 'caller="unknown"' in metrics.render()
+
+    def test_batch_statements_keep_the_batch_caller(self, metrics, monkeypatch):
+        """Pipelined and concurrent-fallback batches credit the submitting function."""
+        statements = [
+            ("MATCH (m:U4_Work_Item {slug: $slug}) RETURN m", {"slug": "mission-47"}),
+            ("MATCH (m:U4_Work_Item) RETURN count(m) AS c", None),
+        ]
+
+        async def load_batch():
+            return await graph.query_graph_many(statements)
+
+        asyncio.run(load_batch())
+        monkeypatch.setattr(settings, "falkordb_pipeline", "off")
+        asyncio.run(load_batch())
+
+        caller = "test_graph_metrics:load_batch"
+        for cypher, _ in statements:
+            stats = metrics.site_stats(caller, metrics.fingerprint(cypher))
+            assert stats.duration.count == 2
+            assert stats.rows.sum == 2
+
+
+class TestSlowQueryLog:
+    """Test suite for the slow-query log."""
+
+    def test_slow_queries_capture_text_and_timing(self, metrics, monkeypatch):
+        """Queries over the threshold are logged with text and param names, not values."""
+        monkeypatch.setattr(settings, "graph_slow_query_ms", 0.0001)
+
+        asyncio.run(_lookup_missions())
+
+        entry = metrics.get_slow_queries(limit=1)[0]
+        assert entry["caller"] == "test_graph_metrics:_lookup_missions"
+        assert entry["query"] == "MATCH (m:U4_Work_Item {slug: $slug}) RETURN m"
+        assert entry["params"] == ["slug"]
+        assert "mission-48" not in str(entry)
+        assert entry["durationMs"] >= 0
+
+    def test_threshold_zero_disables_log(self, metrics, monkeypatch):
+        """GRAPH_SLOW_QUERY_MS=0 turns the log off."""
+        monkeypatch.setattr(settings, "graph_slow_query_ms", 0.0)
+
+        asyncio.run(_lookup_missions())
+
+        assert metrics.get_slow_queries() == []
+
+
+class TestMetricsEndpoint:
+    """Test suite for GET /metrics."""
+
+    def test_prometheus_exposition(self, metrics):
+        """The scrape target serves histograms and client state as Prometheus text."""
+        from app.main import app
+
+        async def scrape():
+            await _lookup_missions()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+                return await client.get("/metrics")
+
+        response = asyncio.run(scrape())
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert "# TYPE graph_query_duration_seconds histogram" in body
+        assert 'graph_query_duration_seconds_count{caller="test_graph_metrics:_lookup_missions"' in body
+        assert 'le="+Inf"' in body
+        assert "graph_query_fingerprint_info{" in body
+        assert "graph_circuit_open 0" in body
@@ -0,0 +1,56 @@
+"""
+Backend Tests: Pipelined Graph Batches
+Maps to: services/graph.py (query_graph_many pipelining auto-probe)
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.graph_client import set_graph_transport
+
+CREATE_EVENT = "CREATE (:U4_Event {slug: 'evt-1', scope_ref: 'scopelock'})"
+COUNT_EVENTS = "MATCH (e:U4_Event {slug: 'evt-1'}) RETURN count(e) AS c"
+
+
+@pytest.fixture
+def unprobed(monkeypatch):
+    """Pipelining support not probed yet (auto mode)."""
+    monkeypatch.setattr(settings, "falkordb_pipeline", "auto")
+    monkeypatch.setattr(graph, "_pipeline_supported", None)
+
+
+def _event_count(standin):
+    return standin.graph(settings.graph_name).query(COUNT_EVENTS)[1][0][0]
+
+
+class TestPipelineProbe:
+    """Test suite for never re-running write batches after a failed pipeline."""
+
+    def test_failed_write_batch_is_not_rerun(self, falkordb_standin, unprobed):
+        """A write batch that partly ran and then failed raises instead of re-running statement by statement."""
+        with pytest.raises(httpx.HTTPError):
+            asyncio.run(graph.query_graph_many([CREATE_EVENT, "THIS IS NOT CYPHER"], ordered=True))
+
+        assert _event_count(falkordb_standin) == 1
+        assert graph._pipeline_supported is True
+
+    def test_proxy_without_batches_runs_writes_once(self, falkordb_standin, unprobed):
+        """Against a proxy that rejects batches, the read-only probe downgrades and each write runs once."""
+        standin_transport = falkordb_standin.async_transport()
+
+        async def no_batches(request):
+            if "queries" in json.loads(request.content):
+                return httpx.Response(404, json={"error": "Not found"})
+            return await standin_transport.handle_async_request(request)
+
+        set_graph_transport(httpx.MockTransport(no_batches), falkordb_standin.transport())
+
+        asyncio.run(graph.query_graph_many([CREATE_EVENT, COUNT_EVENTS], ordered=True))
+
+        assert graph._pipeline_supported is False
+        assert _event_count(falkordb_standin) == 1
@@ -0,0 +1,38 @@
+"""
+Backend Tests: Ad-hoc Graph Query
+Maps to: graph_query.py (GET /api/graph/query cache handling)
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.api.mission_deck import graph_query
+from app.api.mission_deck.services.compensation.tier_calculator import fund_snapshot
+from app.api.mission_deck.services.graph_cache import cache_tag, graph_cache, make_cache_key
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Graph query router on the stand-in graph, with one cached read and a fund snapshot."""
+    graph_cache.set(make_cache_key("MATCH (m) RETURN m", None), [], ttl=30, tags=[cache_tag("U4_Work_Item")], size=1)
+    fund_snapshot.store(Decimal("100"))
+    return app_client(graph_query.router)
+
+
+class TestAdHocQueryCaches:
+    """Test suite for which ad-hoc queries drop cached reads."""
+
+    def test_reads_keep_caches(self, client):
+        """A debugging read doesn't wipe other users' cached results."""
+        assert client.get("/api/graph/query", params={"q": "MATCH (n) RETURN count(n) AS c"}).status_code == 200
+
+        assert graph_cache.get(make_cache_key("MATCH (m) RETURN m", None))[0]
+        assert fund_snapshot.balance == Decimal("100")
+
+    def test_writes_clear_caches_and_fund_snapshot(self, client):
+        """An ad-hoc write drops every cached read, including the fund balance."""
+        client.get("/api/graph/query", params={"q": "CREATE (:U4_Account {accountType: 'mission_fund', balance: 5})"})
+
+        assert not graph_cache.get(make_cache_key("MATCH (m) RETURN m", None))[0]
+        assert fund_snapshot.balance is None
@@ -0,0 +1,183 @@
+"""
+Backend Tests: Graph Client Resilience
+Maps to: services/graph_resilience.py (retries, circuit breaker, hedged reads)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services.graph_resilience import (
+    CircuitBreaker,
+    GraphCircuitOpenError,
+    GraphResilience,
+    GraphUnavailableError,
+    is_read_only,
+)
+
+
+def _response(status: int) -> httpx.Response:
+    return httpx.Response(status, json={"result": []})
+
+
+class FlakyBackend:
+    """Scripted send(): each call pops the next outcome (status code, exception or delay)."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def send(self) -> httpx.Response:
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, tuple):
+            delay, status = outcome
+            await asyncio.sleep(delay)
+            return _response(status)
+        return _response(outcome)
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    """Fresh policy with instant backoff and a small breaker threshold."""
+    monkeypatch.setattr(settings, "graph_retry_base_delay", 0.0)
+    monkeypatch.setattr(settings, "graph_retry_attempts", 2)
+    monkeypatch.setattr(settings, "graph_breaker_failure_threshold", 3)
+    monkeypatch.setattr(settings, "graph_breaker_reset_timeout", 60.0)
+    monkeypatch.setattr(settings, "graph_hedge_enabled", False)
+    return GraphResilience()
+
+
+class TestRetries:
+    """Test suite for idempotent read retries."""
+
+    def test_read_is_retried_after_transient_failure(self, policy):
+        """A read that hits a 503 then succeeds returns the success."""
+        backend = FlakyBackend(503, httpx.ConnectError("refused"), 200)
+
+        response = asyncio.run(policy.execute(backend.send, idempotent=True))
+
+        assert response.status_code == 200
+        assert backend.calls == 3
+        assert policy.retries == 2
+        assert policy.breaker.state == CircuitBreaker.CLOSED
+
+    def test_write_is_never_retried(self, policy):
+        """A failed write fails fast - a lost response may still have applied."""
+        backend = FlakyBackend(httpx.ReadTimeout("slow"), 200)
+
+        with pytest.raises(GraphUnavailableError):
+            asyncio.run(policy.execute(backend.send, idempotent=False))
+        assert backend.calls == 1
+
+    def test_query_errors_are_not_retried(self, policy):
+        """4xx answers mean the backend is healthy - return them for raise_for_status."""
+        backend = FlakyBackend(400)
+
+        response = asyncio.run(policy.execute(backend.send, idempotent=True))
+
+        assert response.status_code == 400
+        assert backend.calls == 1
+        assert policy.breaker.consecutive_failures == 0
+
+    def test_retry_budget_caps_retries(self, policy):
+        """With the budget spent, failures are returned without retrying."""
+        policy.budget._tokens = 0.0
+        policy.budget.min_per_second = 0.0
+        backend = FlakyBackend(503, 200)
+
+        with pytest.raises(GraphUnavailableError):
+            asyncio.run(policy.execute(backend.send, idempotent=True))
+        assert backend.calls == 1
+        assert policy.budget.exhausted == 1
+
+    def test_read_only_detection(self):
+        """Write clauses disable retries; property names containing them don't."""
+        assert is_read_only("MATCH (m {slug: $slug}) RETURN m.created_at, m.reset_count")
+        assert not is_read_only("MATCH (m) SET m.state = 'done'")
+        assert not is_read_only("MERGE (f:U4_Account) ON CREATE SET f.balance = 0")
+        assert not is_read_only("MATCH (m) DETACH DELETE m")
+
+
+class TestCircuitBreaker:
+    """Test suite for failing fast while the backend is down."""
+
+    def test_opens_after_consecutive_failures(self, policy):
+        """Threshold failures open the circuit; later calls never reach the backend."""
+        backend = FlakyBackend(*[503] * 10)
+
+        for _ in range(3):
+            with pytest.raises(GraphUnavailableError):
+                asyncio.run(policy.execute(backend.send, idempotent=False))
+        calls_before = backend.calls
+
+        with pytest.raises(GraphCircuitOpenError):
+            asyncio.run(policy.execute(backend.send, idempotent=True))
+
+        assert backend.calls == calls_before
+        assert policy.stats()["breaker"]["state"] == "open"
+        assert policy.stats()["breaker"]["rejected"] == 1
+
+    def test_half_open_probe_closes_circuit(self, policy):
+        """After the reset timeout one probe goes through and closes the circuit on success."""
+        breaker = policy.breaker
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.opened_at -= breaker.reset_timeout
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()  # Only one probe at a time
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens_circuit(self, policy):
+        """A failing half-open probe reopens the circuit immediately."""
+        breaker = policy.breaker
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+
+
+class TestHedgedReads:
+    """Test suite for duplicate reads after the p95 delay."""
+
+    def test_slow_read_is_hedged(self, policy, monkeypatch):
+        """A primary slower than p95 loses to the hedge."""
+        monkeypatch.setattr(settings, "graph_hedge_enabled", True)
+        monkeypatch.setattr(settings, "graph_hedge_min_samples", 5)
+        monkeypatch.setattr(settings, "graph_hedge_min_delay", 0.01)
+        for _ in range(20):
+            policy.latency.record(0.01)
+
+        backend = FlakyBackend((0.5, 200), (0.0, 200))
+        response = asyncio.run(policy.execute(backend.send, idempotent=True))
+
+        assert response.status_code == 200
+        assert backend.calls == 2
+        hedging = policy.stats()["hedging"]
+        assert hedging["sent"] == 1
+        assert hedging["won"] == 1
+        assert hedging["delayMs"] == 10.0
+
+    def test_no_hedging_without_latency_history(self, policy, monkeypatch):
+        """Hedging waits for enough samples to know what "slow" is."""
+        monkeypatch.setattr(settings, "graph_hedge_enabled", True)
+        backend = FlakyBackend((0.05, 200))
+
+        asyncio.run(policy.execute(backend.send, idempotent=True))
+
+        assert backend.calls == 1
+        assert policy.hedges_sent == 0
@@ -0,0 +1,154 @@
+"""
+Backend Tests: Single-Flight Graph Reads
+Maps to: services/graph_singleflight.py (coalescing identical in-flight queries)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.graph_client import set_graph_transport
+from app.api.mission_deck.services.graph_singleflight import SingleFlight
+from scripts.bench_endpoints import GraphTrafficCounter, StandinBenchTransport
+
+MISSION_QUERY = "MATCH (m:U4_Work_Item {slug: $slug}) RETURN m.slug AS slug"
+
+
+@pytest.fixture
+def slow_graph(falkordb_standin):
+    """Stand-in graph answering after 20ms, so concurrent calls overlap."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (:U4_Work_Item {slug: 'mission-47'}), (:U4_Work_Item {slug: 'mission-48'})"
+    )
+    set_graph_transport(
+        StandinBenchTransport(falkordb_standin, GraphTrafficCounter(), 20.0),
+        falkordb_standin.transport()
+    )
+    return falkordb_standin
+
+
+async def _burst(*calls):
+    return await asyncio.gather(*calls, return_exceptions=True)
+
+
+class TestCoalescing:
+    """Test suite for sharing identical in-flight reads."""
+
+    def test_identical_concurrent_reads_share_one_request(self, slow_graph):
+        """Ten pollers asking the same thing cost one graph request."""
+        results = asyncio.run(_burst(*[
+            graph.query_graph(MISSION_QUERY, {"slug": "mission-47"}) for _ in range(10)
+        ]))
+
+        assert slow_graph.requests_served == 1
+        assert all([dict(row) for row in rows] == [{"slug": "mission-47"}] for rows in results)
+        assert len({id(rows) for rows in results}) == 10  # Each caller owns its list
+
+    def test_different_parameters_are_not_coalesced(self, slow_graph):
+        """Coalescing is keyed by query text and parameters."""
+        results = asyncio.run(_burst(
+            graph.query_graph(MISSION_QUERY, {"slug": "mission-47"}),
+            graph.query_graph(MISSION_QUERY, {"slug": "mission-48"}),
+            graph.query_graph(MISSION_QUERY, {"slug": "mission-47"}),
+        ))
+
+        assert slow_graph.requests_served == 2
+        assert [rows[0]["slug"] for rows in results] == ["mission-47", "mission-48", "mission-47"]
+
+    def test_writes_are_never_coalesced(self, slow_graph):
+        """Identical writes each run - both must apply."""
+        cypher = "MATCH (m:U4_Work_Item {slug: 'mission-47'}) SET m.polls = coalesce(m.polls, 0) + 1"
+
+        asyncio.run(_burst(graph.query_graph(cypher), graph.query_graph(cypher)))
+
+        assert slow_graph.requests_served == 2
+        rows = asyncio.run(graph.query_graph("MATCH (m:U4_Work_Item {slug: 'mission-47'}) RETURN m.polls AS p"))
+        assert rows[0]["p"] == 2
+
+    def test_read_after_write_does_not_join_earlier_read(self, falkordb_standin):
+        """A read issued after a write completes gets post-write data even while a pre-write read is in flight."""
+        falkordb_standin.graph(settings.graph_name).query(
+            "CREATE (m:U4_Work_Item {slug: 'm1', scope_ref: 'scopelock'}) "
+            "CREATE (:U4_Work_Item {slug: 't1', scope_ref: 'scopelock', state: 'todo'})"
+            "-[:U4_MEMBER_OF {role: 'dod_task'}]->(m)"
+        )
+        inner = falkordb_standin.transport()
+
+        class SlowChecklistReads(httpx.AsyncBaseTransport):
+            """Checklist reads see the graph now but answer 100ms later; everything else is instant."""
+
+            async def handle_async_request(self, request):
+                response = inner.handle_request(request)
+                await response.aread()
+                if b"RETURN task" in request.content and b"ORDER BY" in request.content:
+                    await asyncio.sleep(0.1)
+                return response
+
+        set_graph_transport(SlowChecklistReads(), inner)
+
+        async def interleave():
+            reader_a = asyncio.ensure_future(graph.get_mission_dod_items("m1"))
+            await asyncio.sleep(0.01)
+            await graph.update_dod_task_state("t1", "done", mission_slug="m1")
+            reader_b = await graph.get_mission_dod_items("m1")
+            return await reader_a, reader_b
+
+        before, after = asyncio.run(interleave())
+
+        assert before[0]["state"] == "todo"
+        assert after[0]["state"] == "done"
+
+    def test_disabled_sends_every_read(self, slow_graph, monkeypatch):
+        """GRAPH_COALESCE_ENABLED=false restores one request per call."""
+        monkeypatch.setattr(settings, "graph_coalesce_enabled", False)
+
+        asyncio.run(_burst(*[graph.query_graph(MISSION_QUERY, {"slug": "mission-47"}) for _ in range(3)]))
+
+        assert slow_graph.requests_served == 3
+
+
+class TestSingleFlight:
+    """Test suite for outcome sharing and cancellation."""
+
+    def test_errors_reach_every_caller(self):
+        """A failed shared call fails all of its callers, then the key is free again."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("refused")
+
+        async def scenario():
+            outcomes = await _burst(flight.do("k", fetch), flight.do("k", fetch))
+            retry = await asyncio.gather(flight.do("k", fetch), return_exceptions=True)
+            return outcomes + retry
+
+        outcomes = asyncio.run(scenario())
+
+        assert all(isinstance(outcome, httpx.ConnectError) for outcome in outcomes)
+        assert calls == 2
+        assert flight.stats()["coalesced"] == 1
+
+    def test_cancelled_leader_does_not_fail_followers(self):
+        """The shared call runs in its own task - a disconnected caller can't cancel it."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "rows"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("k", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("k", fetch))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(scenario()) == ("rows", True)
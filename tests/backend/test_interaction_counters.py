@@ -0,0 +1,126 @@
+"""
+Backend Tests: Materialized Interaction Counters
+Maps to: services/compensation/interaction_counters.py (job × member counters, reconcile)
+"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck.services import graph
+from app.api.mission_deck.services.compensation import earnings_calculator, interaction_counters
+
+
+@pytest.fixture
+def jobs(falkordb_standin):
+    """A job and a mission to chat about."""
+    g = falkordb_standin.graph(settings.graph_name)
+    g.query(
+        "CREATE (:U4_Work_Item {slug: 'job-1', work_type: 'job', scope_ref: 'scopelock', status: 'active', teamPool: 300.0}),"
+        "       (:U4_Work_Item {slug: 'mission-47', work_type: 'mission', scope_ref: 'scopelock'})"
+    )
+    return g
+
+
+def _counters(g):
+    rows = g.query("MATCH (c:U4_Interaction_Counter) RETURN c.job_slug, c.member_slug, c.count ORDER BY c.member_slug")
+    return [tuple(row) for row in rows[1]]
+
+
+class TestCounterMaintenance:
+    """Test suite for counters updated by create_chat_message."""
+
+    def test_job_messages_increment_counters(self, jobs):
+        """Each message about a job bumps its job × member counter; mission chat doesn't."""
+        for i, actor in enumerate(("kara", "kara", "reza")):
+            asyncio.run(graph.create_chat_message("job-1", "user", f"Status {i}", actor))
+        asyncio.run(graph.create_chat_message("mission-47", "user", "Mission chat", "kara"))
+
+        assert _counters(jobs) == [("job-1", "kara", 2), ("job-1", "reza", 1)]
+        assert asyncio.run(earnings_calculator.get_job_interaction_counts("job-1")) == {"kara": 2, "reza": 1}
+
+    def test_reads_do_not_scan_messages(self, jobs):
+        """Earnings come from counters - messages without one aren't counted until reconciled."""
+        jobs.query(
+            "MATCH (job:U4_Work_Item {slug: 'job-1'}) "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'kara'})-[:U4_ABOUT]->(job)"
+        )
+
+        assert asyncio.run(earnings_calculator.get_job_interaction_counts("job-1")) == {}
+        asyncio.run(interaction_counters.rebuild_interaction_counters())
+        assert asyncio.run(earnings_calculator.get_job_interaction_counts("job-1")) == {"kara": 1}
+
+
+class TestBackfill:
+    """Test suite for the one-off backfill of existing chat history."""
+
+    def test_backfill_counts_history_without_counters(self, jobs):
+        """Messages from before the counters existed are counted; up-to-date counters are left alone."""
+        asyncio.run(graph.create_chat_message("job-1", "user", "Hi", "reza"))
+        jobs.query(
+            "MATCH (job:U4_Work_Item {slug: 'job-1'}) UNWIND range(1, 2) AS i "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'kara'})-[:U4_ABOUT]->(job)"
+        )
+        assert asyncio.run(earnings_calculator.get_job_interaction_counts("job-1")) == {"reza": 1}
+
+        assert asyncio.run(interaction_counters.backfill_interaction_counters()) == 1
+
+        assert asyncio.run(earnings_calculator.get_job_interaction_counts("job-1")) == {"kara": 2, "reza": 1}
+        assert asyncio.run(interaction_counters.backfill_interaction_counters()) == 0
+
+    def test_deploy_backfill_runs_only_without_counters(self, jobs):
+        """--backfill counts history on the first deploy and is a no-op once counters exist."""
+        from scripts.reconcile_interaction_counters import backfill_once
+
+        jobs.query(
+            "MATCH (job:U4_Work_Item {slug: 'job-1'}) "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'kara'})-[:U4_ABOUT]->(job)"
+        )
+        assert not asyncio.run(interaction_counters.interaction_counters_exist())
+        asyncio.run(backfill_once())
+        assert _counters(jobs) == [("job-1", "kara", 1)]
+
+        jobs.query(
+            "MATCH (job:U4_Work_Item {slug: 'job-1'}) "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'reza'})-[:U4_ABOUT]->(job)"
+        )
+        asyncio.run(backfill_once())
+        assert _counters(jobs) == [("job-1", "kara", 1)]
+
+    def test_backfill_corrects_drift_and_keeps_counting(self, jobs):
+        """A drifted counter is set to the event count, and later messages increment it."""
+        asyncio.run(graph.create_chat_message("job-1", "user", "Hi", "kara"))
+        jobs.query("MATCH (c:U4_Interaction_Counter {member_slug: 'kara'}) SET c.count = 7")
+
+        asyncio.run(interaction_counters.backfill_interaction_counters())
+        asyncio.run(graph.create_chat_message("job-1", "user", "Again", "kara"))
+
+        assert _counters(jobs) == [("job-1", "kara", 2)]
+
+
+class TestReconcile:
+    """Test suite for drift detection and rebuild from raw events."""
+
+    def test_check_reports_drift_and_rebuild_fixes_it(self, jobs):
+        """Tampered counters are reported, then rebuilt to the event counts."""
+        for i, actor in enumerate(("kara", "reza")):
+            asyncio.run(graph.create_chat_message("job-1", "user", f"Hi {i}", actor))
+        jobs.query("MATCH (c:U4_Interaction_Counter {member_slug: 'kara'}) SET c.count = 7")
+        jobs.query("CREATE (:U4_Interaction_Counter {job_slug: 'job-1', member_slug: 'ghost', count: 3, scope_ref: 'scopelock'})")
+
+        drift = asyncio.run(interaction_counters.check_interaction_counters())
+        assert [(d["memberSlug"], d["counter"], d["events"]) for d in drift] == [("ghost", 3, 0), ("kara", 7, 1)]
+
+        assert asyncio.run(interaction_counters.rebuild_interaction_counters()) == 2
+        assert asyncio.run(interaction_counters.check_interaction_counters()) == []
+        assert _counters(jobs) == [("job-1", "kara", 1), ("job-1", "reza", 1)]
+
+    def test_rebuild_one_job_leaves_others(self, jobs):
+        """--job scopes the rebuild to that job's counters."""
+        jobs.query("CREATE (:U4_Interaction_Counter {job_slug: 'job-2', member_slug: 'kara', count: 5, scope_ref: 'scopelock'})")
+        asyncio.run(graph.create_chat_message("job-1", "user", "Hi", "reza"))
+
+        asyncio.run(interaction_counters.rebuild_interaction_counters("job-1"))
+
+        assert _counters(jobs) == [("job-2", "kara", 5), ("job-1", "reza", 1)]
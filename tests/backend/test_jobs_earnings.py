@@ -0,0 +1,78 @@
+"""
+Backend Tests: Batch Job Earnings
+Maps to: services/compensation/earnings_calculator.py (calculate_jobs_earnings), GET /api/compensation/jobs/earnings
+"""
+
+import asyncio
+
+from app.config import settings
+from app.api.mission_deck import compensation
+from app.api.mission_deck.services.compensation import interaction_counters
+
+
+def _seed(standin, count):
+    g = standin.graph(settings.graph_name)
+    g.query(
+        "UNWIND range(1, $count) AS i "
+        "CREATE (job:U4_Work_Item {slug: 'job-' + toString(i), name: 'Job ' + toString(i), work_type: 'job', "
+        "scope_ref: 'scopelock', status: 'active', value: 1000, teamPool: 300.0}) "
+        "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'kara'})-[:U4_ABOUT]->(job) "
+        "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'reza'})-[:U4_ABOUT]->(job) "
+        "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: 'reza'})-[:U4_ABOUT]->(job)",
+        {"count": count}
+    )
+    asyncio.run(interaction_counters.rebuild_interaction_counters())
+
+
+class TestJobsEarnings:
+    """Test suite for job card earnings in one round trip."""
+
+    def test_thirty_cards_one_round_trip(self, falkordb_standin, app_client):
+        """A 30-card board matches the per-card endpoint and costs one graph request."""
+        _seed(falkordb_standin, 30)
+        slugs = [f"job-{i}" for i in range(1, 31)]
+
+        client = app_client(compensation.router)
+        served = falkordb_standin.requests_served
+        batch = client.get("/api/compensation/jobs/earnings", params={"jobs": slugs, "members": ["kara"]})
+        batch_requests = falkordb_standin.requests_served - served
+        single = client.get("/api/compensation/jobs/job-7/earnings/kara").json()
+
+        assert batch_requests == 1
+        body = batch.json()
+        assert body['missing'] == []
+        assert body['errors'] == []
+        assert [job['jobSlug'] for job in body['jobs']] == slugs
+        card = body['jobs'][6]
+        assert (card['members'][0]['earning'], card['members'][0]['yourInteractions'], card['teamTotal']) == (
+            single['earning'], single['yourInteractions'], single['teamTotal']
+        )
+
+    def test_all_members_and_missing_jobs(self, falkordb_standin, app_client):
+        """Without members every contributor is listed; unknown slugs are reported, not fatal."""
+        _seed(falkordb_standin, 1)
+
+        client = app_client(compensation.router)
+        body = client.get("/api/compensation/jobs/earnings", params={"jobs": ["job-1", "job-404", "job-1"]}).json()
+
+        assert body['missing'] == ["job-404"]
+        assert body['jobs'][0]['members'] == [
+            {'memberSlug': "kara", 'earning': 100.0, 'yourInteractions': 1},
+            {'memberSlug': "reza", 'earning': 200.0, 'yourInteractions': 2},
+        ]
+
+    def test_job_without_team_pool_is_reported_not_fatal(self, falkordb_standin, app_client):
+        """A card that can't be computed is listed in errors; the rest of the board is still returned."""
+        _seed(falkordb_standin, 3)
+        falkordb_standin.graph(settings.graph_name).query(
+            "MATCH (job:U4_Work_Item {slug: 'job-2'}) REMOVE job.teamPool"
+        )
+
+        client = app_client(compensation.router)
+        response = client.get("/api/compensation/jobs/earnings", params={"jobs": ["job-1", "job-2", "job-3"]})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [job['jobSlug'] for job in body['jobs']] == ["job-1", "job-3"]
+        assert [error['jobSlug'] for error in body['errors']] == ["job-2"]
+        assert "teamPool" in body['errors'][0]['detail']
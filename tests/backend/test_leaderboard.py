@@ -0,0 +1,80 @@
+"""
+Backend Tests: Team Earnings Leaderboard
+Maps to: services/compensation/earnings_calculator.py (calculate_team_earnings), GET /api/compensation/leaderboard
+"""
+
+import asyncio
+from decimal import Decimal
+
+from app.config import settings
+from app.api.mission_deck import compensation
+from app.api.mission_deck.services.compensation import earnings_calculator, interaction_counters
+
+
+def _seed(standin):
+    g = standin.graph(settings.graph_name)
+    for slug, pool, actors in [
+        ("job-a", 333.33, ["kara", "reza", "reza"]),
+        ("job-b", 450.0, ["mina", "kara"]),
+    ]:
+        g.query(
+            "CREATE (:U4_Work_Item {slug: $slug, name: $slug, work_type: 'job', scope_ref: 'scopelock', "
+            "status: 'active', value: 1000, teamPool: $pool})",
+            {"slug": slug, "pool": pool}
+        )
+        g.query(
+            "MATCH (job:U4_Work_Item {slug: $slug}) UNWIND $actors AS actor "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: actor})-[:U4_ABOUT]->(job)",
+            {"slug": slug, "actors": actors}
+        )
+    g.query(
+        "CREATE (:U4_Work_Item {slug: 'mission-1', work_type: 'mission', scope_ref: 'scopelock', "
+        "status: 'completed', claimedBy: 'omar', fixedPayment: 12.0}),"
+        "       (:U4_Work_Item {slug: 'mission-2', work_type: 'mission', scope_ref: 'scopelock', "
+        "status: 'approved', claimedBy: 'reza', fixedPayment: 1.5})"
+    )
+    asyncio.run(interaction_counters.rebuild_interaction_counters())
+
+
+class TestLeaderboard:
+    """Test suite for every member's earnings in a single pass."""
+
+    def test_rows_match_member_view_in_two_round_trips(self, falkordb_standin):
+        """The whole team costs what one member's view costs, and each row agrees with it."""
+        _seed(falkordb_standin)
+        served = falkordb_standin.requests_served
+
+        leaderboard = asyncio.run(earnings_calculator.calculate_team_earnings())
+
+        assert falkordb_standin.requests_served == served + 2
+        assert [(m['memberSlug'], m['rank']) for m in leaderboard['members']] == [
+            ("kara", 1), ("mina", 2), ("reza", 3), ("omar", 4)
+        ]
+        for member in leaderboard['members']:
+            own = asyncio.run(earnings_calculator.calculate_member_full_earnings(member['memberSlug']))
+            assert (member['potentialFromJobs'], member['completedMissions'], member['grandTotal']) == (
+                own['potentialFromJobs'], own['completedMissions'], own['grandTotal']
+            )
+        assert leaderboard['teamGrandTotal'] == 796.83
+
+    def test_cent_shares_round_like_compute_share(self):
+        """Integer-cent shares equal the Decimal shares, ties included."""
+        for pool_cents in (1, 3, 5, 33333, 45000, 100001):
+            for team_total in range(1, 9):
+                for member in range(team_total + 1):
+                    expected = earnings_calculator.compute_share(member, team_total, Decimal(pool_cents) / 100)
+                    cents = earnings_calculator.compute_share_cents(member, team_total, pool_cents)
+                    assert Decimal(cents) / 100 == expected
+
+    def test_endpoint_is_cached(self, falkordb_standin, app_client):
+        """Repeated polls are served from the response cache."""
+        _seed(falkordb_standin)
+        client = app_client(compensation.router)
+
+        first = client.get("/api/compensation/leaderboard")
+        served = falkordb_standin.requests_served
+        second = client.get("/api/compensation/leaderboard")
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert falkordb_standin.requests_served == served
@@ -0,0 +1,88 @@
+"""
+Backend Tests: Mission Dashboard
+Maps to: dashboard.py (GET /api/missions/{mission_id}/dashboard)
+"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.api.mission_deck import dashboard, dod, missions
+from app.api.mission_deck.services import graph
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Mission + dashboard routers on the stand-in graph, signed in as kara."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (m:U4_Work_Item {slug: 'mission-47', name: 'Telegram Notifier', work_type: 'mission', "
+        "scope_ref: 'scopelock', state: 'doing', assignee_ref: 'kara', "
+        "due_date: '2025-11-08T23:59:59Z', created_at: '2025-11-01T09:00:00Z'}) "
+        "CREATE (:U4_Work_Item {slug: 'mission-47-task-1', name: 'Bot sends text messages', work_type: 'task', "
+        "scope_ref: 'scopelock', state: 'done', dod_category: 'functional', dod_sort_order: 1})"
+        "-[:U4_MEMBER_OF {role: 'dod_task'}]->(m) "
+        "CREATE (:U4_Work_Item {slug: 'mission-47-task-2', name: 'Deployed to Render', work_type: 'task', "
+        "scope_ref: 'scopelock', state: 'todo', dod_category: 'non-functional', dod_sort_order: 1})"
+        "-[:U4_MEMBER_OF {role: 'dod_task'}]->(m)"
+    )
+    asyncio.run(graph.create_chat_message("mission-47", "user", "Which bot token?", "kara"))
+    asyncio.run(graph.create_chat_message("mission-47", "assistant", "Use the staging one.", "emma_citizen"))
+
+    return app_client(missions.router, dod.router, dashboard.router)
+
+
+class TestMissionDashboard:
+    """Test suite for the mission page in one call."""
+
+    def test_sections_match_standalone_endpoints(self, client):
+        """Every section equals what its own endpoint returns."""
+        body = client.get("/api/missions/mission-47/dashboard").json()
+
+        assert body["mission"] == client.get("/api/missions/mission-47").json()
+        # Cursors are issued per read (server time)
+        assert {**body["dod"], "cursor": None} == {**client.get("/api/missions/mission-47/dod").json(), "cursor": None}
+        assert [message["content"] for message in body["chat"]["messages"]] == [
+            "Which bot token?", "Use the staging one."
+        ]
+        assert body["earnings"]["grandTotal"] == 0.0
+
+    def test_field_selection(self, client, falkordb_standin):
+        """Only requested sections are loaded and only requested fields returned."""
+        client.get("/api/missions/mission-47")
+        served = falkordb_standin.requests_served
+
+        body = client.get(
+            "/api/missions/mission-47/dashboard",
+            params={"sections": "mission,dod", "fields": "mission.title,dod.completed"}
+        ).json()
+        unknown = client.get("/api/missions/mission-47/dashboard", params={"fields": "mission.budget_cents"})
+
+        assert body == {"mission": {"title": "Telegram Notifier"}, "dod": {"completed": 1}}
+        assert falkordb_standin.requests_served == served + 1
+        assert unknown.status_code == 400
+
+    def test_sections_load_concurrently(self, client, monkeypatch):
+        """Section loads overlap: each one waits for the other to have started."""
+        started = {}
+
+        def waits_for(own, other, result):
+            async def load(*args, **kwargs):
+                for name in (own, other):
+                    started.setdefault(name, asyncio.Event())
+                started[own].set()
+                await asyncio.wait_for(started[other].wait(), timeout=2)
+                return result
+            return load
+
+        monkeypatch.setattr(dashboard, "get_mission_dod_items", waits_for("dod", "chat", []))
+        monkeypatch.setattr(dashboard, "get_mission_messages", waits_for("chat", "dod", []))
+
+        response = client.get("/api/missions/mission-47/dashboard", params={"sections": "dod,chat"})
+
+        body = response.json()
+        assert isinstance(body["dod"].pop("cursor"), str)
+        assert body == {
+            "dod": {"items": [], "total": 0, "completed": 0},
+            "chat": {"messages": [], "total": 0}
+        }
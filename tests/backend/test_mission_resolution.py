@@ -0,0 +1,66 @@
+"""
+Backend Tests: Mission Resolution Cache
+Maps to: dependencies.py (get_current_user_mission, resolve_mission), mission write paths
+"""
+
+from typing import Dict
+
+import pytest
+from fastapi import Depends, Request
+
+from app.config import settings
+from app.api.mission_deck import dod, missions
+from app.api.mission_deck.dependencies import get_current_user_mission, resolve_mission
+
+
+@pytest.fixture
+def client(falkordb_standin, app_client):
+    """Missions + DoD routers on the stand-in graph, signed in as kara."""
+    falkordb_standin.graph(settings.graph_name).query(
+        "CREATE (m:U4_Work_Item {slug: 'mission-47', name: 'Telegram Notifier', work_type: 'mission', "
+        "scope_ref: 'scopelock', state: 'doing', assignee_ref: 'kara', notes: 'Draft', "
+        "due_date: '2025-11-08T23:59:59Z', created_at: '2025-11-01T09:00:00Z'}) "
+        "CREATE (:U4_Work_Item {slug: 'mission-47-task-1', name: 'Bot sends text messages', work_type: 'task', "
+        "scope_ref: 'scopelock', state: 'todo', dod_category: 'functional', dod_sort_order: 1})"
+        "-[:U4_MEMBER_OF {role: 'dod_task'}]->(m)"
+    )
+    client = app_client(missions.router, dod.router)
+
+    @client.app.get("/probe/{mission_id}")
+    async def probe(mission_id: str, request: Request, mission: Dict = Depends(get_current_user_mission)):
+        again = await resolve_mission(request, mission_id)
+        return {"same": again is mission}
+
+    return client
+
+
+class TestMissionResolution:
+    """Test suite for resolving the mission without a graph read per call."""
+
+    def test_repeat_resolution_skips_graph(self, client, falkordb_standin):
+        """Resolving twice in one request reads once; later requests are served from the shared cache."""
+        served = falkordb_standin.requests_served
+
+        first = client.get("/probe/mission-47")
+        after_first = falkordb_standin.requests_served
+        client.get("/api/missions/mission-47")
+        client.get("/api/missions/mission-47")
+
+        assert first.json() == {"same": True}
+        assert after_first == served + 1
+        assert falkordb_standin.requests_served == after_first
+
+    def test_unknown_mission_is_404(self, client):
+        """A missing mission still fails the dependency."""
+        response = client.get("/api/missions/mission-404")
+
+        assert response.status_code == 404
+
+    def test_mission_writes_invalidate(self, client):
+        """A notes update is visible on the next resolution."""
+        assert client.get("/api/missions/mission-47").json()["notes"] == "Draft"
+
+        client.patch("/api/missions/mission-47/notes", json={"notes": "Client prefers inline buttons."})
+        mission = client.get("/api/missions/mission-47").json()
+
+        assert mission["notes"] == "Client prefers inline buttons."
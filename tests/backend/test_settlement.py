@@ -0,0 +1,79 @@
+"""
+Backend Tests: Bulk Payout Settlement
+Maps to: services/compensation/settlement.py (integer-cent largest-remainder settlement)
+"""
+
+import asyncio
+import random
+
+from app.config import settings
+from app.api.mission_deck.services.compensation import earnings_calculator, interaction_counters, settlement
+
+
+def _seed(standin, jobs):
+    """jobs: {slug: (teamPool, [actor, ...])} - one message per actor entry."""
+    g = standin.graph(settings.graph_name)
+    for slug, (team_pool, actors) in jobs.items():
+        g.query(
+            "CREATE (:U4_Work_Item {slug: $slug, name: $slug, work_type: 'job', scope_ref: 'scopelock', "
+            "status: 'active', value: 1000, teamPool: $pool})",
+            {"slug": slug, "pool": team_pool}
+        )
+        g.query(
+            "MATCH (job:U4_Work_Item {slug: $slug}) UNWIND $actors AS actor "
+            "CREATE (:U4_Event {event_kind: 'message', scope_ref: 'scopelock', actor_ref: actor})-[:U4_ABOUT]->(job)",
+            {"slug": slug, "actors": actors}
+        )
+    asyncio.run(interaction_counters.rebuild_interaction_counters())
+
+
+class TestAllocation:
+    """Test suite for the largest-remainder cent allocator."""
+
+    def test_shares_sum_to_pool(self):
+        """Every job's pool is split exactly; leftover cents go to the largest remainders."""
+        shares = settlement.allocate_cents([[1, 1, 1], [2, 1, 0], [0, 0, 0]], [100, 1000, 500])
+
+        assert shares == [[34, 33, 33], [667, 333, 0], [0, 0, 0]]
+
+    def test_python_fallback_matches(self, monkeypatch):
+        """Without NumPy the same shares come out."""
+        rng = random.Random(7)
+        counts = [[rng.choice([0, 1, 2, 3, 7, 13]) for _ in range(9)] for _ in range(40)]
+        pools = [rng.randint(0, 250000) for _ in range(40)]
+        expected = settlement.allocate_cents(counts, pools)
+
+        monkeypatch.setattr(settlement, "np", None)
+
+        assert settlement.allocate_cents(counts, pools) == expected
+        for row, pool, shares in zip(counts, pools, expected):
+            assert sum(shares) == (pool if sum(row) else 0)
+
+
+class TestSettlement:
+    """Test suite for settling all active jobs in one pass."""
+
+    def test_settlement_matches_member_view(self, falkordb_standin):
+        """One graph request; shares equal each member's earnings view except listed one-cent adjustments."""
+        _seed(falkordb_standin, {
+            "job-a": (1.00, ["kara", "mina", "reza"]),
+            "job-b": (450.0, ["kara", "kara", "reza"]),
+            "job-c": (99.99, []),
+        })
+        served = falkordb_standin.requests_served
+
+        report = asyncio.run(settlement.build_settlement())
+
+        assert falkordb_standin.requests_served == served + 1
+        assert [job['jobSlug'] for job in report['jobs']] == ["job-a", "job-b"]
+        assert report['totalCents'] == 45100
+        assert sum(member['totalCents'] for member in report['members']) == 45100
+
+        adjustments = {member['memberSlug']: member['adjustments'] for member in report['members']}
+        assert adjustments["kara"] == [{'jobSlug': "job-a", 'settledCents': 34, 'viewCents': 33}]
+        assert adjustments["mina"] == adjustments["reza"] == []
+
+        for member in report['members']:
+            view = asyncio.run(earnings_calculator.calculate_member_total_potential_earnings(member['memberSlug']))
+            adjusted_cents = sum(a['settledCents'] - a['viewCents'] for a in member['adjustments'])
+            assert earnings_calculator.to_cents(view['total']) + adjusted_cents == member['totalCents']
@@ -0,0 +1,90 @@
+"""
+Shared pytest configuration for ScopeLock tests
+
+Makes the backend package (backend/app) importable from tests/backend.
+Settings load .env relative to the working directory, so tests run from
+backend/ - the same way the app is started.
+
+The falkordb_standin fixture points the app's graph client at an
+in-process FalkorDB stand-in (backend/scripts/falkordb_standin.py);
+app_client builds a TestClient for a set of routers on top of it.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPO_ROOT / "backend"
+
+for path in (REPO_ROOT, BACKEND_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+os.chdir(BACKEND_DIR)
+
+STANDIN_API_URL = "http://falkordb-standin/admin/query"
+STANDIN_API_KEY = "standin-key"
+
+
+@pytest.fixture
+def falkordb_standin(monkeypatch):
+    """
+    Route Mission Deck graph traffic to a fresh in-process FalkorDB stand-in.
+
+    Yields the FalkorDBStandin; standin.graph(settings.graph_name) is the
+    graph the app reads and writes.
+    """
+    from app.config import settings
+    from app.api.mission_deck.services import graph
+    from app.api.mission_deck.services.compensation.tier_calculator import fund_snapshot
+    from app.api.mission_deck.services.graph_cache import clear_graph_caches
+    from app.api.mission_deck.services.graph_client import set_graph_transport
+    from scripts.falkordb_standin import FalkorDBStandin
+
+    standin = FalkorDBStandin(api_key=STANDIN_API_KEY)
+    monkeypatch.setattr(settings, "falkordb_api_key", STANDIN_API_KEY)
+    monkeypatch.setattr(graph, "FALKORDB_API_URL", STANDIN_API_URL)
+    monkeypatch.setattr(graph, "FALKORDB_API_KEY", STANDIN_API_KEY)
+    set_graph_transport(standin.async_transport(), standin.transport())
+    clear_graph_caches()
+    fund_snapshot.invalidate()
+
+    yield standin
+
+    set_graph_transport(None, None)
+    clear_graph_caches()
+    fund_snapshot.invalidate()
+
+
+@pytest.fixture
+def app_client(falkordb_standin):
+    """
+    Factory for TestClients of Mission Deck routers on the stand-in graph.
+
+    app_client(missions.router, dod.router) builds a FastAPI app with those
+    routers, signed in as kara (get_current_user overridden), and returns an
+    open TestClient; client.app is the app. Clients are closed at teardown.
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api.mission_deck.dependencies import CurrentUser, get_current_user
+
+    clients = []
+
+    def build(*routers):
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_current_user] = lambda: CurrentUser("kara", "kara@scopelock.ai")
+        client = TestClient(app)
+        client.__enter__()
+        clients.append(client)
+        return client
+
+    yield build
+
+    for client in clients:
+        client.__exit__(None, None, None)
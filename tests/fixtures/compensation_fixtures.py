@@ -11,42 +11,50 @@ import uuid
 import requests
 import os
 
+from app.api.mission_deck.services.graph_decoder import decode_result
+from scripts.falkordb_standin import FalkorDBStandin
+
 
 # ============================================================================
 # FalkorDB Connection Configuration
 # ============================================================================
 
-FALKORDB_API_URL = os.getenv(
-    "FALKORDB_API_URL",
-    "https://mindprotocol.onrender.com/admin/query"
-)
-FALKORDB_API_KEY = os.getenv("FALKORDB_API_KEY", "Sxv48F2idLAXMnvqQTdvlQ4gArsDVhK4ROGyU")
-GRAPH_NAME = "scopelock"
+# Tests run against the in-process FalkorDB stand-in (hermetic, no network).
+# Set FALKORDB_TEST_API_URL to run the same fixtures against a real FalkorDB
+# REST endpoint (e.g. a disposable graph on the staging proxy).
+FALKORDB_TEST_API_URL = os.getenv("FALKORDB_TEST_API_URL")
+FALKORDB_API_KEY = os.getenv("FALKORDB_API_KEY", "")
+GRAPH_NAME = os.getenv("FALKORDB_TEST_GRAPH", "scopelock")
+
+standin = FalkorDBStandin()
 
 
 def query_graph(cypher: str) -> List[Dict]:
     """
-    Execute Cypher query against FalkorDB production graph.
+    Execute Cypher query against the test graph.
 
     Args:
         cypher: Cypher query string
 
     Returns:
-        List of result dictionaries
-    """
-    response = requests.post(
-        FALKORDB_API_URL,
-        headers={"Authorization": f"Bearer {FALKORDB_API_KEY}"},
-        json={
-            "graph": GRAPH_NAME,
-            "query": cypher
-        }
-    )
+        List of result rows (dict-style access by column name)
+    """
+    body = {"graph_name": GRAPH_NAME, "query": cypher}
+
+    if FALKORDB_TEST_API_URL:
+        response = requests.post(
+            FALKORDB_TEST_API_URL,
+            headers={"X-API-Key": FALKORDB_API_KEY, "Content-Type": "application/json"},
+            json=body
+        )
+        status_code, payload = response.status_code, (response.json() if response.content else {})
+    else:
+        status_code, payload = standin.handle(body, api_key=None)
 
-    if response.status_code != 200:
-        raise RuntimeError(f"FalkorDB query failed: {response.text}")
+    if status_code != 200:
+        raise RuntimeError(f"FalkorDB query failed: {payload}")
 
-    return response.json().get("results", [])
+    return decode_result(payload.get("result", []))
 
 
 # ============================================================================
@@ -98,7 +106,6 @@ def create_test_job(value: float, title: str, status: str = "active") -> TestJob
     Returns:
         TestJob instance
     """
-    job_id = f"test-job-{uuid.uuid4().hex[:8]}"
     job_slug = title.lower().replace(" ", "-")
 
     team_pool = Decimal(str(value)) * Decimal("0.30")
@@ -126,9 +133,10 @@ def create_test_job(value: float, title: str, status: str = "active") -> TestJob
 
     # Update mission fund balance
     _update_mission_fund_balance(mission_fund)
+    _mission_fund_sources[job_slug] = mission_fund.quantize(Decimal("0.01"))
 
     return TestJob(
-        id=job_id,
+        id=job_slug,
         slug=job_slug,
         title=title,
         value=value,
@@ -146,7 +154,6 @@ def create_test_member(slug: str) -> TestMember:
     Returns:
         TestMember instance
     """
-    member_id = f"test-member-{uuid.uuid4().hex[:8]}"
     name = slug.replace("_", " ").title()
 
     cypher = f"""
@@ -165,7 +172,7 @@ def create_test_member(slug: str) -> TestMember:
     query_graph(cypher)
 
     return TestMember(
-        id=member_id,
+        id=slug,
         slug=slug,
         name=name
     )
@@ -197,7 +204,6 @@ def create_test_mission(
             f"Mission fund insufficient (${balance} available, need ${payment})"
         )
 
-    mission_id = f"test-mission-{uuid.uuid4().hex[:8]}"
     mission_slug = title.lower().replace(" ", "-")
 
     cypher = f"""
@@ -221,7 +227,7 @@ def create_test_mission(
     query_graph(cypher)
 
     return TestMission(
-        id=mission_id,
+        id=mission_slug,
         slug=mission_slug,
         title=title,
         payment=payment,
@@ -250,16 +256,23 @@ def send_message_to_ai(
 
     Returns:
         Dictionary with interaction count
+
+    Raises:
+        ValueError: If the job was already paid (counts are frozen)
     """
     if job_id is None:
         # Message not in job context, don't count
         return {"interaction_counted": False}
 
-    # Check for duplicate (same message within 1 second)
+    if get_job_status(job_id) == "paid":
+        raise ValueError("Cannot add interactions to paid job")
+
+    # Check for duplicate (same message within 1 second) - ISO timestamps
+    # compare as strings (FalkorDB has no datetime())
     recent = query_graph(f"""
         MATCH (e:U4_Event)-[:U4_CREATED_BY]->(m:U4_Agent {{slug: '{member_id}'}})
         WHERE e.content = '{message}'
-        AND datetime(e.timestamp) > datetime('{(datetime.utcnow() - timedelta(seconds=1)).isoformat()}')
+        AND e.timestamp > '{(datetime.utcnow() - timedelta(seconds=1)).isoformat()}'
         RETURN count(e) as count
     """)
 
@@ -305,11 +318,12 @@ def add_interactions(job_id: str, member_id: str, count: int):
         count: Number of interactions to add
     """
     for i in range(count):
+        # Unique content so repeated calls within 1s aren't dropped as duplicates
         send_message_to_ai(
             job_id=job_id,
             member_id=member_id,
             ai="rafael",
-            message=f"Test message {i+1}"
+            message=f"Test message {i+1} ({uuid.uuid4().hex[:6]})"
         )
 
 
@@ -428,8 +442,10 @@ def get_member_potential_earnings(member_id: str, job_id: str) -> Decimal:
         job_id: Job slug
 
     Returns:
-        Potential earning
+        Potential earning ($0 once the job is paid - it moved to paid history)
     """
+    if get_job_status(job_id) == "paid":
+        return Decimal("0.00")
     return calculate_member_earning(job_id, member_id)
 
 
@@ -643,7 +659,7 @@ def advance_time(hours: int):
     query_graph(f"""
         MATCH (mission:U4_Work_Item)
         WHERE mission.status = 'claimed'
-        AND datetime(mission.claimedAt) < datetime('{cutoff.isoformat()}')
+        AND mission.claimedAt < '{cutoff.isoformat()}'
         SET mission.status = 'available'
         SET mission.claimedBy = null
         SET mission.claimedAt = null
@@ -705,6 +721,7 @@ def trigger_payment(
 
     # Calculate payments
     member_payments = {}
+    frozen_interactions = {}
     for contrib in contributors:
         member_slug = contrib["slug"]
         interactions = contrib["interactions"]
@@ -713,6 +730,7 @@ def trigger_payment(
         share = share.quantize(Decimal("0.01"))
 
         member_payments[member_slug] = share
+        frozen_interactions[member_slug] = interactions
 
         # Update member paid history
         query_graph(f"""
@@ -738,10 +756,10 @@ def trigger_payment(
 
     return {
         "member_payments": member_payments,
-        "total_paid": team_pool,
+        "total_paid": sum(member_payments.values(), Decimal("0.00")),
         "frozen_interactions_total": total_interactions,
-        **{f"frozen_interactions_{slug}": member_payments[slug]
-           for slug in member_payments.keys()}
+        **{f"frozen_interactions_{slug}": count
+           for slug, count in frozen_interactions.items()}
     }
 
 
@@ -865,12 +883,15 @@ def clear_notifications():
 
 def clear_test_data():
     """Clear all test data from FalkorDB."""
-    # Delete test nodes
-    query_graph("""
-        MATCH (n)
-        WHERE n.slug STARTS WITH 'test-'
-        DETACH DELETE n
-    """)
+    if FALKORDB_TEST_API_URL:
+        # Delete test nodes
+        query_graph("""
+            MATCH (n)
+            WHERE n.slug STARTS WITH 'test-'
+            DETACH DELETE n
+        """)
+    else:
+        standin.graph(GRAPH_NAME).reset()
 
     # Reset mission fund
     global _mission_fund_balance, _mission_fund_sources, _sent_notifications